@@ -3,10 +3,47 @@ from .driver_adapter import (
     BrowserConfig,
     BrowserAdapter,
     check_browser_available,
+    find_free_port,
+)
+from .driver_resolver import (
+    DriverResolver,
+    DriverResolutionError,
+    ResolvedDriver,
+    create_chrome_driver,
+    get_default_resolver,
+)
+from .pool import BrowserPool, PooledBrowser, reset_browser_state
+from .contexts import BrowserContext, BrowserContextHost
+from .session_cache import SessionCache, CachedSession
+from .editor_url_cache import EditorUrlCache, is_editor_url
+from .resource_blocking import (
+    DEFAULT_BLOCKED_GROUPS,
+    RESOURCE_GROUPS,
+    apply_resource_blocking,
+    blocked_url_patterns,
 )
 
 __all__ = [
     'BrowserConfig',
     'BrowserAdapter',
     'check_browser_available',
+    'find_free_port',
+    'DriverResolver',
+    'DriverResolutionError',
+    'ResolvedDriver',
+    'create_chrome_driver',
+    'get_default_resolver',
+    'BrowserPool',
+    'PooledBrowser',
+    'reset_browser_state',
+    'BrowserContext',
+    'BrowserContextHost',
+    'SessionCache',
+    'CachedSession',
+    'EditorUrlCache',
+    'is_editor_url',
+    'DEFAULT_BLOCKED_GROUPS',
+    'RESOURCE_GROUPS',
+    'apply_resource_blocking',
+    'blocked_url_patterns',
 ]
@@ -5,11 +5,19 @@ Wraps the WebDriver management for browser automation.
 This adapter provides a clean interface for the CLI to interact with browsers.
 """
 import os
+import socket
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 from selenium import webdriver
 
+from .resource_blocking import apply_resource_blocking
+
+# Driver options recording network events in the performance log
+# (publish response capture and traffic meter in src.cdp_network)
+PERFORMANCE_LOGGING_PREFS = {'performance': 'ALL'}
+PERF_LOGGING_OPTIONS = {'enableNetwork': True, 'enablePage': False}
+
 
 @dataclass
 class BrowserConfig:
@@ -17,17 +25,19 @@ class BrowserConfig:
     browser_type: str = 'chrome'
     headless: bool = False
     remote_mode: bool = False
-    remote_debug_port: int = 9222
+    remote_debug_port: Optional[int] = None  # None = pick a free port per browser
     window_size: str = '1920,1080'
     user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+    blocked_urls: Tuple[str, ...] = ()  # URL patterns not loaded (see resource_blocking)
 
     @classmethod
-    def for_automation(cls, headless: bool = True) -> 'BrowserConfig':
+    def for_automation(cls, headless: bool = True, blocked_urls: Tuple[str, ...] = ()) -> 'BrowserConfig':
         """Create config optimized for automation."""
         return cls(
             browser_type='chrome',
             headless=headless,
             remote_mode=headless,  # Remote mode implies headless
+            blocked_urls=tuple(blocked_urls),
         )
 
 
@@ -55,9 +65,8 @@ class BrowserAdapter:
         Returns:
             Configured WebDriver instance
         """
-        from selenium.webdriver.chrome.service import Service as ChromeService
         from selenium.webdriver.chrome.options import Options as ChromeOptions
-        from webdriver_manager.chrome import ChromeDriverManager
+        from .driver_resolver import create_chrome_driver
 
         options = ChromeOptions()
 
@@ -86,26 +95,33 @@ class BrowserAdapter:
         # Remote/SSH mode optimizations
         if self.config.remote_mode:
             options.add_argument('--disable-infobars')
-            options.add_argument(f'--remote-debugging-port={self.config.remote_debug_port}')
+            port = self.config.remote_debug_port or find_free_port()
+            options.add_argument(f'--remote-debugging-port={port}')
 
         # Language settings
         options.add_argument('--lang=ko-KR')
 
+        # Network events in the performance log (publish response capture, traffic meter)
+        options.set_capability('goog:loggingPrefs', PERFORMANCE_LOGGING_PREFS)
+        options.add_experimental_option('perfLoggingPrefs', PERF_LOGGING_OPTIONS)
+
         # Handle display environment
         if not self.config.headless:
             display = os.environ.get('DISPLAY')
             if not display:
                 os.environ['DISPLAY'] = ':0'
 
-        # Create driver
-        service = ChromeService(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Create driver (cached chromedriver/Chrome, one shared chromedriver process)
+        self.driver = create_chrome_driver(options)
 
         # Remove webdriver detection
         self.driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
 
+        # Drop images, fonts, trackers etc. (per tab; new tabs apply it themselves)
+        apply_resource_blocking(self.driver, self.config.blocked_urls)
+
         # Set implicit wait
         self.driver.implicitly_wait(10)
 
@@ -156,6 +172,21 @@ class BrowserAdapter:
         self.close()
 
 
+def find_free_port() -> int:
+    """
+    Ask the OS for a free TCP port.
+
+    Used for the remote debugging port so that several browsers
+    (e.g. parallel posting workers) can run side by side.
+
+    Returns:
+        Port number that was free at the time of the call
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
 def check_browser_available() -> bool:
     """
     Check if browser automation is available.
@@ -165,16 +196,14 @@ def check_browser_available() -> bool:
     """
     try:
         from selenium.webdriver.chrome.options import Options as ChromeOptions
-        from selenium.webdriver.chrome.service import Service as ChromeService
-        from webdriver_manager.chrome import ChromeDriverManager
+        from .driver_resolver import create_chrome_driver
 
         options = ChromeOptions()
         options.add_argument('--headless=new')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
 
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        driver = create_chrome_driver(options)
         driver.quit()
         return True
     except Exception as e:
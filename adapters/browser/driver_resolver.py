@@ -0,0 +1,424 @@
+"""
+Offline chromedriver / Chrome resolution.
+
+``ChromeDriverManager().install()`` performs a version lookup (and possibly a
+download) on every launch, which is slow and fails on air-gapped hosts.
+The resolver records the matched Chrome and chromedriver paths and versions
+in ``~/.nblog/drivers.json`` after the first successful resolution and
+reuses them on later runs:
+
+- If both binaries still have their recorded mtimes, the cache is used as-is
+  (no process spawn, no network)
+- If a binary changed (e.g. Chrome auto-updated), versions are re-read
+  locally with ``--version`` and the cache is kept while major versions match
+- Only when no compatible local chromedriver is found does it fall back to
+  webdriver-manager (the only step that may reach the network)
+
+Drivers can also share one long-lived chromedriver service process
+(``get_shared_service``) instead of spawning one per browser.
+"""
+import atexit
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+
+DEFAULT_RESOLVER_CACHE = Path.home() / '.nblog' / 'drivers.json'
+
+# Chrome binaries checked when no path is configured
+CHROME_CANDIDATES = (
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+    r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+)
+
+# Where webdriver-manager keeps previously downloaded drivers
+WDM_DRIVER_GLOB = str(Path.home() / '.wdm' / 'drivers' / 'chromedriver' / '**' / 'chromedriver*')
+
+_VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+
+class DriverResolutionError(Exception):
+    """Raised when no usable chromedriver can be found."""
+    pass
+
+
+def parse_version(output: str) -> Optional[str]:
+    """
+    Extract a dotted version from ``--version`` output.
+
+    Args:
+        output: e.g. "Google Chrome 131.0.6778.85" or "ChromeDriver 131.0.6778.85 (...)"
+
+    Returns:
+        Version string, or None if not found
+    """
+    match = _VERSION_PATTERN.search(output or '')
+    return match.group(0) if match else None
+
+
+def major_version(version: Optional[str]) -> Optional[int]:
+    """Major version number of a dotted version string."""
+    if not version:
+        return None
+    return int(version.split('.')[0])
+
+
+def read_binary_version(path: str) -> Optional[str]:
+    """
+    Run ``<path> --version`` locally and parse the result.
+
+    Args:
+        path: Path to chrome or chromedriver
+
+    Returns:
+        Version string, or None if it could not be determined
+    """
+    try:
+        completed = subprocess.run(
+            [path, '--version'], capture_output=True, text=True, timeout=15
+        )
+        return parse_version(completed.stdout + completed.stderr)
+    except Exception:
+        return None
+
+
+def _mtime(path: Optional[str]) -> float:
+    """mtime of a file, or 0.0 if it does not exist."""
+    if not path:
+        return 0.0
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+@dataclass
+class ResolvedDriver:
+    """A matched chromedriver / Chrome pair."""
+    chromedriver_path: str
+    chromedriver_version: Optional[str] = None
+    chrome_path: Optional[str] = None
+    chrome_version: Optional[str] = None
+    chromedriver_mtime: float = 0.0
+    chrome_mtime: float = 0.0
+    resolved_at: float = 0.0
+
+    def is_compatible(self) -> bool:
+        """Check that chromedriver and Chrome major versions match (unknown counts as a match)."""
+        driver_major = major_version(self.chromedriver_version)
+        chrome_major = major_version(self.chrome_version)
+        if driver_major is None or chrome_major is None:
+            return True
+        return driver_major == chrome_major
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for the cache file."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ResolvedDriver':
+        """Create ResolvedDriver from dictionary."""
+        return cls(**{k: data.get(k) for k in cls.__dataclass_fields__ if k in data})
+
+
+class DriverResolver:
+    """
+    Resolves chromedriver and Chrome, caching the result on disk.
+    """
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        allow_download: bool = True,
+        version_reader: Optional[Callable[[str], Optional[str]]] = None,
+        downloader: Optional[Callable[[], str]] = None
+    ):
+        """
+        Initialize resolver.
+
+        Args:
+            cache_file: Cache path, defaults to ~/.nblog/drivers.json
+            allow_download: Fall back to webdriver-manager when nothing local matches
+            version_reader: Reads a binary's version, defaults to running --version
+            downloader: Returns a chromedriver path, defaults to webdriver-manager
+        """
+        self.cache_file = Path(cache_file) if cache_file else DEFAULT_RESOLVER_CACHE
+        self.allow_download = allow_download
+        self._read_version = version_reader or read_binary_version
+        self._download = downloader or _webdriver_manager_install
+        self._resolved: Optional[ResolvedDriver] = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> ResolvedDriver:
+        """
+        Get a compatible chromedriver / Chrome pair.
+
+        Returns:
+            ResolvedDriver
+
+        Raises:
+            DriverResolutionError: No compatible chromedriver was found
+        """
+        with self._lock:
+            if self._resolved and self._is_unchanged(self._resolved):
+                return self._resolved
+
+            resolved = self._from_cache() or self._from_local() or self._from_download()
+            if resolved is None:
+                raise DriverResolutionError(
+                    "No compatible chromedriver found locally and downloading is disabled"
+                )
+            self._resolved = resolved
+            return resolved
+
+    def invalidate(self):
+        """Forget the cached resolution (e.g. after a driver failed to start)."""
+        self._resolved = None
+        try:
+            self.cache_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _is_unchanged(self, resolved: ResolvedDriver) -> bool:
+        """Check that both binaries still exist with their recorded mtimes."""
+        if _mtime(resolved.chromedriver_path) != resolved.chromedriver_mtime:
+            return False
+        if resolved.chrome_path and _mtime(resolved.chrome_path) != resolved.chrome_mtime:
+            return False
+        return resolved.chromedriver_mtime > 0
+
+    def _from_cache(self) -> Optional[ResolvedDriver]:
+        """Load and validate the on-disk cache."""
+        if not self.cache_file.exists():
+            return None
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = ResolvedDriver.from_dict(json.load(f))
+        except Exception as e:
+            print(f"[WARNING] Ignoring unreadable driver cache: {e}")
+            return None
+
+        if self._is_unchanged(cached):
+            return cached
+
+        if not os.path.isfile(cached.chromedriver_path):
+            return None
+
+        # A binary was updated in place: re-check versions locally
+        refreshed = self._build(cached.chromedriver_path, cached.chrome_path)
+        if refreshed.is_compatible():
+            self._save(refreshed)
+            return refreshed
+        return None
+
+    def _from_local(self) -> Optional[ResolvedDriver]:
+        """Find a compatible chromedriver already on this machine."""
+        chrome_path = find_chrome_binary()
+        for driver_path in find_local_chromedrivers():
+            resolved = self._build(driver_path, chrome_path)
+            if resolved.chromedriver_version and resolved.is_compatible():
+                self._save(resolved)
+                return resolved
+        return None
+
+    def _from_download(self) -> Optional[ResolvedDriver]:
+        """Fall back to webdriver-manager (may use the network)."""
+        if not self.allow_download:
+            return None
+        resolved = self._build(self._download(), find_chrome_binary())
+        self._save(resolved)
+        return resolved
+
+    def _build(self, driver_path: str, chrome_path: Optional[str]) -> ResolvedDriver:
+        """Create a ResolvedDriver, reading versions and mtimes."""
+        return ResolvedDriver(
+            chromedriver_path=driver_path,
+            chromedriver_version=self._read_version(driver_path),
+            chrome_path=chrome_path,
+            chrome_version=self._read_version(chrome_path) if chrome_path else None,
+            chromedriver_mtime=_mtime(driver_path),
+            chrome_mtime=_mtime(chrome_path),
+            resolved_at=time.time(),
+        )
+
+    def _save(self, resolved: ResolvedDriver):
+        """Atomically write the cache file."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(resolved.to_dict(), f, indent=2)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            print(f"[WARNING] Failed to write driver cache: {e}")
+
+
+def find_chrome_binary() -> Optional[str]:
+    """
+    Locate the Chrome binary.
+
+    Returns:
+        Path from $CHROME_BIN or the first existing candidate, or None
+    """
+    env_path = os.environ.get('CHROME_BIN')
+    if env_path and os.path.isfile(env_path):
+        return env_path
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    return None
+
+
+def find_local_chromedrivers() -> List[str]:
+    """
+    List chromedriver binaries available without downloading.
+
+    Returns:
+        Paths from $CHROMEDRIVER, PATH and the webdriver-manager cache (newest first)
+    """
+    paths = []
+    env_path = os.environ.get('CHROMEDRIVER')
+    if env_path and os.path.isfile(env_path):
+        paths.append(env_path)
+    on_path = shutil.which('chromedriver')
+    if on_path:
+        paths.append(on_path)
+
+    cached = [
+        p for p in glob.glob(WDM_DRIVER_GLOB, recursive=True)
+        if os.path.isfile(p) and os.path.basename(p) in ('chromedriver', 'chromedriver.exe')
+    ]
+    paths.extend(sorted(cached, key=_mtime, reverse=True))
+
+    # Deduplicate, keep order
+    return list(dict.fromkeys(paths))
+
+
+def _webdriver_manager_install() -> str:
+    """Download (or look up) chromedriver with webdriver-manager."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+_default_resolver: Optional[DriverResolver] = None
+
+
+def get_default_resolver() -> DriverResolver:
+    """Process-wide resolver using ~/.nblog/drivers.json."""
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = DriverResolver()
+    return _default_resolver
+
+
+class SharedChromeService(ChromeService):
+    """
+    chromedriver service shared by several drivers.
+
+    ``start`` only launches the process once, and ``stop`` (called by each
+    driver's ``quit``) leaves it running; ``shutdown`` really stops it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        with self._start_lock:
+            process = getattr(self, 'process', None)
+            if process is not None and process.poll() is None:
+                return
+            super().start()
+
+    def stop(self):
+        # Drivers quitting must not take down the shared service
+        pass
+
+    def shutdown(self):
+        """Stop the chromedriver process."""
+        super().stop()
+
+
+_shared_services: Dict[str, SharedChromeService] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_service(chromedriver_path: str) -> SharedChromeService:
+    """
+    Get the long-lived chromedriver service for a driver binary.
+
+    Args:
+        chromedriver_path: Resolved chromedriver path
+
+    Returns:
+        SharedChromeService (started lazily by the first driver)
+    """
+    with _shared_lock:
+        service = _shared_services.get(chromedriver_path)
+        if service is None:
+            service = SharedChromeService(executable_path=chromedriver_path)
+            _shared_services[chromedriver_path] = service
+        return service
+
+
+def shutdown_shared_services():
+    """Stop every shared chromedriver service (registered with atexit)."""
+    with _shared_lock:
+        services = list(_shared_services.values())
+        _shared_services.clear()
+    for service in services:
+        try:
+            service.shutdown()
+        except Exception:
+            pass
+
+
+atexit.register(shutdown_shared_services)
+
+
+def create_chrome_driver(options, resolver: Optional[DriverResolver] = None):
+    """
+    Start Chrome with the resolved chromedriver on the shared service.
+
+    If the cached pair is rejected by chromedriver (version mismatch), the
+    cache is dropped and resolution runs once more.
+
+    Args:
+        options: ChromeOptions for the new browser
+        resolver: DriverResolver, defaults to the process-wide one
+
+    Returns:
+        webdriver.Chrome instance
+    """
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+
+    resolver = resolver or get_default_resolver()
+    for attempt in range(2):
+        resolved = resolver.resolve()
+        if resolved.chrome_path:
+            options.binary_location = resolved.chrome_path
+        try:
+            return webdriver.Chrome(service=get_shared_service(resolved.chromedriver_path), options=options)
+        except SessionNotCreatedException:
+            if attempt:
+                raise
+            print("[WARNING] Cached chromedriver was rejected, resolving again")
+            resolver.invalidate()
@@ -0,0 +1,130 @@
+"""
+Editor URL cache.
+
+Finding a blog's editor means loading the blog main page and looking for
+the write button inside its ``mainFrame`` iframe. The resulting URL does
+not change for a blog, so it is cached per blog ID on disk and the writer
+goes to it directly; discovery only runs again when the cached URL is
+missing, stale or no longer opens the editor.
+
+All blogs share one small JSON file. Writes replace the file atomically;
+concurrent writers (parallel workers) can at worst drop each other's new
+entry, which is rediscovered on the next post.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+DEFAULT_EDITOR_URL_CACHE = Path.home() / '.nblog' / 'editor_urls.json'
+
+
+def is_editor_url(url: str, blog_id: str) -> bool:
+    """
+    Check that a URL can be the editor of a blog.
+
+    Args:
+        url: Candidate editor URL
+        blog_id: Blog the URL should belong to
+
+    Returns:
+        True for an https URL on blog.naver.com that mentions the blog ID
+    """
+    try:
+        parsed = urlparse(url or '')
+    except ValueError:
+        return False
+    return (
+        parsed.scheme == 'https'
+        and (parsed.hostname or '').endswith('blog.naver.com')
+        and bool(blog_id)
+        and blog_id.lower() in url.lower()
+    )
+
+
+class EditorUrlCache:
+    """Per-blog editor URL stored in a JSON file."""
+
+    def __init__(self, path: Optional[str] = None, max_age: float = 7 * 24 * 3600):
+        """
+        Initialize editor URL cache.
+
+        Args:
+            path: Cache file, defaults to ~/.nblog/editor_urls.json
+            max_age: Seconds after which a cached URL is discovered again
+        """
+        self.path = Path(path) if path else DEFAULT_EDITOR_URL_CACHE
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, dict]:
+        """Read all entries (empty if the file is missing or unreadable)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[WARNING] Failed to read editor URL cache: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, data: Dict[str, dict]):
+        """Replace the cache file atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[WARNING] Failed to write editor URL cache: {e}")
+
+    def get(self, blog_id: str) -> Optional[str]:
+        """
+        Get the cached editor URL of a blog.
+
+        Args:
+            blog_id: Blog ID
+
+        Returns:
+            Editor URL, or None when missing, stale or not a valid editor URL
+        """
+        entry = self._read().get(blog_id)
+        if not isinstance(entry, dict):
+            return None
+        url = entry.get('url', '')
+        if time.time() - entry.get('saved_at', 0.0) > self.max_age or not is_editor_url(url, blog_id):
+            return None
+        return url
+
+    def put(self, blog_id: str, url: str) -> bool:
+        """
+        Cache the editor URL of a blog.
+
+        Args:
+            blog_id: Blog ID
+            url: Discovered editor URL
+
+        Returns:
+            True if the URL was valid and cached
+        """
+        if not is_editor_url(url, blog_id):
+            return False
+        with self._lock:
+            data = self._read()
+            data[blog_id] = {'url': url, 'saved_at': time.time()}
+            self._write(data)
+        return True
+
+    def invalidate(self, blog_id: str):
+        """Forget the editor URL of a blog."""
+        with self._lock:
+            data = self._read()
+            if data.pop(blog_id, None) is not None:
+                self._write(data)
@@ -0,0 +1,266 @@
+"""
+Warm browser pool.
+
+Keeps pre-launched, pre-configured Chrome instances ready so that each
+account does not pay a cold browser start. Instances are cleaned between
+accounts (cookies, storage, extra tabs), retired after a configurable
+number of uses, and replaced by background launches.
+
+The HTTP cache is deliberately kept between accounts: it holds the editor
+and blog skin assets, which are the same for every account.
+"""
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+from .driver_adapter import BrowserAdapter, BrowserConfig
+
+
+# Origins whose storage is wiped when a browser changes hands
+NAVER_ORIGINS = (
+    'https://www.naver.com',
+    'https://nid.naver.com',
+    'https://blog.naver.com',
+    'https://m.blog.naver.com',
+)
+
+
+def reset_browser_state(driver):
+    """
+    Return a browser to a clean, logged-out state.
+
+    Closes every tab but the first, navigates it to about:blank, and clears
+    cookies plus Naver origin storage.
+
+    Args:
+        driver: WebDriver with CDP support
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.get('about:blank')
+
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    for origin in NAVER_ORIGINS:
+        driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+            'origin': origin,
+            'storageTypes': 'local_storage,session_storage,indexeddb,cache_storage,service_workers',
+        })
+
+
+@dataclass
+class PooledBrowser:
+    """A pooled browser and how many accounts it has served."""
+    adapter: BrowserAdapter
+    uses: int = 0
+
+    @property
+    def driver(self):
+        return self.adapter.driver
+
+
+class BrowserPool:
+    """
+    Pool of warm browser instances.
+
+    The pool keeps ``size`` live instances (idle, in use or launching).
+    Released instances are cleaned and reused until they reach ``max_uses``;
+    when an instance is handed out for its last use, or dies, a replacement
+    is launched in the background so the next account finds a warm browser.
+    """
+
+    def __init__(
+        self,
+        config: Optional[BrowserConfig] = None,
+        size: int = 1,
+        max_uses: int = 20,
+        adapter_factory: Optional[Callable[[BrowserConfig], BrowserAdapter]] = None
+    ):
+        """
+        Initialize browser pool.
+
+        Args:
+            config: BrowserConfig used for every instance
+            size: Number of live instances to keep
+            max_uses: Accounts served before an instance is retired
+            adapter_factory: Creates adapters, defaults to BrowserAdapter
+        """
+        self.config = config or BrowserConfig.for_automation()
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._adapter_factory = adapter_factory or BrowserAdapter
+        self._idle: 'queue.Queue[PooledBrowser]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._live = 0  # instances counted toward size (idle, in use, launching)
+        self._launching = 0
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+
+    def start(self):
+        """Begin warming up instances in the background."""
+        self._refill()
+
+    def _launch(self) -> PooledBrowser:
+        """Launch one browser instance (blocking)."""
+        adapter = self._adapter_factory(self.config)
+        adapter.create_driver()
+        return PooledBrowser(adapter=adapter)
+
+    def _launch_into_pool(self):
+        """Background launch that adds the new instance to the idle queue."""
+        try:
+            browser = self._launch()
+        except Exception as e:
+            print(f"[WARNING] Browser pool launch failed: {e}")
+            browser = None
+
+        with self._lock:
+            self._launching -= 1
+            if browser is None or self._closed:
+                self._live -= 1
+            closed = self._closed
+
+        if browser is None:
+            return
+        if closed:
+            browser.adapter.close()
+            return
+        self._idle.put(browser)
+
+    def _refill(self):
+        """Start background launches until ``size`` instances are live."""
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - self._live
+            if missing <= 0:
+                return
+            self._live += missing
+            self._launching += missing
+            self._threads = [t for t in self._threads if t.is_alive()]
+
+        for _ in range(missing):
+            thread = threading.Thread(target=self._launch_into_pool, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _retire(self, browser: PooledBrowser):
+        """Shut down a live instance and launch a replacement."""
+        browser.adapter.close()
+        with self._lock:
+            self._live -= 1
+        self._refill()
+
+    def acquire(self, timeout: float = 120.0) -> PooledBrowser:
+        """
+        Take a clean browser from the pool.
+
+        Waits for a background launch if none is idle, and launches one
+        directly when nothing is on the way (e.g. background launches failed).
+
+        Args:
+            timeout: Seconds to wait for a warm instance
+
+        Returns:
+            PooledBrowser ready for a new account
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        self._refill()
+        waited = 0.0
+        browser = None
+        while browser is None:
+            try:
+                browser = self._idle.get(timeout=0.5)
+            except queue.Empty:
+                waited += 0.5
+                with self._lock:
+                    launching = self._launching
+                if launching == 0 or waited >= timeout:
+                    browser = self._launch()
+                    with self._lock:
+                        self._live += 1
+                continue
+
+            if not browser.adapter.is_healthy():
+                self._retire(browser)
+                browser = None
+
+        browser.uses += 1
+        if browser.uses >= self.max_uses:
+            # Last use: no longer counted, start its replacement now
+            with self._lock:
+                self._live -= 1
+            self._refill()
+        return browser
+
+    def release(self, browser: PooledBrowser, healthy: bool = True):
+        """
+        Return a browser to the pool.
+
+        Healthy instances below ``max_uses`` are cleaned and kept;
+        anything else is shut down and replaced in the background.
+
+        Args:
+            browser: Browser obtained from acquire()
+            healthy: False if the caller saw the browser misbehave
+        """
+        if browser.uses >= self.max_uses:
+            browser.adapter.close()
+            return
+
+        if not healthy or self._closed:
+            self._retire(browser)
+            return
+
+        try:
+            reset_browser_state(browser.driver)
+        except Exception as e:
+            print(f"[WARNING] Could not clean pooled browser, discarding it: {e}")
+            self._retire(browser)
+            return
+
+        self._idle.put(browser)
+
+    @contextmanager
+    def browser(self, timeout: float = 120.0) -> Iterator[PooledBrowser]:
+        """Context manager: acquire a browser and release it afterwards."""
+        browser = self.acquire(timeout=timeout)
+        healthy = True
+        try:
+            yield browser
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.release(browser, healthy=healthy and browser.adapter.is_healthy())
+
+    def close(self):
+        """Shut down every idle instance and stop refilling."""
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+
+        for thread in threads:
+            thread.join(timeout=60)
+
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            browser.adapter.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
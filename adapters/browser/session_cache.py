@@ -0,0 +1,230 @@
+"""
+Login session cache.
+
+Persists each account's Naver cookies after a successful login so that later
+runs can restore them with CDP instead of going through the full login flow.
+
+Cookies are exported with ``Network.getAllCookies`` and restored with
+``Network.setCookies`` before the first navigation. A cached session is only
+used while its authentication cookies are unexpired; callers are expected to
+run a cheap validity probe after restoring and fall back to a real login.
+
+Security features:
+- Cache files are written with 0600 permissions
+- Cookie values are never logged
+"""
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+
+DEFAULT_SESSION_DIR = Path.home() / '.nblog' / 'sessions'
+
+# Cookies that carry the Naver login state
+AUTH_COOKIES = ('NID_AUT', 'NID_SES')
+
+# Fields accepted by Network.setCookies (CookieParam)
+_COOKIE_PARAM_FIELDS = (
+    'name', 'value', 'domain', 'path', 'secure', 'httpOnly',
+    'sameSite', 'expires', 'priority', 'sourceScheme', 'sourcePort',
+)
+
+
+@dataclass
+class CachedSession:
+    """Cookies for one account plus expiry bookkeeping."""
+    sns_id: str
+    cookies: List[dict] = field(default_factory=list)
+    saved_at: float = 0.0
+    expires_at: float = 0.0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check whether the session has passed its expiry time."""
+        now = time.time() if now is None else now
+        return now >= self.expires_at
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for the cache file."""
+        return {
+            'sns_id': self.sns_id,
+            'saved_at': self.saved_at,
+            'expires_at': self.expires_at,
+            'cookies': self.cookies,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CachedSession':
+        """Create CachedSession from dictionary."""
+        return cls(
+            sns_id=data.get('sns_id', ''),
+            cookies=data.get('cookies', []),
+            saved_at=data.get('saved_at', 0.0),
+            expires_at=data.get('expires_at', 0.0),
+        )
+
+
+class SessionCache:
+    """
+    Per-account cookie jar stored on disk.
+
+    The effective expiry of a session is the earliest expiry of its
+    authentication cookies, capped at ``max_age`` seconds after it was saved
+    (Naver's NID_SES is usually a session cookie without an expiry).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_age: float = 12 * 3600):
+        """
+        Initialize session cache.
+
+        Args:
+            cache_dir: Directory for cache files, defaults to ~/.nblog/sessions
+            max_age: Maximum age in seconds before a session is considered stale
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_SESSION_DIR
+        self.max_age = max_age
+
+    def _path_for(self, sns_id: str) -> Path:
+        """Get cache file path for an account."""
+        safe_name = re.sub(r'[^a-zA-Z0-9_.-]', '_', sns_id.replace('@', '_at_'))
+        return self.cache_dir / f"{safe_name}.json"
+
+    def _compute_expiry(self, cookies: List[dict], saved_at: float) -> float:
+        """Earliest auth cookie expiry, capped at saved_at + max_age."""
+        expiry = saved_at + self.max_age
+        for cookie in cookies:
+            if cookie.get('name') in AUTH_COOKIES:
+                expires = cookie.get('expires', -1)
+                # -1 (or missing) means a session cookie
+                if expires and expires > 0:
+                    expiry = min(expiry, expires)
+        return expiry
+
+    def load(self, sns_id: str) -> Optional[CachedSession]:
+        """
+        Load a cached session if present and not expired.
+
+        Args:
+            sns_id: Account email/ID
+
+        Returns:
+            CachedSession, or None when missing, unreadable or stale
+        """
+        path = self._path_for(sns_id)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                session = CachedSession.from_dict(json.load(f))
+        except Exception as e:
+            print(f"[WARNING] Failed to read session cache for {sns_id}: {e}")
+            return None
+
+        if session.is_expired():
+            return None
+
+        names = {c.get('name') for c in session.cookies}
+        if not all(name in names for name in AUTH_COOKIES):
+            return None
+
+        return session
+
+    def save(self, sns_id: str, cookies: List[dict]) -> Optional[CachedSession]:
+        """
+        Save cookies for an account.
+
+        Only Naver cookies are kept. Nothing is written if the login cookies
+        are missing (i.e. the login did not actually succeed).
+
+        Args:
+            sns_id: Account email/ID
+            cookies: Cookie dicts as returned by Network.getAllCookies
+
+        Returns:
+            The saved CachedSession, or None if nothing was saved
+        """
+        naver_cookies = [c for c in cookies if 'naver.com' in c.get('domain', '')]
+        names = {c.get('name') for c in naver_cookies}
+        if not all(name in names for name in AUTH_COOKIES):
+            return None
+
+        saved_at = time.time()
+        session = CachedSession(
+            sns_id=sns_id,
+            cookies=naver_cookies,
+            saved_at=saved_at,
+            expires_at=self._compute_expiry(naver_cookies, saved_at),
+        )
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            os.chmod(self.cache_dir, 0o700)
+            path = self._path_for(sns_id)
+            tmp_path = path.with_suffix('.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(session.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARNING] Failed to write session cache for {sns_id}: {e}")
+            return None
+
+        return session
+
+    def invalidate(self, sns_id: str):
+        """Remove the cached session for an account."""
+        try:
+            self._path_for(sns_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def export_from_driver(self, driver, sns_id: str) -> bool:
+        """
+        Export the browser's cookies into the cache after a successful login.
+
+        Args:
+            driver: WebDriver with CDP support
+            sns_id: Account email/ID
+
+        Returns:
+            True if a session was saved
+        """
+        try:
+            result = driver.execute_cdp_cmd("Network.getAllCookies", {})
+        except Exception as e:
+            print(f"[WARNING] Failed to export cookies: {e}")
+            return False
+        return self.save(sns_id, result.get('cookies', [])) is not None
+
+    def restore_to_driver(self, driver, sns_id: str) -> bool:
+        """
+        Restore a cached session into the browser before navigation.
+
+        Args:
+            driver: WebDriver with CDP support
+            sns_id: Account email/ID
+
+        Returns:
+            True if an unexpired session was restored
+        """
+        session = self.load(sns_id)
+        if session is None:
+            return False
+
+        cookies = []
+        for cookie in session.cookies:
+            param = {k: v for k, v in cookie.items() if k in _COOKIE_PARAM_FIELDS}
+            # Session cookies are reported with expires=-1; omit it on restore
+            if param.get('expires', 0) <= 0:
+                param.pop('expires', None)
+            cookies.append(param)
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        except Exception as e:
+            print(f"[WARNING] Failed to restore cookies: {e}")
+            return False
+        return True
@@ -0,0 +1,20 @@
+"""HTTP adapters."""
+from .connection_pool import ConnectionPool
+from .blog_client import (
+    BlogHttpClient,
+    BlogPostSummary,
+    PostListSnapshot,
+    PostVerifier,
+    cookie_header,
+    cookies_from_driver,
+)
+
+__all__ = [
+    'ConnectionPool',
+    'BlogHttpClient',
+    'BlogPostSummary',
+    'PostListSnapshot',
+    'PostVerifier',
+    'cookie_header',
+    'cookies_from_driver',
+]
@@ -0,0 +1,362 @@
+"""
+Lightweight HTTP client for checking published posts.
+
+Verifying a post through the browser costs one or two full page loads and
+a large ``page_source`` transfer over the chromedriver wire. The blog's
+post list endpoint (and its RSS feed as a fallback) answer the same
+question in a few KB, so this client queries them directly over pooled
+keep-alive connections, sending the account's cookies exported from the
+browser (needed to see posts that are not public yet).
+
+Only the standard library is used (``http.client``), so nothing is added
+to the requirements.
+"""
+import json
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote, unquote_plus, urlencode, urlsplit
+
+from .connection_pool import ConnectionPool
+
+
+DEFAULT_BLOG_URL = 'https://blog.naver.com'
+DEFAULT_RSS_URL = 'https://rss.blog.naver.com'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+
+# Pages whose cookies are sent with the requests
+COOKIE_URLS = ['https://blog.naver.com', 'https://rss.blog.naver.com', 'https://nid.naver.com']
+
+_LOG_NO_PATTERN = re.compile(r'(?:logNo=|/)(\d{5,})')
+# Fallback for post list responses that are not valid JSON
+_POST_FIELDS_PATTERN = re.compile(r'"logNo"\s*:\s*"?(\d+)"?.*?"title"\s*:\s*"([^"]*)"', re.DOTALL)
+
+
+@dataclass
+class BlogPostSummary:
+    """A post as listed by the blog."""
+    log_no: str
+    title: str
+
+
+def _normalize_title(title: str) -> str:
+    """Title for comparison (whitespace removed)."""
+    return ''.join((title or '').split())
+
+
+def cookie_header(cookies: Iterable[dict]) -> str:
+    """
+    Build a Cookie header from CDP cookie dicts.
+
+    Args:
+        cookies: Cookies as returned by ``Network.getCookies``
+
+    Returns:
+        Header value (empty if there are no cookies)
+    """
+    return '; '.join(f"{c['name']}={c['value']}" for c in cookies if c.get('name'))
+
+
+def cookies_from_driver(driver, urls: Optional[List[str]] = None) -> List[dict]:
+    """
+    Export the cookies the browser would send to the blog.
+
+    ``Network.getCookies`` only returns cookies of the current tab's browser
+    context, so accounts in separate contexts never see each other's cookies.
+
+    Args:
+        driver: WebDriver with CDP support, on the account's tab
+        urls: Pages whose cookies to export, defaults to COOKIE_URLS
+
+    Returns:
+        Cookie dicts (empty on failure)
+    """
+    try:
+        result = driver.execute_cdp_cmd('Network.getCookies', {'urls': urls or COOKIE_URLS})
+    except Exception as e:
+        print(f"[WARNING] Failed to export cookies for HTTP verification: {e}")
+        return []
+    return result.get('cookies', [])
+
+
+class BlogHttpClient:
+    """
+    Reads a blog's post list over HTTP.
+
+    Thread-safe; connections are pooled per origin and kept alive across
+    requests and accounts (cookies are passed per call).
+    """
+
+    def __init__(
+        self,
+        blog_url: str = DEFAULT_BLOG_URL,
+        rss_url: str = DEFAULT_RSS_URL,
+        timeout: float = 10.0,
+        pool_size: int = 4
+    ):
+        """
+        Initialize client.
+
+        Args:
+            blog_url: Origin of the blog pages and the post list endpoint
+            rss_url: Origin of the RSS feeds
+            timeout: Socket timeout in seconds
+            pool_size: Idle connections kept per origin
+        """
+        self.blog_url = blog_url.rstrip('/')
+        self.rss_url = rss_url.rstrip('/')
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._pools: Dict[Tuple[str, str], ConnectionPool] = {}
+        self._lock = threading.Lock()
+        self.bytes_received = 0
+
+    def _get(self, url: str, cookies: Optional[List[dict]] = None) -> Tuple[int, bytes]:
+        """GET a URL through the origin's connection pool."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = ConnectionPool(parts.scheme, parts.netloc, self.pool_size, self.timeout)
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': 'gzip',
+            'Referer': f"{self.blog_url}/",
+        }
+        if cookies:
+            headers['Cookie'] = cookie_header(cookies)
+        path = parts.path or '/'
+        if parts.query:
+            path += f"?{parts.query}"
+        status, body = pool.request(path, headers)
+        self.bytes_received += len(body)
+        return status, body
+
+    def list_posts(self, blog_id: str, cookies: Optional[List[dict]] = None,
+                   count: int = 30, page: int = 1) -> Optional[List[BlogPostSummary]]:
+        """
+        Latest posts from the blog's post list endpoint.
+
+        Args:
+            blog_id: Blog ID
+            cookies: Account cookies (to include posts only the owner sees)
+            count: Number of posts per page
+            page: Page of the list (1 = newest)
+
+        Returns:
+            Posts (newest first), or None if the list could not be read
+        """
+        query = urlencode({
+            'blogId': blog_id,
+            'viewdate': '',
+            'currentPage': page,
+            'categoryNo': 0,
+            'parentCategoryNo': 0,
+            'countPerPage': count,
+        })
+        try:
+            status, body = self._get(f"{self.blog_url}/PostTitleListAsync.naver?{query}", cookies)
+        except Exception as e:
+            print(f"[WARNING] Post list request failed for {blog_id}: {e}")
+            return None
+        if status != 200:
+            return None
+        return _parse_post_list(body.decode('utf-8', errors='replace'))
+
+    def list_rss(self, blog_id: str, cookies: Optional[List[dict]] = None) -> Optional[List[BlogPostSummary]]:
+        """
+        Latest public posts from the blog's RSS feed.
+
+        Returns:
+            Posts (newest first), or None if the feed could not be read
+        """
+        try:
+            status, body = self._get(f"{self.rss_url}/{quote(blog_id)}.xml", cookies)
+        except Exception as e:
+            print(f"[WARNING] RSS request failed for {blog_id}: {e}")
+            return None
+        if status != 200:
+            return None
+        try:
+            channel = ET.fromstring(body)
+        except ET.ParseError:
+            return None
+        posts = []
+        for item in channel.iter('item'):
+            link = item.findtext('link') or item.findtext('guid') or ''
+            match = _LOG_NO_PATTERN.search(link)
+            posts.append(BlogPostSummary(log_no=match.group(1) if match else '', title=item.findtext('title') or ''))
+        return posts
+
+    def snapshot(self, blog_id: str, log_nos: Iterable[str] = (), titles: Iterable[str] = (),
+                 cookies: Optional[List[dict]] = None, page_size: int = 30,
+                 max_pages: int = 10) -> Optional['PostListSnapshot']:
+        """
+        Read the post list page by page until every wanted post is seen.
+
+        Reading stops early at the last page or once all wanted numbers and
+        titles were listed, so the cost depends on how far back the wanted
+        posts are, not on how many there are.
+
+        Args:
+            blog_id: Blog ID
+            log_nos: Post numbers to look for
+            titles: Titles to look for (for posts without a known number)
+            cookies: Account cookies
+            page_size: Posts per page
+            max_pages: Pages to read at most
+
+        Returns:
+            Snapshot of the pages read, or None if the list could not be read
+        """
+        snapshot = PostListSnapshot()
+        wanted_log_nos = {n for n in log_nos if n}
+        wanted_titles = {_normalize_title(t) for t in titles if t}
+        for page in range(1, max_pages + 1):
+            posts = self.list_posts(blog_id, cookies, count=page_size, page=page)
+            if posts is None:
+                return snapshot if page > 1 else None
+            snapshot.add(posts)
+            snapshot.pages = page
+            if len(posts) < page_size:
+                break
+            if wanted_log_nos <= snapshot.log_nos and wanted_titles <= snapshot.titles:
+                break
+        return snapshot
+
+    def find_post(self, blog_id: str, log_no: Optional[str] = None, title: Optional[str] = None,
+                  cookies: Optional[List[dict]] = None) -> Optional[bool]:
+        """
+        Look for a post by number (preferred) or title.
+
+        Args:
+            blog_id: Blog ID
+            log_no: Post number from the publish response
+            title: Post title (used when the number is unknown)
+            cookies: Account cookies
+
+        Returns:
+            True if listed, False if the lists were read but do not have it,
+            None if neither list could be read
+        """
+        wanted_title = _normalize_title(title)
+        read_any = False
+        for listing in (self.list_posts, self.list_rss):
+            posts = listing(blog_id, cookies)
+            if posts is None:
+                continue
+            read_any = True
+            for post in posts:
+                if log_no and post.log_no == log_no:
+                    return True
+                if not log_no and wanted_title and _normalize_title(post.title) == wanted_title:
+                    return True
+        return False if read_any else None
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+
+@dataclass
+class PostListSnapshot:
+    """Posts seen in one read of a blog's post list."""
+    log_nos: Set[str] = field(default_factory=set)
+    titles: Set[str] = field(default_factory=set)  # normalized
+    pages: int = 0
+
+    def add(self, posts: Iterable[BlogPostSummary]):
+        for post in posts:
+            if post.log_no:
+                self.log_nos.add(post.log_no)
+            self.titles.add(_normalize_title(post.title))
+
+    def contains(self, log_no: Optional[str] = None, title: Optional[str] = None) -> bool:
+        """Whether a post is listed, by number if known, else by title."""
+        if log_no:
+            return log_no in self.log_nos
+        return bool(title) and _normalize_title(title) in self.titles
+
+
+def _parse_post_list(text: str) -> Optional[List[BlogPostSummary]]:
+    """Parse a PostTitleListAsync response (JSON with URL-encoded titles)."""
+    # The endpoint escapes single quotes, which is not valid JSON
+    text = text.replace("\\'", "'")
+    try:
+        data = json.loads(text)
+        items = [(str(p.get('logNo', '')), p.get('title', '')) for p in data.get('postList', [])]
+    except (ValueError, AttributeError):
+        items = _POST_FIELDS_PATTERN.findall(text)
+        if not items and 'postList' not in text:
+            return None
+    return [BlogPostSummary(log_no=log_no, title=unquote_plus(title)) for log_no, title in items]
+
+
+class PostVerifier:
+    """
+    Verifies published posts over HTTP in background threads.
+
+    A freshly published post can take a moment to show up in the lists,
+    so each check polls a few times before giving up.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BlogHttpClient] = None,
+        workers: int = 2,
+        attempts: int = 3,
+        interval: float = 1.5
+    ):
+        """
+        Initialize verifier.
+
+        Args:
+            client: HTTP client, defaults to BlogHttpClient()
+            workers: Checks running at the same time
+            attempts: Polls per check while the post is not listed yet
+            interval: Seconds between polls
+        """
+        self.client = client or BlogHttpClient()
+        self.attempts = max(1, attempts)
+        self.interval = interval
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='verify')
+
+    def check(self, blog_id: str, log_no: Optional[str], title: str,
+              cookies: Optional[List[dict]] = None) -> Optional[bool]:
+        """
+        Check a post now (blocking).
+
+        Returns:
+            True if found, False if not listed after every poll, None if
+            the blog could not be read
+        """
+        found = None
+        for attempt in range(self.attempts):
+            if attempt > 0:
+                time.sleep(self.interval)
+            try:
+                found = self.client.find_post(blog_id, log_no=log_no, title=title, cookies=cookies)
+            except Exception as e:
+                print(f"[WARNING] HTTP verification error: {e}")
+                found = None
+            if found:
+                return True
+        return found
+
+    def submit(self, blog_id: str, log_no: Optional[str], title: str,
+               cookies: Optional[List[dict]] = None) -> 'Future[Optional[bool]]':
+        """Start a check in the background (see check())."""
+        return self._executor.submit(self.check, blog_id, log_no, title, cookies)
+
+    def close(self):
+        """Stop the background threads and close the connections."""
+        self._executor.shutdown(wait=True)
+        self.client.close()
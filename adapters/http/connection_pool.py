@@ -0,0 +1,109 @@
+"""
+Keep-alive HTTP connections to one origin.
+
+A small pool on top of ``http.client`` (no extra dependency): idle
+connections are kept and handed to the next request, so a series of
+requests to the same host pays for the TCP and TLS handshakes once.
+"""
+import gzip
+import http.client
+import queue
+from typing import Dict, Optional, Tuple
+
+
+class ConnectionPool:
+    """Keep-alive connections to one origin, shared by threads."""
+
+    def __init__(self, scheme: str, netloc: str, size: int, timeout: float):
+        """
+        Initialize connection pool.
+
+        Args:
+            scheme: 'http' or 'https'
+            netloc: Host (and port) of the origin
+            size: Idle connections kept at most
+            timeout: Socket timeout in seconds
+        """
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self._idle: 'queue.LifoQueue[http.client.HTTPConnection]' = queue.LifoQueue(maxsize=size)
+        self.created = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        self.created += 1
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def fetch(self, path: str, headers: Dict[str, str],
+              max_bytes: Optional[int] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        GET a path, reusing an idle connection when there is one.
+
+        A reused connection the server already closed is retried once on a
+        fresh connection.
+
+        Args:
+            path: Path and query of the URL
+            headers: Request headers
+            max_bytes: Largest body accepted (None = no limit)
+
+        Returns:
+            (status, response headers with lower-case names, decoded body)
+
+        Raises:
+            ValueError: If the body is larger than max_bytes
+        """
+        for attempt in range(2):
+            try:
+                conn = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                conn = self._connect()
+                reused = False
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                length = response.getheader('Content-Length')
+                if max_bytes is not None and length and length.isdigit() and int(length) > max_bytes:
+                    conn.close()
+                    raise ValueError(f"Response of {length} bytes is larger than {max_bytes}")
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+
+            if response.getheader('Content-Encoding', '') == 'gzip':
+                body = gzip.decompress(body)
+            if response.will_close:
+                conn.close()
+            else:
+                try:
+                    self._idle.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+            if max_bytes is not None and len(body) > max_bytes:
+                raise ValueError(f"Response of {len(body)} bytes is larger than {max_bytes}")
+            return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+        raise ConnectionError(f"Could not reach {self.netloc}")
+
+    def request(self, path: str, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        """
+        GET a path (see fetch()).
+
+        Returns:
+            (status, decoded body)
+        """
+        status, _, body = self.fetch(path, headers)
+        return status, body
+
+    def close(self):
+        """Close the idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
@@ -0,0 +1,12 @@
+"""Image adapters."""
+from .cache import ImageCache, image_extension
+from .fetcher import ImageFetcher
+from .normalize import EDITOR_MAX_WIDTH, ImageNormalizer
+
+__all__ = [
+    'EDITOR_MAX_WIDTH',
+    'ImageCache',
+    'ImageFetcher',
+    'ImageNormalizer',
+    'image_extension',
+]
@@ -0,0 +1,278 @@
+"""
+Content-addressed image cache.
+
+Downloaded images are stored on disk under the SHA-256 of their bytes,
+so the same picture behind different URLs is kept once. A small JSON
+index maps each URL to its file, so a URL that was downloaded before (in
+this run or an earlier one) is not downloaded again.
+
+The cache is bounded by total size: when it grows past ``max_bytes``,
+the least recently used files (by modification time, refreshed on every
+hit) are deleted. Index entries of deleted files are dropped when they
+are next looked up. Files that are pinned (handed out but not uploaded
+yet) are never deleted, so the cache can stay above ``max_bytes`` while
+they are in use.
+
+Several processes (``--jobs``) can share one cache directory. Each
+process saves only its own index changes, merged into the file under a
+lock, and files another process deleted are treated as not cached. The
+size bound is kept per process: each one tracks what it added since it
+last scanned the directory, so with N processes the cache can briefly
+grow past ``max_bytes`` until one of them evicts (and rescans).
+"""
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # not POSIX: index changes are merged without a lock
+    fcntl = None
+
+
+DEFAULT_IMAGE_CACHE_DIR = Path.home() / '.nblog' / 'images'
+DEFAULT_IMAGE_CACHE_BYTES = 512 * 1024 * 1024
+
+# File signature -> extension (the editor picks the upload type from it)
+_SIGNATURES = [
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+    (b'BM', 'bmp'),
+]
+
+
+def image_extension(data: bytes) -> Optional[str]:
+    """
+    Detect the image type from the first bytes.
+
+    Args:
+        data: File content
+
+    Returns:
+        Extension without the dot, or None if the data is not a known image
+    """
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    for signature, extension in _SIGNATURES:
+        if data.startswith(signature):
+            return extension
+    return None
+
+
+class ImageCache:
+    """Images on disk by content hash, with size-bounded LRU eviction."""
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = DEFAULT_IMAGE_CACHE_BYTES):
+        """
+        Initialize image cache.
+
+        Args:
+            root: Cache directory, defaults to ~/.nblog/images
+            max_bytes: Total size of the cached files at most
+        """
+        self.root = Path(root) if root else DEFAULT_IMAGE_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.index_path = self.root / 'urls.json'
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, str]] = None  # URL -> file name
+        self._changes: Dict[str, Optional[str]] = {}  # index changes not saved yet (None = removed)
+        self._size: Optional[int] = None
+        self._pins: Dict[Path, int] = {}  # file -> holders that still need it
+
+    def _objects(self) -> Path:
+        return self.root / 'objects'
+
+    def _read_index(self) -> Dict[str, str]:
+        """Index file content (empty if missing or unreadable)."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[WARNING] Failed to read image cache index: {e}")
+            return {}
+
+    def _load_index(self) -> Dict[str, str]:
+        """URL index (read once, then updated on every save)."""
+        if self._index is None:
+            self._index = self._read_index()
+        return self._index
+
+    def _set_entry(self, url: str, name: Optional[str]):
+        """Change the index (None removes the URL); saved by _save_index()."""
+        if name is None:
+            self._load_index().pop(url, None)
+        else:
+            self._load_index()[url] = name
+        self._changes[url] = name
+
+    def _with_changes(self, index: Dict[str, str]) -> Dict[str, str]:
+        """An index read from the file, with this process's unsaved changes applied."""
+        for url, name in self._changes.items():
+            if name is None:
+                index.pop(url, None)
+            else:
+                index[url] = name
+        return index
+
+    @contextmanager
+    def _index_locked(self):
+        """Hold the index lock shared with other processes."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.root / 'urls.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _save_index(self):
+        """Merge this process's changes into the index file and replace it atomically."""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with self._index_locked():
+                index = self._with_changes(self._read_index())
+                tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(index, f)
+                os.replace(tmp_path, self.index_path)
+            self._index = index
+            self._changes = {}
+        except Exception as e:
+            print(f"[WARNING] Failed to write image cache index: {e}")
+
+    def _file(self, name: str) -> Path:
+        return self._objects() / name[:2] / name
+
+    def get(self, url: str, pin: bool = False) -> Optional[Path]:
+        """
+        Local file of a previously cached URL.
+
+        Args:
+            url: Image URL
+            pin: Keep the file from eviction until unpin()
+
+        Returns:
+            Path of the cached file, or None if the URL is not cached
+        """
+        with self._lock:
+            name = self._load_index().get(url)
+            if not name and url not in self._changes:
+                # Another process may have cached it since the index was read
+                self._index = self._with_changes(self._read_index())
+                name = self._index.get(url)
+            if not name:
+                return None
+            path = self._file(name)
+            try:
+                os.utime(path)  # mark as recently used
+            except OSError:
+                self._set_entry(url, None)
+                return None
+            if pin:
+                self._pin(path)
+            return path
+
+    def put(self, url: str, data: bytes, pin: bool = False) -> Path:
+        """
+        Store the image downloaded from a URL.
+
+        Args:
+            url: Image URL
+            data: Image bytes
+            pin: Keep the file from eviction until unpin()
+
+        Returns:
+            Path of the cached file (shared with any URL of the same image)
+
+        Raises:
+            ValueError: If the data is not an image
+        """
+        extension = image_extension(data)
+        if extension is None:
+            raise ValueError(f"Not an image: {url}")
+        name = f"{hashlib.sha256(data).hexdigest()}.{extension}"
+        path = self._file(name)
+        with self._lock:
+            size = self._total_size()
+            try:
+                os.utime(path)  # already cached (possibly by another process)
+            except OSError:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+                self._size = size + len(data)
+            if pin:
+                self._pin(path)
+            self._set_entry(url, name)
+            self._save_index()
+            self._evict(keep=path)
+        return path
+
+    def _pin(self, path: Path):
+        self._pins[path] = self._pins.get(path, 0) + 1
+
+    def unpin(self, path: Path):
+        """
+        Release one pin of a file (see get() and put()); unknown files are ignored.
+
+        Args:
+            path: File returned by get() or put() with pin=True
+        """
+        with self._lock:
+            count = self._pins.get(Path(path), 0)
+            if count > 1:
+                self._pins[Path(path)] = count - 1
+            else:
+                self._pins.pop(Path(path), None)
+
+    def _scan(self):
+        """(mtime, size, path) of every cached file (files deleted meanwhile are skipped)."""
+        for path in self._objects().glob('*/*'):
+            if path.suffix == '.tmp':
+                continue
+            try:
+                stat = path.stat()
+            except OSError:  # deleted by another process
+                continue
+            yield stat.st_mtime, stat.st_size, path
+
+    def _total_size(self) -> int:
+        """Size of all cached files (scanned once, then tracked)."""
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._scan())
+        return self._size
+
+    def _evict(self, keep: Path):
+        """Delete least recently used files (not pinned) until the cache fits max_bytes."""
+        if self._total_size() <= self.max_bytes:
+            return
+        scanned = list(self._scan())
+        # Rescan: other processes sharing the directory may have added or deleted files
+        self._size = sum(size for _, size, _ in scanned)
+        files = [f for f in scanned if f[2] != keep and f[2] not in self._pins]
+        for _, size, path in sorted(files):
+            if self._size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                self._size -= size
+            except OSError:
+                pass
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached files in bytes."""
+        with self._lock:
+            return self._total_size()
@@ -0,0 +1,218 @@
+"""
+Parallel image downloads into the image cache.
+
+``prefetch()`` starts downloading every image of a batch at once on a
+bounded number of worker threads, over kept-alive connections per host;
+``local_files()`` then waits only for the images of the entry about to
+be posted. Each URL is downloaded at most once per run (later requests
+for it share the first download), and not at all when the cache already
+has it.
+
+Each file handed out stays pinned in the cache, so eviction cannot
+delete it before it is uploaded: ``prefetch()`` and ``local_files()``
+count a use of each URL and ``release()`` gives it back once the post
+is done. With a normalizer, each image is also downscaled and re-encoded
+as soon as it is downloaded, so ``local_files()`` returns the smaller
+copies.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from adapters.http import ConnectionPool
+from adapters.http.blog_client import USER_AGENT
+
+from .cache import ImageCache
+from .normalize import ImageNormalizer
+
+MAX_REDIRECTS = 3
+
+
+class ImageFetcher:
+    """Downloads images concurrently into an ImageCache."""
+
+    def __init__(
+        self,
+        cache: Optional[ImageCache] = None,
+        workers: int = 4,
+        timeout: float = 20.0,
+        max_image_bytes: int = 20 * 1024 * 1024,
+        normalizer: Optional[ImageNormalizer] = None
+    ):
+        """
+        Initialize image fetcher.
+
+        Args:
+            cache: Image cache, defaults to ImageCache()
+            workers: Downloads running at the same time (and connections kept per host)
+            timeout: Socket timeout in seconds
+            max_image_bytes: Largest image accepted
+            normalizer: Re-encodes each downloaded image for upload (None = upload as downloaded)
+        """
+        self.cache = cache or ImageCache()
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.max_image_bytes = max_image_bytes
+        self.normalizer = normalizer
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='image')
+        self._futures: Dict[str, Future] = {}  # URL -> Future of (cache, pinned file)
+        self._uses: Dict[str, int] = {}  # URL -> uses not released yet
+        self._reserved: Dict[str, int] = {}  # URL -> uses counted by prefetch() not claimed yet
+        self._pools: Dict[Tuple[str, str], ConnectionPool] = {}
+        self._lock = threading.Lock()
+        self.downloaded = 0
+        self.cache_hits = 0
+        self.bytes_downloaded = 0
+
+    def prefetch(self, urls: Iterable[str]) -> int:
+        """
+        Start downloading images in the background.
+
+        Args:
+            urls: Image URLs (duplicates are downloaded once)
+
+        Returns:
+            Number of URLs that were not queued yet
+        """
+        queued = 0
+        for url in urls:
+            if not url:
+                continue
+            with self._lock:
+                self._uses[url] = self._uses.get(url, 0) + 1
+                self._reserved[url] = self._reserved.get(url, 0) + 1
+            if self._submit(url)[1]:
+                queued += 1
+        return queued
+
+    def _submit(self, url: str) -> Tuple[Future, bool]:
+        """Future of a URL's download, and whether it was queued just now."""
+        with self._lock:
+            future = self._futures.get(url)
+            if future is not None:
+                return future, False
+            future = self._futures[url] = self._executor.submit(self._fetch, url)
+            return future, True
+
+    def local_file(self, url: str) -> Optional[str]:
+        """
+        Local path of an image, downloading it if needed (blocking).
+
+        The file stays in the cache until the URL is released (see release()).
+
+        Returns:
+            Path, or None if the image could not be downloaded
+        """
+        with self._lock:
+            if self._reserved.get(url, 0) > 0:
+                self._reserved[url] -= 1
+            else:
+                self._uses[url] = self._uses.get(url, 0) + 1
+        try:
+            return str(self._submit(url)[0].result()[1])
+        except Exception as e:
+            print(f"[WARNING] Image download failed: {url} ({e})")
+            return None
+
+    def local_files(self, urls: Iterable[str]) -> List[str]:
+        """Local paths of the images that could be downloaded, in order."""
+        paths = [self.local_file(url) for url in urls if url]
+        return [path for path in paths if path]
+
+    def release(self, urls: Iterable[str]):
+        """
+        Give back one use of each URL (after its post is done).
+
+        A URL without uses left is unpinned, and downloaded again (or taken
+        from the cache) if it is needed later.
+        """
+        for url in urls:
+            if not url:
+                continue
+            with self._lock:
+                uses = self._uses.get(url, 0) - 1
+                if uses > 0:
+                    self._uses[url] = uses
+                    continue
+                self._uses.pop(url, None)
+                self._reserved.pop(url, None)
+                future = self._futures.pop(url, None)
+            if future is not None:
+                future.add_done_callback(self._unpin)
+
+    @staticmethod
+    def _unpin(future: Future):
+        if not future.cancelled() and future.exception() is None:
+            cache, path = future.result()
+            cache.unpin(path)
+
+    def _fetch(self, url: str) -> Tuple[ImageCache, Path]:
+        """Download one image, then normalize it if there is a normalizer (result pinned)."""
+        path = self._download(url)
+        if self.normalizer is not None:
+            normalized = Path(self.normalizer.normalize(str(path), pin=True))
+            if normalized != path:
+                self.cache.unpin(path)
+                return self.normalizer.cache, normalized
+        return self.cache, path
+
+    def _download(self, url: str) -> Path:
+        """Download one image into the cache (cache hits are not downloaded), pinned."""
+        cached = self.cache.get(url, pin=True)
+        if cached is not None:
+            with self._lock:
+                self.cache_hits += 1
+            return cached
+
+        location = url
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(location)
+            if parts.scheme not in ('http', 'https'):
+                raise ValueError(f"Unsupported URL: {location}")
+            path = parts.path or '/'
+            if parts.query:
+                path += f"?{parts.query}"
+            status, headers, body = self._pool(parts.scheme, parts.netloc).fetch(
+                path,
+                {'User-Agent': USER_AGENT, 'Accept': 'image/*', 'Accept-Encoding': 'gzip'},
+                max_bytes=self.max_image_bytes,
+            )
+            if status in (301, 302, 303, 307, 308) and headers.get('location'):
+                location = urljoin(location, headers['location'])
+                continue
+            if status != 200:
+                raise ValueError(f"HTTP {status}")
+            with self._lock:
+                self.downloaded += 1
+                self.bytes_downloaded += len(body)
+            return self.cache.put(url, body, pin=True)
+        raise ValueError("Too many redirects")
+
+    def _pool(self, scheme: str, netloc: str) -> ConnectionPool:
+        with self._lock:
+            pool = self._pools.get((scheme, netloc))
+            if pool is None:
+                pool = self._pools[(scheme, netloc)] = ConnectionPool(
+                    scheme, netloc, self.workers, self.timeout
+                )
+            return pool
+
+    def close(self):
+        """Stop pending downloads and close the connections (and the normalizer)."""
+        for future in self._futures.values():
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            futures, self._futures = list(self._futures.values()), {}
+            self._uses.clear()
+            self._reserved.clear()
+        for future in futures:
+            self._unpin(future)
+        if self.normalizer is not None:
+            self.normalizer.close()
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
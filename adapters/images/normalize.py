@@ -0,0 +1,171 @@
+"""
+Image normalization before upload.
+
+Source images are often multi-megabyte camera photos, far larger than
+the editor ever shows them. ``ImageNormalizer`` re-encodes each image in
+a process pool (decoding and resampling are CPU-bound) before it is
+uploaded: it is scaled down to the editor's widest useful width, its
+metadata (EXIF, GPS, ICC profiles) is dropped, and it is saved again as
+JPEG at a quality target, or as PNG when it has transparency.
+
+Results are kept in an ImageCache of their own, keyed by the SHA-256 of
+the source bytes plus the parameters, so a re-run (or another URL of the
+same picture) skips the work. When the re-encoded image would not be
+smaller, or cannot be decoded, the source is kept as it is.
+
+Pillow is optional: without it images are uploaded unchanged.
+"""
+import hashlib
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from .cache import ImageCache
+
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Widest image the blog shows (wide post layout); larger images are downscaled by the editor anyway
+EDITOR_MAX_WIDTH = 966
+DEFAULT_QUALITY = 85
+
+
+def _has_alpha(image) -> bool:
+    return image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+
+
+def reencode_image(path: str, max_width: int, quality: int) -> Optional[bytes]:
+    """
+    Downscale and re-encode one image file (runs in a worker process).
+
+    Args:
+        path: Source image file
+        max_width: Width in pixels at most
+        quality: JPEG quality (1-95)
+
+    Returns:
+        Re-encoded image, or None to keep the source (animated, or not smaller)
+    """
+    with open(path, 'rb') as f:
+        source = f.read()
+    with Image.open(io.BytesIO(source)) as image:
+        if getattr(image, 'is_animated', False):
+            return None
+        image = ImageOps.exif_transpose(image)  # keep the orientation the EXIF tag asked for
+        resized = image.width > max_width
+        if resized:
+            height = max(1, round(image.height * max_width / image.width))
+            image = image.resize((max_width, height), Image.LANCZOS)
+
+        out = io.BytesIO()
+        if _has_alpha(image):
+            image.save(out, 'PNG', optimize=True)
+        else:
+            image.convert('RGB').save(out, 'JPEG', quality=quality, optimize=True, progressive=True)
+    data = out.getvalue()
+    if not resized and len(data) >= len(source):
+        return None
+    return data
+
+
+class ImageNormalizer:
+    """Re-encodes images for upload in a process pool, with cached results."""
+
+    def __init__(
+        self,
+        cache: ImageCache,
+        max_width: int = EDITOR_MAX_WIDTH,
+        quality: int = DEFAULT_QUALITY,
+        workers: Optional[int] = None
+    ):
+        """
+        Initialize image normalizer.
+
+        Args:
+            cache: Cache for the normalized images (separate from the downloads)
+            max_width: Width in pixels at most
+            quality: JPEG quality (1-95)
+            workers: Worker processes, defaults to the CPU count (at most 4);
+                0 re-encodes in the calling thread
+        """
+        if max_width < 1:
+            raise ValueError("max_width must be at least 1")
+        if not 1 <= quality <= 95:
+            raise ValueError("quality must be between 1 and 95")
+        self.cache = cache
+        self.max_width = max_width
+        self.quality = quality
+        self.workers = min(4, os.cpu_count() or 1) if workers is None else max(0, workers)
+        self.available = PIL_AVAILABLE
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.normalized = 0
+        self.cache_hits = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        if not self.available:
+            print("[WARNING] Pillow is not installed - images are uploaded without normalization")
+
+    def key(self, data: bytes) -> str:
+        """Cache key of a source image under the current parameters."""
+        return f"{hashlib.sha256(data).hexdigest()}:w{self.max_width}:q{self.quality}"
+
+    def normalize(self, path: str, pin: bool = False) -> str:
+        """
+        Normalized copy of an image file (blocking).
+
+        Args:
+            path: Source image file
+            pin: Pin a normalized copy in the cache (see ImageCache.get())
+
+        Returns:
+            Path of the normalized image, or the source path if it is kept
+        """
+        if not self.available:
+            return path
+        with open(path, 'rb') as f:
+            source = f.read()
+        key = self.key(source)
+        cached = self.cache.get(key, pin=pin)
+        if cached is not None:
+            with self._lock:
+                self.cache_hits += 1
+            return str(cached)
+
+        try:
+            data = self._reencode(path)
+        except Exception as e:
+            print(f"[WARNING] Image normalization failed, uploading the original: {path} ({e})")
+            return path
+        # Kept sources are cached too, so a re-run does not decode them again
+        result = self.cache.put(key, data if data is not None else source, pin=pin)
+        with self._lock:
+            self.normalized += 1
+            self.bytes_in += len(source)
+            self.bytes_out += len(data) if data is not None else len(source)
+        return str(result)
+
+    def _reencode(self, path: str) -> Optional[bytes]:
+        if self.workers == 0:
+            return reencode_image(path, self.max_width, self.quality)
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that runs browser and download threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            future: Future = self._executor.submit(reencode_image, path, self.max_width, self.quality)
+        return future.result()
+
+    def close(self):
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
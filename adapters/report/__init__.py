@@ -1,4 +1,11 @@
 """Report generation adapters."""
 from .reporter import Reporter, create_reporter
+from .stream import JsonlReportWriter, read_report, summarize_report
 
-__all__ = ['Reporter', 'create_reporter']
+__all__ = [
+    'Reporter',
+    'create_reporter',
+    'JsonlReportWriter',
+    'read_report',
+    'summarize_report',
+]
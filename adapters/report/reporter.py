@@ -3,6 +3,7 @@ Report generation adapter.
 
 Generates execution reports in various formats:
 - JSON file
+- Streaming JSONL file (written as results arrive)
 - Console output
 - Summary statistics
 """
@@ -14,6 +15,7 @@ from typing import Optional, TextIO
 
 from core.models import BatchPostResult, PostResult
 from core.validation import ValidationResult
+from .stream import JsonlReportWriter
 
 
 class Reporter:
@@ -21,16 +23,23 @@ class Reporter:
     Generates and outputs execution reports.
     """
 
-    def __init__(self, output_file: Optional[str] = None, quiet: bool = False):
+    def __init__(
+        self,
+        output_file: Optional[str] = None,
+        quiet: bool = False,
+        stream: Optional[JsonlReportWriter] = None
+    ):
         """
         Initialize reporter.
 
         Args:
             output_file: Optional path for JSON report output
             quiet: If True, minimize console output
+            stream: Optional JsonlReportWriter for a streaming report
         """
         self.output_file = output_file
         self.quiet = quiet
+        self.stream = stream
         self._start_time: Optional[datetime] = None
 
     def start(self):
@@ -94,7 +103,8 @@ class Reporter:
         print(f"    Status: {status}")
 
         if result.error_message:
-            print(f"    Error: {result.error_message}")
+            kind = f" ({result.failure_kind})" if result.failure_kind else ""
+            print(f"    Error: {result.error_message}{kind}")
         if result.post_url:
             print(f"    URL: {result.post_url}")
 
@@ -119,14 +129,29 @@ class Reporter:
         print(f"  Failed:     {result.failed}")
         print(f"  Skipped:    {result.skipped}")
         print(f"  Duration:   {duration}")
+        if result.bytes_received:
+            per_post = result.bytes_received / max(result.total, 1)
+            print(f"  Received:   {result.bytes_received / 1e6:.1f} MB ({per_post / 1e3:.0f} KB per post)")
+        if result.pacing:
+            print(f"  Pacing:     {result.pacing['rate_per_minute']} posts/min per account "
+                  f"({result.pacing['increases']} up, {result.pacing['decreases']} down)")
         print("=" * 60)
 
         # Summary of failed
-        if result.failed > 0:
+        if result.failed > 0 and result.keep_results:
             print("\nFailed entries:")
             for r in result.results:
                 if not r.success:
-                    print(f"  [{r.entry.index}] {r.entry.sns_id}: {r.error_message}")
+                    kind = f"[{r.failure_kind}] " if r.failure_kind else ""
+                    print(f"  [{r.entry.index}] {r.entry.sns_id}: {kind}{r.error_message}")
+        elif result.failed > 0 and self.stream:
+            print(f"\nFailed entries are listed in: {self.stream.path}")
+
+        # Close the streaming report with its summary record
+        if self.stream:
+            self.stream.add_skipped(result.skipped)
+            self.stream.finish({'pacing': result.pacing} if result.pacing else None)
+            print(f"\n[INFO] Streaming report written to: {self.stream.path}")
 
         # Write JSON report if output file specified
         if self.output_file:
@@ -227,15 +252,27 @@ class Reporter:
         print("\n" + "=" * 60)
 
 
-def create_reporter(output_file: Optional[str] = None, quiet: bool = False) -> Reporter:
+def create_reporter(
+    output_file: Optional[str] = None,
+    quiet: bool = False,
+    jsonl_file: Optional[str] = None,
+    fsync: str = 'interval',
+    rotate_bytes: Optional[int] = None
+) -> Reporter:
     """
     Factory function to create a reporter.
 
     Args:
         output_file: Optional path for JSON report
         quiet: Minimize console output
+        jsonl_file: Optional path for a streaming JSONL report
+        fsync: fsync policy of the JSONL report ('always', 'interval', 'never')
+        rotate_bytes: Rotate and gzip the JSONL report past this size
 
     Returns:
         Reporter instance
     """
-    return Reporter(output_file=output_file, quiet=quiet)
+    stream = None
+    if jsonl_file:
+        stream = JsonlReportWriter(jsonl_file, fsync=fsync, rotate_bytes=rotate_bytes)
+    return Reporter(output_file=output_file, quiet=quiet, stream=stream)
@@ -0,0 +1,238 @@
+"""
+Streaming JSONL report writer.
+
+Appends one JSON line per post result as soon as it is known, instead of
+serializing the whole batch at the end. The summary is built from running
+counters, so memory use does not grow with the batch size, and a crash
+leaves every result written so far on disk.
+
+Record types (field ``record``):
+- ``started``: the report was opened
+- ``result``: one ``PostResult.to_dict()``
+- ``summary``: final counters, written by ``finish()``
+
+With ``rotate_bytes`` set, a full file is renamed to ``<path>.<n>`` and
+gzip-compressed to ``<path>.<n>.gz``; ``read_report`` reads the rotated
+parts and the live file in order.
+"""
+import gzip
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from core.models import PostResult
+
+
+FSYNC_POLICIES = ('always', 'interval', 'never')
+
+
+class JsonlReportWriter:
+    """
+    Append-only JSONL report with running counters.
+
+    Every record is flushed to the OS immediately, so a crash of this
+    process loses nothing; ``fsync`` controls durability against power
+    loss or kernel crashes:
+
+    - ``always``: fsync after every record
+    - ``interval``: fsync at most every ``fsync_interval`` seconds
+    - ``never``: leave it to the OS
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync: str = 'interval',
+        fsync_interval: float = 1.0,
+        rotate_bytes: Optional[int] = None
+    ):
+        """
+        Initialize report writer.
+
+        Args:
+            path: Path of the JSONL report
+            fsync: 'always', 'interval' or 'never'
+            fsync_interval: Seconds between fsyncs for the 'interval' policy
+            rotate_bytes: Rotate and gzip the file once it exceeds this size
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+
+        self.path = Path(path)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.rotate_bytes = rotate_bytes
+        self.total = 0
+        self.successful = 0
+        self.failed = 0
+        self.skipped = 0
+        self._file = None
+        self._size = 0
+        self._last_fsync = 0.0
+        self._rotations = 0
+        self._start_time: Optional[datetime] = None
+
+    def open(self):
+        """
+        Start a new report, replacing any previous file and rotated parts.
+
+        Called automatically by the first write.
+        """
+        for part in _rotated_parts(self.path):
+            part.unlink()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._size = 0
+        self._start_time = datetime.now()
+        self._append({'record': 'started', 'timestamp': self._start_time.isoformat()})
+
+    def write_result(self, result: PostResult):
+        """Append one post result and update the counters."""
+        self.total += 1
+        if result.success:
+            self.successful += 1
+        else:
+            self.failed += 1
+        self._append({'record': 'result', **result.to_dict()})
+
+    def add_skipped(self, count: int = 1):
+        """Count entries skipped without a result (e.g. on resume)."""
+        self.skipped += count
+
+    def summary(self) -> dict:
+        """Current counters in the same shape as BatchPostResult.to_dict()."""
+        return {
+            'total': self.total,
+            'successful': self.successful,
+            'failed': self.failed,
+            'skipped': self.skipped,
+        }
+
+    def finish(self, extra: Optional[dict] = None):
+        """
+        Write the summary record, fsync and close the file.
+
+        Args:
+            extra: Additional summary fields (e.g. final pacing state)
+        """
+        duration = None
+        if self._start_time:
+            duration = (datetime.now() - self._start_time).total_seconds()
+        if self._file is None:
+            self.open()
+        self._append({
+            'record': 'summary',
+            'timestamp': datetime.now().isoformat(),
+            'duration_seconds': duration,
+            **self.summary(),
+            **(extra or {}),
+        }, force_fsync=True)
+        self._file.close()
+        self._file = None
+
+    def _append(self, record: dict, force_fsync: bool = False):
+        """Write one line, flush, and fsync/rotate according to the policy."""
+        if self._file is None:
+            self.open()
+
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        self._file.write(line)
+        self._file.flush()
+        self._size += len(line.encode('utf-8'))
+
+        now = time.monotonic()
+        if force_fsync or self.fsync == 'always' or (
+            self.fsync == 'interval' and now - self._last_fsync >= self.fsync_interval
+        ):
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+
+        if self.rotate_bytes and self._size >= self.rotate_bytes and record['record'] != 'summary':
+            self._rotate()
+
+    def _rotate(self):
+        """Move the current file to a gzip part and continue in a new file."""
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+        self._rotations += 1
+        rotated = self.path.with_name(f"{self.path.name}.{self._rotations}")
+        os.replace(self.path, rotated)
+        with open(rotated, 'rb') as src, gzip.open(f"{rotated}.gz", 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        rotated.unlink()
+
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._size = 0
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.finish()
+
+
+def _rotated_parts(path: Path) -> List[Path]:
+    """Rotated gzip parts of a report, oldest first."""
+    parts = []
+    for part in path.parent.glob(f"{path.name}.*.gz"):
+        number = part.name[len(path.name) + 1:-len('.gz')]
+        if number.isdigit():
+            parts.append((int(number), part))
+    return [part for _, part in sorted(parts)]
+
+
+def read_report(path: str) -> Iterator[dict]:
+    """
+    Read every record of a (possibly rotated or partial) JSONL report.
+
+    Lines that do not parse, such as a line cut short by a crash, are
+    skipped.
+
+    Args:
+        path: Path of the JSONL report
+
+    Yields:
+        Record dicts in write order
+    """
+    path = Path(path)
+    sources = [gzip.open(part, 'rt', encoding='utf-8') for part in _rotated_parts(path)]
+    if path.exists():
+        sources.append(open(path, 'r', encoding='utf-8'))
+
+    for source in sources:
+        with source:
+            for line in source:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def summarize_report(path: str) -> dict:
+    """
+    Rebuild the counters of a report, including one that never finished.
+
+    Args:
+        path: Path of the JSONL report
+
+    Returns:
+        Dict with total, successful, failed, skipped and ``complete``
+        (True if the summary record was written)
+    """
+    summary = {'total': 0, 'successful': 0, 'failed': 0, 'skipped': 0, 'complete': False}
+    for record in read_report(path):
+        if record.get('record') == 'result':
+            summary['total'] += 1
+            summary['successful' if record.get('success') else 'failed'] += 1
+        elif record.get('record') == 'summary':
+            summary['skipped'] = record.get('skipped', 0)
+            summary['complete'] = True
+    return summary
@@ -6,6 +6,12 @@ from .orchestrator import (
     BatchPostingOrchestrator,
     create_orchestrator,
 )
+from .journal import PostingJournal, JournalState, hash_input_file
+from .events import EventBus, JsonlEventSink, create_event_bus
+from .circuit import AccountCircuitBreaker
+from .pacing import PacingController, TokenBucket, create_pacer
+from .pipeline import EntryPreparer, IdleWindowRunner, PreparedPost, prepare_post
+from .scheduler import InterleavedScheduler
 
 __all__ = [
     'PostingConfig',
@@ -13,4 +19,19 @@ __all__ = [
     'WriterConfig',
     'BatchPostingOrchestrator',
     'create_orchestrator',
+    'PostingJournal',
+    'JournalState',
+    'hash_input_file',
+    'EventBus',
+    'JsonlEventSink',
+    'create_event_bus',
+    'AccountCircuitBreaker',
+    'PacingController',
+    'TokenBucket',
+    'create_pacer',
+    'EntryPreparer',
+    'IdleWindowRunner',
+    'PreparedPost',
+    'prepare_post',
+    'InterleavedScheduler',
 ]
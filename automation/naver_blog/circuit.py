@@ -0,0 +1,94 @@
+"""
+Per-account circuit breaker for batch posting.
+
+Stops posting to an account once it is clearly broken, instead of running
+every remaining entry through the full retry cycle:
+
+- ``auth`` or ``captcha`` failures open the circuit immediately
+- ``failure_threshold`` consecutive failures of any kind open it
+- transient failures (rate limit, network, browser crash) are followed by
+  an exponential backoff with jitter before the next entry
+"""
+import random
+from typing import Callable, Optional
+
+from core.models import PostResult, ACCOUNT_FATAL_FAILURES, FAILURE_UNKNOWN, is_transient
+
+
+class AccountCircuitBreaker:
+    """
+    Failure tracker for the entries of one account.
+
+    Feed every result to ``record()``; it returns how long to wait before
+    the next entry. Once ``is_open`` is True, the remaining entries should
+    fail fast with ``open_reason`` as their failure kind.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        backoff_base: float = 5.0,
+        backoff_max: float = 120.0,
+        rng: Optional[Callable[[], float]] = None
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (0 = never)
+            backoff_base: Backoff after the first transient failure in seconds
+            backoff_max: Upper bound of the backoff in seconds
+            rng: Source of uniform [0, 1) numbers for the jitter
+        """
+        self.failure_threshold = failure_threshold
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rng = rng or random.random
+        self.consecutive_failures = 0
+        self.transient_failures = 0
+        self.open_reason = ""
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the remaining entries of the account should be skipped."""
+        return bool(self.open_reason)
+
+    def record(self, result: PostResult) -> float:
+        """
+        Record a post result.
+
+        Args:
+            result: Result of the entry just posted
+
+        Returns:
+            Seconds to wait before the next entry (0 if no backoff applies)
+        """
+        if result.success:
+            self.consecutive_failures = 0
+            self.transient_failures = 0
+            return 0.0
+
+        self.consecutive_failures += 1
+        kind = result.failure_kind or FAILURE_UNKNOWN
+        if kind in ACCOUNT_FATAL_FAILURES or (
+            self.failure_threshold and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.open_reason = kind
+            return 0.0
+
+        if not is_transient(kind):
+            self.transient_failures = 0
+            return 0.0
+
+        self.transient_failures += 1
+        return self.backoff_delay(self.transient_failures)
+
+    def backoff_delay(self, failures: int) -> float:
+        """
+        Exponential backoff with jitter for the n-th transient failure in a row.
+
+        The delay is drawn from the upper half of ``[0, base * 2**(n-1)]``
+        (capped at ``backoff_max``), so workers backing off together spread out.
+        """
+        cap = min(self.backoff_max, self.backoff_base * (2 ** (failures - 1)))
+        return cap / 2 + self.rng() * cap / 2
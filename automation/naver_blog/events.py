@@ -0,0 +1,189 @@
+"""
+Structured progress events.
+
+The orchestrator publishes machine-readable events to an ``EventBus``;
+subscribers are plain callables that receive one dict per event. The
+bundled ``JsonlEventSink`` writes them as line-buffered JSONL so
+dashboards and alerting can follow a batch live.
+
+Every event has ``ts`` (ISO timestamp), ``event`` and ``pid``; timed
+events (``*_finished``) add ``duration_ms``.
+
+Event types:
+- ``batch_started`` / ``batch_finished``
+- ``account_login_started`` / ``account_login_finished``
+- ``post_step_started`` / ``post_step_finished`` (``step``, ``attempt``)
+- ``post_succeeded`` / ``post_failed``
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Union
+
+
+Subscriber = Callable[[dict], None]
+
+
+class EventBus:
+    """
+    Fan-out of progress events to subscribers.
+
+    A subscriber that raises is reported and skipped; it never interrupts
+    posting. With no subscribers, emitting is a no-op.
+    """
+
+    def __init__(self):
+        """Initialize event bus."""
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, subscriber: Subscriber) -> Subscriber:
+        """
+        Add a subscriber.
+
+        Args:
+            subscriber: Callable receiving each event dict
+
+        Returns:
+            The subscriber, for later unsubscribe()
+        """
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        """Remove a subscriber (no-op if it is not subscribed)."""
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def emit(self, event: str, **fields) -> dict:
+        """
+        Build and publish an event.
+
+        Args:
+            event: Event type, e.g. 'post_succeeded'
+            **fields: Event payload (JSON-serializable)
+
+        Returns:
+            The published event dict
+        """
+        record = {
+            'ts': datetime.now().isoformat(),
+            'event': event,
+            'pid': os.getpid(),
+            **fields,
+        }
+        self.publish(record)
+        return record
+
+    def publish(self, record: dict):
+        """Deliver an already-built event (e.g. forwarded from a worker)."""
+        if not self._subscribers:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber(record)
+            except Exception as e:
+                print(f"[WARNING] Event subscriber failed: {e}")
+
+    def close(self):
+        """Close every subscriber that has a close() method."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            close = getattr(subscriber, 'close', None)
+            if close:
+                close()
+
+    @contextmanager
+    def span(self, name: str, **fields) -> Iterator[Dict]:
+        """
+        Emit ``<name>_started`` now and ``<name>_finished`` on exit.
+
+        The yielded dict is merged into the finished event, so callers can
+        attach outcomes (e.g. ``span['success'] = True``). An exception
+        marks the span with ``error`` and is re-raised.
+
+        Args:
+            name: Span name, e.g. 'account_login'
+            **fields: Fields included in both events
+        """
+        self.emit(f'{name}_started', **fields)
+        outcome: Dict = {}
+        started = time.monotonic()
+        try:
+            yield outcome
+        except Exception as e:
+            outcome.setdefault('success', False)
+            outcome['error'] = str(e)
+            raise
+        finally:
+            self.emit(
+                f'{name}_finished',
+                **{**fields, **outcome},
+                duration_ms=round((time.monotonic() - started) * 1000, 1),
+            )
+
+
+class JsonlEventSink:
+    """
+    Subscriber writing events as JSONL.
+
+    Each event is written as one line and flushed immediately. Writes are
+    serialized with a lock so threads never interleave lines.
+    """
+
+    def __init__(self, target: Union[str, int]):
+        """
+        Initialize sink.
+
+        Args:
+            target: File path (appended to), an open file descriptor, or
+                'fd:N' for descriptor N
+        """
+        if isinstance(target, str) and target.startswith('fd:'):
+            target = int(target[3:])
+
+        if isinstance(target, int):
+            self._stream = os.fdopen(target, 'a', buffering=1, encoding='utf-8', closefd=False)
+        else:
+            self._stream = open(target, 'a', buffering=1, encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict):
+        """Write one event."""
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            self._stream.write(line)
+            self._stream.flush()
+
+    def close(self):
+        """Close the underlying stream (descriptors passed in stay open)."""
+        with self._lock:
+            self._stream.close()
+
+
+def create_event_bus(events_target: Union[str, int, None] = None) -> EventBus:
+    """
+    Factory function to create an event bus.
+
+    Args:
+        events_target: Optional JSONL destination (path, fd or 'fd:N')
+
+    Returns:
+        EventBus, with a JsonlEventSink subscribed if a target was given
+    """
+    bus = EventBus()
+    if events_target is not None:
+        bus.subscribe(JsonlEventSink(events_target))
+    return bus
@@ -0,0 +1,213 @@
+"""
+Crash-safe posting journal.
+
+An append-only JSONL file that records, per input file, which entries
+were started and how they finished. Every record is written with a single
+``write`` on an ``O_APPEND`` descriptor and fsync'd before returning, so the
+journal survives crashes (OOM-killed Chrome, SSH drops, Ctrl-C) and can be
+shared by parallel worker processes.
+
+Journals are keyed by the SHA-256 of the input file; entries are keyed by
+their ``index`` in the input array.
+
+Record types:
+- ``batch_started``: a new (or resumed) run began
+- ``publishing``: an entry is about to be published
+- ``completed`` / ``failed``: the final outcome for an entry
+- ``unverified``: the entry was published but could not be verified; it
+  stays in flight, so a resumed run checks the blog before posting it again
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Set
+
+from core.models import BlogPostEntry, PostResult
+
+
+DEFAULT_JOURNAL_DIR = Path.home() / '.nblog' / 'journals'
+
+
+def hash_input_file(path: str) -> str:
+    """
+    Compute the SHA-256 of an input file.
+
+    Args:
+        path: Path to the JSON input file
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class JournalState:
+    """State reconstructed from an existing journal."""
+    completed: Set[int] = field(default_factory=set)
+    failed: Set[int] = field(default_factory=set)
+    in_flight: Set[int] = field(default_factory=set)  # started but no outcome recorded
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.completed or self.failed or self.in_flight)
+
+
+class PostingJournal:
+    """
+    Append-only, fsync'd journal of posting progress.
+
+    The journal holds no open file handles, so it can be pickled and handed
+    to worker processes.
+    """
+
+    def __init__(self, path: str, input_hash: str = ""):
+        """
+        Initialize journal.
+
+        Args:
+            path: Path of the JSONL journal file
+            input_hash: SHA-256 of the input file the journal belongs to
+        """
+        self.path = Path(path)
+        self.input_hash = input_hash
+
+    @classmethod
+    def for_input_file(
+        cls,
+        input_file: str,
+        journal_dir: Optional[str] = None
+    ) -> 'PostingJournal':
+        """
+        Create the journal for an input file.
+
+        Args:
+            input_file: Path to the JSON input file
+            journal_dir: Directory for journals, defaults to ~/.nblog/journals
+
+        Returns:
+            PostingJournal located at <journal_dir>/<input hash>.jsonl
+        """
+        input_hash = hash_input_file(input_file)
+        directory = Path(journal_dir) if journal_dir else DEFAULT_JOURNAL_DIR
+        return cls(str(directory / f"{input_hash}.jsonl"), input_hash=input_hash)
+
+    def _append(self, record: dict):
+        """Durably append one record."""
+        record = {'ts': datetime.now().isoformat(), **record}
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def load(self) -> JournalState:
+        """
+        Replay the journal.
+
+        A truncated last line (crash mid-write) is ignored.
+
+        Returns:
+            JournalState with completed, failed and in-flight entry indexes
+        """
+        state = JournalState()
+        if not self.path.exists():
+            return state
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                index = record.get('index')
+                event = record.get('event')
+                if index is None:
+                    continue
+
+                if event == 'publishing':
+                    state.in_flight.add(index)
+                    state.failed.discard(index)
+                elif event == 'completed':
+                    state.in_flight.discard(index)
+                    state.failed.discard(index)
+                    state.completed.add(index)
+                elif event == 'unverified':
+                    state.in_flight.add(index)
+                    state.failed.discard(index)
+                elif event == 'failed':
+                    state.in_flight.discard(index)
+                    if index not in state.completed:
+                        state.failed.add(index)
+
+        return state
+
+    def start(self, resume: bool = False) -> JournalState:
+        """
+        Begin a run.
+
+        Args:
+            resume: Keep existing records and return their state.
+                If False, any previous journal for this input is discarded.
+
+        Returns:
+            JournalState to resume from (empty for a fresh run)
+        """
+        if resume:
+            state = self.load()
+        else:
+            state = JournalState()
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+        self._append({
+            'event': 'batch_started',
+            'input_hash': self.input_hash,
+            'resume': resume,
+        })
+        return state
+
+    def record_publishing(self, entry: BlogPostEntry):
+        """Record that an entry is about to be published."""
+        self._append({
+            'event': 'publishing',
+            'index': entry.index,
+            'sns_id': entry.sns_id,
+            'blog_title': entry.sns_upload_cont.blog_title,
+        })
+
+    def record_result(self, result: PostResult, published: bool = False):
+        """
+        Record the final outcome of an entry.
+
+        Args:
+            result: Outcome of the entry
+            published: A failed entry was published (only its verification
+                failed), so it is recorded as unverified instead of failed
+        """
+        if result.success:
+            event = 'completed'
+        else:
+            event = 'unverified' if published else 'failed'
+        self._append({
+            'event': event,
+            'index': result.entry.index,
+            'sns_id': result.entry.sns_id,
+            'error_message': result.error_message,
+            'post_url': result.post_url,
+            'failure_kind': result.failure_kind,
+        })
@@ -7,15 +7,45 @@ Handles the complete workflow of posting multiple blog entries:
 3. Track results
 4. Handle errors and retries
 """
+import multiprocessing
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Callable
+from typing import Any, Dict, Iterator, List, Optional, Callable, Set, Tuple
 
-from core.models import BlogPostEntry, PostResult, BatchPostResult
-from core.rendering import render_content
+from core.models import (
+    BlogPostEntry,
+    PostResult,
+    BatchPostResult,
+    FAILURE_AUTH,
+    FAILURE_BROWSER_CRASH,
+    FAILURE_NETWORK,
+    FAILURE_SELECTOR_DRIFT,
+    FAILURE_UNKNOWN,
+    classify_error,
+)
 from adapters.secrets import CredentialManager, ResolvedCredentials
-from adapters.browser import BrowserAdapter, BrowserConfig
+from adapters.browser import (
+    BrowserAdapter,
+    BrowserConfig,
+    BrowserContextHost,
+    BrowserPool,
+    EditorUrlCache,
+    SessionCache,
+)
+from adapters.http import PostVerifier, cookies_from_driver
+from adapters.images import EDITOR_MAX_WIDTH, ImageCache, ImageFetcher, ImageNormalizer
+from adapters.report import JsonlReportWriter
+from .circuit import AccountCircuitBreaker
+from .events import EventBus
+from .journal import PostingJournal
+from .pacing import PacingController, PacingManager, create_pacer
+from .pipeline import EntryPreparer, IdleWindowRunner, PreparedPost, prepare_post
+from .scheduler import InterleavedScheduler
 
 
 @dataclass
@@ -26,6 +56,62 @@ class PostingConfig:
     delay_between_accounts: float = 10.0  # seconds
     headless: bool = True
     writer_mode: str = 'cdp'  # 'cdp' or 'selenium'
+    jobs: int = 1  # number of accounts posted in parallel worker processes
+    reuse_sessions: bool = True  # restore cached login cookies instead of logging in
+    session_cache_dir: Optional[str] = None  # defaults to ~/.nblog/sessions
+    reuse_editor_urls: bool = True  # open each blog's cached editor URL directly
+    editor_url_cache_path: Optional[str] = None  # defaults to ~/.nblog/editor_urls.json
+    browser_pool_size: int = 0  # warm browsers reused across accounts (0 = one fresh browser per account)
+    browser_max_uses: int = 20  # accounts served by a pooled browser before it is replaced
+    keep_results: bool = True  # keep every PostResult in memory (False with a streaming report)
+    failure_threshold: int = 3  # consecutive failures that stop an account (0 = never)
+    backoff_base: float = 5.0  # seconds of backoff after the first transient failure
+    backoff_max: float = 120.0  # upper bound of the transient-failure backoff
+    pacing: str = 'fixed'  # 'fixed' (the delays above) or 'adaptive' (AIMD token buckets)
+    pacing_min_rate: float = 0.5  # adaptive pacing floor, posts per minute per account
+    pacing_max_rate: float = 30.0  # adaptive pacing ceiling, posts per minute per account
+    pipeline: bool = True  # prepare, verify and log in ahead during the delays between posts
+    sessions: int = 1  # accounts logged in at once and posted interleaved in this process
+    browser_contexts: bool = False  # one shared browser, an isolated context per account
+    draft_tabs: int = 1  # editor tabs per account (> 1 drafts the next entry in a background tab)
+    preload_editor: bool = False  # load the next entry's editor in a background tab while posting
+    http_verify: bool = False  # verify posts over HTTP in the background (browser check as fallback)
+    verify_batch: bool = False  # verify an account's posts together against its post list at the end
+    blocked_urls: Tuple[str, ...] = ()  # URL patterns the browser does not load (adapters.browser.resource_blocking)
+    upload_images: bool = False  # download the entries' images and upload them with the post (CDP writer)
+    image_cache_dir: Optional[str] = None  # None = ~/.nblog/images
+    image_cache_mb: int = 512  # size of the image cache before least recently used images are dropped
+    image_workers: int = 4  # concurrent image downloads
+    normalize_images: bool = False  # downscale and re-encode images before upload (needs Pillow)
+    image_max_width: int = EDITOR_MAX_WIDTH  # width of normalized images at most
+    image_quality: int = 85  # JPEG quality of normalized images
+
+
+# error_message of a post that was published but could not be verified
+POST_UNVERIFIED = "Published but not verified"
+
+# Failure kind of a writer step that failed without a more specific cause
+STEP_FAILURE_KINDS = {
+    'navigate': FAILURE_NETWORK,
+    'title': FAILURE_SELECTOR_DRIFT,
+    'content': FAILURE_SELECTOR_DRIFT,
+    'open_popup': FAILURE_SELECTOR_DRIFT,
+    'configure': FAILURE_SELECTOR_DRIFT,
+    'publish': FAILURE_SELECTOR_DRIFT,
+    'verify': FAILURE_NETWORK,
+}
+
+
+@dataclass
+class AccountSession:
+    """A browser logged in (or not) to one account."""
+    driver: Any = None
+    adapter: Optional[BrowserAdapter] = None  # set for a fresh browser
+    pooled: Any = None  # PooledBrowser when taken from the pool
+    context: Any = None  # BrowserContext when hosted in the shared browser
+    logged_in: bool = False
+    failure_kind: str = ""  # login failure kind when not logged in
+    error: str = ""  # browser start or login error
 
 
 @dataclass
@@ -62,7 +148,10 @@ class BatchPostingOrchestrator:
         self,
         credential_manager: CredentialManager,
         config: Optional[PostingConfig] = None,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        journal: Optional[PostingJournal] = None,
+        events: Optional[EventBus] = None,
+        report_writer: Optional[JsonlReportWriter] = None
     ):
         """
         Initialize orchestrator.
@@ -71,11 +160,44 @@ class BatchPostingOrchestrator:
             credential_manager: CredentialManager for password resolution
             config: PostingConfig for posting behavior
             progress_callback: Optional callback(current, total, message) for progress
+            journal: Optional PostingJournal recording progress for --resume
+            events: Optional EventBus receiving structured progress events
+            report_writer: Optional JsonlReportWriter receiving each result as it arrives
         """
         self.credential_manager = credential_manager
         self.config = config or PostingConfig()
         self.progress_callback = progress_callback
-        self._browser_adapter: Optional[BrowserAdapter] = None
+        self.journal = journal
+        self.events = events or EventBus()
+        self.report_writer = report_writer
+        # Monotonic start time of each entry being posted, for post_* durations
+        self._post_started: Dict[int, float] = {}
+        # Entries that were mid-publish when a previous run crashed
+        self._recheck_indexes: Set[int] = set()
+        # Failure kind of the last failed _login() call
+        self._login_failure = FAILURE_UNKNOWN
+        # Serializes logins (the next account may log in from a background thread)
+        self._login_lock = threading.Lock()
+        # Adaptive pacing (None: fixed delays); shared across workers in parallel runs
+        self.pacer: Optional[PacingController] = create_pacer(self.config, concurrency=max(1, self.config.sessions))
+        self._pacing_rate: Optional[float] = None
+        # Published posts whose verification was deferred: index -> (writer, title)
+        self._pending_verifications: Dict[int, Tuple[Any, str]] = {}
+        self.session_cache: Optional[SessionCache] = None
+        self._browser_pool: Optional[BrowserPool] = None
+        # Shared browser hosting one context per account (browser_contexts)
+        self._context_host: Optional[BrowserContextHost] = None
+        if self.config.reuse_sessions:
+            self.session_cache = SessionCache(cache_dir=self.config.session_cache_dir)
+        # driver -> TrafficMeter counting the bytes the browser received
+        self._traffic_meters: Dict[Any, Any] = {}
+        # Image downloads (upload_images), started on first use
+        self.images: Optional[ImageFetcher] = None
+        # Background HTTP verification (http_verify), started on first use
+        self.http_verifier: Optional[PostVerifier] = None
+        self.editor_url_cache: Optional[EditorUrlCache] = None
+        if self.config.reuse_editor_urls:
+            self.editor_url_cache = EditorUrlCache(path=self.config.editor_url_cache_path)
 
     def _report_progress(self, current: int, total: int, message: str):
         """Report progress to callback if set."""
@@ -87,7 +209,8 @@ class BatchPostingOrchestrator:
         self,
         entries: List[BlogPostEntry],
         filter_email: Optional[str] = None,
-        account_index: Optional[int] = None
+        account_index: Optional[int] = None,
+        resume: bool = False
     ) -> BatchPostResult:
         """
         Post all entries (or filtered subset).
@@ -96,14 +219,31 @@ class BatchPostingOrchestrator:
             entries: List of BlogPostEntry to post
             filter_email: Only post entries matching this email
             account_index: Only post entry at this index
+            resume: Skip entries the journal records as completed and
+                re-check entries that were mid-publish before retrying them
 
         Returns:
             BatchPostResult with all posting results
         """
-        result = BatchPostResult()
+        result = BatchPostResult(keep_results=self.config.keep_results)
 
         # Filter entries if requested
         filtered_entries = self._filter_entries(entries, filter_email, account_index)
+
+        if self.journal:
+            state = self.journal.start(resume=resume)
+            if resume and not state.is_empty:
+                remaining = []
+                for entry in filtered_entries:
+                    if entry.index in state.completed:
+                        result.add_skipped()
+                    else:
+                        remaining.append(entry)
+                print(f"[INFO] Resuming: {result.skipped} completed entries skipped, "
+                      f"{len(state.in_flight)} will be re-checked before retrying")
+                filtered_entries = remaining
+                self._recheck_indexes = set(state.in_flight)
+
         total = len(filtered_entries)
 
         if total == 0:
@@ -113,41 +253,382 @@ class BatchPostingOrchestrator:
         # Group by account for efficient login handling
         by_account = self._group_by_account(filtered_entries)
 
-        current = 0
-        for sns_id, account_entries in by_account.items():
-            self._report_progress(current, total, f"Processing account: {sns_id}")
-
-            # Resolve credentials
-            creds = self.credential_manager.resolve_password(account_entries[0])
-            if not creds.sns_pw:
-                # Skip entries without credentials
-                for entry in account_entries:
-                    post_result = PostResult(
-                        entry=entry,
-                        success=False,
-                        error_message="No credentials available",
-                        timestamp=datetime.now().isoformat()
+        started = time.monotonic()
+        self.events.emit(
+            'batch_started',
+            total=total,
+            accounts=len(by_account),
+            jobs=self.config.jobs,
+            resume=resume,
+            skipped=result.skipped,
+        )
+
+        if not (self.config.jobs > 1 and len(by_account) > 1):
+            # Parallel workers download their own accounts' images
+            self._prefetch_images(filtered_entries)
+
+        try:
+            if self.config.jobs > 1 and len(by_account) > 1:
+                self._post_accounts_parallel(by_account, total, result)
+            elif self.config.sessions > 1 and len(by_account) > 1:
+                self._post_accounts_interleaved(by_account, total, result)
+            else:
+                self._post_accounts_sequential(by_account, total, result)
+        finally:
+            self._close_http_verifier()
+            self._close_images()
+
+        if result.pacing is None and self.pacer:
+            result.pacing = self.pacer.snapshot()
+
+        self.events.emit(
+            'batch_finished',
+            total=result.total,
+            successful=result.successful,
+            failed=result.failed,
+            skipped=result.skipped,
+            duration_ms=round((time.monotonic() - started) * 1000, 1),
+        )
+        return result
+
+    def _post_accounts_sequential(
+        self,
+        by_account: Dict[str, List[BlogPostEntry]],
+        total: int,
+        result: BatchPostResult
+    ):
+        """
+        Post account groups one after another in this process.
+
+        With ``browser_pool_size`` set, browsers come from a warm pool that
+        starts launching immediately, so later accounts skip the cold start.
+        With ``browser_contexts``, every account gets an isolated context of
+        one shared browser instead.
+        With ``pipeline`` on, the next account is logged in to in a second
+        browser (in a background thread) while the current one is posting.
+        """
+        self._start_browsers(len(by_account))
+
+        # Resolve every account's credentials up front
+        accounts = [
+            (sns_id, account_entries, self.credential_manager.resolve_password(account_entries[0]))
+            for sns_id, account_entries in by_account.items()
+        ]
+        login_ahead = ThreadPoolExecutor(max_workers=1, thread_name_prefix='login') if self.config.pipeline else None
+        # (position in accounts, future AccountSession) of the account logged in ahead
+        next_session: Optional[Tuple[int, Future]] = None
+
+        try:
+            current = 0
+            for position, (sns_id, account_entries, creds) in enumerate(accounts):
+                self._report_progress(current, total, f"Processing account: {sns_id}")
+
+                if not creds.sns_pw:
+                    # Skip entries without credentials
+                    for post_result in self._missing_credentials_results(account_entries):
+                        result.add_result(post_result)
+                        current += 1
+                    continue
+
+                # Logged in ahead while the previous account was posting (or None)
+                session = None
+                if next_session and next_session[0] == position:
+                    session = next_session[1].result()
+                next_session = None
+
+                if login_ahead:
+                    following = next(
+                        (i for i in range(position + 1, len(accounts)) if accounts[i][2].sns_pw), None
                     )
+                    if following is not None:
+                        # This account logs in first, then the next one in the background
+                        if session is None:
+                            session = self._open_session(creds)
+                        next_session = (following, login_ahead.submit(self._open_session, accounts[following][2]))
+
+                # Post all entries for this account
+                account_results = self._post_account_entries(account_entries, creds, session=session)
+                for post_result in account_results:
                     result.add_result(post_result)
                     current += 1
-                continue
+                    self._report_post_result(current, total, post_result)
+
+                # Delay between accounts (adaptive pacing spaces posts itself)
+                if current < total and not self.pacer:
+                    time.sleep(self.config.delay_between_accounts)
+        finally:
+            if next_session:
+                # Interrupted before the account logged in ahead was used
+                self._close_session(next_session[1].result())
+            if login_ahead:
+                login_ahead.shutdown(wait=True)
+            self._stop_browsers()
+
+    def _post_accounts_interleaved(
+        self,
+        by_account: Dict[str, List[BlogPostEntry]],
+        total: int,
+        result: BatchPostResult
+    ):
+        """
+        Post several accounts at once by interleaving their posts in this process.
+
+        Up to ``sessions`` accounts stay logged in at the same time. Each
+        account keeps its own spacing between posts, and the account that
+        may post soonest goes next (see InterleavedScheduler), so one
+        account's delay is spent posting for another instead of sleeping.
+        ``delay_between_accounts`` does not apply, since accounts overlap.
+        """
+        sessions = min(self.config.sessions, len(by_account))
+        print(f"[INFO] Interleaving {len(by_account)} accounts over {sessions} sessions")
+        self._start_browsers(sessions)
 
-            # Post all entries for this account
-            account_results = self._post_account_entries(account_entries, creds)
-            for post_result in account_results:
+        pending = deque(by_account.items())
+        runs: List[AccountRun] = []
+        scheduler = InterleavedScheduler()
+        current = 0
+
+        def finish_run(run: AccountRun) -> int:
+            run.close()
+            added = 0
+            for post_result in run.results:
                 result.add_result(post_result)
-                current += 1
-                self._report_progress(
-                    current, total,
-                    f"Posted: {post_result.entry.sns_upload_cont.blog_title[:30]}... - "
-                    f"{'SUCCESS' if post_result.success else 'FAILED'}"
+                added += 1
+                self._report_post_result(current + added, total, post_result)
+            return added
+
+        try:
+            while pending or runs:
+                # Keep up to `sessions` accounts logged in
+                while pending and len(runs) < sessions:
+                    sns_id, account_entries = pending.popleft()
+                    self._report_progress(current, total, f"Processing account: {sns_id}")
+                    creds = self.credential_manager.resolve_password(account_entries[0])
+                    if not creds.sns_pw:
+                        # Skip entries without credentials
+                        for post_result in self._missing_credentials_results(account_entries):
+                            result.add_result(post_result)
+                            current += 1
+                        continue
+
+                    run = AccountRun(self, account_entries, creds)
+                    try:
+                        started = run.start()
+                    except Exception as e:
+                        run.fail_remaining(e)
+                        started = False
+                    if started:
+                        runs.append(run)
+                    else:
+                        current += finish_run(run)
+
+                if not runs:
+                    continue
+
+                run = scheduler.pick(runs)
+                try:
+                    # Verify the other accounts' last posts while this one waits
+                    for other in runs:
+                        if other is not run:
+                            other.window.idle()
+                    window_started = time.monotonic()
+                    run.window.idle(lambda: run.ready_at() - window_started)
+                    run.post_next()
+                    if run.done:
+                        run.window.idle()
+                        # May put posts missing from the list back in the queue
+                        run.verify_batch()
+                except Exception as e:
+                    run.fail_remaining(e)
+
+                if run.done:
+                    runs.remove(run)
+                    scheduler.forget(run)
+                    current += finish_run(run)
+        finally:
+            for run in runs:
+                run.close()
+            self._stop_browsers()
+
+    def _start_browsers(self, accounts: int):
+        """
+        Set up where account sessions get their browser.
+
+        With ``browser_contexts`` every account gets an isolated context of
+        one shared browser; with ``browser_pool_size`` a warm pool of up to
+        ``accounts`` browsers starts launching; otherwise each session
+        launches its own browser.
+        """
+        if self.config.browser_contexts:
+            self._context_host = BrowserContextHost(self._browser_config())
+        elif self.config.browser_pool_size > 0:
+            self._browser_pool = BrowserPool(
+                self._browser_config(),
+                size=min(self.config.browser_pool_size, accounts),
+                max_uses=self.config.browser_max_uses,
+            )
+            self._browser_pool.start()
+
+    def _stop_browsers(self):
+        """Close the shared browser or the warm browser pool, if any."""
+        if self._context_host:
+            self._context_host.close()
+            self._context_host = None
+        if self._browser_pool:
+            self._browser_pool.close()
+            self._browser_pool = None
+
+    def _post_accounts_parallel(
+        self,
+        by_account: Dict[str, List[BlogPostEntry]],
+        total: int,
+        result: BatchPostResult
+    ):
+        """
+        Post account groups concurrently in worker processes.
+
+        Each worker owns its own browser and login session. Credentials are
+        resolved here so the workers never need the secrets file. Results are
+        merged into ``result`` as each account finishes.
+        """
+        jobs = min(self.config.jobs, len(by_account))
+        print(f"[INFO] Posting {len(by_account)} accounts with {jobs} parallel workers")
+
+        # 'spawn' keeps workers free of inherited browser/thread state
+        context = multiprocessing.get_context('spawn')
+
+        # One manager serves the shared pacing controller and the events queue
+        manager = events_queue = forwarder = pacer = None
+        if self.pacer or self.events.has_subscribers:
+            manager = PacingManager(ctx=context)
+            manager.start()
+            pacer = create_pacer(self.config, concurrency=jobs, manager=manager)
+
+        # Workers send their events through a queue; a thread republishes them here
+        if self.events.has_subscribers:
+            events_queue = manager.Queue()
+            forwarder = threading.Thread(
+                target=_forward_worker_events, args=(events_queue, self.events), daemon=True
+            )
+            forwarder.start()
+
+        try:
+            self._run_parallel_workers(context, jobs, by_account, total, result, events_queue, pacer)
+        finally:
+            if pacer:
+                result.pacing = pacer.snapshot()
+            if forwarder:
+                events_queue.put(None)
+                forwarder.join(timeout=10)
+            if manager:
+                manager.shutdown()
+
+    def _run_parallel_workers(
+        self,
+        context,
+        jobs: int,
+        by_account: Dict[str, List[BlogPostEntry]],
+        total: int,
+        result: BatchPostResult,
+        events_queue=None,
+        pacer=None
+    ):
+        """Submit account groups to a process pool and merge their results."""
+        current = 0
+        futures = {}
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+            for sns_id, account_entries in by_account.items():
+                creds = self.credential_manager.resolve_password(account_entries[0])
+                if not creds.sns_pw:
+                    for post_result in self._missing_credentials_results(account_entries):
+                        result.add_result(post_result)
+                        current += 1
+                    continue
+
+                future = executor.submit(
+                    _post_account_worker, self.config, account_entries, creds,
+                    self.journal, self._recheck_indexes, events_queue, pacer
                 )
+                futures[future] = account_entries
+                self._report_progress(current, total, f"Queued account: {sns_id}")
 
-            # Delay between accounts
-            if current < total:
-                time.sleep(self.config.delay_between_accounts)
+            for future in as_completed(futures):
+                account_entries = futures[future]
+                try:
+                    account_results = future.result()
+                    if self.report_writer:
+                        # Workers have no report writer of their own
+                        for post_result in account_results:
+                            self.report_writer.write_result(post_result)
+                except Exception as e:
+                    # Worker process died (e.g. browser crash took it down)
+                    account_results = [
+                        self._journal_result(PostResult(
+                            entry=entry,
+                            success=False,
+                            error_message=f"Worker failed: {str(e)}",
+                            timestamp=datetime.now().isoformat(),
+                            failure_kind=FAILURE_BROWSER_CRASH
+                        ))
+                        for entry in account_entries
+                    ]
 
-        return result
+                for post_result in account_results:
+                    result.add_result(post_result)
+                    current += 1
+                    self._report_post_result(current, total, post_result)
+
+    def _missing_credentials_results(self, entries: List[BlogPostEntry]) -> List[PostResult]:
+        """Build failed results for entries whose account has no password."""
+        return [
+            self._journal_result(PostResult(
+                entry=entry,
+                success=False,
+                error_message="No credentials available",
+                timestamp=datetime.now().isoformat(),
+                failure_kind=FAILURE_AUTH
+            ))
+            for entry in entries
+        ]
+
+    def _journal_result(self, post_result: PostResult) -> PostResult:
+        """
+        Record a result in the journal and the streaming report (if any),
+        publish its event and return it.
+        """
+        if self.journal:
+            # Published but unverified posts stay in flight: --resume checks the blog first
+            self.journal.record_result(post_result, published=post_result.error_message == POST_UNVERIFIED)
+        if self.report_writer:
+            self.report_writer.write_result(post_result)
+
+        entry = post_result.entry
+        fields = {
+            'index': entry.index,
+            'sns_id': entry.sns_id,
+            'blog_title': entry.sns_upload_cont.blog_title,
+        }
+        started = self._post_started.pop(entry.index, None)
+        if started is not None:
+            fields['duration_ms'] = round((time.monotonic() - started) * 1000, 1)
+        if post_result.success:
+            self.events.emit('post_succeeded', post_url=post_result.post_url, **fields)
+        else:
+            self.events.emit(
+                'post_failed',
+                error_message=post_result.error_message,
+                failure_kind=post_result.failure_kind,
+                **fields
+            )
+        return post_result
+
+    def _report_post_result(self, current: int, total: int, post_result: PostResult):
+        """Report progress for a finished post."""
+        self._report_progress(
+            current, total,
+            f"Posted: {post_result.entry.sns_upload_cont.blog_title[:30]}... - "
+            f"{'SUCCESS' if post_result.success else 'FAILED'}"
+        )
 
     def _filter_entries(
         self,
@@ -178,66 +659,229 @@ class BatchPostingOrchestrator:
     def _post_account_entries(
         self,
         entries: List[BlogPostEntry],
-        creds: ResolvedCredentials
+        creds: ResolvedCredentials,
+        session: Optional['AccountSession'] = None
     ) -> List[PostResult]:
         """
         Post all entries for a single account.
 
-        This creates a browser session, logs in once, then posts all entries.
+        This takes a browser session (from the pool, or a fresh one),
+        logs in once, then posts all entries with the delay in between
+        (see AccountRun for the per-entry handling).
+
+        Args:
+            entries: Entries of one account
+            creds: Resolved credentials of the account
+            session: Session opened ahead of time (see _open_session);
+                opened here if not given
+        """
+        run = AccountRun(self, entries, creds, session)
+        try:
+            if run.start():
+                while not run.done:
+                    if run.posted:
+                        # Idle window: verify the previous post, then wait out the delay
+                        run.window.idle(run.spacing)
+                    run.post_next()
+                    if run.done:
+                        # Verify the last post (and the batch, which may re-queue missing posts)
+                        run.window.idle()
+                        run.verify_batch()
+        except Exception as e:
+            run.fail_remaining(e)
+        finally:
+            run.close()
+
+        return run.results
+
+    def _open_session(self, creds: ResolvedCredentials) -> 'AccountSession':
         """
-        results = []
+        Get a browser and log in to an account.
 
+        Safe to run in a background thread while another account is being
+        posted (the sequential path logs in to the next account this way).
+        Errors are captured in the returned session instead of raised.
+        """
+        session = AccountSession()
         try:
-            # Create browser
-            browser_config = BrowserConfig.for_automation(headless=self.config.headless)
-            self._browser_adapter = BrowserAdapter(browser_config)
-            driver = self._browser_adapter.create_driver()
+            # Get browser
+            if self._context_host:
+                session.context = self._context_host.open()
+                session.driver = session.context.driver
+            elif self._browser_pool:
+                session.pooled = self._browser_pool.acquire()
+                session.driver = session.pooled.driver
+            else:
+                session.adapter = BrowserAdapter(self._browser_config())
+                session.driver = session.adapter.create_driver()
 
             # Login to account
-            if not self._login(driver, creds):
-                # Login failed - mark all entries as failed
-                for entry in entries:
-                    results.append(PostResult(
-                        entry=entry,
-                        success=False,
-                        error_message="Login failed",
-                        timestamp=datetime.now().isoformat()
-                    ))
-                return results
-
-            # Post each entry
-            for entry in entries:
-                post_result = self._post_single(driver, entry, creds)
-                results.append(post_result)
-
-                # Delay between posts
-                if entry != entries[-1]:
-                    time.sleep(self.config.delay_between_posts)
+            with self._login_lock, self._using(session):
+                with self.events.span('account_login', sns_id=creds.sns_id) as login_event:
+                    session.logged_in = self._login(session.driver, creds)
+                    login_event['success'] = session.logged_in
+                if not session.logged_in:
+                    session.failure_kind = self._login_failure
+        except Exception as e:
+            session.error = str(e)
+        return session
+
+    def _close_session(self, session: 'AccountSession', healthy: bool = True):
+        """Release a session's browser (pooled browsers are cleaned and reused)."""
+        if session.context:
+            session.context.host.close_context(session.context)
+        elif session.pooled:
+            self._browser_pool.release(
+                session.pooled, healthy=healthy and session.pooled.adapter.is_healthy()
+            )
+        elif session.adapter:
+            self._traffic_meters.pop(session.driver, None)
+            session.adapter.close()
+
+    def _browser_config(self) -> BrowserConfig:
+        """BrowserConfig of the browsers this orchestrator launches."""
+        return BrowserConfig.for_automation(
+            headless=self.config.headless, blocked_urls=self.config.blocked_urls
+        )
+
+    def _traffic_meter(self, driver):
+        """
+        TrafficMeter of a driver (src.cdp_network), shared by everything using it.
+
+        Writers pass it the performance log events they read for the publish
+        response, so no received bytes are missed. Accounts hosted as contexts
+        of one browser take their own context's bytes from it.
+        """
+        meter = self._traffic_meters.get(driver)
+        if meter is None:
+            from src.cdp_network import TrafficMeter
+            meter = self._traffic_meters[driver] = TrafficMeter(driver)
+        return meter
+
+    @contextmanager
+    def _using(self, session: 'AccountSession') -> Iterator:
+        """
+        Hold a session's browser while using its driver.
+
+        A no-op for a browser of its own; for a context of the shared browser
+        it switches to the account's tab and keeps other threads out.
+        """
+        if session.context:
+            with session.context.host.using(session.context):
+                yield
+        else:
+            yield
+
+    def _image_fetcher(self) -> Optional[ImageFetcher]:
+        """The image fetcher (started on first use), or None without upload_images."""
+        if self.images is None and self.config.upload_images:
+            max_bytes = self.config.image_cache_mb * 1024 * 1024
+            cache = ImageCache(self.config.image_cache_dir, max_bytes=max_bytes)
+            normalizer = None
+            if self.config.normalize_images:
+                normalizer = ImageNormalizer(
+                    ImageCache(str(cache.root / 'normalized'), max_bytes=max_bytes),
+                    max_width=self.config.image_max_width,
+                    quality=self.config.image_quality,
+                )
+            self.images = ImageFetcher(cache, workers=self.config.image_workers, normalizer=normalizer)
+        return self.images
+
+    def _prefetch_images(self, entries: List[BlogPostEntry]):
+        """Start downloading every image of the entries in the background."""
+        images = self._image_fetcher()
+        if images:
+            queued = images.prefetch(url for entry in entries for url in entry.sns_upload_cont.get_image_urls())
+            if queued:
+                print(f"[INFO] Fetching {queued} images in the background")
+
+    def _release_images(self, entry: BlogPostEntry):
+        """Let the image cache evict an entry's images again (its post is done)."""
+        if self.images:
+            self.images.release(entry.sns_upload_cont.get_image_urls())
+
+    def _close_images(self):
+        """Stop the image fetcher, if it was started."""
+        if self.images:
+            print(f"[INFO] Images: {self.images.downloaded} downloaded, {self.images.cache_hits} from cache")
+            normalizer = self.images.normalizer
+            if normalizer and normalizer.normalized:
+                print(f"[INFO] Images normalized: {normalizer.normalized} "
+                      f"({normalizer.bytes_in:,} -> {normalizer.bytes_out:,} bytes), "
+                      f"{normalizer.cache_hits} from cache")
+            self.images.close()
+            self.images = None
+
+    def _get_http_verifier(self) -> PostVerifier:
+        """The background HTTP verifier (started on first use)."""
+        if self.http_verifier is None:
+            self.http_verifier = PostVerifier()
+        return self.http_verifier
 
+    def _close_http_verifier(self):
+        """Stop the HTTP verifier, if it was started."""
+        if self.http_verifier:
+            self.http_verifier.close()
+            self.http_verifier = None
+
+    def _submit_http_verification(self, driver, entry: BlogPostEntry) -> Optional[Future]:
+        """
+        Start checking a deferred verification over HTTP in the background.
+
+        Must be called on the account's tab (the account's cookies are exported
+        from it). Returns None when HTTP verification is off.
+        """
+        if not self.config.http_verify or entry.index not in self._pending_verifications:
+            return None
+        writer, title = self._pending_verifications[entry.index]
+        return self._get_http_verifier().submit(
+            writer.blog_id, writer.last_log_no, title, cookies_from_driver(driver)
+        )
+
+    def _http_verified(self, entry: BlogPostEntry, check: Optional[Future]) -> bool:
+        """Wait for a background HTTP check; False means "ask the browser"."""
+        if check is None:
+            return False
+        try:
+            found = check.result()
         except Exception as e:
-            # Handle any unhandled errors
-            for entry in entries:
-                if not any(r.entry.index == entry.index for r in results):
-                    results.append(PostResult(
-                        entry=entry,
-                        success=False,
-                        error_message=f"Unexpected error: {str(e)}",
-                        timestamp=datetime.now().isoformat()
-                    ))
-        finally:
-            # Clean up browser
-            if self._browser_adapter:
-                self._browser_adapter.close()
-                self._browser_adapter = None
+            print(f"[WARNING] HTTP verification of entry {entry.index} failed: {e}")
+            return False
+        if found:
+            print(f"[INFO] Entry {entry.index} verified over HTTP")
+        return bool(found)
 
-        return results
+    def _verify_deferred(self, entry: BlogPostEntry) -> bool:
+        """Verify a post published with verification deferred."""
+        writer, title = self._pending_verifications.pop(entry.index)
+        try:
+            return writer.verify_post(title)
+        except Exception as e:
+            print(f"[WARNING] Could not verify entry {entry.index}: {e}")
+            return False
+
+    def _record_pacing(self, sns_id: str, post_result: PostResult, latency: float):
+        """Feed a post outcome to the pacing controller and publish rate changes."""
+        if self._pacing_rate is None:
+            self._pacing_rate = self.pacer.snapshot()['rate_per_minute']
+        rate = round(self.pacer.record(
+            sns_id, post_result, latency,
+            verified=post_result.error_message != POST_UNVERIFIED
+        ), 2)
+        if rate != self._pacing_rate:
+            self.events.emit('pacing_changed', sns_id=sns_id, rate_per_minute=rate)
+            self._pacing_rate = rate
 
     def _login(self, driver, creds: ResolvedCredentials) -> bool:
         """
         Login to Naver account.
 
         Uses the existing NaverLogin class from src.naver_login.
+        A cached session is restored first when available; the full login
+        flow only runs when there is no cached session or it is stale.
+        On failure, the failure kind is left in ``self._login_failure``.
         """
+        self._login_failure = FAILURE_UNKNOWN
         try:
             # Import here to avoid circular imports
             from src.naver_login import NaverLogin
@@ -249,41 +893,102 @@ class BatchPostingOrchestrator:
             )
             login = NaverLogin(driver, config)
 
-            return login.login()
+            if self.session_cache and self.session_cache.restore_to_driver(driver, creds.sns_id):
+                if login.is_session_valid():
+                    print(f"[INFO] Reusing cached session for {creds.sns_id}")
+                    return True
+                print(f"[INFO] Cached session for {creds.sns_id} is stale, logging in")
+                self.session_cache.invalidate(creds.sns_id)
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+            if not login.login():
+                self._login_failure = getattr(login, 'last_failure', None) or FAILURE_AUTH
+                return False
+
+            if self.session_cache:
+                self.session_cache.export_from_driver(driver, creds.sns_id)
+            return True
 
         except Exception as e:
             print(f"[ERROR] Login failed: {e}")
+            self._login_failure = classify_error(str(e))
             return False
 
-    def _post_single(
+    def _step_listener(self, entry: BlogPostEntry) -> Callable:
+        """Build a writer step listener that publishes post_step_* events."""
+        def listener(phase: str, step: str, **info):
+            self.events.emit(
+                f'post_step_{phase}',
+                index=entry.index,
+                sns_id=entry.sns_id,
+                step=step,
+                **info
+            )
+        return listener
+
+    def _is_already_published(
         self,
         driver,
         entry: BlogPostEntry,
         creds: ResolvedCredentials
-    ) -> PostResult:
+    ) -> bool:
         """
-        Post a single blog entry.
+        Check the blog for an entry that was mid-publish when a run crashed.
 
-        Uses the existing blog writer classes.
+        Uses the CDP writer's post list check regardless of writer mode,
+        since every posting browser is Chrome.
         """
         try:
-            # Import writer
-            if self.config.writer_mode == 'cdp':
-                from src.blog_writer_cdp import NaverBlogWriterCDP as Writer
-            else:
-                from src.blog_writer import NaverBlogWriter as Writer
+            from src.blog_writer_cdp import NaverBlogWriterCDP
 
-            # Extract blog ID from email (username part)
             blog_id = creds.sns_id.split('@')[0]
-            config = WriterConfig(blog_id=blog_id)
+            title = entry.sns_upload_cont.blog_title
+            # The post list over HTTP first; only "not found" needs the full browser check
+            found = self.config.http_verify and self._get_http_verifier().client.find_post(
+                blog_id, title=title, cookies=cookies_from_driver(driver)
+            )
+            if not found:
+                writer = NaverBlogWriterCDP(driver, WriterConfig(blog_id=blog_id))
+                found = writer.is_post_published(title)
+            if found:
+                print(f"[INFO] Entry {entry.index} was already published, skipping repost")
+            return found
+        except Exception as e:
+            print(f"[WARNING] Could not re-check entry {entry.index}: {e}")
+            return False
+
+    def _post_single(
+        self,
+        driver,
+        entry: BlogPostEntry,
+        creds: ResolvedCredentials,
+        prepared: Optional[PreparedPost] = None,
+        verify: bool = True,
+        writer=None
+    ) -> PostResult:
+        """
+        Post a single blog entry.
 
-            writer = Writer(driver, config)
+        Uses the existing blog writer classes.
 
-            # Render content
-            content_text = render_content(entry.sns_upload_cont, format='plain')
+        Args:
+            driver: Logged-in WebDriver
+            entry: Entry to post
+            creds: Resolved credentials of the account
+            prepared: Content prepared ahead of time (prepared here if None)
+            verify: False to publish without verifying (CDP writer only); the
+                writer is then kept in ``_pending_verifications`` for
+                _verify_deferred()
+            writer: Writer from _create_writer(), possibly with the entry
+                already drafted in its own tab (created here if None)
+        """
+        try:
+            writer = writer or self._create_writer(driver, entry, creds)
 
-            # Get tags
-            tags = entry.sns_upload_cont.get_tags()
+            # Rendered content and tags
+            prepared = prepared or prepare_post(entry, self._image_fetcher())
+            content_text = prepared.content_text
+            tags = prepared.tags
 
             # Default publish settings
             publish_settings = {
@@ -303,8 +1008,12 @@ class BatchPostingOrchestrator:
                     content=content_text,
                     tags=tags if tags else None,
                     publish_settings=publish_settings,
-                    max_retries=self.config.max_retries
+                    max_retries=self.config.max_retries,
+                    verify=verify,
+                    image_files=prepared.image_files or None
                 )
+                if success and not verify:
+                    self._pending_verifications[entry.index] = (writer, entry.sns_upload_cont.blog_title)
             else:
                 success = writer.write_post(
                     title=entry.sns_upload_cont.blog_title,
@@ -313,11 +1022,17 @@ class BatchPostingOrchestrator:
                     is_public=True
                 )
 
+            error_message = ""
+            if not success:
+                error_message = POST_UNVERIFIED if getattr(writer, 'published', False) else "Post failed"
+
             return PostResult(
                 entry=entry,
                 success=success,
-                error_message="" if success else "Post failed",
-                timestamp=datetime.now().isoformat()
+                error_message=error_message,
+                post_url=(getattr(writer, 'last_post_url', None) or "") if success else "",
+                timestamp=datetime.now().isoformat(),
+                failure_kind="" if success else _classify_writer_failure(writer)
             )
 
         except Exception as e:
@@ -325,20 +1040,499 @@ class BatchPostingOrchestrator:
                 entry=entry,
                 success=False,
                 error_message=str(e),
-                timestamp=datetime.now().isoformat()
+                timestamp=datetime.now().isoformat(),
+                failure_kind=classify_error(str(e))
             )
 
+    def _create_writer(self, driver, entry: BlogPostEntry, creds: ResolvedCredentials):
+        """Create the blog writer that posts ``entry`` (CDP or Selenium, per config)."""
+        # Import writer
+        if self.config.writer_mode == 'cdp':
+            from src.blog_writer_cdp import NaverBlogWriterCDP as Writer
+        else:
+            from src.blog_writer import NaverBlogWriter as Writer
+
+        # Extract blog ID from email (username part)
+        blog_id = creds.sns_id.split('@')[0]
+        config = WriterConfig(blog_id=blog_id)
+
+        writer = Writer(driver, config)
+        if self.events.has_subscribers and hasattr(writer, 'step_listener'):
+            writer.step_listener = self._step_listener(entry)
+        if self.editor_url_cache and hasattr(writer, 'editor_url_cache'):
+            writer.editor_url_cache = self.editor_url_cache
+        if hasattr(writer, 'traffic_meter'):
+            writer.traffic_meter = self._traffic_meter(driver)
+        return writer
+
+
+class AccountRun:
+    """
+    Posting state of one account.
+
+    Holds the account's session, remaining entries, circuit breaker,
+    deferred verifications and results. ``post_next()`` posts one entry;
+    the caller decides when, either one account after another with the
+    delay in between (_post_account_entries) or interleaved with other
+    accounts (_post_accounts_interleaved).
+
+    A circuit breaker backs off after transient failures and fails the
+    remaining entries fast once the account is clearly broken (see
+    AccountCircuitBreaker). With ``pipeline`` on, the next entries are
+    prepared in the background and each post is verified in the idle
+    window before the account's next publish instead of before it. With
+    ``verify_batch``, posts are only verified once the account's entries
+    are all published, together against one read of the blog's post list
+    (see verify_batch()).
+
+    With ``preload_editor`` (CDP writer), the next entry's editor loads in
+    a background tab while the current entry publishes and verifies, and
+    the next post starts in that tab. With ``draft_tabs`` > 1, the next
+    entries' editors load in background tabs, and the next entry is also
+    drafted up to the publish popup in the idle window, so its publish is
+    only the final click.
+    """
+
+    def __init__(
+        self,
+        orchestrator: BatchPostingOrchestrator,
+        entries: List[BlogPostEntry],
+        creds: ResolvedCredentials,
+        session: Optional[AccountSession] = None
+    ):
+        """
+        Initialize account run.
+
+        Args:
+            orchestrator: Orchestrator providing config, journal, events and pacing
+            entries: Entries of the account in posting order
+            creds: Resolved credentials of the account
+            session: Session opened ahead of time (opened by start() if None)
+        """
+        config = orchestrator.config
+        self.orchestrator = orchestrator
+        self.creds = creds
+        self.entries = list(entries)
+        self.remaining = deque(self.entries)
+        self.session = session
+        self.results: List[PostResult] = []
+        self.posted = 0
+        self.breaker = AccountCircuitBreaker(
+            failure_threshold=config.failure_threshold,
+            backoff_base=config.backoff_base,
+            backoff_max=config.backoff_max,
+        )
+        self.window = IdleWindowRunner()
+        self.preparer = EntryPreparer(self.entries, images=orchestrator._image_fetcher()) if config.pipeline else None
+        self.batch_verify = config.verify_batch and config.writer_mode == 'cdp'
+        self.defer_verify = (
+            config.pipeline or config.http_verify or config.verify_batch
+        ) and config.writer_mode == 'cdp'
+        # Published posts awaiting verify_batch(): (result, publish latency)
+        self._unverified: List[Tuple[PostResult, float]] = []
+        self._republished: Set[int] = set()
+        self.backoff = 0.0
+        self.healthy = True
+        # Upcoming entries that get their own editor tab ahead of time (CDP writer only)
+        self.tabs_ahead = 0
+        if config.writer_mode == 'cdp':
+            self.tabs_ahead = max(config.draft_tabs - 1, 1 if config.preload_editor else 0)
+        self.draft_ahead = config.draft_tabs > 1 and self.tabs_ahead > 0
+        self.tabs = None  # EditorTabs (src.cdp_tabs) once the account posts from tabs
+        # entry index -> writer working in the entry's own tab
+        self.tab_writers: Dict[int, Any] = {}
+        self._prepared: Dict[int, PreparedPost] = {}
+        self.editor_url: Optional[str] = None  # write link found on the blog, for new tabs
+        self.traffic = None  # TrafficMeter of the session's browser, once logged in
+        self.traffic_context = None  # browser context whose bytes are the account's (None: whole browser)
+        self._last_started: Optional[float] = None
+        self._last_finished: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether every entry has been taken."""
+        return not self.remaining
+
+    def start(self) -> bool:
+        """
+        Open the session (unless given) and check the login.
+
+        Returns:
+            True if the account can post; False if the login failed (all
+            entries then have a failed result)
+        """
+        if self.session is None:
+            self.session = self.orchestrator._open_session(self.creds)
+        if self.session.error:
+            raise RuntimeError(self.session.error)
+
+        if not self.session.logged_in:
+            # Login failed - mark all entries as failed
+            while self.remaining:
+                entry = self.remaining.popleft()
+                self.orchestrator._release_images(entry)
+                self.results.append(self.orchestrator._journal_result(PostResult(
+                    entry=entry,
+                    success=False,
+                    error_message="Login failed",
+                    timestamp=datetime.now().isoformat(),
+                    failure_kind=self.session.failure_kind
+                )))
+            return False
+
+        with self.orchestrator._using(self.session):
+            # Each post counts the bytes received since the previous one (the login is not counted).
+            # Accounts sharing a browser as contexts only count their own context's tabs.
+            self.traffic = self.orchestrator._traffic_meter(self.session.driver)
+            if self.session.context:
+                self.traffic_context = self.session.context.context_id
+            self.traffic.take(self.traffic_context)
+        return True
+
+    def spacing(self) -> float:
+        """Delay before the next publish (at least the backoff after a transient failure)."""
+        if self.breaker.is_open:
+            return 0.0
+        if self.orchestrator.pacer:
+            return self.backoff
+        return max(self.orchestrator.config.delay_between_posts, self.backoff)
+
+    def ready_at(self) -> float:
+        """Monotonic time at which the account may start its next post."""
+        if self._last_finished is None:
+            return 0.0
+        if self.breaker.is_open:
+            return self._last_finished
+        ready = self._last_finished + self.spacing()
+        pacer = self.orchestrator.pacer
+        if pacer:
+            # Token bucket spacing is measured between post starts
+            rate = pacer.snapshot()['rate_per_minute']
+            ready = max(ready, self._last_started + 60 / rate)
+        return ready
+
+    def post_next(self):
+        """Post the next entry (or fail it fast if the breaker is open)."""
+        orchestrator = self.orchestrator
+        creds = self.creds
+        entry = self.remaining.popleft()
+        self.posted += 1
+
+        if self.breaker.is_open:
+            # Account is broken - don't spend a full retry cycle per entry
+            orchestrator._release_images(entry)
+            self.results.append(orchestrator._journal_result(PostResult(
+                entry=entry,
+                success=False,
+                error_message=f"Skipped: account stopped after {self.breaker.open_reason} failure",
+                timestamp=datetime.now().isoformat(),
+                failure_kind=self.breaker.open_reason
+            )))
+            return
+
+        if orchestrator.pacer:
+            wait = orchestrator.pacer.reserve(creds.sns_id)
+            if wait > 0:
+                time.sleep(wait)
+
+        prepared = self._prepared.pop(entry.index, None)
+        if prepared is None and self.preparer:
+            prepared = self.preparer.get(entry)
+        with orchestrator._using(self.session):
+            self._last_started = time.monotonic()
+            orchestrator._post_started[entry.index] = self._last_started
+            driver = self.session.driver
+            if entry.index in orchestrator._recheck_indexes and orchestrator._is_already_published(driver, entry, creds):
+                # Published before the previous run died - don't post a duplicate
+                orchestrator._release_images(entry)
+                self.results.append(orchestrator._journal_result(PostResult(
+                    entry=entry,
+                    success=True,
+                    timestamp=datetime.now().isoformat()
+                )))
+                self._last_finished = time.monotonic()
+                return
+
+            if orchestrator.journal:
+                orchestrator.journal.record_publishing(entry)
+            kwargs = {}
+            if self.tabs_ahead:
+                kwargs['writer'] = self._writer_for(entry)
+                # The next editors load while this entry publishes and verifies
+                self._open_tabs()
+            post_result = orchestrator._post_single(
+                driver, entry, creds, prepared=prepared, verify=not self.defer_verify, **kwargs
+            )
+            orchestrator._release_images(entry)
+            if kwargs:
+                self.editor_url = kwargs['writer'].editor_url or self.editor_url
+            post_result.bytes_received = self.traffic.take(self.traffic_context)
+            http_check = None
+            if entry.index in orchestrator._pending_verifications and not self.batch_verify:
+                http_check = orchestrator._submit_http_verification(driver, entry)
+            else:
+                self._close_tab(entry)
+        self._last_finished = time.monotonic()
+        latency = self._last_finished - self._last_started
+        if entry.index in orchestrator._pending_verifications and self.batch_verify:
+            self._unverified.append((post_result, latency))
+        elif entry.index in orchestrator._pending_verifications:
+            self._verify_later(post_result, latency, http_check)
+        else:
+            self._finish(post_result, latency)
+        if self.draft_ahead and self.remaining:
+            self.window.defer(self._draft_next)
+
+    def _writer_for(self, entry: BlogPostEntry):
+        """Writer of an entry, in its own tab (preloaded or drafted ahead if possible)."""
+        if self.tabs is None:
+            from src.cdp_tabs import EditorTabs
+            self.tabs = EditorTabs(self.session.driver, blocked_urls=self.orchestrator.config.blocked_urls)
+        writer = self.tab_writers.get(entry.index)
+        if writer is None:
+            writer = self.orchestrator._create_writer(self.session.driver, entry, self.creds)
+            writer.window = self.tabs.home
+        return writer
+
+    def _open_tabs(self):
+        """Open editor tabs (loading in the background) for the next entries without one."""
+        for entry in list(self.remaining)[:self.tabs_ahead]:
+            if entry.index not in self.tab_writers:
+                writer = self.orchestrator._create_writer(self.session.driver, entry, self.creds)
+                writer.window = self.tabs.open(self.editor_url or writer.editor_entry_url())
+                writer.editor_preloaded = True
+                self.tab_writers[entry.index] = writer
+
+    def _draft_next(self):
+        """Open editor tabs for the next entries and draft the first of them."""
+        if self.breaker.is_open or not self.remaining:
+            return
+        with self.orchestrator._using(self.session):
+            self._open_tabs()
+            entry = self.remaining[0]
+            writer = self.tab_writers[entry.index]
+            if writer.drafted:
+                return
+            prepared = self._prepared.get(entry.index)
+            if prepared is None:
+                if self.preparer:
+                    prepared = self.preparer.get(entry)
+                else:
+                    prepared = prepare_post(entry, self.orchestrator._image_fetcher())
+                self._prepared[entry.index] = prepared
+            writer.draft_post(
+                title=entry.sns_upload_cont.blog_title,
+                content=prepared.content_text,
+                tags=prepared.tags or None,
+                image_files=prepared.image_files or None,
+            )
+
+    def _close_tab(self, entry: BlogPostEntry):
+        """Close the tab an entry was posted from (the account's first tab stays)."""
+        writer = self.tab_writers.pop(entry.index, None)
+        if writer is not None:
+            self.tabs.close(writer.window)
+
+    def _finish(self, post_result: PostResult, latency: float):
+        """Record a final result and update the breaker and pacing."""
+        orchestrator = self.orchestrator
+        self.results.append(orchestrator._journal_result(post_result))
+        if orchestrator.pacer:
+            orchestrator._record_pacing(self.creds.sns_id, post_result, latency)
+        self.backoff = self.breaker.record(post_result)
+        if self.breaker.is_open:
+            print(f"[WARNING] Stopping account {self.creds.sns_id}: {self.breaker.open_reason} failure")
+        elif self.backoff:
+            print(f"[INFO] {post_result.failure_kind} failure, backing off {self.backoff:.1f}s")
+
+    def _verify_later(self, post_result: PostResult, latency: float, http_check: Optional[Future] = None):
+        """
+        Verify a post in the account's next idle window, then finish it.
+
+        With a background HTTP check, the browser is only used when that
+        check did not find the post.
+        """
+        def task():
+            verified = post_result
+            orchestrator = self.orchestrator
+            ok = orchestrator._http_verified(post_result.entry, http_check)
+            with orchestrator._using(self.session):
+                if ok:
+                    orchestrator._pending_verifications.pop(post_result.entry.index, None)
+                else:
+                    ok = orchestrator._verify_deferred(post_result.entry)
+                self._close_tab(post_result.entry)
+            if not ok:
+                verified = PostResult(
+                    entry=post_result.entry,
+                    success=False,
+                    error_message=POST_UNVERIFIED,
+                    timestamp=datetime.now().isoformat(),
+                    failure_kind=FAILURE_NETWORK,
+                    bytes_received=post_result.bytes_received
+                )
+            self._finish(verified, latency)
+        self.window.defer(task)
+
+    def verify_batch(self):
+        """
+        Verify every post published since the last batch at once.
+
+        The blog's post list is read (page by page, only as far back as
+        the posts go) once for the whole batch. Posts it does not list are
+        checked in the browser, and those still missing are put back in
+        the queue to be published again, once; the caller keeps posting
+        while ``done`` is False. If the list cannot be read at all, each
+        post is checked in the browser.
+        """
+        if not self._unverified:
+            return
+        orchestrator = self.orchestrator
+        unverified, self._unverified = self._unverified, []
+        pending = [
+            (post_result, latency, *orchestrator._pending_verifications[post_result.entry.index])
+            for post_result, latency in unverified
+        ]
+        with orchestrator._using(self.session):
+            cookies = cookies_from_driver(self.session.driver)
+        snapshot = orchestrator._get_http_verifier().client.snapshot(
+            self.creds.sns_id.split('@')[0],
+            log_nos=[writer.last_log_no for _, _, writer, _ in pending],
+            titles=[title for _, _, writer, title in pending if not writer.last_log_no],
+            cookies=cookies,
+        )
+        if snapshot is not None:
+            print(f"[INFO] Verifying {len(pending)} posts against {snapshot.pages} page(s) of the post list")
+
+        for post_result, latency, writer, title in pending:
+            entry = post_result.entry
+            ok = snapshot is not None and snapshot.contains(writer.last_log_no, title)
+            if ok:
+                orchestrator._pending_verifications.pop(entry.index)
+            else:
+                with orchestrator._using(self.session):
+                    ok = orchestrator._verify_deferred(entry)
+            if ok:
+                self._finish(post_result, latency)
+            elif entry.index not in self._republished:
+                print(f"[WARNING] Entry {entry.index} is not on the blog, publishing it again")
+                self._republished.add(entry.index)
+                self.remaining.append(entry)
+            else:
+                self._finish(PostResult(
+                    entry=entry,
+                    success=False,
+                    error_message=POST_UNVERIFIED,
+                    timestamp=datetime.now().isoformat(),
+                    failure_kind=FAILURE_NETWORK,
+                    bytes_received=post_result.bytes_received
+                ), latency)
+
+    def fail_remaining(self, error: Exception):
+        """Fail every entry without a result after an unexpected error."""
+        self.healthy = False
+        for entry in self.entries:
+            self.orchestrator._pending_verifications.pop(entry.index, None)
+            if not any(r.entry.index == entry.index for r in self.results):
+                self.results.append(self.orchestrator._journal_result(PostResult(
+                    entry=entry,
+                    success=False,
+                    error_message=f"Unexpected error: {str(error)}",
+                    timestamp=datetime.now().isoformat(),
+                    failure_kind=classify_error(str(error))
+                )))
+        self.remaining.clear()
+
+    def close(self):
+        """Stop background preparation, close extra tabs and release the browser."""
+        if self.preparer:
+            self.preparer.close()
+        if self.tabs and self.healthy:
+            with self.orchestrator._using(self.session):
+                self.tabs.close_all()
+        if self.session:
+            self.orchestrator._close_session(self.session, self.healthy)
+
+
+def _classify_writer_failure(writer) -> str:
+    """
+    Failure kind of a write_post() that returned False.
+
+    A page alert (e.g. Naver's posting limit) or an exception says most
+    about the cause; otherwise the step that gave up decides.
+    """
+    for text in (getattr(writer, 'last_alert_text', None), getattr(writer, 'last_error', None)):
+        if text:
+            kind = classify_error(text)
+            if kind != FAILURE_UNKNOWN:
+                return kind
+    return STEP_FAILURE_KINDS.get(getattr(writer, 'last_failed_step', None), FAILURE_UNKNOWN)
+
+
+def _post_account_worker(
+    config: PostingConfig,
+    entries: List[BlogPostEntry],
+    creds: ResolvedCredentials,
+    journal: Optional[PostingJournal] = None,
+    recheck_indexes: Optional[Set[int]] = None,
+    events_queue=None,
+    pacer=None
+) -> List[PostResult]:
+    """
+    Worker process entry point for parallel posting.
+
+    Module-level so it can be pickled by the process pool. The worker builds
+    its own orchestrator (and therefore its own BrowserAdapter) and posts a
+    single account group. Journal appends are atomic, so workers share the
+    parent's journal file. Events go to ``events_queue`` (if given) and are
+    republished by the parent; ``pacer`` is the parent's shared pacing
+    controller proxy (if adaptive pacing is on).
+    """
+    events = EventBus()
+    if events_queue is not None:
+        events.subscribe(events_queue.put)
+    orchestrator = BatchPostingOrchestrator(
+        credential_manager=CredentialManager(),
+        config=config,
+        journal=journal,
+        events=events
+    )
+    orchestrator._recheck_indexes = set(recheck_indexes or ())
+    if pacer is not None:
+        orchestrator.pacer = pacer
+    orchestrator._prefetch_images(entries)
+    try:
+        return orchestrator._post_account_entries(entries, creds)
+    finally:
+        orchestrator._close_http_verifier()
+        orchestrator._close_images()
+
+
+def _forward_worker_events(events_queue, events: EventBus):
+    """Republish events sent by worker processes until a None sentinel."""
+    while True:
+        record = events_queue.get()
+        if record is None:
+            return
+        events.publish(record)
+
 
 def create_orchestrator(
     secrets_file: Optional[str] = None,
-    config: Optional[PostingConfig] = None
+    config: Optional[PostingConfig] = None,
+    journal: Optional[PostingJournal] = None,
+    events: Optional[EventBus] = None,
+    report_writer: Optional[JsonlReportWriter] = None
 ) -> BatchPostingOrchestrator:
     """
     Factory function to create an orchestrator.
 
     Args:
-        secrets_file: Optional path to secrets JSON file
+        secrets_file: Optional path to external secrets JSON file
         config: Optional PostingConfig
+        journal: Optional PostingJournal for crash-safe resume
+        events: Optional EventBus for structured progress events
+        report_writer: Optional JsonlReportWriter for a streaming report
 
     Returns:
         BatchPostingOrchestrator instance
@@ -346,5 +1540,8 @@ def create_orchestrator(
     credential_manager = CredentialManager(secrets_file=secrets_file)
     return BatchPostingOrchestrator(
         credential_manager=credential_manager,
-        config=config
+        config=config,
+        journal=journal,
+        events=events,
+        report_writer=report_writer
     )
@@ -0,0 +1,265 @@
+"""
+Adaptive pacing for batch posting.
+
+Replaces the fixed ``delay_between_posts``/``delay_between_accounts``
+sleeps with token buckets whose refill rate is tuned by AIMD (additive
+increase, multiplicative decrease):
+
+- every clean publish raises the per-account rate by ``increase`` posts/min
+- a rate-limit or captcha signal, a publish that could not be verified, or
+  a publish much slower than usual cuts the rate by ``decrease``
+
+Each account has its own bucket, and a global bucket (refilled at the
+account rate times ``concurrency``) caps the combined rate, so one rate
+applies to all accounts at once. In parallel runs a single controller is
+shared by the worker processes through a multiprocessing manager.
+"""
+import threading
+import time
+from multiprocessing.managers import SyncManager
+from typing import Callable, Dict, Optional
+
+from core.models import PostResult, FAILURE_CAPTCHA, FAILURE_RATE_LIMIT
+
+
+PACING_MODES = ('fixed', 'adaptive')
+
+# Failure kinds that mean Naver wants us to slow down
+CONGESTION_FAILURES = frozenset({FAILURE_RATE_LIMIT, FAILURE_CAPTCHA})
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of blocking.
+
+    ``reserve()`` takes a token right away and returns how long the caller
+    has to wait for it; the balance may go negative, so callers that
+    reserve back to back are spaced out in order.
+    """
+
+    def __init__(self, capacity: float, clock: Callable[[], float]):
+        """
+        Initialize bucket (full).
+
+        Args:
+            capacity: Maximum number of stored tokens (burst size)
+            clock: Monotonic clock in seconds
+        """
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self._updated = clock()
+
+    def reserve(self, rate: float) -> float:
+        """
+        Take one token.
+
+        Args:
+            rate: Refill rate in tokens per second
+
+        Returns:
+            Seconds until the token is actually available (0 if now)
+        """
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * rate)
+        self._updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / rate
+
+
+class PacingController:
+    """
+    AIMD-controlled posting rate shared by all accounts.
+
+    Call ``reserve()`` before posting and sleep for the returned time, then
+    ``record()`` the outcome. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 12.0,
+        min_rate: float = 0.5,
+        max_rate: float = 30.0,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        burst: float = 1.0,
+        concurrency: int = 1,
+        slow_factor: float = 2.0,
+        clock: Optional[Callable[[], float]] = None
+    ):
+        """
+        Initialize pacing controller.
+
+        Args:
+            initial_rate: Starting rate in posts per minute per account
+            min_rate: Lowest rate in posts per minute per account
+            max_rate: Highest rate in posts per minute per account
+            increase: Posts per minute added after each clean publish
+            decrease: Factor applied to the rate on a congestion signal
+            burst: Posts an idle account may make without waiting
+            concurrency: Accounts posting at the same time (scales the global bucket)
+            slow_factor: A publish slower than this multiple of the average
+                latency counts as a congestion signal
+            clock: Monotonic clock in seconds
+        """
+        self.min_rate = min(min_rate, max_rate)
+        self.max_rate = max_rate
+        self.rate = max(self.min_rate, min(max_rate, initial_rate))
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = burst
+        self.concurrency = max(1, concurrency)
+        self.slow_factor = slow_factor
+        self.clock = clock or time.monotonic
+        self.increases = 0
+        self.decreases = 0
+        self.last_signal = ""
+        self._lock = threading.Lock()
+        self._global = TokenBucket(burst * self.concurrency, self.clock)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._accounts: Dict[str, dict] = {}
+        self._avg_latency: Optional[float] = None
+        self._latency_samples = 0
+        self._last_decrease: Optional[float] = None
+
+    def reserve(self, sns_id: str) -> float:
+        """
+        Reserve the next post of an account.
+
+        Args:
+            sns_id: Account about to post
+
+        Returns:
+            Seconds to wait before posting
+        """
+        with self._lock:
+            per_second = self.rate / 60
+            bucket = self._buckets.get(sns_id)
+            if bucket is None:
+                bucket = self._buckets[sns_id] = TokenBucket(self.burst, self.clock)
+            wait = max(
+                bucket.reserve(per_second),
+                self._global.reserve(per_second * self.concurrency),
+            )
+            self._account(sns_id)['waited_seconds'] += wait
+            return wait
+
+    def record(self, sns_id: str, result: PostResult, latency: float, verified: bool = True) -> float:
+        """
+        Adjust the rate from the outcome of a post.
+
+        Args:
+            sns_id: Account that posted
+            result: Result of the post
+            latency: Seconds the post took
+            verified: False if the post was published but could not be verified
+
+        Returns:
+            The rate in posts per minute after the adjustment
+        """
+        with self._lock:
+            account = self._account(sns_id)
+            account['posts'] += 1
+
+            if result.failure_kind in CONGESTION_FAILURES:
+                self._decrease(result.failure_kind)
+            elif not verified:
+                self._decrease('unverified')
+            elif result.success:
+                if self._is_slow(latency):
+                    self._decrease('slow_publish')
+                else:
+                    self.rate = min(self.max_rate, self.rate + self.increase)
+                    self.increases += 1
+                self._add_latency(latency)
+            return self.rate
+
+    def snapshot(self) -> dict:
+        """Current pacing state for reports."""
+        with self._lock:
+            return {
+                'mode': 'adaptive',
+                'rate_per_minute': round(self.rate, 2),
+                'min_rate_per_minute': self.min_rate,
+                'max_rate_per_minute': self.max_rate,
+                'increases': self.increases,
+                'decreases': self.decreases,
+                'last_signal': self.last_signal,
+                'avg_publish_seconds': round(self._avg_latency, 1) if self._avg_latency is not None else None,
+                'accounts': {
+                    sns_id: {
+                        'posts': account['posts'],
+                        'waited_seconds': round(account['waited_seconds'], 1),
+                    }
+                    for sns_id, account in self._accounts.items()
+                },
+            }
+
+    def _account(self, sns_id: str) -> dict:
+        """Per-account counters."""
+        if sns_id not in self._accounts:
+            self._accounts[sns_id] = {'posts': 0, 'waited_seconds': 0.0}
+        return self._accounts[sns_id]
+
+    def _decrease(self, signal: str):
+        """
+        Cut the rate, at most once per current post interval.
+
+        Workers that hit the same limit at the same time would otherwise
+        cut the rate once each.
+        """
+        self.last_signal = signal
+        now = self.clock()
+        if self._last_decrease is not None and now - self._last_decrease < 60 / self.rate:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.decreases += 1
+
+    def _is_slow(self, latency: float) -> bool:
+        """Whether a publish took much longer than the average so far."""
+        return self._latency_samples >= 3 and latency > self._avg_latency * self.slow_factor
+
+    def _add_latency(self, latency: float):
+        """Update the moving average of publish latency."""
+        self._latency_samples += 1
+        if self._avg_latency is None:
+            self._avg_latency = latency
+        else:
+            self._avg_latency += (latency - self._avg_latency) * 0.2
+
+
+class PacingManager(SyncManager):
+    """Multiprocessing manager that serves a shared PacingController."""
+
+
+PacingManager.register('PacingController', PacingController)
+
+
+def create_pacer(config, concurrency: int = 1, manager: Optional[PacingManager] = None):
+    """
+    Create a pacing controller from a PostingConfig.
+
+    Args:
+        config: PostingConfig (pacing_* fields)
+        concurrency: Accounts posting at the same time
+        manager: Started PacingManager to create a shared (proxied) controller
+
+    Returns:
+        PacingController (or its proxy), or None for fixed pacing
+    """
+    if config.pacing != 'adaptive':
+        return None
+
+    initial_rate = 60 / config.delay_between_posts if config.delay_between_posts > 0 else config.pacing_max_rate
+    kwargs = dict(
+        initial_rate=initial_rate,
+        min_rate=config.pacing_min_rate,
+        max_rate=config.pacing_max_rate,
+        concurrency=concurrency,
+    )
+    if manager is not None:
+        return manager.PacingController(**kwargs)
+    return PacingController(**kwargs)
@@ -0,0 +1,172 @@
+"""
+Pipelined posting stages.
+
+Publishing is the only step that has to respect the spacing between
+posts; everything else is moved off that critical path:
+
+- ``EntryPreparer`` renders content, resolves tags and collects image URLs
+  (and their downloaded files, with an ImageFetcher) for the next entries
+  in a background thread while the current one is being published
+- ``IdleWindowRunner`` runs deferred browser work (verifying the previous
+  post) inside the delay between publishes and only sleeps for whatever
+  part of the delay is left
+
+Logging in to the next account in a background browser is done by the
+orchestrator itself (see ``BatchPostingOrchestrator._open_session``).
+"""
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Union
+
+from adapters.images import ImageFetcher
+from core.models import BlogPostEntry
+from core.rendering import render_content
+
+
+@dataclass
+class PreparedPost:
+    """Everything the writer needs for an entry, computed ahead of time."""
+    entry: BlogPostEntry
+    content_text: str
+    tags: List[str] = field(default_factory=list)
+    image_urls: List[str] = field(default_factory=list)
+    image_files: List[str] = field(default_factory=list)  # downloaded images, to upload
+
+
+def prepare_post(entry: BlogPostEntry, images: Optional[ImageFetcher] = None) -> PreparedPost:
+    """
+    Render and collect the inputs of one post.
+
+    Args:
+        entry: Entry to prepare
+        images: Downloads the entry's images (not downloaded if None)
+
+    Returns:
+        PreparedPost for the entry
+    """
+    content = entry.sns_upload_cont
+    image_urls = content.get_image_urls()
+    return PreparedPost(
+        entry=entry,
+        content_text=render_content(content, format='plain'),
+        tags=content.get_tags(),
+        image_urls=image_urls,
+        image_files=images.local_files(image_urls) if images else [],
+    )
+
+
+class EntryPreparer:
+    """
+    Prepares entries a few steps ahead of the one being posted.
+
+    Preparation runs in a single background thread; ``get()`` returns the
+    prepared post (waiting only if it is not ready yet) and queues the
+    next entry, so at most ``lookahead`` entries are held in memory.
+    """
+
+    def __init__(self, entries: List[BlogPostEntry], lookahead: int = 2,
+                 images: Optional[ImageFetcher] = None):
+        """
+        Initialize preparer and start on the first entries.
+
+        Args:
+            entries: Entries in posting order
+            lookahead: Entries prepared ahead of the current one
+            images: Downloads the entries' images (see prepare_post)
+        """
+        self._entries = list(entries)
+        self._lookahead = max(1, lookahead)
+        self._images = images
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prepare')
+        self._futures: Dict[int, Future] = {}
+        self._next = 0
+        self._fill()
+
+    def _fill(self):
+        """Queue entries until ``lookahead`` are pending."""
+        while self._next < len(self._entries) and len(self._futures) < self._lookahead:
+            entry = self._entries[self._next]
+            self._futures[entry.index] = self._executor.submit(prepare_post, entry, self._images)
+            self._next += 1
+
+    def get(self, entry: BlogPostEntry) -> PreparedPost:
+        """
+        Get the prepared post of an entry.
+
+        Args:
+            entry: Entry about to be posted
+
+        Returns:
+            PreparedPost (prepared on the spot if it was never queued)
+        """
+        future = self._futures.pop(entry.index, None)
+        self._fill()
+        if future is None:
+            return prepare_post(entry, self._images)
+        return future.result()
+
+    def close(self):
+        """Stop the background thread, dropping unused preparations."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=False)
+
+
+class IdleWindowRunner:
+    """
+    Runs deferred work in the delay between two publishes.
+
+    Deferred tasks always run to completion (they use the browser, so
+    they must finish before the next post starts); the delay is measured
+    from the start of the window, so it is only extended when the tasks
+    take longer than the delay itself.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], None]] = None
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            clock: Monotonic clock in seconds
+            sleep: Sleep function (defaults to time.sleep)
+        """
+        self.clock = clock or time.monotonic
+        self._sleep = sleep
+        self._tasks: Deque[Callable[[], None]] = deque()
+        # Seconds of idle time spent on deferred work instead of sleeping
+        self.overlapped = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Number of deferred tasks not run yet."""
+        return len(self._tasks)
+
+    def defer(self, task: Callable[[], None]):
+        """Queue a task for the next idle window."""
+        self._tasks.append(task)
+
+    def idle(self, seconds: Union[float, Callable[[], float]] = 0.0):
+        """
+        Run deferred tasks, then sleep out the rest of the window.
+
+        Args:
+            seconds: Length of the window, or a callable evaluated after
+                the tasks ran (when the tasks decide how long to wait)
+        """
+        started = self.clock()
+        while self._tasks:
+            self._tasks.popleft()()
+        busy = self.clock() - started
+
+        window = seconds() if callable(seconds) else seconds
+        self.overlapped += min(busy, window)
+        remaining = window - busy
+        if remaining > 0:
+            (self._sleep or time.sleep)(remaining)
@@ -0,0 +1,61 @@
+"""
+Interleaved scheduling of several account sessions in one process.
+
+Each account has to keep a minimum spacing between its own posts, but
+nothing stops another account from posting in the meantime. The
+scheduler keeps several logged-in sessions open and always lets the
+account that may post soonest go next, so one account's cooldown is
+filled with another account's post.
+"""
+import time
+from typing import Callable, Dict, List, Optional, Protocol
+
+
+class SchedulableRun(Protocol):
+    """What the scheduler needs to know about an account session."""
+
+    def ready_at(self) -> float:
+        """Monotonic time at which the account may post next."""
+
+
+class InterleavedScheduler:
+    """
+    Picks which open account session posts next.
+
+    The account that becomes ready first wins; accounts that are ready at
+    the same time take turns (round-robin, least recently served first).
+    """
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialize scheduler.
+
+        Args:
+            clock: Monotonic clock in seconds
+        """
+        self.clock = clock or time.monotonic
+        self._served: Dict[int, int] = {}
+        self._turn = 0
+
+    def pick(self, runs: List[SchedulableRun]):
+        """
+        Choose the next account to post.
+
+        Args:
+            runs: Open account sessions with entries left
+
+        Returns:
+            The chosen run
+        """
+        now = self.clock()
+        run = min(
+            runs,
+            key=lambda r: (max(r.ready_at(), now), self._served.get(id(r), -1)),
+        )
+        self._turn += 1
+        self._served[id(run)] = self._turn
+        return run
+
+    def forget(self, run: SchedulableRun):
+        """Drop a finished run's round-robin state."""
+        self._served.pop(id(run), None)
@@ -41,6 +41,21 @@ Examples:
     # Post and save report
     nblog post input.json --all --out report.json
 
+    # Post 4 accounts at a time
+    nblog post input.json --all --jobs 4
+
+    # Reuse 2 warm browsers across accounts instead of cold-starting each
+    nblog post input.json --all --browser-pool 2
+
+    # Write the report incrementally (survives crashes, flat memory)
+    nblog post input.json --all --report-jsonl report.jsonl
+
+    # Stream progress events as JSONL for monitoring
+    nblog post input.json --all --events events.jsonl
+
+    # Continue an interrupted run without re-posting finished entries
+    nblog post input.json --all --resume
+
     # Check system health
     nblog doctor
 '''
@@ -126,6 +141,25 @@ Examples:
         metavar='FILE',
         help='Write JSON report to this file'
     )
+    post_parser.add_argument(
+        '--report-jsonl',
+        type=str,
+        metavar='FILE',
+        help='Append one JSONL record per result as it finishes; results are '
+             'then not kept in memory (--out only gets the summary)'
+    )
+    post_parser.add_argument(
+        '--report-fsync',
+        choices=['always', 'interval', 'never'],
+        default='interval',
+        help='When to fsync the JSONL report (default: interval, at most once a second)'
+    )
+    post_parser.add_argument(
+        '--report-rotate-mb',
+        type=float,
+        metavar='MB',
+        help='Gzip-rotate the JSONL report once it grows past MB megabytes'
+    )
     post_parser.add_argument(
         '--secrets-file',
         type=str,
@@ -146,6 +180,173 @@ Examples:
         metavar='N',
         help='Max retries per post (default: 2)'
     )
+    post_parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume an interrupted run: skip entries already published '
+             '(tracked in ~/.nblog/journals/, keyed by input file hash)'
+    )
+    post_parser.add_argument(
+        '--no-session-cache',
+        action='store_false',
+        dest='reuse_sessions',
+        help='Always log in instead of reusing cached login cookies'
+    )
+    post_parser.set_defaults(reuse_sessions=True)
+    post_parser.add_argument(
+        '--no-editor-cache',
+        action='store_false',
+        dest='reuse_editor_urls',
+        help='Always find the editor through the blog main page instead of opening '
+             'the cached editor URL (~/.nblog/editor_urls.json)'
+    )
+    post_parser.set_defaults(reuse_editor_urls=True)
+    post_parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Post up to N accounts in parallel worker processes (default: 1)'
+    )
+    post_parser.add_argument(
+        '--sessions',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Keep N accounts logged in and interleave their posts in one process, '
+             'so one account posts while another waits out its delay (default: 1)'
+    )
+    post_parser.add_argument(
+        '--browser-pool',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Keep N warm browsers and reuse them across accounts '
+             '(default: 0, a fresh browser per account)'
+    )
+    post_parser.add_argument(
+        '--browser-max-uses',
+        type=int,
+        default=20,
+        metavar='N',
+        help='Replace a pooled browser after it served N accounts (default: 20)'
+    )
+    post_parser.add_argument(
+        '--browser-contexts',
+        action='store_true',
+        help='Run every account in an isolated browser context (own cookies and '
+             'storage) of one shared Chrome instead of a browser per account'
+    )
+    post_parser.add_argument(
+        '--draft-tabs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Editor tabs per account: with N > 1, the next entries load in background '
+             'tabs and the next one is typed in during the delay, so each publish is '
+             'only the final click (CDP writer, default: 1)'
+    )
+    post_parser.add_argument(
+        '--preload',
+        action='store_true',
+        help="Load the next entry's editor in a background tab while the current one "
+             "publishes (default: load each editor only when its entry's turn comes)"
+    )
+    post_parser.add_argument(
+        '--http-verify',
+        action='store_true',
+        help='Check the blog post list over HTTP in the background and use the browser '
+             'only as a fallback (default: verify every post in the browser)'
+    )
+    post_parser.add_argument(
+        '--block-resources',
+        nargs='?',
+        const='images,media,fonts,trackers',
+        default=None,
+        metavar='GROUPS',
+        help='Do not load these resources in the browser, comma separated from '
+             'images, media, fonts, trackers (default with no value: all of them)'
+    )
+    post_parser.add_argument(
+        '--block-url',
+        action='append',
+        dest='block_urls',
+        default=[],
+        metavar='PATTERN',
+        help="Also do not load URLs matching PATTERN ('*' wildcards, repeatable)"
+    )
+    post_parser.add_argument(
+        '--upload-images',
+        action='store_true',
+        help="Download each entry's images (all at once, in the background) and upload "
+             'them at the end of the post (CDP writer)'
+    )
+    post_parser.add_argument(
+        '--image-cache-mb',
+        type=int,
+        default=512,
+        metavar='MB',
+        help='Keep up to MB of downloaded images in ~/.nblog/images, so images used '
+             'again are not downloaded again (default: 512, per --jobs worker)'
+    )
+    post_parser.add_argument(
+        '--normalize-images',
+        action='store_true',
+        help='With --upload-images: downscale, strip metadata from and re-encode each '
+             'image before upload, in worker processes (needs Pillow)'
+    )
+    post_parser.add_argument(
+        '--image-max-width',
+        type=int,
+        default=966,
+        metavar='PX',
+        help='Width of normalized images at most (default: 966, the widest the blog shows)'
+    )
+    post_parser.add_argument(
+        '--image-quality',
+        type=int,
+        default=85,
+        metavar='Q',
+        help='JPEG quality of normalized images, 1-95 (default: 85)'
+    )
+    post_parser.add_argument(
+        '--batch-verify',
+        action='store_true',
+        dest='verify_batch',
+        help="Verify an account's posts together after its last publish, against one read "
+             "of the blog's post list, and publish missing ones again (CDP writer)"
+    )
+    post_parser.add_argument(
+        '--pacing',
+        choices=['adaptive', 'fixed'],
+        default='fixed',
+        help='fixed: sleep a constant delay between posts and accounts; adaptive: raise '
+             'the posting rate while posts go through and cut it on rate limits, '
+             'captchas or slow/unverified publishes (default: fixed)'
+    )
+    post_parser.add_argument(
+        '--max-rate',
+        type=float,
+        default=30.0,
+        metavar='N',
+        help='Adaptive pacing ceiling in posts per minute per account (default: 30)'
+    )
+    post_parser.add_argument(
+        '--no-pipeline',
+        action='store_false',
+        dest='pipeline',
+        help='Verify each post before the next one and log in to each account only '
+             'when its turn comes (default: verify during the delay before the next '
+             'post and log in to the next account in a second browser meanwhile)'
+    )
+    post_parser.set_defaults(pipeline=True)
+    post_parser.add_argument(
+        '--events',
+        type=str,
+        metavar='FILE',
+        help='Append structured progress events as JSONL to FILE '
+             '(use fd:N to write to an open file descriptor)'
+    )
     post_parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -185,11 +386,49 @@ def cmd_validate(args) -> int:
 def cmd_post(args) -> int:
     """Execute post command."""
     from core.validation import load_and_validate
+    from adapters.browser import blocked_url_patterns
     from adapters.report import create_reporter
     from adapters.secrets import CredentialManager
 
+    if args.jobs < 1 or args.sessions < 1 or args.draft_tabs < 1:
+        print("[ERROR] --jobs, --sessions and --draft-tabs must be at least 1")
+        return 1
+    if args.browser_pool < 0 or args.browser_max_uses < 1:
+        print("[ERROR] --browser-pool must be >= 0 and --browser-max-uses at least 1")
+        return 1
+    if args.browser_contexts and args.browser_pool:
+        print("[ERROR] --browser-contexts and --browser-pool cannot be combined")
+        return 1
+    if args.report_rotate_mb is not None and args.report_rotate_mb <= 0:
+        print("[ERROR] --report-rotate-mb must be positive")
+        return 1
+    if args.max_rate <= 0:
+        print("[ERROR] --max-rate must be positive")
+        return 1
+    if args.image_cache_mb < 1:
+        print("[ERROR] --image-cache-mb must be at least 1")
+        return 1
+    if args.image_max_width < 1:
+        print("[ERROR] --image-max-width must be at least 1")
+        return 1
+    if not 1 <= args.image_quality <= 95:
+        print("[ERROR] --image-quality must be between 1 and 95")
+        return 1
+    try:
+        groups = [g.strip() for g in args.block_resources.split(',') if g.strip()] if args.block_resources else []
+        blocked_urls = tuple(blocked_url_patterns(groups, args.block_urls))
+    except ValueError as e:
+        print(f"[ERROR] --block-resources: {e}")
+        return 1
+
     # Create reporter
-    reporter = create_reporter(output_file=args.out, quiet=args.quiet)
+    reporter = create_reporter(
+        output_file=args.out,
+        quiet=args.quiet,
+        jsonl_file=args.report_jsonl,
+        fsync=args.report_fsync,
+        rotate_bytes=int(args.report_rotate_mb * 1024 * 1024) if args.report_rotate_mb else None,
+    )
     reporter.start()
 
     # Validate input
@@ -224,26 +463,71 @@ def cmd_post(args) -> int:
         return 0
 
     # Import posting modules (requires selenium)
-    from automation.naver_blog import PostingConfig, create_orchestrator
+    from automation.naver_blog import (
+        PostingConfig, PostingJournal, create_event_bus, create_orchestrator
+    )
+
+    # Crash-safe journal for this input file
+    journal = PostingJournal.for_input_file(args.input_file)
+    if not args.resume:
+        previous = journal.load()
+        if previous.completed:
+            print(f"[WARNING] A previous run of this file published {len(previous.completed)} "
+                  f"entries; they will be posted again. Use --resume to skip them.")
 
     # Create posting config
     config = PostingConfig(
         max_retries=args.retries,
         headless=args.headless,
+        jobs=args.jobs,
+        reuse_sessions=args.reuse_sessions,
+        reuse_editor_urls=args.reuse_editor_urls,
+        browser_pool_size=args.browser_pool,
+        browser_max_uses=args.browser_max_uses,
+        keep_results=args.report_jsonl is None,
+        pacing=args.pacing,
+        pacing_max_rate=args.max_rate,
+        pipeline=args.pipeline,
+        sessions=args.sessions,
+        browser_contexts=args.browser_contexts,
+        draft_tabs=args.draft_tabs,
+        preload_editor=args.preload,
+        http_verify=args.http_verify,
+        verify_batch=args.verify_batch,
+        blocked_urls=blocked_urls,
+        upload_images=args.upload_images,
+        image_cache_mb=args.image_cache_mb,
+        normalize_images=args.normalize_images,
+        image_max_width=args.image_max_width,
+        image_quality=args.image_quality,
     )
 
+    # Structured progress events (no-op without --events)
+    try:
+        events = create_event_bus(args.events)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Cannot open events output {args.events}: {e}")
+        return 1
+
     # Create orchestrator
     orchestrator = create_orchestrator(
         secrets_file=args.secrets_file,
-        config=config
+        config=config,
+        journal=journal,
+        events=events,
+        report_writer=reporter.stream
     )
 
     # Post
-    result = orchestrator.post_all(
-        entries=entries,
-        filter_email=args.filter_email,
-        account_index=args.account_index
-    )
+    try:
+        result = orchestrator.post_all(
+            entries=entries,
+            filter_email=args.filter_email,
+            account_index=args.account_index,
+            resume=args.resume
+        )
+    finally:
+        events.close()
 
     # Report results
     reporter.report_batch_result(result)
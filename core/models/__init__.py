@@ -5,10 +5,36 @@ from .blog_post import (
     PostResult,
     BatchPostResult,
 )
+from .failure import (
+    FAILURE_AUTH,
+    FAILURE_CAPTCHA,
+    FAILURE_RATE_LIMIT,
+    FAILURE_SELECTOR_DRIFT,
+    FAILURE_NETWORK,
+    FAILURE_BROWSER_CRASH,
+    FAILURE_UNKNOWN,
+    FAILURE_KINDS,
+    TRANSIENT_FAILURES,
+    ACCOUNT_FATAL_FAILURES,
+    classify_error,
+    is_transient,
+)
 
 __all__ = [
     'BlogContent',
     'BlogPostEntry',
     'PostResult',
     'BatchPostResult',
+    'FAILURE_AUTH',
+    'FAILURE_CAPTCHA',
+    'FAILURE_RATE_LIMIT',
+    'FAILURE_SELECTOR_DRIFT',
+    'FAILURE_NETWORK',
+    'FAILURE_BROWSER_CRASH',
+    'FAILURE_UNKNOWN',
+    'FAILURE_KINDS',
+    'TRANSIENT_FAILURES',
+    'ACCOUNT_FATAL_FAILURES',
+    'classify_error',
+    'is_transient',
 ]
@@ -167,6 +167,8 @@ class PostResult:
     error_message: str = ""
     post_url: str = ""
     timestamp: str = ""
+    failure_kind: str = ""  # one of core.models.failure.FAILURE_KINDS when not successful
+    bytes_received: int = 0  # network bytes the browser received for this post (0 if not measured)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON report."""
@@ -178,6 +180,8 @@ class PostResult:
             'error_message': self.error_message,
             'post_url': self.post_url,
             'timestamp': self.timestamp,
+            'failure_kind': self.failure_kind,
+            'bytes_received': self.bytes_received,
         }
 
 
@@ -189,11 +193,16 @@ class BatchPostResult:
     failed: int = 0
     skipped: int = 0
     results: List[PostResult] = field(default_factory=list)
+    keep_results: bool = True  # False: only count (results are streamed elsewhere)
+    pacing: Optional[dict] = None  # final adaptive pacing state (None with fixed delays)
+    bytes_received: int = 0  # sum of the results' bytes_received
 
     def add_result(self, result: PostResult):
         """Add a result and update counters."""
-        self.results.append(result)
+        if self.keep_results:
+            self.results.append(result)
         self.total += 1
+        self.bytes_received += result.bytes_received
         if result.success:
             self.successful += 1
         else:
@@ -205,12 +214,16 @@ class BatchPostResult:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON report."""
-        return {
+        report = {
             'summary': {
                 'total': self.total,
                 'successful': self.successful,
                 'failed': self.failed,
                 'skipped': self.skipped,
+                'bytes_received': self.bytes_received,
             },
             'results': [r.to_dict() for r in self.results],
         }
+        if self.pacing is not None:
+            report['pacing'] = self.pacing
+        return report
@@ -0,0 +1,74 @@
+"""
+Failure classification for post results.
+
+Every failed ``PostResult`` carries a ``failure_kind`` so callers can
+react by class instead of parsing free-text error messages:
+
+- ``auth``: wrong password, locked or suspended account, missing credentials
+- ``captcha``: captcha or extra verification required
+- ``rate_limit``: Naver refuses because of posting or request volume
+- ``selector_drift``: an expected page element was not found
+- ``network``: page loads or requests failed or timed out
+- ``browser_crash``: the browser or its session died
+- ``unknown``: anything else
+"""
+import re
+
+
+FAILURE_AUTH = 'auth'
+FAILURE_CAPTCHA = 'captcha'
+FAILURE_RATE_LIMIT = 'rate_limit'
+FAILURE_SELECTOR_DRIFT = 'selector_drift'
+FAILURE_NETWORK = 'network'
+FAILURE_BROWSER_CRASH = 'browser_crash'
+FAILURE_UNKNOWN = 'unknown'
+
+FAILURE_KINDS = (
+    FAILURE_AUTH,
+    FAILURE_CAPTCHA,
+    FAILURE_RATE_LIMIT,
+    FAILURE_SELECTOR_DRIFT,
+    FAILURE_NETWORK,
+    FAILURE_BROWSER_CRASH,
+    FAILURE_UNKNOWN,
+)
+
+# Failures that may go away by waiting
+TRANSIENT_FAILURES = frozenset({FAILURE_RATE_LIMIT, FAILURE_NETWORK, FAILURE_BROWSER_CRASH})
+
+# Failures that make every further post of the same account pointless
+ACCOUNT_FATAL_FAILURES = frozenset({FAILURE_AUTH, FAILURE_CAPTCHA})
+
+# (kind, pattern) checked in order; the first match wins
+_PATTERNS = [
+    (FAILURE_CAPTCHA, r'captcha|protect|보안\s*문자|자동입력\s*방지|추가\s*인증'),
+    (FAILURE_AUTH, r'login failed|no credentials|password|비밀번호|보호조치|잠금|locked|suspend|이용\s*제한'),
+    (FAILURE_RATE_LIMIT, r'too many|rate.?limit|\b429\b|잠시\s*후|짧은\s*시간|많은\s*글|일시적으로'),
+    (FAILURE_BROWSER_CRASH, r'invalid session id|chrome not reachable|disconnected|session deleted|'
+                            r'no such window|target window already closed|tab crashed|worker failed'),
+    (FAILURE_NETWORK, r'net::err|err_[a-z_]+|timed? ?out|timeout|connection (refused|reset|aborted)|'
+                      r'max retries exceeded|name or service not known'),
+    (FAILURE_SELECTOR_DRIFT, r'no such element|unable to locate|not found|찾을 수 없|찾지 못'),
+]
+
+
+def classify_error(message: str) -> str:
+    """
+    Classify an error message or alert text.
+
+    Args:
+        message: Exception text, error message or page alert text
+
+    Returns:
+        One of FAILURE_KINDS (FAILURE_UNKNOWN if nothing matches)
+    """
+    text = (message or '').lower()
+    for kind, pattern in _PATTERNS:
+        if re.search(pattern, text):
+            return kind
+    return FAILURE_UNKNOWN
+
+
+def is_transient(kind: str) -> bool:
+    """Whether a failure kind may succeed after waiting."""
+    return kind in TRANSIENT_FAILURES
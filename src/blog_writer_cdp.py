@@ -7,7 +7,7 @@ Chrome DevTools MCP 기반 블로그 글쓰기 모듈
 Chrome DevTools Protocol을 활용하여 더 안정적인 페이지 조작
 """
 import time
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -16,6 +16,52 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from src.config import Config
+from src.cdp_wait import CDPWaiter
+from src.cdp_runtime import CDPHelperRuntime
+from src.cdp_network import PublishResponseCapture, extract_log_no, build_post_url
+
+
+# 발행 팝업 체크박스 옵션 (설정 키, 레이블 검색 텍스트)
+# 순서가 중요: 앞의 옵션이 먼저 체크박스를 차지함
+PUBLISH_CHECKBOX_TEXTS = [
+    ('allow_comment', ['댓글허용', '댓글 허용', '댓글']),
+    ('allow_sympathy', ['공감허용', '공감 허용', '공감']),
+    ('allow_search', ['검색허용', '검색 허용', '검색']),
+    ('allow_external_share', ['외부 공유 허용', '외부 공유', '외부공유', '외부']),
+    ('blog_cafe_share', ['블로그/카페', '블로그·카페', '카페 공유', '카페']),
+    ('is_notice', ['공지사항', '공지 사항', '공지']),
+]
+
+# 기본 발행 설정
+DEFAULT_PUBLISH_SETTINGS = {
+    'visibility': 'public',
+    'allow_comment': True,
+    'allow_sympathy': True,
+    'allow_search': True,
+    'blog_cafe_share': 'link',
+    'allow_external_share': True,
+    'is_notice': False
+}
+
+# 발행 전까지의 단계 (draft_post 로 미리 작성해 둘 수 있는 부분)
+DRAFT_STEPS = ('navigate', 'title', 'content', 'images', 'open_popup', 'configure')
+
+# 에디터 툴바의 사진 버튼
+IMAGE_BUTTON_SELECTOR = 'button[data-name="image"], button.se-image-toolbar-button'
+# 사진 버튼이 여는 파일 입력 요소 (이미지만 받는 것, 첨부파일 등 다른 입력과 구분)
+IMAGE_FILE_INPUT_SELECTOR = 'input[type="file"][accept*="image"]'
+# 업로드된 이미지 (업로드 완료 확인용)
+EDITOR_IMAGE_SELECTOR = '.se-component.se-image'
+# 이미지 업로드 완료 대기 시간 (초, 이미지 한 장당)
+IMAGE_UPLOAD_TIMEOUT = 15
+
+# 공개 설정 값 -> 팝업 라디오 레이블
+VISIBILITY_TEXTS = {
+    'public': '전체공개',
+    'neighbor': '이웃공개',
+    'mutual': '서로이웃공개',
+    'private': '비공개',
+}
 
 
 class NaverBlogWriterCDP:
@@ -25,7 +71,104 @@ class NaverBlogWriterCDP:
         self.driver = driver
         self.config = config
         self.wait = WebDriverWait(driver, 20)
+        self.waiter = CDPWaiter(driver)
+        self.js = CDPHelperRuntime(driver)
         self.blog_id = config.blog_id
+        # 마지막으로 발행한 글 (발행 응답에서 얻음)
+        self.last_log_no: Optional[str] = None
+        self.last_post_url: Optional[str] = None
+        # 단계 시작/종료 알림 (phase, step, attempt=..., retry=..., ok=..., duration_ms=...)
+        self.step_listener: Optional[Callable] = None
+        # 단계별 재시도 횟수 (복구 동작 후 같은 단계만 다시 실행)
+        self.step_retries = 2
+        # 이번 시도에서 최종 발행까지 완료했는지 (재시작 시 중복 발행 방지)
+        self._published = False
+        # 마지막 실패 정보 (실패 원인 분류용)
+        self.last_failed_step: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_alert_text: Optional[str] = None
+        # 이 글을 작성하는 탭의 창 핸들 (None 이면 현재 탭)
+        self.window: Optional[str] = None
+        # 탭을 열 때 에디터 주소를 이미 불러오기 시작했는지 (이동 대신 로드만 대기)
+        self.editor_preloaded = False
+        # 마지막으로 찾은 글쓰기 주소 (다음 글의 탭을 미리 열 때 사용)
+        self.editor_url: Optional[str] = None
+        # 블로그별 글쓰기 주소 캐시 (get/put/invalidate, 없으면 매번 블로그 메인에서 찾음)
+        self.editor_url_cache = None
+        # draft_post 로 발행 직전(발행 팝업 설정)까지 작성해 두었는지
+        self.drafted = False
+        # 발행 응답 캡처가 읽은 로그의 수신 바이트를 넘길 TrafficMeter (src.cdp_network)
+        self.traffic_meter = None
+    
+    @property
+    def published(self) -> bool:
+        """마지막 시도에서 최종 발행 버튼까지 눌렸는지 (확인 실패와 발행 실패 구분용)"""
+        return self._published
+    
+    def _run_step(self, step: str, attempt: int, func: Callable, retry: int = 0):
+        """단계 실행 후 결과 반환 (step_listener 가 있으면 시작/종료 알림)"""
+        if self.step_listener is None:
+            return func()
+        
+        self.step_listener('started', step, attempt=attempt, retry=retry)
+        started = time.monotonic()
+        result = None
+        try:
+            result = func()
+            return result
+        finally:
+            self.step_listener('finished', step, attempt=attempt, retry=retry, ok=bool(result),
+                               duration_ms=round((time.monotonic() - started) * 1000, 1))
+    
+    def _run_recoverable_step(self, step: str, attempt: int, action: Callable,
+                              check: Optional[Callable] = None,
+                              recover: Optional[Callable] = None) -> bool:
+        """
+        한 단계를 실행하고, 실패하면 복구 동작 후 그 단계만 다시 실행
+        
+        Args:
+            step: 단계 이름
+            attempt: 전체 시도 번호
+            action: 단계 동작 (성공 시 truthy 반환)
+            check: 단계 결과 확인 (동작 후 / 복구 후 이미 완료되었는지)
+            recover: 재시도 전 복구 동작 (False 반환 시 이 단계에서는 복구 불가)
+            
+        Returns:
+            bool: 단계 성공 여부 (False면 전체 재시작 필요)
+        """
+        for retry in range(self.step_retries + 1):
+            if retry > 0:
+                # 동작은 실패로 보고했지만 실제로는 완료된 경우 (예: 발행 후 응답 대기 중 오류)
+                if check is not None and check():
+                    return True
+                print(f"[INFO] [CDP] '{step}' 단계 재시도 {retry}/{self.step_retries}")
+                if recover is not None and not recover():
+                    print(f"[WARNING] [CDP] '{step}' 단계 복구 불가")
+                    return False
+                # 복구 동작으로 이미 완료된 상태가 되었으면 다시 실행하지 않음 (예: 새로고침으로 에디터 로드)
+                if check is not None and check():
+                    return True
+            
+            if self._run_step(step, attempt, action, retry=retry) and (check is None or check()):
+                return True
+        return False
+    
+    def _activate(self):
+        """이 글의 탭으로 전환 (탭이 지정된 경우)"""
+        if self.window:
+            self.driver.switch_to.window(self.window)
+    
+    def _open_editor(self) -> bool:
+        """에디터 이동 후 임시저장/도움말 팝업 정리"""
+        # 미리 열어 둔 탭이면 로드만 기다림 (실패하면 평소처럼 이동)
+        preloaded, self.editor_preloaded = self.editor_preloaded, False
+        if not (preloaded and self._wait_for_editor()) and not self._navigate_to_editor():
+            return False
+        # 임시저장 글 팝업 처리 (작성 취소)
+        self._handle_draft_popup()
+        # 도움말 팝업 닫기 (우측에 나오는 팝업)
+        self._close_help_popup()
+        return True
     
     def _execute_cdp(self, cmd: str, params: dict = None):
         """CDP 명령 실행"""
@@ -56,7 +199,6 @@ class NaverBlogWriterCDP:
                 "button": "left",
                 "clickCount": 1
             })
-            time.sleep(0.05)
             self._execute_cdp("Input.dispatchMouseEvent", {
                 "type": "mouseReleased",
                 "x": x,
@@ -100,18 +242,7 @@ class NaverBlogWriterCDP:
     
     def _get_element_center(self, selector: str) -> Optional[tuple]:
         """요소의 중심 좌표 가져오기"""
-        result = self._evaluate_js(f'''
-        (function() {{
-            const el = document.querySelector('{selector}');
-            if (!el) return null;
-            const rect = el.getBoundingClientRect();
-            return {{
-                x: rect.left + rect.width / 2,
-                y: rect.top + rect.height / 2,
-                visible: rect.width > 0 && rect.height > 0
-            }};
-        }})()
-        ''')
+        result = self.js.call('findElementCenter', selector)
         if result and result.get('visible'):
             return (result['x'], result['y'])
         return None
@@ -127,15 +258,16 @@ class NaverBlogWriterCDP:
         """알림창 처리"""
         try:
             alert = self.driver.switch_to.alert
+            self.last_alert_text = alert.text
             print(f"[WARNING] 알림창 감지: {alert.text}")
             alert.accept()
-            time.sleep(1)
         except:
             pass
     
     def write_post(self, title: str, content: str, category: Optional[str] = None, 
                    tags: Optional[List[str]] = None, publish_settings: Optional[dict] = None,
-                   max_retries: int = 2) -> bool:
+                   max_retries: int = 2, verify: bool = True,
+                   image_files: Optional[List[str]] = None) -> bool:
         """
         블로그 글 작성 및 발행 (CDP 기반)
         
@@ -156,72 +288,276 @@ class NaverBlogWriterCDP:
             tags: 태그 리스트
             publish_settings: 발행 설정 딕셔너리
             max_retries: 최대 재시도 횟수
+            verify: False 면 발행 확인을 건너뜀 (나중에 verify_post 로 확인)
+            image_files: 본문 끝에 올릴 이미지 파일 경로 (업로드 실패는 발행을 막지 않음)
         """
         # 기본 발행 설정
         if publish_settings is None:
-            publish_settings = {
-                'visibility': 'public',
-                'allow_comment': True,
-                'allow_sympathy': True,
-                'allow_search': True,
-                'blog_cafe_share': 'link',
-                'allow_external_share': True,
-                'is_notice': False
-            }
+            publish_settings = dict(DEFAULT_PUBLISH_SETTINGS)
         
-        print(f"[INFO] [CDP] 블로그 글 작성 시작: {title}")
+        print(f"[INFO] [CDP] 블로그 글 {'발행' if self.drafted else '작성'} 시작: {title}")
+        self.last_alert_text = None
+        self._activate()
+        # 미리 작성해 둔 글은 첫 시도에서 발행 단계부터 (재시작은 처음부터)
+        drafted, self.drafted = self.drafted, False
         
+        # 전체 재시작(에디터 재진입부터)은 단계별 복구가 모두 실패했을 때만
         for attempt in range(max_retries + 1):
             if attempt > 0:
-                print(f"\n[INFO] [CDP] 재시도 {attempt}/{max_retries}...")
+                print(f"\n[INFO] [CDP] 전체 재시작 {attempt}/{max_retries}...")
+            
+            self.last_log_no = None
+            self.last_post_url = None
+            self._published = False
+            self.last_failed_step = None
+            self.last_error = None
             
             try:
-                # 글쓰기 에디터로 이동
-                if not self._navigate_to_editor():
-                    continue
-                
-                # 임시저장 글 팝업 처리 (작성 취소)
-                self._handle_draft_popup()
-                
-                # 도움말 팝업 닫기 (우측에 나오는 팝업)
-                self._close_help_popup()
-                
-                # 제목 입력
-                if not self._input_title(title):
-                    continue
-                
-                # 본문 내용 입력
-                if not self._input_content(content):
-                    continue
-                
-                # 발행 (카테고리, 태그, 공개설정 포함)
-                publish_result = self._publish(title=title, category=category, tags=tags, publish_settings=publish_settings)
-                
-                if publish_result:
-                    # 발행 성공 확인 (블로그 글목록에서 확인)
-                    if self._verify_post_published(title):
-                        print("[SUCCESS] [CDP] 발행 확인 완료!")
-                        return True
-                    else:
-                        print("[WARNING] [CDP] 발행 확인 실패, 재시도...")
-                        continue
-                else:
-                    continue
-                    
+                if self._write_post_steps(title, content, category, tags, publish_settings, attempt, verify,
+                                          skip_draft=drafted and attempt == 0, image_files=image_files):
+                    print("[SUCCESS] [CDP] 발행 확인 완료!" if verify else "[SUCCESS] [CDP] 발행 완료 (확인은 나중에)")
+                    return True
             except Exception as e:
+                self.last_error = str(e)
                 print(f"[ERROR] 글 작성 중 오류 발생: {e}")
                 import traceback
                 traceback.print_exc()
-                continue
+            
+            # 이미 발행된 글을 처음부터 다시 쓰면 중복 글이 됨
+            if self._published:
+                print(f"[WARNING] [CDP] 글은 발행되었으나(logNo: {self.last_log_no}) 확인 실패 - 중복 방지를 위해 재발행하지 않음")
+                return False
         
         print(f"[ERROR] [CDP] {max_retries + 1}번 시도 후 발행 실패")
         return False
     
+    def draft_post(self, title: str, content: str, category: Optional[str] = None,
+                   tags: Optional[List[str]] = None, publish_settings: Optional[dict] = None,
+                   image_files: Optional[List[str]] = None) -> bool:
+        """
+        발행 직전까지만 작성 (에디터 이동, 제목/본문 입력, 발행 팝업 설정)
+        
+        이전 글의 발행 간격 동안 다음 글을 다른 탭에 미리 작성해 두는 용도입니다.
+        성공하면 같은 인자로 호출한 write_post 가 발행 단계부터 실행합니다.
+        실패해도 write_post 가 처음부터 다시 작성하므로 발행에는 영향이 없습니다.
+        
+        Returns:
+            bool: 발행 팝업 설정까지 완료했는지
+        """
+        if publish_settings is None:
+            publish_settings = dict(DEFAULT_PUBLISH_SETTINGS)
+        
+        print(f"[INFO] [CDP] 다음 글 미리 작성: {title}")
+        self.drafted = False
+        self._activate()
+        try:
+            self.drafted = self._write_post_steps(title, content, category, tags, publish_settings,
+                                                  0, verify=False, draft_only=True, image_files=image_files)
+        except Exception as e:
+            print(f"[WARNING] [CDP] 미리 작성 실패 (발행 시 다시 작성): {e}")
+        return self.drafted
+    
+    def _write_post_steps(self, title: str, content: str, category: Optional[str],
+                          tags: Optional[List[str]], publish_settings: dict, attempt: int,
+                          verify: bool = True, draft_only: bool = False,
+                          skip_draft: bool = False, image_files: Optional[List[str]] = None) -> bool:
+        """
+        글 작성/발행을 단계별로 실행
+        
+        각 단계는 실패 시 저렴한 복구 동작(에디터 새로고침, 본문 재포커스,
+        발행 버튼 재클릭, 팝업 다시 열기) 후 그 단계만 다시 실행합니다.
+        
+        Args:
+            draft_only: 발행 전 단계(DRAFT_STEPS)만 실행
+            skip_draft: 발행 전 단계는 draft_post 로 끝났으므로 건너뜀
+            image_files: 본문 뒤에 업로드할 이미지 파일
+        
+        Returns:
+            bool: 발행 및 확인 성공 여부 (draft_only 면 발행 팝업 설정까지)
+        """
+        # 태그는 한 번만 입력 (설정 재시도 시 중복 입력 방지)
+        pending_tags = {'tags': tags}
+        
+        def configure_popup() -> bool:
+            ok = self._configure_publish_popup(category, pending_tags['tags'], publish_settings)
+            pending_tags['tags'] = None
+            return ok
+        
+        # 이미지 수는 단계 전에 한 번만 기록 (재시도 시 빠진 이미지만 올려 중복 업로드 방지)
+        images = {'base': None}
+        
+        def images_expected() -> int:
+            return images['base'] + len(image_files)
+        
+        def upload_images() -> bool:
+            if images['base'] is None:
+                images['base'] = self._count_editor_images()
+            present = max(0, self._count_editor_images() - images['base'])
+            if present >= len(image_files):
+                return True
+            return self._insert_images(image_files[present:], expected=images_expected())
+        
+        def images_uploaded() -> bool:
+            return images['base'] is not None and self._count_editor_images() >= images_expected()
+        
+        steps = [
+            # 에디터 진입 (임시저장/도움말 팝업 처리 포함) - 복구: 에디터 새로고침
+            ('navigate', self._open_editor, self._editor_ready, self._reload_editor),
+            # 제목 입력 - 복구: 제목이 비어 있으면 다시 포커스 후 입력
+            ('title', lambda: self._input_title(title), lambda: self._title_matches(title),
+             self._can_retype_title),
+            # 본문 입력 - 복구: 본문이 비어 있으면 다시 포커스 후 입력
+            ('content', lambda: self._input_content(content), lambda: self._body_matches(content),
+             lambda: self._can_retype_body(title)),
+            # 이미지 업로드 (파일 선택 창 없이 DOM.setFileInputFiles) - 재시도: 아직 안 들어간 이미지만
+            ('images', upload_images, images_uploaded, None),
+            # 1차 발행 버튼 → 팝업 - 복구: 방해 요소 정리 후 버튼 다시 클릭
+            ('open_popup', self._open_publish_popup, self._is_publish_popup_open,
+             self._clear_editor_overlays),
+            # 팝업 설정 - 복구: 팝업이 닫혔으면 다시 열기
+            ('configure', configure_popup, None, self._open_publish_popup),
+            # 최종 발행 - 복구: 아직 에디터에 있으면 팝업을 다시 열고 재클릭
+            ('publish', self._click_final_publish, self._publish_went_through,
+             self._open_publish_popup),
+        ]
+        if not image_files:
+            steps = [s for s in steps if s[0] != 'images']
+        if verify:
+            # 발행 확인 - 글 번호 확인 실패 시 제목 검색으로
+            steps.append(('verify', lambda: self._verify_current_post(title), None, None))
+        
+        if draft_only:
+            steps = [s for s in steps if s[0] in DRAFT_STEPS]
+        elif skip_draft:
+            steps = [s for s in steps if s[0] not in DRAFT_STEPS]
+        
+        for step, action, check, recover in steps:
+            if self._run_recoverable_step(step, attempt, action, check, recover):
+                continue
+            if step == 'configure':
+                # 발행 설정 불일치는 발행을 막지 않음 (기존 동작 유지)
+                print("[WARNING] [CDP] 발행 설정을 모두 적용하지 못함, 계속 진행...")
+                continue
+            if step == 'images':
+                # 이미지가 빠져도 글은 발행 (글만 올라가던 기존 동작)
+                print("[WARNING] [CDP] 이미지를 모두 올리지 못함, 계속 진행...")
+                continue
+            print(f"[WARNING] [CDP] '{step}' 단계 실패")
+            self.last_failed_step = step
+            return False
+        return True
+    
+    def _read_editor_state(self) -> Optional[dict]:
+        """에디터 상태 (제목/본문 텍스트, 팝업 열림 여부, 에디터 페이지 여부)"""
+        return self.js.call('readEditorState')
+    
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """비교용 텍스트 (공백 제거)"""
+        return ''.join((text or '').split())
+    
+    def _editor_ready(self) -> bool:
+        """에디터가 로드되어 입력 가능한 상태인지 (상태를 읽지 못하면 통과)"""
+        state = self._read_editor_state()
+        return not state or bool(state.get('inEditor'))
+    
+    def _reload_editor(self) -> bool:
+        """에디터 페이지면 새로고침만, 아니면 처음부터 에디터로 이동"""
+        try:
+            if 'postwrite' not in self.driver.current_url.lower():
+                return self._open_editor()
+            print("[INFO] [CDP] 에디터 새로고침...")
+            self.driver.refresh()
+            self._handle_alert()
+            if not self._wait_for_editor():
+                return False
+            self._handle_draft_popup()
+            self._close_help_popup()
+            return True
+        except Exception as e:
+            print(f"[WARNING] [CDP] 에디터 새로고침 실패: {e}")
+            return False
+    
+    def _title_matches(self, title: str) -> bool:
+        """제목 영역에 입력한 제목이 들어갔는지 (상태를 읽지 못하면 통과)"""
+        state = self._read_editor_state()
+        if not state:
+            return True
+        return self._normalize_text(state.get('title')) == self._normalize_text(title)
+    
+    def _body_matches(self, content: str) -> bool:
+        """
+        본문에 내용이 들어갔는지 (상태를 읽지 못하면 통과)
+        
+        링크가 카드로 바뀌는 등 에디터가 본문을 변형할 수 있어
+        앞부분이 들어갔는지만 확인합니다.
+        """
+        state = self._read_editor_state()
+        if not state:
+            return True
+        expected = self._normalize_text(content)[:20]
+        return expected in self._normalize_text(state.get('body'))
+    
+    def _can_retype_title(self) -> bool:
+        """제목이 비어 있으면 다시 입력 가능 (일부만 들어간 경우는 전체 재시작)"""
+        state = self._read_editor_state()
+        return bool(state) and not self._normalize_text(state.get('title'))
+    
+    def _can_retype_body(self, title: str) -> bool:
+        """본문이 비어 있고 제목이 그대로면 본문만 다시 입력 가능"""
+        state = self._read_editor_state()
+        if not state or self._normalize_text(state.get('body')):
+            return False
+        # 캐럿이 제목에 남아 본문이 제목에 입력된 경우는 복구 불가
+        return self._title_matches(title)
+    
+    def _is_publish_popup_open(self) -> bool:
+        """발행 설정 팝업이 열려 있는지"""
+        return bool(self.js.call('findPublishPopup'))
+    
+    def _clear_editor_overlays(self) -> bool:
+        """발행 버튼 클릭을 가로막는 알림창/도움말 팝업 정리"""
+        self._handle_alert()
+        self._close_help_popup()
+        return self._editor_ready()
+    
+    def _publish_went_through(self) -> bool:
+        """발행이 이루어졌는지 (글 번호를 받았거나 에디터를 벗어남)"""
+        if not (self._published or self.last_log_no):
+            try:
+                self._published = 'postwrite' not in self.driver.current_url.lower()
+            except Exception:
+                return False
+        return self._published
+    
+    def verify_post(self, title: str) -> bool:
+        """
+        verify=False 로 발행한 글을 나중에 확인
+        
+        Args:
+            title: 발행한 글 제목
+            
+        Returns:
+            bool: 발행된 글이 확인되면 True
+        """
+        self._activate()
+        ok = self._run_step('verify', 0, lambda: self._verify_current_post(title))
+        if not ok:
+            self.last_failed_step = 'verify'
+        return ok
+    
+    def _verify_current_post(self, title: str) -> bool:
+        """발행 확인 (글 번호를 알면 해당 글만, 실패하거나 모르면 글목록에서 제목으로)"""
+        if self.last_log_no and self._verify_post_by_log_no(self.last_log_no):
+            return True
+        return self._verify_post_published(title)
+    
     def _handle_draft_popup(self) -> bool:
         """임시저장 글 팝업 처리 - '작성 취소' 버튼 클릭"""
         try:
             print("[INFO] [CDP] 임시저장 글 팝업 확인 중...")
-            time.sleep(2)
+            # 에디터가 초기 렌더링을 마칠 때까지 (팝업은 그 과정에서 뜸)
+            self.waiter.dom_settled(quiet_ms=300, timeout=3)
             
             result = self._evaluate_js('''
             (function() {
@@ -271,7 +607,7 @@ class NaverBlogWriterCDP:
             
             if result and result.get('found'):
                 print(f"[INFO] [CDP] 임시저장 팝업 - '{result.get('clicked')}' 버튼 클릭 (container: {result.get('container')})")
-                time.sleep(2)
+                self.waiter.dom_settled(quiet_ms=300, timeout=3)
             else:
                 print("[INFO] [CDP] 임시저장 팝업 없음")
             
@@ -285,7 +621,6 @@ class NaverBlogWriterCDP:
         """도움말 팝업 닫기 (글쓰기 페이지 우측 팝업)"""
         try:
             print("[INFO] [CDP] 도움말 팝업 확인 중...")
-            time.sleep(1)
             
             # 도움말/가이드 팝업 닫기 버튼 찾기
             close_result = self._evaluate_js('''
@@ -368,13 +703,13 @@ class NaverBlogWriterCDP:
             
             if close_result and close_result.get('closed', 0) > 0:
                 print(f"[INFO] [CDP] 팝업 닫기 버튼 {close_result.get('closed')}개 클릭")
-                time.sleep(1)
+                self.waiter.dom_settled(quiet_ms=200, timeout=2)
             else:
                 print("[INFO] [CDP] 닫을 팝업 없음")
             
             # ESC 키로 팝업 닫기 시도
             self._cdp_press_key("Escape")
-            time.sleep(0.5)
+            self.waiter.dom_settled(quiet_ms=200, timeout=1)
             
             return True
             
@@ -382,23 +717,51 @@ class NaverBlogWriterCDP:
             print(f"[DEBUG] [CDP] 도움말 팝업 닫기 중 오류: {e}")
             return True  # 에러가 나도 계속 진행
     
+    def editor_entry_url(self) -> str:
+        """에디터를 열 주소 (찾은 주소 > 캐시된 주소 > 기본 글쓰기 주소)"""
+        if self.editor_url:
+            return self.editor_url
+        cached = self.editor_url_cache.get(self.blog_id) if self.editor_url_cache else None
+        return cached or f"https://blog.naver.com/{self.blog_id}/postwrite"
+    
+    def _open_cached_editor(self) -> bool:
+        """캐시된 글쓰기 주소로 바로 이동 (에디터가 열리지 않으면 캐시 삭제)"""
+        url = self.editor_url_cache.get(self.blog_id) if self.editor_url_cache else None
+        if not url:
+            return False
+        print(f"[INFO] [CDP] 캐시된 글쓰기 URL로 바로 이동: {url}")
+        try:
+            self.driver.get(url)
+            self._handle_alert()
+            if self._wait_for_editor():
+                self.editor_url = url
+                return True
+        except Exception as e:
+            print(f"[WARNING] [CDP] 캐시된 글쓰기 URL 이동 실패: {e}")
+        print("[INFO] [CDP] 캐시된 글쓰기 URL에서 에디터가 열리지 않음, 블로그 메인에서 다시 찾음")
+        self.editor_url_cache.invalidate(self.blog_id)
+        return False
+    
     def _navigate_to_editor(self) -> bool:
-        """글쓰기 에디터로 이동 (CDP 활용)"""
+        """글쓰기 에디터로 이동 (캐시된 주소 우선, 없거나 실패하면 블로그 메인에서 찾음)"""
         try:
             self._handle_alert()
             
+            if self._open_cached_editor():
+                print("[INFO] [CDP] 에디터 로드 완료")
+                return True
+            
             # 블로그 메인 페이지로 이동
             blog_main_url = f"https://blog.naver.com/{self.blog_id}"
             print(f"[INFO] [CDP] 블로그 메인 페이지로 이동: {blog_main_url}")
             self.driver.get(blog_main_url)
-            time.sleep(4)
             self._handle_alert()
             
-            # JavaScript로 iframe 내부의 글쓰기 버튼 찾아서 href 가져오기
+            # mainFrame iframe 내부에 글쓰기 버튼이 나타날 때까지 대기 후 href 가져오기
             print("[INFO] [CDP] iframe 내부에서 글쓰기 버튼 검색...")
             
-            write_url = self._evaluate_js('''
-            (function() {
+            write_url = self.waiter.condition('''
+            () => {
                 const mainFrame = document.getElementById('mainFrame');
                 if (mainFrame && mainFrame.contentDocument) {
                     const frameDoc = mainFrame.contentDocument;
@@ -421,19 +784,19 @@ class NaverBlogWriterCDP:
                     }
                 }
                 return null;
-            })()
-            ''')
+            }
+            ''', timeout=10)
             
             if write_url:
                 print(f"[INFO] [CDP] 글쓰기 URL 발견: {write_url}")
                 self.driver.get(write_url)
+                self.editor_url = write_url
             else:
                 # 직접 URL로 이동
                 print("[INFO] [CDP] 글쓰기 버튼을 찾지 못해 직접 URL로 이동...")
                 write_url = f"https://blog.naver.com/{self.blog_id}/postwrite"
                 self.driver.get(write_url)
             
-            time.sleep(4)
             self._handle_alert()
             
             # 에디터 로드 확인
@@ -442,6 +805,9 @@ class NaverBlogWriterCDP:
             
             if editor_loaded:
                 print("[INFO] [CDP] 에디터 로드 완료")
+                # 에디터가 열린 주소만 캐시 (다음 글부터 블로그 메인을 거치지 않음)
+                if self.editor_url_cache and self.editor_url == write_url:
+                    self.editor_url_cache.put(self.blog_id, write_url)
                 return True
             else:
                 print("[WARNING] [CDP] 에디터 로드 확인 실패, 계속 진행...")
@@ -452,32 +818,38 @@ class NaverBlogWriterCDP:
             return False
     
     def _wait_for_editor(self, timeout: int = 15) -> bool:
-        """에디터 로드 대기"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            # 에디터 요소 확인
-            result = self._evaluate_js('''
-            (function() {
-                // 스마트에디터 ONE 확인
-                const seBody = document.querySelector('.se-body, .__se-body');
-                const seContent = document.querySelector('.se-content');
-                const titleInput = document.querySelector('.se-title-input, [contenteditable="true"]');
-                
-                return {
-                    seBody: !!seBody,
-                    seContent: !!seContent,
-                    titleInput: !!titleInput,
-                    url: window.location.href
-                };
-            })()
-            ''')
-            
-            if result and (result.get('seBody') or result.get('seContent') or result.get('titleInput')):
-                return True
-            
-            time.sleep(0.5)
+        """에디터 로드 대기 (스마트에디터 요소가 DOM에 나타나면 즉시 반환)"""
+        result = self.waiter.condition('''
+        () => {
+            // 스마트에디터 ONE 확인
+            const seBody = document.querySelector('.se-body, .__se-body');
+            const seContent = document.querySelector('.se-content');
+            const titleInput = document.querySelector('.se-title-input, [contenteditable="true"]');
+            
+            if (!seBody && !seContent && !titleInput) return null;
+            return {
+                seBody: !!seBody,
+                seContent: !!seContent,
+                titleInput: !!titleInput,
+                url: window.location.href
+            };
+        }
+        ''', timeout=timeout)
         
-        return False
+        return bool(result)
+    
+    def _wait_for_caret(self, in_title: bool, timeout: float = 1.5) -> bool:
+        """클릭 후 캐럿(selection)이 제목/본문 영역에 들어올 때까지 대기"""
+        return bool(self.waiter.condition('''
+        () => {
+            const sel = window.getSelection();
+            if (!sel || !sel.anchorNode) return null;
+            const node = sel.anchorNode.nodeType === 1 ? sel.anchorNode : sel.anchorNode.parentElement;
+            if (!node || !node.closest('.se-text-paragraph, [contenteditable="true"]')) return null;
+            const inTitle = !!node.closest('.se-title-text, .se-documentTitle');
+            return inTitle === %s ? true : null;
+        }
+        ''' % ('true' if in_title else 'false'), timeout=timeout))
     
     def _input_title(self, title: str) -> bool:
         """제목 입력 (CDP 클릭 + Input.insertText 방식)"""
@@ -486,56 +858,24 @@ class NaverBlogWriterCDP:
             print(f"[DEBUG] [CDP] 입력할 제목: {title}")
             
             # 제목 영역 좌표 얻기
-            title_pos = self._evaluate_js('''
-            (function() {
-                // 제목 영역 찾기 - placeholder가 "제목"인 영역
-                const allParagraphs = document.querySelectorAll('.se-text-paragraph');
-                for (const el of allParagraphs) {
-                    const placeholder = el.querySelector('.se-placeholder');
-                    if (placeholder && placeholder.textContent.includes('제목')) {
-                        const rect = el.getBoundingClientRect();
-                        return {
-                            found: true,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2,
-                            selector: 'placeholder-title'
-                        };
-                    }
-                }
-                
-                // se-title-text 클래스로 찾기
-                const titleEl = document.querySelector('.se-title-text .se-text-paragraph');
-                if (titleEl) {
-                    const rect = titleEl.getBoundingClientRect();
-                    return {
-                        found: true,
-                        x: rect.left + rect.width / 2,
-                        y: rect.top + rect.height / 2,
-                        selector: '.se-title-text .se-text-paragraph'
-                    };
-                }
-                
-                return { found: false };
-            })()
-            ''')
+            title_pos = self.js.call('findTitleArea')
             
             if title_pos and title_pos.get('found'):
                 print(f"[DEBUG] [CDP] 제목 영역 발견: {title_pos.get('selector')}, 좌표: ({title_pos.get('x')}, {title_pos.get('y')})")
                 
                 # CDP로 제목 영역 클릭
                 self._cdp_click(title_pos['x'], title_pos['y'])
-                time.sleep(0.3)
                 
-                # 한 번 더 클릭 (확실하게)
-                self._cdp_click(title_pos['x'], title_pos['y'])
-                time.sleep(0.3)
+                # 캐럿이 들어오지 않았으면 한 번 더 클릭
+                if not self._wait_for_caret(in_title=True):
+                    self._cdp_click(title_pos['x'], title_pos['y'])
+                    self._wait_for_caret(in_title=True)
                 
                 # CDP Input.insertText로 제목 입력
                 success = self._cdp_type_text(title)
                 
                 if success:
                     print("[INFO] [CDP] 제목 입력 완료")
-                    time.sleep(0.3)
                     return True
             
             print("[ERROR] [CDP] 제목 영역을 찾지 못함")
@@ -552,53 +892,18 @@ class NaverBlogWriterCDP:
             print(f"[DEBUG] [CDP] 입력할 내용: {content[:50]}..." if len(content) > 50 else f"[DEBUG] [CDP] 입력할 내용: {content}")
             
             # 본문 영역 좌표 얻기 (제목이 아닌 영역)
-            content_pos = self._evaluate_js('''
-            (function() {
-                // 모든 se-text-paragraph 중 제목이 아닌 것 찾기
-                const allParagraphs = document.querySelectorAll('.se-text-paragraph');
-                for (const el of allParagraphs) {
-                    // 제목 영역이 아닌지 확인
-                    const isTitle = el.closest('.se-title-text') || 
-                                   el.closest('.se-documentTitle') ||
-                                   el.querySelector('.se-placeholder')?.textContent?.includes('제목');
-                    
-                    if (!isTitle) {
-                        const rect = el.getBoundingClientRect();
-                        return {
-                            found: true,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2,
-                            selector: 'non-title paragraph'
-                        };
-                    }
-                }
-                
-                // se-component.se-text 내의 본문 영역 찾기
-                const contentEl = document.querySelector('.se-component.se-text .se-text-paragraph');
-                if (contentEl) {
-                    const rect = contentEl.getBoundingClientRect();
-                    return {
-                        found: true,
-                        x: rect.left + rect.width / 2,
-                        y: rect.top + rect.height / 2,
-                        selector: '.se-component.se-text .se-text-paragraph'
-                    };
-                }
-                
-                return { found: false };
-            })()
-            ''')
+            content_pos = self.js.call('findBodyParagraph')
             
             if content_pos and content_pos.get('found'):
                 print(f"[DEBUG] [CDP] 본문 영역 발견: {content_pos.get('selector')}, 좌표: ({content_pos.get('x')}, {content_pos.get('y')})")
                 
                 # CDP로 본문 영역 클릭
                 self._cdp_click(content_pos['x'], content_pos['y'])
-                time.sleep(0.3)
                 
-                # 한 번 더 클릭 (확실하게)
-                self._cdp_click(content_pos['x'], content_pos['y'])
-                time.sleep(0.3)
+                # 캐럿이 들어오지 않았으면 한 번 더 클릭
+                if not self._wait_for_caret(in_title=False):
+                    self._cdp_click(content_pos['x'], content_pos['y'])
+                    self._wait_for_caret(in_title=False)
             else:
                 print("[WARNING] [CDP] 본문 영역을 찾지 못함")
             
@@ -607,7 +912,6 @@ class NaverBlogWriterCDP:
             
             if success:
                 print("[INFO] [CDP] 본문 입력 완료")
-                time.sleep(0.3)
                 return True
             else:
                 print("[ERROR] [CDP] 본문 입력 실패")
@@ -619,90 +923,85 @@ class NaverBlogWriterCDP:
             traceback.print_exc()
             return False
     
-    def _publish(self, title: str = "", category: Optional[str] = None, 
-                 tags: Optional[List[str]] = None, publish_settings: Optional[dict] = None) -> bool:
+    def _count_editor_images(self) -> int:
+        """본문에 들어간 이미지 수"""
+        return self._evaluate_js(f"document.querySelectorAll('{EDITOR_IMAGE_SELECTOR}').length") or 0
+    
+    def _find_file_input(self) -> Optional[int]:
         """
-        글 발행 (CDP 활용)
+        사진 버튼이 연결된 파일 입력 요소의 DOM nodeId
         
-        단계:
-        1. 도움말 팝업이 있으면 닫기
-        2. 우측 상단 발행 버튼 클릭 (1차)
-        3. 발행 설정 팝업에서 카테고리/태그/공개설정/발행옵션
-        4. 팝업 내 발행 버튼 클릭 (최종)
+        이미지를 받는 입력(accept 에 image)을 먼저 찾고, 없으면 첫 파일 입력을 씁니다.
         """
-        # 기본 발행 설정
-        if publish_settings is None:
-            publish_settings = {
-                'visibility': 'public',
-                'allow_comment': True,
-                'allow_sympathy': True,
-                'allow_search': True,
-                'blog_cafe_share': 'link',
-                'allow_external_share': True,
-                'is_notice': False
-            }
+        root = self._execute_cdp("DOM.getDocument", {"depth": 0})['root']['nodeId']
+        for selector in (IMAGE_FILE_INPUT_SELECTOR, 'input[type="file"]'):
+            node_id = self._execute_cdp("DOM.querySelector", {
+                "nodeId": root,
+                "selector": selector
+            }).get('nodeId')
+            if node_id:
+                if selector != IMAGE_FILE_INPUT_SELECTOR:
+                    print("[WARNING] [CDP] 이미지용 파일 입력 요소가 없어 첫 파일 입력 요소 사용")
+                return node_id
+        return None
+    
+    def _insert_images(self, image_files: List[str], expected: Optional[int] = None) -> bool:
+        """
+        본문 끝에 이미지 업로드 (사진 버튼 + DOM.setFileInputFiles)
+        
+        파일 선택 창은 Page.setInterceptFileChooserDialog 로 막고,
+        에디터의 파일 입력 요소에 로컬 파일을 직접 넣습니다.
         
+        Args:
+            image_files: 업로드할 이미지 파일
+            expected: 업로드 후 본문의 이미지 수 (기본: 현재 수 + 파일 수)
+        
+        Returns:
+            bool: 모든 이미지가 본문에 들어갔는지
+        """
+        try:
+            print(f"[INFO] [CDP] 이미지 {len(image_files)}장 업로드 중...")
+            if expected is None:
+                expected = self._count_editor_images() + len(image_files)
+            self._execute_cdp("Page.setInterceptFileChooserDialog", {"enabled": True})
+            try:
+                if not self._click_element_by_selector(IMAGE_BUTTON_SELECTOR):
+                    print("[WARNING] [CDP] 사진 버튼을 찾지 못함")
+                    return False
+                self.waiter.condition("() => !!document.querySelector('input[type=\"file\"]')", timeout=5)
+                node_id = self._find_file_input()
+                if not node_id:
+                    print("[WARNING] [CDP] 파일 입력 요소를 찾지 못함")
+                    return False
+                self._execute_cdp("DOM.setFileInputFiles", {"files": list(image_files), "nodeId": node_id})
+            finally:
+                self._execute_cdp("Page.setInterceptFileChooserDialog", {"enabled": False})
+            
+            uploaded = self.waiter.condition(
+                f"() => document.querySelectorAll('{EDITOR_IMAGE_SELECTOR}').length >= {expected}",
+                timeout=IMAGE_UPLOAD_TIMEOUT * len(image_files)
+            )
+            if not uploaded:
+                print("[WARNING] [CDP] 이미지 업로드 완료를 확인하지 못함")
+                return False
+            print("[INFO] [CDP] 이미지 업로드 완료")
+            return True
+        except Exception as e:
+            print(f"[ERROR] [CDP] 이미지 업로드 실패: {e}")
+            return False
+    
+    def _open_publish_popup(self) -> bool:
+        """우측 상단 발행 버튼(1차)을 눌러 발행 설정 팝업 열기 (이미 열려 있으면 그대로)"""
         try:
-            print("[INFO] [CDP] 글 발행 프로세스 시작...")
             self._handle_alert()
+            if self._is_publish_popup_open():
+                return True
             
-            # 1. 도움말 팝업 다시 확인하고 닫기
+            # 도움말 팝업 다시 확인하고 닫기
             self._close_help_popup()
-            time.sleep(1)
             
-            # 2. 우측 상단 발행 버튼 찾기 (1차 발행 버튼)
             print("[INFO] [CDP] 1차 발행 버튼 검색...")
-            
-            first_publish_result = self._evaluate_js('''
-            (function() {
-                // 헤더 영역의 발행 버튼 (우측 상단)
-                const headerSelectors = [
-                    'header button[class*="publish"]',
-                    '.header button[class*="publish"]',
-                    '[class*="header"] button[class*="publish"]',
-                    'button[class*="publish_btn__"]',
-                    'button.publish_btn__m9KHH',
-                    '.publish_btn_area__KjA2i button',
-                    '[class*="publish_btn_area"] button'
-                ];
-                
-                for (const sel of headerSelectors) {
-                    const btn = document.querySelector(sel);
-                    if (btn && btn.offsetParent !== null) {
-                        const rect = btn.getBoundingClientRect();
-                        // 상단에 있는 버튼 (y < 100)
-                        if (rect.top < 100) {
-                            return {
-                                found: true,
-                                x: rect.left + rect.width / 2,
-                                y: rect.top + rect.height / 2,
-                                text: btn.textContent.trim(),
-                                type: 'header'
-                            };
-                        }
-                    }
-                }
-                
-                // 모든 버튼에서 "발행" 텍스트 찾기 (상단)
-                const buttons = document.querySelectorAll('button');
-                for (const btn of buttons) {
-                    if (btn.textContent.trim() === '발행' && btn.offsetParent !== null) {
-                        const rect = btn.getBoundingClientRect();
-                        if (rect.top < 100) {  // 상단 영역
-                            return {
-                                found: true,
-                                x: rect.left + rect.width / 2,
-                                y: rect.top + rect.height / 2,
-                                text: '발행',
-                                type: 'text'
-                            };
-                        }
-                    }
-                }
-                
-                return { found: false };
-            })()
-            ''')
+            first_publish_result = self.js.call('findHeaderPublishButton')
             
             if not first_publish_result or not first_publish_result.get('found'):
                 print("[ERROR] [CDP] 1차 발행 버튼을 찾을 수 없습니다.")
@@ -711,114 +1010,34 @@ class NaverBlogWriterCDP:
                 return False
             
             print(f"[INFO] [CDP] 1차 발행 버튼 발견 (type: {first_publish_result.get('type')})")
-            
-            # 1차 발행 버튼 클릭
             self._cdp_click(first_publish_result['x'], first_publish_result['y'])
             print("[INFO] [CDP] 1차 발행 버튼 클릭 완료")
-            time.sleep(2)
             
-            # 3. 발행 설정 팝업 대기
             print("[INFO] [CDP] 발행 설정 팝업 대기...")
-            popup_ready = self._wait_for_publish_popup()
-            
-            if not popup_ready:
-                print("[WARNING] [CDP] 발행 팝업을 찾지 못함, 재시도...")
-                time.sleep(1)
-            
-            # 4. 팝업에서 카테고리 설정
-            if category:
-                self._set_category_in_popup(category)
-            
-            # 5. 팝업에서 태그 설정
-            if tags:
-                self._set_tags_in_popup(tags)
-            
-            # 6. 팝업에서 공개 설정 (라디오 버튼)
-            self._set_visibility_in_popup(publish_settings.get('visibility', 'public'))
-            
-            # 7. 발행 설정 옵션 (체크박스들)
-            self._set_publish_options_in_popup(publish_settings)
-            
-            time.sleep(1)
+            if not self._wait_for_publish_popup():
+                print("[WARNING] [CDP] 발행 팝업을 찾지 못함")
+                return False
+            return True
             
-            # 8. 팝업 내 최종 발행 버튼 클릭
+        except Exception as e:
+            print(f"[ERROR] [CDP] 발행 팝업 열기 실패: {e}")
+            return False
+    
+    def _click_final_publish(self) -> bool:
+        """
+        팝업 내 최종 발행 버튼 클릭 후 발행 결과(logNo 또는 에디터 이탈) 확인
+        
+        Returns:
+            bool: 발행이 확인되면 True (아직 에디터에 머물러 있으면 False)
+        """
+        try:
             print("[INFO] [CDP] 최종 발행 버튼 검색...")
             
-            final_publish_result = self._evaluate_js('''
-            (function() {
-                // 1순위: data-testid로 정확히 찾기
-                const seOnePublishBtn = document.querySelector('[data-testid="seOnePublishBtn"]');
-                if (seOnePublishBtn && seOnePublishBtn.offsetParent !== null) {
-                    const rect = seOnePublishBtn.getBoundingClientRect();
-                    seOnePublishBtn.click();
-                    return {
-                        found: true,
-                        clicked: true,
-                        x: rect.left + rect.width / 2,
-                        y: rect.top + rect.height / 2,
-                        container: 'data-testid=seOnePublishBtn'
-                    };
-                }
-                
-                // 2순위: confirm_btn 클래스로 찾기
-                const confirmBtn = document.querySelector('button.confirm_btn__WEaBq');
-                if (confirmBtn && confirmBtn.offsetParent !== null) {
-                    const rect = confirmBtn.getBoundingClientRect();
-                    confirmBtn.click();
-                    return {
-                        found: true,
-                        clicked: true,
-                        x: rect.left + rect.width / 2,
-                        y: rect.top + rect.height / 2,
-                        container: 'confirm_btn__WEaBq'
-                    };
-                }
-                
-                // 3순위: confirm_btn 패턴으로 찾기
-                const confirmBtnPattern = document.querySelector('button[class*="confirm_btn"]');
-                if (confirmBtnPattern && confirmBtnPattern.offsetParent !== null) {
-                    const rect = confirmBtnPattern.getBoundingClientRect();
-                    confirmBtnPattern.click();
-                    return {
-                        found: true,
-                        clicked: true,
-                        x: rect.left + rect.width / 2,
-                        y: rect.top + rect.height / 2,
-                        container: 'confirm_btn pattern'
-                    };
-                }
-                
-                // 4순위: 모든 '발행' 버튼 중 y좌표가 큰 것 (팝업 내부)
-                const publishButtons = [];
-                document.querySelectorAll('button').forEach(btn => {
-                    const text = btn.textContent.trim();
-                    if (text === '발행' && btn.offsetParent !== null) {
-                        const rect = btn.getBoundingClientRect();
-                        publishButtons.push({
-                            element: btn,
-                            rect: rect,
-                            y: rect.top
-                        });
-                    }
-                });
-                
-                if (publishButtons.length >= 2) {
-                    publishButtons.sort((a, b) => b.y - a.y);
-                    const btn = publishButtons[0];
-                    btn.element.click();
-                    return {
-                        found: true,
-                        clicked: true,
-                        x: btn.rect.left + btn.rect.width / 2,
-                        y: btn.rect.top + btn.rect.height / 2,
-                        container: 'popup (lower button)',
-                        buttonCount: publishButtons.length
-                    };
-                }
-                
-                return { found: false, buttonCount: publishButtons.length };
-            })()
-            ''')
+            # 발행 응답에서 글 번호를 얻기 위해 클릭 직전부터 네트워크 이벤트 수집
+            capture = PublishResponseCapture(self.driver, meter=self.traffic_meter)
+            capture.start()
+            
+            final_publish_result = self.js.call('clickFinalPublishButton')
             
             if not final_publish_result or not final_publish_result.get('found'):
                 print("[ERROR] [CDP] 최종 발행 버튼을 찾을 수 없습니다.")
@@ -835,25 +1054,29 @@ class NaverBlogWriterCDP:
                 self._cdp_click(final_publish_result['x'], final_publish_result['y'])
                 print("[INFO] [CDP] 최종 발행 버튼 클릭 완료 (CDP)")
             
-            time.sleep(3)
+            # 발행 응답(저장 API 또는 글 주소 이동)에서 logNo 얻기
+            log_no = capture.wait_for_log_no(timeout=10)
+            
+            # 발행 후 에디터를 벗어날 때까지 대기 (URL 변경)
+            left_editor = self._wait_for_leave_editor(timeout=10)
             self._handle_alert()
             
-            # 발행 성공 확인
             current_url = self.driver.current_url
             print(f"[DEBUG] [CDP] 현재 URL: {current_url}")
             
-            if "postwrite" not in current_url.lower() or "logNo" in current_url:
+            # performance 로그를 쓸 수 없으면 이동한 URL에서 찾기
+            log_no = log_no or extract_log_no(current_url)
+            if log_no:
+                self.last_log_no = log_no
+                self.last_post_url = build_post_url(self.blog_id, log_no)
+                print(f"[INFO] [CDP] 발행된 글: {self.last_post_url}")
+            
+            if log_no or left_editor or "postwrite" not in current_url.lower():
+                self._published = True
                 print("[SUCCESS] [CDP] 글 발행 완료!")
                 return True
-            else:
-                # 추가 확인
-                time.sleep(2)
-                current_url = self.driver.current_url
-                if "postwrite" not in current_url.lower():
-                    print("[SUCCESS] [CDP] 글 발행 완료!")
-                    return True
-                print("[WARNING] [CDP] 발행 상태 확인 필요")
-                return True
+            print("[WARNING] [CDP] 발행 후에도 에디터에 머물러 있음")
+            return False
                 
         except Exception as e:
             print(f"[ERROR] [CDP] 글 발행 실패: {e}")
@@ -861,52 +1084,32 @@ class NaverBlogWriterCDP:
             traceback.print_exc()
             return False
     
+    def _wait_for_leave_editor(self, timeout: float = 10) -> bool:
+        """발행 후 페이지가 글쓰기(postwrite) URL을 벗어날 때까지 대기"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            # 같은 문서 안에서 URL이 바뀌는 경우 (history API)
+            left = self.waiter.condition('''
+            () => (!location.href.toLowerCase().includes('postwrite') || location.href.includes('logNo')) ? true : null
+            ''', timeout=max(deadline - time.time(), 0))
+            if left:
+                return True
+            # 문서 자체가 교체되면 평가가 끊기므로 URL을 직접 확인
+            try:
+                current_url = self.driver.current_url
+            except Exception:
+                return False
+            if "postwrite" not in current_url.lower() or "logNo" in current_url:
+                return True
+        return False
+    
     def _wait_for_publish_popup(self, timeout: int = 10) -> bool:
         """발행 설정 팝업이 나타날 때까지 대기"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            result = self._evaluate_js('''
-            (function() {
-                // 발행 설정 팝업 확인
-                const popupIndicators = [
-                    '[class*="publish_layer"]',
-                    '[class*="publishLayer"]',
-                    '[class*="publish_setting"]',
-                    '[class*="publish_popup"]',
-                    // 팝업 내 특정 요소
-                    '[class*="category"]',
-                    '[class*="tag_input"]',
-                    '[class*="공개"]'
-                ];
-                
-                for (const sel of popupIndicators) {
-                    const el = document.querySelector(sel);
-                    if (el && el.offsetParent !== null) {
-                        return { found: true, selector: sel };
-                    }
-                }
-                
-                // 버튼이 2개 이상인 발행 버튼 확인 (팝업 열림)
-                let publishBtnCount = 0;
-                document.querySelectorAll('button').forEach(btn => {
-                    if (btn.textContent.trim() === '발행' && btn.offsetParent !== null) {
-                        publishBtnCount++;
-                    }
-                });
-                
-                if (publishBtnCount >= 2) {
-                    return { found: true, selector: 'multiple_publish_buttons' };
-                }
-                
-                return { found: false };
-            })()
-            ''')
-            
-            if result and result.get('found'):
-                print(f"[INFO] [CDP] 발행 팝업 감지: {result.get('selector')}")
-                return True
-            
-            time.sleep(0.5)
+        result = self.js.wait_for('findPublishPopup', timeout=timeout)
+        
+        if result and result.get('found'):
+            print(f"[INFO] [CDP] 발행 팝업 감지: {result.get('selector')}")
+            return True
         
         return False
     
@@ -915,44 +1118,16 @@ class NaverBlogWriterCDP:
         try:
             print(f"[INFO] [CDP] 카테고리 설정: {category_name}")
             
-            result = self._evaluate_js(f'''
-            (function() {{
-                // 카테고리 선택 드롭다운/버튼 찾기
-                const categorySelectors = [
-                    '[class*="category"] select',
-                    '[class*="category"] button',
-                    'select[class*="category"]',
-                    '[class*="categorySelect"]'
-                ];
-                
-                for (const sel of categorySelectors) {{
-                    const el = document.querySelector(sel);
-                    if (el && el.offsetParent !== null) {{
-                        el.click();
-                        return {{ clicked: true, selector: sel }};
-                    }}
-                }}
-                return {{ clicked: false }};
-            }})()
-            ''')
+            result = self.js.call('openCategoryDropdown')
             
             if result and result.get('clicked'):
-                time.sleep(0.5)
+                # 카테고리 목록이 펼쳐질 때까지 대기
+                self.waiter.selector('[class*="category"] li, [class*="category"] option, [role="option"]',
+                                     visible=True, timeout=3)
                 
                 # 카테고리 항목 선택
-                self._evaluate_js(f'''
-                (function() {{
-                    const items = document.querySelectorAll('[class*="category"] li, [class*="category"] option, [role="option"]');
-                    for (const item of items) {{
-                        if (item.textContent.includes('{category_name}')) {{
-                            item.click();
-                            return true;
-                        }}
-                    }}
-                    return false;
-                }})()
-                ''')
-                time.sleep(0.3)
+                self.js.call('selectCategoryItem', category_name)
+                self.waiter.dom_settled(quiet_ms=200, timeout=1)
             
             return True
             
@@ -960,54 +1135,38 @@ class NaverBlogWriterCDP:
             print(f"[WARNING] [CDP] 카테고리 설정 실패: {e}")
             return False
     
-    def _set_tags_in_popup(self, tags: List[str]) -> bool:
-        """발행 팝업 내에서 태그 설정 (띄어쓰기로 구분)"""
+    def _set_tags_in_popup(self, tags: List[str], tag_pos: Optional[dict] = None) -> bool:
+        """발행 팝업 내에서 태그 설정 (띄어쓰기로 구분, tag_pos가 있으면 좌표 조회 생략)"""
         try:
             # 태그를 띄어쓰기로 구분된 문자열로 변환
             tags_text = ' '.join(tags)
             print(f"[INFO] [CDP] 태그 설정: {tags_text}")
             
-            # 태그 입력 필드 좌표 얻기
-            tag_pos = self._evaluate_js('''
-            (function() {
-                const tagSelectors = [
-                    'input[class*="tag_input"]',
-                    'input[placeholder*="태그"]',
-                    '[class*="tag"] input',
-                    '.tag_input__rvUB5'
-                ];
-                
-                for (const sel of tagSelectors) {
-                    const input = document.querySelector(sel);
-                    if (input && input.offsetParent !== null) {
-                        const rect = input.getBoundingClientRect();
-                        return { 
-                            found: true, 
-                            selector: sel,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2
-                        };
-                    }
-                }
-                return { found: false };
-            })()
-            ''')
+            if tag_pos:
+                tag_pos = dict(tag_pos, found=True)
+            else:
+                # 태그 입력 필드 좌표 얻기
+                tag_pos = self.js.call('findTagInput')
             
             if tag_pos and tag_pos.get('found'):
                 print(f"[DEBUG] [CDP] 태그 입력 영역 발견: {tag_pos.get('selector')}")
                 
-                # CDP로 태그 입력 영역 클릭
+                # CDP로 태그 입력 영역 클릭 후 포커스 확인
                 self._cdp_click(tag_pos['x'], tag_pos['y'])
-                time.sleep(0.3)
+                self.waiter.condition(
+                    '() => (document.activeElement && document.activeElement.tagName === "INPUT") ? true : null',
+                    timeout=1
+                )
                 
                 # 태그를 하나씩 입력 (띄어쓰기가 구분자)
                 for tag in tags:
-                    time.sleep(0.2)
                     self._cdp_type_text(tag)
-                    time.sleep(0.2)
                     # 스페이스로 태그 구분 (Enter 대신)
                     self._cdp_press_key("Space")
                 
+                # 태그 칩 렌더링이 끝날 때까지
+                self.waiter.dom_settled(quiet_ms=200, timeout=2)
+                
                 print("[INFO] [CDP] 태그 입력 완료")
             else:
                 print("[WARNING] [CDP] 태그 입력 영역을 찾지 못함")
@@ -1018,264 +1177,140 @@ class NaverBlogWriterCDP:
             print(f"[WARNING] [CDP] 태그 설정 실패: {e}")
             return False
     
-    def _set_visibility_in_popup(self, visibility: str) -> bool:
-        """발행 팝업 내에서 공개 설정 (라디오 버튼 클릭)"""
+    def _read_publish_popup_state(self) -> Optional[dict]:
+        """
+        발행 팝업의 현재 상태를 한 번의 평가로 읽기
+
+        체크박스 / 공개 설정 라디오 / 블로그·카페 공유 드롭다운 / 카테고리 /
+        태그 입력 필드의 현재 값과 클릭 좌표를 함께 반환합니다.
+        """
+        spec = {
+            'checkboxes': {key: texts for key, texts in PUBLISH_CHECKBOX_TEXTS},
+            'visibility': VISIBILITY_TEXTS,
+        }
+        return self.js.call('readPublishPopupState', spec)
+    
+    @staticmethod
+    def _plan_publish_popup_changes(state: dict, publish_settings: dict) -> dict:
+        """
+        팝업 현재 상태와 발행 설정을 비교해 바꿔야 할 항목만 계산
+
+        Returns:
+            {'clicks': [(이름, x, y), ...], 'share': 드롭다운 목표값 또는 None}
+        """
+        blog_cafe_share = publish_settings.get('blog_cafe_share', 'link')
+        desired_checks = {
+            'allow_comment': publish_settings.get('allow_comment', True),
+            'allow_sympathy': publish_settings.get('allow_sympathy', True),
+            'allow_search': publish_settings.get('allow_search', True),
+            'allow_external_share': publish_settings.get('allow_external_share', True),
+            'blog_cafe_share': blog_cafe_share != 'none',
+            'is_notice': publish_settings.get('is_notice', False),
+        }
+        
+        clicks = []
+        checkboxes = state.get('checkboxes') or {}
+        for key, _ in PUBLISH_CHECKBOX_TEXTS:
+            current = checkboxes.get(key)
+            if current and bool(current.get('checked')) != bool(desired_checks[key]):
+                clicks.append((key, current['x'], current['y']))
+        
+        visibility = publish_settings.get('visibility', 'public')
+        if visibility not in VISIBILITY_TEXTS:
+            visibility = 'public'
+        radio = (state.get('visibility') or {}).get(visibility)
+        if radio and not radio.get('checked'):
+            clicks.append((f"visibility:{visibility}", radio['x'], radio['y']))
+        
+        share = None
+        current_share = state.get('share')
+        if blog_cafe_share in ('link', 'content') and current_share:
+            if current_share.get('current') != blog_cafe_share:
+                share = blog_cafe_share
+        
+        return {'clicks': clicks, 'share': share}
+    
+    def _configure_publish_popup(self, category: Optional[str], tags: Optional[List[str]],
+                                 publish_settings: dict) -> bool:
+        """
+        발행 팝업을 트랜잭션처럼 설정
+
+        1. 팝업 전체 상태를 한 번에 읽기
+        2. 발행 설정과 비교해 바뀌어야 할 항목만 계산
+        3. 변경 항목의 클릭을 한 번에 연속 전송 (중간 조회 없음)
+        4. 드롭다운(카테고리/공유 범위)과 태그는 필요할 때만 처리
+        5. 마지막으로 한 번 다시 읽어 결과 검증
+
+        Returns:
+            최종 상태가 발행 설정과 일치하면 True
+        """
         try:
-            # visibility: 'public', 'neighbor', 'mutual', 'private'
-            visibility_map = {
-                'public': '전체공개',
-                'neighbor': '이웃공개',
-                'mutual': '서로이웃공개',
-                'private': '비공개'
-            }
-            visibility_text = visibility_map.get(visibility, '전체공개')
-            print(f"[INFO] [CDP] 공개 설정 적용: {visibility_text}")
+            state = self._read_publish_popup_state()
+            if not state:
+                print("[WARNING] [CDP] 발행 팝업 상태를 읽지 못함, 기본값 유지")
+                return False
             
-            # 공개 설정 라디오 버튼 좌표 얻기
-            visibility_pos = self._evaluate_js(f'''
-            (function() {{
-                const targetText = '{visibility_text}';
-                
-                // 라디오 버튼 레이블 찾기
-                const labels = document.querySelectorAll('label');
-                for (const label of labels) {{
-                    if (label.textContent.includes(targetText) && label.offsetParent !== null) {{
-                        const rect = label.getBoundingClientRect();
-                        return {{
-                            found: true,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2,
-                            element: 'label'
-                        }};
-                    }}
-                }}
-                
-                // input[type="radio"] 찾기
-                const radios = document.querySelectorAll('input[type="radio"]');
-                for (const radio of radios) {{
-                    const parent = radio.closest('label, div, span');
-                    if (parent && parent.textContent.includes(targetText) && radio.offsetParent !== null) {{
-                        const rect = radio.getBoundingClientRect();
-                        return {{
-                            found: true,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2,
-                            element: 'radio'
-                        }};
-                    }}
-                }}
-                
-                // span/div 텍스트로 찾기
-                const elements = document.querySelectorAll('span, div');
-                for (const el of elements) {{
-                    if (el.textContent.trim() === targetText && el.offsetParent !== null) {{
-                        const rect = el.getBoundingClientRect();
-                        return {{
-                            found: true,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2,
-                            element: 'span/div'
-                        }};
-                    }}
-                }}
-                
-                return {{ found: false }};
-            }})()
-            ''')
+            plan = self._plan_publish_popup_changes(state, publish_settings)
             
-            if visibility_pos and visibility_pos.get('found'):
-                print(f"[DEBUG] [CDP] 공개 설정 영역 발견: {visibility_pos.get('element')}")
-                self._cdp_click(visibility_pos['x'], visibility_pos['y'])
-                time.sleep(0.3)
-                print(f"[INFO] [CDP] 공개 설정 클릭 완료: {visibility_text}")
+            # 체크박스/라디오: 변경분만 연속 클릭
+            if plan['clicks']:
+                print(f"[INFO] [CDP] 발행 설정 변경: {', '.join(name for name, _, _ in plan['clicks'])}")
+                for _, x, y in plan['clicks']:
+                    self._cdp_click(x, y)
+                self.waiter.dom_settled(quiet_ms=150, timeout=1)
             else:
-                print(f"[WARNING] [CDP] 공개 설정 '{visibility_text}'을 찾지 못함, 기본값 유지")
+                print("[INFO] [CDP] 발행 설정 변경 없음 (현재 상태 유지)")
             
-            return True
+            # 카테고리: 이미 선택되어 있으면 건너뜀
+            if category:
+                current_category = (state.get('category') or {}).get('current', '')
+                if category not in current_category:
+                    self._set_category_in_popup(category)
             
-        except Exception as e:
-            print(f"[WARNING] [CDP] 공개 설정 실패: {e}")
-            return True
-    
-    def _set_publish_options_in_popup(self, publish_settings: dict) -> bool:
-        """발행 팝업 내에서 발행 설정 옵션들 설정 (체크박스 클릭)"""
-        try:
-            print("[INFO] [CDP] 발행 설정 옵션 적용 중...")
-            
-            # 체크박스 옵션 매핑 (네이버 블로그 기본값은 모두 체크되어 있음)
-            # 기본값에서 해제하려면 클릭해야 함
-            checkbox_options = [
-                ('allow_comment', '댓글', '댓글허용', '댓글 허용'),
-                ('allow_sympathy', '공감', '공감허용', '공감 허용'),
-                ('allow_search', '검색', '검색허용', '검색 허용'),
-                ('allow_external_share', '외부', '외부 공유', '외부공유', '외부 공유 허용'),
-            ]
-            
-            for setting_key, *search_texts in checkbox_options:
-                setting_value = publish_settings.get(setting_key, True)
-                
-                # 기본값(True)에서 False로 변경하려면 클릭하여 해제
-                if not setting_value:
-                    self._toggle_checkbox(search_texts, uncheck=True)
-            
-            # 블로그/카페 공유 설정 (드롭다운)
-            blog_cafe_share = publish_settings.get('blog_cafe_share', 'link')
-            if blog_cafe_share == 'content':
-                # 본문 허용으로 변경
-                self._set_blog_cafe_share_option('본문')
-            elif blog_cafe_share == 'none':
-                # 블로그/카페 공유 체크박스 해제
-                self._toggle_checkbox(['블로그', '카페', '공유'], uncheck=True)
-            
-            # 공지사항 체크박스
-            is_notice = publish_settings.get('is_notice', False)
-            if is_notice:
-                self._toggle_checkbox(['공지사항', '공지 사항', '공지'], check=True)
-            
-            print("[INFO] [CDP] 발행 설정 옵션 적용 완료")
-            return True
+            # 블로그/카페 공유 범위 (체크박스가 켜진 뒤에 드롭다운이 활성화됨)
+            if plan['share']:
+                self._set_blog_cafe_share_option('본문' if plan['share'] == 'content' else '링크')
             
-        except Exception as e:
-            print(f"[WARNING] [CDP] 발행 설정 옵션 적용 실패: {e}")
-            return True
-    
-    def _toggle_checkbox(self, search_texts: list, check: bool = False, uncheck: bool = False) -> bool:
-        """체크박스 토글 (check=True면 체크, uncheck=True면 해제)"""
-        try:
-            search_texts_js = str(search_texts)
-            action = 'check' if check else 'uncheck' if uncheck else 'toggle'
-            
-            result = self._evaluate_js(f'''
-            (function() {{
-                const searchTexts = {search_texts_js};
-                const action = '{action}';
-                
-                // 체크박스 또는 레이블 찾기
-                const checkboxes = document.querySelectorAll('input[type="checkbox"]');
-                for (const cb of checkboxes) {{
-                    const parent = cb.closest('label, div, li');
-                    if (!parent) continue;
-                    
-                    const parentText = parent.textContent;
-                    let matched = false;
-                    
-                    for (const text of searchTexts) {{
-                        if (parentText.includes(text)) {{
-                            matched = true;
-                            break;
-                        }}
-                    }}
-                    
-                    if (matched && cb.offsetParent !== null) {{
-                        // 현재 상태 확인
-                        const isChecked = cb.checked;
-                        
-                        // 원하는 상태와 다르면 클릭
-                        if ((action === 'check' && !isChecked) || 
-                            (action === 'uncheck' && isChecked) ||
-                            action === 'toggle') {{
-                            const rect = cb.getBoundingClientRect();
-                            return {{
-                                found: true,
-                                x: rect.left + rect.width / 2,
-                                y: rect.top + rect.height / 2,
-                                wasChecked: isChecked
-                            }};
-                        }}
-                        return {{ found: true, noChange: true, isChecked: isChecked }};
-                    }}
-                }}
-                
-                // 레이블로 찾기
-                const labels = document.querySelectorAll('label');
-                for (const label of labels) {{
-                    const labelText = label.textContent;
-                    let matched = false;
-                    
-                    for (const text of searchTexts) {{
-                        if (labelText.includes(text)) {{
-                            matched = true;
-                            break;
-                        }}
-                    }}
-                    
-                    if (matched && label.offsetParent !== null) {{
-                        const rect = label.getBoundingClientRect();
-                        return {{
-                            found: true,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2,
-                            element: 'label'
-                        }};
-                    }}
-                }}
-                
-                return {{ found: false }};
-            }})()
-            ''')
+            if tags:
+                self._set_tags_in_popup(tags, tag_pos=state.get('tag_input'))
             
-            if result and result.get('found') and not result.get('noChange'):
-                self._cdp_click(result['x'], result['y'])
-                time.sleep(0.2)
-                print(f"[DEBUG] [CDP] 체크박스 토글: {search_texts[0]}")
-                return True
+            # 최종 검증 (한 번만 다시 읽기)
+            final_state = self._read_publish_popup_state()
+            if not final_state:
+                return False
+            remaining = self._plan_publish_popup_changes(final_state, publish_settings)
+            mismatched = [name for name, _, _ in remaining['clicks']]
+            if remaining['share']:
+                mismatched.append('blog_cafe_share_scope')
+            if mismatched:
+                print(f"[WARNING] [CDP] 발행 설정 불일치: {', '.join(mismatched)}")
+                return False
             
+            print("[INFO] [CDP] 발행 설정 적용 완료")
             return True
             
         except Exception as e:
-            print(f"[WARNING] [CDP] 체크박스 토글 실패: {e}")
+            print(f"[WARNING] [CDP] 발행 설정 적용 실패: {e}")
             return False
     
+    
     def _set_blog_cafe_share_option(self, option_text: str) -> bool:
         """블로그/카페 공유 드롭다운 옵션 선택"""
         try:
             # 드롭다운 버튼 클릭
-            dropdown_result = self._evaluate_js('''
-            (function() {
-                // 링크 허용/본문 허용 드롭다운 버튼 찾기
-                const buttons = document.querySelectorAll('button, [class*="dropdown"], [class*="select"]');
-                for (const btn of buttons) {
-                    const text = btn.textContent;
-                    if ((text.includes('링크') || text.includes('본문')) && 
-                        text.includes('허용') && btn.offsetParent !== null) {
-                        const rect = btn.getBoundingClientRect();
-                        return {
-                            found: true,
-                            x: rect.left + rect.width / 2,
-                            y: rect.top + rect.height / 2
-                        };
-                    }
-                }
-                return { found: false };
-            })()
-            ''')
+            dropdown_result = self.js.call('findShareDropdown')
             
             if dropdown_result and dropdown_result.get('found'):
                 self._cdp_click(dropdown_result['x'], dropdown_result['y'])
-                time.sleep(0.3)
+                # 드롭다운 옵션이 펼쳐질 때까지
+                self.waiter.dom_settled(quiet_ms=150, timeout=1)
                 
                 # 옵션 선택
-                option_result = self._evaluate_js(f'''
-                (function() {{
-                    const targetText = '{option_text}';
-                    const options = document.querySelectorAll('li, option, [role="option"], [class*="item"]');
-                    for (const opt of options) {{
-                        if (opt.textContent.includes(targetText) && opt.offsetParent !== null) {{
-                            const rect = opt.getBoundingClientRect();
-                            return {{
-                                found: true,
-                                x: rect.left + rect.width / 2,
-                                y: rect.top + rect.height / 2
-                            }};
-                        }}
-                    }}
-                    return {{ found: false }};
-                }})()
-                ''')
+                option_result = self.js.call('findShareOption', option_text)
                 
                 if option_result and option_result.get('found'):
                     self._cdp_click(option_result['x'], option_result['y'])
-                    time.sleep(0.2)
+                    self.waiter.dom_settled(quiet_ms=150, timeout=1)
                     print(f"[DEBUG] [CDP] 블로그/카페 공유 옵션 선택: {option_text}")
             
             return True
@@ -1284,6 +1319,41 @@ class NaverBlogWriterCDP:
             print(f"[WARNING] [CDP] 블로그/카페 공유 옵션 설정 실패: {e}")
             return False
     
+    def is_post_published(self, title: str) -> bool:
+        """
+        블로그에 해당 제목의 글이 이미 발행되어 있는지 확인
+        (중단된 배치를 재개할 때 중복 발행 방지용)
+        """
+        return self._verify_post_published(title)
+    
+    def _verify_post_by_log_no(self, log_no: str) -> bool:
+        """
+        글 번호(logNo)로 발행된 글 확인 (글 보기 페이지 1회 로드)
+        
+        Args:
+            log_no: 발행 응답에서 얻은 글 번호
+            
+        Returns:
+            bool: 해당 글이 존재하면 True
+        """
+        try:
+            post_view_url = f"https://blog.naver.com/PostView.naver?blogId={self.blog_id}&logNo={log_no}"
+            print(f"[INFO] [CDP] 글 번호로 발행 확인: {log_no}")
+            self.driver.get(post_view_url)
+            self._handle_alert()
+            
+            result = self.js.wait_for('findPostById', log_no, timeout=8)
+            if result and result.get('found'):
+                print(f"[SUCCESS] [CDP] 글 발행 확인됨 - logNo: {log_no} ({result.get('source')})")
+                return True
+            
+            print(f"[WARNING] [CDP] 글 번호 {log_no} 의 글을 찾을 수 없음")
+            return False
+            
+        except Exception as e:
+            print(f"[ERROR] [CDP] 발행 확인 실패: {e}")
+            return False
+    
     def _verify_post_published(self, title: str) -> bool:
         """
         블로그 글목록에서 발행된 글 확인
@@ -1296,82 +1366,28 @@ class NaverBlogWriterCDP:
         """
         try:
             print(f"[INFO] [CDP] 발행 확인 중: '{title}'")
-            time.sleep(3)
             
             # 1. 먼저 블로그 전체글 보기 페이지로 이동
             post_list_url = f"https://blog.naver.com/PostList.naver?blogId={self.blog_id}&from=postList&categoryNo=0"
             print(f"[INFO] [CDP] 글목록으로 이동: {post_list_url}")
             self.driver.get(post_list_url)
-            time.sleep(4)
             
-            # iframe 내부에서 제목 검색
-            result = self._evaluate_js(f'''
-            (function() {{
-                const searchTitle = '{title}';
-                
-                // mainFrame iframe 접근
-                const mainFrame = document.getElementById('mainFrame');
-                if (mainFrame && mainFrame.contentDocument) {{
-                    const frameDoc = mainFrame.contentDocument;
-                    const frameText = frameDoc.body.innerText;
-                    
-                    // 제목이 포함되어 있는지 확인
-                    if (frameText.includes(searchTitle)) {{
-                        return {{ found: true, location: 'mainFrame', source: 'text' }};
-                    }}
-                    
-                    // 글 목록 링크들에서 검색
-                    const links = frameDoc.querySelectorAll('a');
-                    for (const link of links) {{
-                        const text = link.textContent.trim();
-                        if (text.includes(searchTitle)) {{
-                            return {{ found: true, location: 'mainFrame', source: 'link', title: text }};
-                        }}
-                    }}
-                }}
-                
-                // 메인 문서에서도 검색
-                if (document.body.innerText.includes(searchTitle)) {{
-                    return {{ found: true, location: 'main', source: 'text' }};
-                }}
-                
-                return {{ found: false }};
-            }})()
-            ''')
+            # 글목록(iframe 포함)에 제목이 나타날 때까지 대기
+            result = self.js.wait_for('searchPostList', title, timeout=10)
             
             if result and result.get('found'):
                 print(f"[SUCCESS] [CDP] 글 발행 확인됨 - 위치: {result.get('location')}, 소스: {result.get('source')}")
                 return True
             
-            # 2. 블로그 메인 페이지에서 추가 확인
+            # 2. 블로그 메인 페이지에서 추가 확인 (문서 + iframe HTML)
             blog_main_url = f"https://blog.naver.com/{self.blog_id}"
             print(f"[INFO] [CDP] 블로그 메인에서 재확인: {blog_main_url}")
             self.driver.get(blog_main_url)
-            time.sleep(4)
-            
-            # 페이지 소스에서 직접 검색
-            page_source = self.driver.page_source
-            if title in page_source:
-                print(f"[SUCCESS] [CDP] 블로그 메인에서 발견됨")
-                return True
             
-            # 3. iframe 내부에서 다시 확인
-            result2 = self._evaluate_js(f'''
-            (function() {{
-                const searchTitle = '{title}';
-                const mainFrame = document.getElementById('mainFrame');
-                if (mainFrame && mainFrame.contentDocument) {{
-                    const frameSource = mainFrame.contentDocument.body.innerHTML;
-                    if (frameSource.includes(searchTitle)) {{
-                        return {{ found: true }};
-                    }}
-                }}
-                return {{ found: false }};
-            }})()
-            ''')
+            result2 = self.js.wait_for('searchBlogMain', title, timeout=8)
             
             if result2 and result2.get('found'):
-                print(f"[SUCCESS] [CDP] iframe HTML에서 발견됨")
+                print(f"[SUCCESS] [CDP] 블로그 메인에서 발견됨 - 위치: {result2.get('location')}")
                 return True
                 
             print("[WARNING] [CDP] 글목록에서 해당 글을 찾을 수 없음")
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네이버 블로그 자동 글쓰기 프로그램
+발행 응답 캡처 모듈
+
+최종 발행 버튼을 누르는 동안의 네트워크 이벤트(크롬 performance 로그)를 읽어
+에디터의 저장/발행 응답에서 새 글의 logNo 와 URL 을 얻습니다.
+발행 확인을 제목 문자열 검색 대신 글 번호(logNo) 비교로 할 수 있게 합니다.
+
+performance 로그는 드라이버 생성 시 goog:loggingPrefs 로 켜야 하며
+(PERFORMANCE_LOGGING_PREFS 참고), 꺼져 있으면 None 을 반환하고
+호출 측은 현재 URL 에서 logNo 를 찾는 방식으로 대체합니다.
+
+같은 로그의 Network.loadingFinished 이벤트로 브라우저가 받은 바이트 수도
+셉니다 (TrafficMeter). 로그는 읽으면 비워지므로 발행 응답 캡처가 읽은
+이벤트도 TrafficMeter 에 넘겨 집계합니다. 한 브라우저를 여러 계정이
+브라우저 컨텍스트로 나눠 쓰므로 바이트는 이벤트가 나온 탭의 컨텍스트별로
+따로 셉니다.
+"""
+import json
+import re
+import time
+from typing import Dict, Optional
+
+# 드라이버 옵션 (네트워크 이벤트만 기록) - 드라이버 어댑터와 같은 값을 씀
+from adapters.browser.driver_adapter import PERFORMANCE_LOGGING_PREFS, PERF_LOGGING_OPTIONS
+
+# 에디터 저장/발행 요청 URL
+PUBLISH_REQUEST_PATTERN = re.compile(r'RabbitWrite|PostWrite|/api/.*(?:publish|post)', re.IGNORECASE)
+
+# 응답 본문/URL 에서 글 번호 찾기
+_LOG_NO_PATTERNS = [
+    re.compile(r'logNo["\']?\s*[=:]\s*["\']?(\d{5,})'),
+    re.compile(r'blog\.naver\.com/[A-Za-z0-9_-]+/(\d{5,})'),
+]
+
+
+def extract_log_no(text: str) -> Optional[str]:
+    """
+    응답 본문이나 URL 에서 logNo 추출
+
+    Args:
+        text: JSON 응답 본문 또는 URL
+
+    Returns:
+        logNo 문자열 (없으면 None)
+    """
+    if not text:
+        return None
+    for pattern in _LOG_NO_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def build_post_url(blog_id: str, log_no: str) -> str:
+    """블로그 ID와 logNo로 글 주소 생성"""
+    return f"https://blog.naver.com/{blog_id}/{log_no}"
+
+
+def read_performance_events(driver) -> Optional[list]:
+    """
+    쌓인 performance 로그를 꺼내 (method, params, target_id) 목록으로 반환
+
+    target_id 는 이벤트가 나온 탭의 CDP 타깃 ID (chromedriver 의 webview, 없으면 None)
+
+    Returns:
+        이벤트 목록 (로그가 켜져 있지 않은 드라이버면 None)
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return None
+
+    events = []
+    for entry in entries:
+        try:
+            record = json.loads(entry['message'])
+            message = record['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        events.append((message.get('method'), message.get('params', {}), record.get('webview')))
+    return events
+
+
+class TrafficMeter:
+    """
+    브라우저가 받은 바이트 수 집계 (Network.loadingFinished 의 encodedDataLength)
+
+    바이트는 이벤트가 나온 탭의 브라우저 컨텍스트별로 셉니다. 컨텍스트를
+    알 수 없는 이벤트(이미 닫힌 탭 등)는 브라우저 전체 합계에만 들어갑니다.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        # 브라우저 컨텍스트 ID -> 바이트 수 (None: 컨텍스트를 모르는 이벤트)
+        self.totals: Dict[Optional[str], int] = {}
+        # take() 에 넘긴 컨텍스트 ID -> 지난번까지 가져간 바이트 수 (None: 브라우저 전체)
+        self._taken: Dict[Optional[str], int] = {}
+        # 타깃(탭) ID -> 브라우저 컨텍스트 ID
+        self._contexts: Dict[str, Optional[str]] = {}
+        self.enabled = True
+
+    @property
+    def total(self) -> int:
+        """브라우저 전체가 받은 바이트 수"""
+        return sum(self.totals.values())
+
+    def _context_of(self, target_id: Optional[str]) -> Optional[str]:
+        """탭의 브라우저 컨텍스트 ID (처음 보는 탭이면 Target.getTargets 로 조회)"""
+        if target_id is None:
+            return None
+        if target_id not in self._contexts:
+            try:
+                infos = self.driver.execute_cdp_cmd("Target.getTargets", {}).get('targetInfos', [])
+            except Exception:
+                infos = []
+            for info in infos:
+                self._contexts[info.get('targetId')] = info.get('browserContextId')
+            self._contexts.setdefault(target_id, None)
+        return self._contexts[target_id]
+
+    def add_events(self, events: list):
+        """다른 곳에서 읽은 performance 로그 이벤트 반영"""
+        for method, params, target_id in events:
+            if method == 'Network.loadingFinished':
+                context_id = self._context_of(target_id)
+                received = int(params.get('encodedDataLength') or 0)
+                self.totals[context_id] = self.totals.get(context_id, 0) + received
+
+    def poll(self):
+        """쌓인 로그 읽어서 반영"""
+        if not self.enabled:
+            return
+        events = read_performance_events(self.driver)
+        if events is None:
+            self.enabled = False
+            return
+        self.add_events(events)
+
+    def take(self, context_id: Optional[str] = None) -> int:
+        """
+        지난 take() 이후 받은 바이트 수
+
+        Args:
+            context_id: 이 브라우저 컨텍스트의 탭들이 받은 바이트만 셈
+                (None 이면 브라우저 전체)
+
+        Returns:
+            바이트 수 (로그를 쓸 수 없으면 0)
+        """
+        self.poll()
+        total = self.total if context_id is None else self.totals.get(context_id, 0)
+        received = total - self._taken.get(context_id, 0)
+        self._taken[context_id] = total
+        return received
+
+
+class PublishResponseCapture:
+    """발행 요청의 네트워크 응답에서 logNo 를 읽는 클래스"""
+
+    def __init__(self, driver, poll_interval: float = 0.2, meter: Optional[TrafficMeter] = None):
+        self.driver = driver
+        self.poll_interval = poll_interval
+        self.enabled = True
+        # 읽은 이벤트의 수신 바이트도 집계할 TrafficMeter
+        self.meter = meter
+
+    def _read_events(self) -> list:
+        """쌓인 performance 로그를 꺼내 (method, params) 목록으로 반환"""
+        events = read_performance_events(self.driver)
+        if events is None:
+            # 로그가 켜져 있지 않은 드라이버
+            self.enabled = False
+            return []
+        if self.meter:
+            self.meter.add_events(events)
+        return events
+
+    def start(self) -> bool:
+        """
+        발행 클릭 직전에 호출: 이전 이벤트를 비움
+
+        Returns:
+            performance 로그를 사용할 수 있으면 True
+        """
+        self._read_events()
+        return self.enabled
+
+    def _response_body(self, request_id: str) -> str:
+        """Network.getResponseBody 로 응답 본문 읽기"""
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            return result.get('body', '')
+        except Exception as e:
+            print(f"[DEBUG] [NET] 응답 본문 읽기 실패: {e}")
+            return ''
+
+    def wait_for_log_no(self, timeout: float = 10.0) -> Optional[str]:
+        """
+        발행 응답(또는 발행 후 이동하는 글 주소)에서 logNo 가 나올 때까지 대기
+
+        Returns:
+            logNo (타임아웃 또는 로그 미사용 시 None)
+        """
+        if not self.enabled:
+            return None
+
+        pending = set()
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            for method, params, _ in self._read_events():
+                if method == 'Network.requestWillBeSent':
+                    # 발행 후 글 주소로 이동하는 문서 요청
+                    request = params.get('request', {})
+                    if params.get('type') == 'Document':
+                        log_no = extract_log_no(request.get('url', ''))
+                        if log_no:
+                            return log_no
+                elif method == 'Network.responseReceived':
+                    url = params.get('response', {}).get('url', '')
+                    if PUBLISH_REQUEST_PATTERN.search(url):
+                        pending.add(params.get('requestId'))
+                elif method == 'Network.loadingFinished':
+                    request_id = params.get('requestId')
+                    if request_id in pending:
+                        pending.discard(request_id)
+                        log_no = extract_log_no(self._response_body(request_id))
+                        if log_no:
+                            return log_no
+
+            if not self.enabled:
+                return None
+            time.sleep(self.poll_interval)
+
+        return None
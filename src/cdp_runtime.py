@@ -0,0 +1,529 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네이버 블로그 자동 글쓰기 프로그램
+CDP 헬퍼 런타임 모듈
+
+자주 쓰는 페이지 조작 함수(제목/본문 영역 찾기, 발행 버튼 찾기, 팝업 상태 읽기,
+글목록 검색 등)를 문서마다 한 번만 설치하고(window.__nblog),
+이후에는 Runtime.callFunctionOn 으로 함수 이름과 JSON 인자만 보내 호출합니다.
+
+- 매 호출마다 수 KB 스크립트를 전송/파싱하지 않음
+- 제목 등 값은 JSON 인자로 전달되므로 따옴표가 스크립트를 깨뜨리지 않음
+- 새 문서에는 Page.addScriptToEvaluateOnNewDocument 로 자동 설치 (탭마다 등록),
+  이미 열린 문서에 헬퍼가 없으면 그 자리에서 다시 설치
+"""
+import itertools
+import weakref
+from typing import Any, Optional
+
+
+HELPERS_VERSION = 3
+
+# 헬퍼 설치 스크립트 (같은 버전이 이미 있으면 아무것도 하지 않음)
+_HELPERS_SOURCE = '''
+(function() {
+    if (window.__nblog && window.__nblog.version === __VERSION__) return;
+
+    const visible = (el) => !!el && el.offsetParent !== null;
+    const center = (el) => {
+        const rect = el.getBoundingClientRect();
+        return { x: rect.left + rect.width / 2, y: rect.top + rect.height / 2 };
+    };
+    const located = (el, extra) => Object.assign({ found: true }, center(el), extra || {});
+    const frameDocument = () => {
+        const mainFrame = document.getElementById('mainFrame');
+        try {
+            if (mainFrame && mainFrame.contentDocument && mainFrame.contentDocument.body) {
+                return mainFrame.contentDocument;
+            }
+        } catch (e) {}
+        return null;
+    };
+
+    const helpers = {
+        version: __VERSION__,
+
+        // 선택자 요소의 중심 좌표
+        findElementCenter(selector) {
+            const el = document.querySelector(selector);
+            if (!el) return null;
+            const rect = el.getBoundingClientRect();
+            return Object.assign(center(el), { visible: rect.width > 0 && rect.height > 0 });
+        },
+
+        // 제목 입력 영역
+        findTitleArea() {
+            // placeholder가 "제목"인 영역
+            for (const el of document.querySelectorAll('.se-text-paragraph')) {
+                const placeholder = el.querySelector('.se-placeholder');
+                if (placeholder && placeholder.textContent.includes('제목')) {
+                    return located(el, { selector: 'placeholder-title' });
+                }
+            }
+            const titleEl = document.querySelector('.se-title-text .se-text-paragraph');
+            if (titleEl) {
+                return located(titleEl, { selector: '.se-title-text .se-text-paragraph' });
+            }
+            return { found: false };
+        },
+
+        // 본문 입력 영역 (제목이 아닌 첫 문단)
+        findBodyParagraph() {
+            for (const el of document.querySelectorAll('.se-text-paragraph')) {
+                const placeholder = el.querySelector('.se-placeholder');
+                const isTitle = el.closest('.se-title-text') ||
+                                el.closest('.se-documentTitle') ||
+                                (placeholder && placeholder.textContent.includes('제목'));
+                if (!isTitle) {
+                    return located(el, { selector: 'non-title paragraph' });
+                }
+            }
+            const contentEl = document.querySelector('.se-component.se-text .se-text-paragraph');
+            if (contentEl) {
+                return located(contentEl, { selector: '.se-component.se-text .se-text-paragraph' });
+            }
+            return { found: false };
+        },
+
+        // 우측 상단 1차 발행 버튼
+        findHeaderPublishButton() {
+            const headerSelectors = [
+                'header button[class*="publish"]',
+                '.header button[class*="publish"]',
+                '[class*="header"] button[class*="publish"]',
+                'button[class*="publish_btn__"]',
+                'button.publish_btn__m9KHH',
+                '.publish_btn_area__KjA2i button',
+                '[class*="publish_btn_area"] button'
+            ];
+            for (const sel of headerSelectors) {
+                const btn = document.querySelector(sel);
+                // 상단에 있는 버튼 (y < 100)
+                if (visible(btn) && btn.getBoundingClientRect().top < 100) {
+                    return located(btn, { text: btn.textContent.trim(), type: 'header' });
+                }
+            }
+            for (const btn of document.querySelectorAll('button')) {
+                if (btn.textContent.trim() === '발행' && visible(btn) &&
+                    btn.getBoundingClientRect().top < 100) {
+                    return located(btn, { text: '발행', type: 'text' });
+                }
+            }
+            return { found: false };
+        },
+
+        // 발행 팝업 내 최종 발행 버튼 찾아서 클릭
+        clickFinalPublishButton() {
+            const candidates = [
+                ['[data-testid="seOnePublishBtn"]', 'data-testid=seOnePublishBtn'],
+                ['button.confirm_btn__WEaBq', 'confirm_btn__WEaBq'],
+                ['button[class*="confirm_btn"]', 'confirm_btn pattern']
+            ];
+            for (const [sel, container] of candidates) {
+                const btn = document.querySelector(sel);
+                if (visible(btn)) {
+                    const result = located(btn, { clicked: true, container: container });
+                    btn.click();
+                    return result;
+                }
+            }
+            // 모든 '발행' 버튼 중 가장 아래 것 (팝업 내부)
+            const publishButtons = Array.from(document.querySelectorAll('button'))
+                .filter(btn => btn.textContent.trim() === '발행' && visible(btn));
+            if (publishButtons.length >= 2) {
+                publishButtons.sort((a, b) => b.getBoundingClientRect().top - a.getBoundingClientRect().top);
+                const btn = publishButtons[0];
+                const result = located(btn, {
+                    clicked: true,
+                    container: 'popup (lower button)',
+                    buttonCount: publishButtons.length
+                });
+                btn.click();
+                return result;
+            }
+            return { found: false, buttonCount: publishButtons.length };
+        },
+
+        // 발행 설정 팝업이 열려 있는지
+        findPublishPopup() {
+            const popupIndicators = [
+                '[class*="publish_layer"]',
+                '[class*="publishLayer"]',
+                '[class*="publish_setting"]',
+                '[class*="publish_popup"]',
+                // 팝업 내 특정 요소
+                '[class*="category"]',
+                '[class*="tag_input"]',
+                '[class*="공개"]'
+            ];
+            for (const sel of popupIndicators) {
+                if (visible(document.querySelector(sel))) {
+                    return { found: true, selector: sel };
+                }
+            }
+            // 발행 버튼이 2개 이상 보이면 팝업이 열린 것
+            const publishButtons = Array.from(document.querySelectorAll('button'))
+                .filter(btn => btn.textContent.trim() === '발행' && visible(btn));
+            if (publishButtons.length >= 2) {
+                return { found: true, selector: 'multiple_publish_buttons' };
+            }
+            return null;
+        },
+
+        // 에디터 상태: 제목/본문 텍스트(placeholder 제외), 발행 팝업 열림 여부
+        readEditorState() {
+            const textOf = (el) => {
+                if (!el) return '';
+                const clone = el.cloneNode(true);
+                clone.querySelectorAll('.se-placeholder').forEach(p => p.remove());
+                return clone.textContent.replace(/\\u200b/g, '').trim();
+            };
+            const isTitle = (el) => !!el.closest('.se-title-text, .se-documentTitle');
+            const paragraphs = Array.from(document.querySelectorAll('.se-text-paragraph'));
+            const titleEl = paragraphs.find(isTitle) || null;
+            const body = paragraphs.filter(el => !isTitle(el)).map(textOf).filter(Boolean);
+            return {
+                inEditor: location.href.toLowerCase().includes('postwrite') &&
+                          !!document.querySelector('.se-body, .__se-body, .se-content'),
+                title: textOf(titleEl),
+                body: body.join('\\n'),
+                popupOpen: !!helpers.findPublishPopup()
+            };
+        },
+
+        // 발행 팝업의 태그 입력 필드
+        findTagInput() {
+            const tagSelectors = [
+                'input[class*="tag_input"]',
+                'input[placeholder*="태그"]',
+                '[class*="tag"] input',
+                '.tag_input__rvUB5'
+            ];
+            for (const sel of tagSelectors) {
+                const input = document.querySelector(sel);
+                if (visible(input)) return located(input, { selector: sel });
+            }
+            return { found: false };
+        },
+
+        // 발행 팝업 전체 상태 (체크박스/공개 설정/공유 드롭다운/카테고리/태그 입력)
+        readPublishPopupState(spec) {
+            const labelText = (cb) => {
+                if (cb.labels && cb.labels.length) return cb.labels[0].textContent;
+                const parent = cb.closest('label, li, div');
+                return parent ? parent.textContent : '';
+            };
+            const state = { checkboxes: {}, visibility: {}, share: null, category: null, tag_input: null };
+
+            // 체크박스 (하나의 체크박스는 하나의 옵션에만 대응)
+            const used = new Set();
+            const checkboxes = Array.from(document.querySelectorAll('input[type="checkbox"]'));
+            for (const [key, texts] of Object.entries(spec.checkboxes)) {
+                for (const cb of checkboxes) {
+                    if (used.has(cb)) continue;
+                    const text = labelText(cb);
+                    if (!texts.some(t => text.includes(t))) continue;
+                    const target = visible(cb) ? cb : ((cb.labels && cb.labels[0]) || cb.closest('label, li, div'));
+                    if (!visible(target)) continue;
+                    used.add(cb);
+                    state.checkboxes[key] = Object.assign({ checked: cb.checked }, center(target));
+                    break;
+                }
+            }
+
+            // 공개 설정 라디오 (정확히 일치하는 레이블 우선: '이웃공개' vs '서로이웃공개')
+            const labels = Array.from(document.querySelectorAll('label')).filter(visible);
+            for (const [key, text] of Object.entries(spec.visibility)) {
+                const label = labels.find(l => l.textContent.trim() === text)
+                    || labels.find(l => l.textContent.includes(text));
+                if (!label) continue;
+                const radio = label.control || label.querySelector('input[type="radio"]');
+                state.visibility[key] = Object.assign({ checked: !!(radio && radio.checked) }, center(label));
+            }
+
+            const share = helpers.findShareDropdown();
+            if (share.found) {
+                state.share = { current: share.current, x: share.x, y: share.y };
+            }
+
+            // 카테고리 (현재 선택된 이름)
+            for (const sel of ['[class*="category"] button', '[class*="categorySelect"]', 'select[class*="category"]']) {
+                const el = document.querySelector(sel);
+                if (visible(el)) {
+                    const current = el.tagName === 'SELECT'
+                        ? (el.selectedOptions[0] ? el.selectedOptions[0].textContent : '')
+                        : el.textContent;
+                    state.category = { current: current.trim() };
+                    break;
+                }
+            }
+
+            const tagInput = helpers.findTagInput();
+            if (tagInput.found) {
+                state.tag_input = { selector: tagInput.selector, x: tagInput.x, y: tagInput.y };
+            }
+
+            return state;
+        },
+
+        // 카테고리 드롭다운 열기
+        openCategoryDropdown() {
+            const categorySelectors = [
+                '[class*="category"] select',
+                '[class*="category"] button',
+                'select[class*="category"]',
+                '[class*="categorySelect"]'
+            ];
+            for (const sel of categorySelectors) {
+                const el = document.querySelector(sel);
+                if (visible(el)) {
+                    el.click();
+                    return { clicked: true, selector: sel };
+                }
+            }
+            return { clicked: false };
+        },
+
+        // 펼쳐진 카테고리 목록에서 항목 선택
+        selectCategoryItem(name) {
+            const items = document.querySelectorAll('[class*="category"] li, [class*="category"] option, [role="option"]');
+            for (const item of items) {
+                if (item.textContent.includes(name)) {
+                    item.click();
+                    return true;
+                }
+            }
+            return false;
+        },
+
+        // 블로그/카페 공유 드롭다운 (링크 허용 / 본문 허용)
+        findShareDropdown() {
+            for (const btn of document.querySelectorAll('button, [class*="dropdown"], [class*="select"]')) {
+                const text = btn.textContent;
+                if ((text.includes('링크') || text.includes('본문')) && text.includes('허용') && visible(btn)) {
+                    return located(btn, { current: text.includes('본문') ? 'content' : 'link' });
+                }
+            }
+            return { found: false };
+        },
+
+        // 펼쳐진 드롭다운의 옵션
+        findShareOption(text) {
+            for (const opt of document.querySelectorAll('li, option, [role="option"], [class*="item"]')) {
+                if (opt.textContent.includes(text) && visible(opt)) return located(opt);
+            }
+            return { found: false };
+        },
+
+        // 글목록(PostList) 페이지에서 제목 검색 (mainFrame 포함)
+        searchPostList(title) {
+            const frameDoc = frameDocument();
+            if (frameDoc) {
+                if (frameDoc.body.innerText.includes(title)) {
+                    return { found: true, location: 'mainFrame', source: 'text' };
+                }
+                for (const link of frameDoc.querySelectorAll('a')) {
+                    const text = link.textContent.trim();
+                    if (text.includes(title)) {
+                        return { found: true, location: 'mainFrame', source: 'link', title: text };
+                    }
+                }
+            }
+            if (document.body && document.body.innerText.includes(title)) {
+                return { found: true, location: 'main', source: 'text' };
+            }
+            return null;
+        },
+
+        // 블로그 메인 페이지 HTML에서 제목 검색 (문서 + mainFrame)
+        searchBlogMain(title) {
+            if (document.documentElement.innerHTML.includes(title)) {
+                return { found: true, location: 'main' };
+            }
+            const frameDoc = frameDocument();
+            if (frameDoc && frameDoc.body.innerHTML.includes(title)) {
+                return { found: true, location: 'mainFrame' };
+            }
+            return null;
+        },
+
+        // 글 보기 페이지가 해당 글 번호의 글인지 확인 (문서 + mainFrame)
+        findPostById(logNo) {
+            const docs = [document, frameDocument()].filter(Boolean);
+            for (const doc of docs) {
+                if (doc.getElementById('post-view' + logNo)) {
+                    return { found: true, source: 'post-view' };
+                }
+                const ogUrl = doc.querySelector('meta[property="og:url"]');
+                if (ogUrl && (ogUrl.content || '').endsWith('/' + logNo)) {
+                    return { found: true, source: 'og:url' };
+                }
+            }
+            return null;
+        },
+
+        // 헬퍼 함수가 truthy 값을 반환할 때까지 대기 (DOM 변경 시 / poll 간격으로 재검사)
+        waitFor(name, args, timeoutMs, pollMs) {
+            const check = () => { try { return helpers[name].apply(helpers, args); } catch (e) { return null; } };
+            return new Promise((resolve) => {
+                const first = check();
+                if (first) { resolve(first); return; }
+                let done = false;
+                let timer = null;
+                let deadline = null;
+                const observer = new MutationObserver(() => { const v = check(); if (v) finish(v); });
+                const finish = (value) => {
+                    if (done) return;
+                    done = true;
+                    observer.disconnect();
+                    clearInterval(timer);
+                    clearTimeout(deadline);
+                    resolve(value);
+                };
+                observer.observe(document.documentElement || document, {
+                    childList: true, subtree: true, attributes: true, characterData: true
+                });
+                timer = setInterval(() => { const v = check(); if (v) finish(v); }, pollMs);
+                deadline = setTimeout(() => finish(null), timeoutMs);
+            });
+        }
+    };
+
+    window.__nblog = helpers;
+})();
+'''.replace('__VERSION__', str(HELPERS_VERSION))
+
+# 헬퍼가 없으면 표시값 반환 (호출 측에서 재설치 후 재시도)
+_MISSING_MARKER = '__nblogMissing'
+
+_CALL_FUNCTION = '''function(name, args) {
+    const helpers = this.__nblog;
+    if (!helpers || helpers.version !== %d || typeof helpers[name] !== 'function') {
+        return { %s: true };
+    }
+    return helpers[name].apply(helpers, args);
+}''' % (HELPERS_VERSION, _MISSING_MARKER)
+
+# 드라이버별, 탭(창 핸들)별 등록된 새 문서 스크립트 ID
+# (새 문서 스크립트는 탭마다 따로 등록됨 - 글마다 writer 를 새로 만들거나
+#  브라우저를 재사용해도 같은 탭에는 중복 등록하지 않음)
+_REGISTERED_SCRIPTS: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+# 런타임마다 다른 객체 그룹 (다른 런타임의 window 핸들을 해제하지 않도록)
+_OBJECT_GROUPS = itertools.count(1)
+
+
+class CDPHelperRuntime:
+    """페이지에 설치된 헬퍼 함수를 Runtime.callFunctionOn 으로 호출하는 클래스"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._installed = False
+        self._window_id: Optional[str] = None
+        self._object_group = f"nblog-{next(_OBJECT_GROUPS)}"
+        self._group_used = False
+
+    def _current_target(self) -> str:
+        """현재 탭의 창 핸들 (알 수 없으면 빈 문자열)"""
+        try:
+            return self.driver.current_window_handle or ''
+        except Exception:
+            return ''
+
+    def install(self) -> bool:
+        """현재 탭에 새 문서마다 헬퍼가 설치되도록 등록하고 현재 문서에도 설치"""
+        registered = _REGISTERED_SCRIPTS.setdefault(self.driver, {})
+        target = self._current_target()
+        if target not in registered:
+            try:
+                result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                    "source": _HELPERS_SOURCE
+                })
+                registered[target] = result.get('identifier', '')
+            except Exception as e:
+                print(f"[DEBUG] [JS] 헬퍼 등록 실패: {e}")
+        self._installed = True
+        return self._inject_current()
+
+    def _inject_current(self) -> bool:
+        """현재 문서에 헬퍼 설치"""
+        self._window_id = None
+        try:
+            self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": _HELPERS_SOURCE,
+                "returnByValue": True
+            })
+            return True
+        except Exception as e:
+            print(f"[DEBUG] [JS] 헬퍼 설치 실패: {e}")
+            return False
+
+    def _window_object_id(self) -> str:
+        """현재 문서의 window 객체 핸들 (문서가 바뀌면 이전 핸들을 해제하고 다시 얻음)"""
+        if self._window_id is None:
+            if self._group_used:
+                try:
+                    self.driver.execute_cdp_cmd("Runtime.releaseObjectGroup", {
+                        "objectGroup": self._object_group
+                    })
+                except Exception:
+                    pass
+            self._group_used = True
+            result = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": "window",
+                "objectGroup": self._object_group
+            })
+            self._window_id = result['result']['objectId']
+        return self._window_id
+
+    def call(self, name: str, *args) -> Any:
+        """
+        헬퍼 함수 호출
+
+        Args:
+            name: window.__nblog 의 함수 이름
+            *args: JSON 직렬화 가능한 인자
+
+        Returns:
+            함수 반환값 (Promise면 resolve 값, 실패 시 None)
+        """
+        if not self._installed:
+            self.install()
+
+        for _ in range(3):
+            try:
+                result = self.driver.execute_cdp_cmd("Runtime.callFunctionOn", {
+                    "functionDeclaration": _CALL_FUNCTION,
+                    "objectId": self._window_object_id(),
+                    "arguments": [{"value": name}, {"value": list(args)}],
+                    "returnByValue": True,
+                    "awaitPromise": True
+                })
+            except Exception as e:
+                # 페이지 이동으로 window 핸들이 무효화됨 -> 새 문서에서 다시 시도
+                print(f"[DEBUG] [JS] {name} 호출 실패, 재시도: {e}")
+                self._window_id = None
+                continue
+
+            if 'exceptionDetails' in result:
+                print(f"[DEBUG] [JS] {name} 실행 오류: {result['exceptionDetails'].get('text')}")
+                return None
+
+            value = result.get('result', {}).get('value')
+            if isinstance(value, dict) and value.get(_MISSING_MARKER):
+                # 새 탭 등 아직 등록되지 않은 탭이면 등록도 함께
+                self.install()
+                continue
+            return value
+
+        return None
+
+    def wait_for(self, name: str, *args, timeout: float = 10.0, poll_ms: int = 100) -> Any:
+        """
+        헬퍼 함수가 truthy 값을 반환할 때까지 페이지 안에서 대기
+
+        Returns:
+            헬퍼 반환값 (타임아웃 시 None)
+        """
+        return self.call('waitFor', name, list(args), int(timeout * 1000), poll_ms)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네이버 블로그 자동 글쓰기 프로그램
+글쓰기 탭 관리 모듈
+
+한 계정의 로그인 세션에서 글쓰기 탭을 여러 개 엽니다 (Target.createTarget).
+새 탭은 현재 탭과 같은 브라우저 컨텍스트(쿠키/저장소)에 만들어지므로
+로그인 상태를 공유하고, 백그라운드에서 바로 에디터를 불러오기 시작합니다.
+
+WebDriver 는 한 번에 한 탭만 조작하므로 탭 작업은 switch() 후에 합니다.
+페이지 로드만 탭끼리 동시에 진행됩니다.
+
+리소스 차단 목록(Network.setBlockedURLs)은 탭마다 설정해야 하므로,
+차단 목록이 있으면 빈 탭을 열어 목록을 설정한 뒤 주소를 불러옵니다.
+"""
+from typing import Dict, Iterable, Optional
+
+from adapters.browser.resource_blocking import apply_resource_blocking
+
+
+class EditorTabs:
+    """한 계정의 글쓰기 탭들 (창 핸들 기준)"""
+
+    def __init__(self, driver, blocked_urls: Iterable[str] = ()):
+        self.driver = driver
+        # 새 탭에서 불러오지 않을 URL 패턴
+        self.blocked_urls = list(blocked_urls)
+        # 탭을 연 원래 탭 (탭을 닫은 뒤 돌아갈 곳)
+        self.home = driver.current_window_handle
+        # 창 핸들 -> CDP targetId
+        self._targets: Dict[str, str] = {}
+        self._context_id: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def _browser_context_id(self) -> Optional[str]:
+        """현재 탭의 브라우저 컨텍스트 (로그인 쿠키를 공유하기 위해)"""
+        if self._context_id is None:
+            info = self.driver.execute_cdp_cmd('Target.getTargetInfo', {})
+            self._context_id = info.get('targetInfo', {}).get('browserContextId')
+        return self._context_id
+
+    def open(self, url: str) -> str:
+        """
+        백그라운드 탭을 열고 url 로드 시작 (로드 완료를 기다리지 않음)
+
+        Args:
+            url: 탭에서 열 주소
+
+        Returns:
+            str: 새 탭의 창 핸들
+        """
+        params = {'url': 'about:blank' if self.blocked_urls else url, 'background': True}
+        context_id = self._browser_context_id()
+        if context_id:
+            params['browserContextId'] = context_id
+
+        before = set(self.driver.window_handles)
+        target_id = self.driver.execute_cdp_cmd('Target.createTarget', params)['targetId']
+        handles = [h for h in self.driver.window_handles if h not in before]
+        handle = next((h for h in handles if h.upper() == target_id.upper()), None)
+        if handle is None:
+            if len(handles) != 1:
+                raise RuntimeError(f"새 탭의 창 핸들을 찾지 못함: {target_id}")
+            handle = handles[0]
+
+        self._targets[handle] = target_id
+        if self.blocked_urls:
+            # 차단 목록을 설정한 뒤 로드 시작 (Page.navigate 는 로드를 기다리지 않음)
+            current = self.driver.current_window_handle
+            self.switch(handle)
+            try:
+                apply_resource_blocking(self.driver, self.blocked_urls)
+                self.driver.execute_cdp_cmd('Page.navigate', {'url': url})
+            finally:
+                self.switch(current)
+        print(f"[INFO] [CDP] 글쓰기 탭 열기 ({len(self._targets)}개): {url}")
+        return handle
+
+    def switch(self, handle: str):
+        """탭으로 전환"""
+        self.driver.switch_to.window(handle)
+
+    def close(self, handle: str):
+        """탭 닫기 (이미 닫혔으면 무시) 후 원래 탭으로 전환"""
+        target_id = self._targets.pop(handle, None)
+        if target_id is None:
+            return
+        try:
+            self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': target_id})
+            self.driver.switch_to.window(self.home)
+        except Exception as e:
+            print(f"[WARNING] [CDP] 글쓰기 탭 닫기 실패: {e}")
+
+    def close_all(self):
+        """열어 둔 탭 모두 닫기"""
+        for handle in list(self._targets):
+            self.close(handle)
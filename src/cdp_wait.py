@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네이버 블로그 자동 글쓰기 프로그램
+CDP 기반 대기(wait) 모듈
+
+고정 time.sleep 대신 페이지 상태를 조건으로 기다립니다.
+모든 조건은 페이지 안에서 Promise로 평가되며(Runtime.evaluate + awaitPromise),
+MutationObserver / PerformanceObserver 이벤트로 즉시 깨어나고
+각 조건마다 타임아웃 예산을 가집니다.
+"""
+import json
+from typing import Any, Optional
+
+
+# 조건 대기 Promise 템플릿
+# - 즉시 한 번 검사
+# - DOM 변경(MutationObserver) 시 재검사
+# - iframe 내부처럼 관찰이 안 되는 변화는 poll 간격으로 재검사
+# - 타임아웃 시 null 반환
+_CONDITION_TEMPLATE = '''
+new Promise((resolve) => {
+    const predicate = %(predicate)s;
+    const check = () => { try { return predicate(); } catch (e) { return null; } };
+    const first = check();
+    if (first) { resolve(first); return; }
+
+    let done = false;
+    let observer = null;
+    let timer = null;
+    let deadline = null;
+    const finish = (value) => {
+        if (done) return;
+        done = true;
+        if (observer) observer.disconnect();
+        clearInterval(timer);
+        clearTimeout(deadline);
+        resolve(value);
+    };
+    observer = new MutationObserver(() => { const v = check(); if (v) finish(v); });
+    observer.observe(document.documentElement || document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    timer = setInterval(() => { const v = check(); if (v) finish(v); }, %(poll_ms)d);
+    deadline = setTimeout(() => finish(null), %(timeout_ms)d);
+})
+'''
+
+# 페이지 로드 완료 대기 (load 이벤트)
+_PAGE_LOAD_TEMPLATE = '''
+new Promise((resolve) => {
+    if (document.readyState === 'complete') { resolve(true); return; }
+    const deadline = setTimeout(() => resolve(false), %(timeout_ms)d);
+    window.addEventListener('load', () => { clearTimeout(deadline); resolve(true); }, { once: true });
+})
+'''
+
+# DOM 변경이 quiet_ms 동안 없을 때까지 대기
+_DOM_SETTLED_TEMPLATE = '''
+new Promise((resolve) => {
+    let quiet = null;
+    let observer = null;
+    const finish = (value) => {
+        if (observer) observer.disconnect();
+        clearTimeout(quiet);
+        clearTimeout(deadline);
+        resolve(value);
+    };
+    const deadline = setTimeout(() => finish(false), %(timeout_ms)d);
+    const arm = () => { clearTimeout(quiet); quiet = setTimeout(() => finish(true), %(quiet_ms)d); };
+    observer = new MutationObserver(arm);
+    observer.observe(document.documentElement || document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    arm();
+})
+'''
+
+# 새 리소스 요청이 idle_ms 동안 없을 때까지 대기 (PerformanceObserver)
+_NETWORK_IDLE_TEMPLATE = '''
+new Promise((resolve) => {
+    let idle = null;
+    let observer = null;
+    const finish = (value) => {
+        if (observer) observer.disconnect();
+        clearTimeout(idle);
+        clearTimeout(deadline);
+        resolve(value);
+    };
+    const deadline = setTimeout(() => finish(false), %(timeout_ms)d);
+    const arm = () => { clearTimeout(idle); idle = setTimeout(() => finish(true), %(idle_ms)d); };
+    try {
+        observer = new PerformanceObserver(() => arm());
+        observer.observe({ type: 'resource', buffered: false });
+    } catch (e) {
+        observer = null;
+    }
+    if (document.readyState === 'complete') {
+        arm();
+    } else {
+        window.addEventListener('load', arm, { once: true });
+    }
+})
+'''
+
+# 요소 선택자 조건 (존재 / 화면 표시)
+_SELECTOR_PREDICATE = '''() => {
+    const el = document.querySelector(%(selector)s);
+    if (!el) return null;
+    if (!%(visible)s) return true;
+    const rect = el.getBoundingClientRect();
+    return (el.offsetParent !== null && rect.width > 0 && rect.height > 0) ? true : null;
+}'''
+
+
+class CDPWaiter:
+    """CDP Promise 평가 기반 조건 대기 클래스"""
+
+    def __init__(self, driver, default_timeout: float = 10.0, poll_ms: int = 100):
+        self.driver = driver
+        self.default_timeout = default_timeout
+        self.poll_ms = poll_ms
+
+    def _await(self, expression: str) -> Any:
+        """Promise 표현식을 평가하고 resolve 값을 반환 (실패 시 None)"""
+        try:
+            result = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": expression,
+                "returnByValue": True,
+                "awaitPromise": True
+            })
+            return result.get('result', {}).get('value')
+        except Exception as e:
+            # 대기 중 페이지 이동이 일어나면 실행 컨텍스트가 사라짐
+            print(f"[DEBUG] [WAIT] 조건 평가 실패: {e}")
+            return None
+
+    def _timeout_ms(self, timeout: Optional[float]) -> int:
+        return int((self.default_timeout if timeout is None else timeout) * 1000)
+
+    def condition(self, predicate: str, timeout: Optional[float] = None) -> Any:
+        """
+        JS 조건 함수가 truthy 값을 반환할 때까지 대기
+
+        Args:
+            predicate: 인자 없는 JS 함수 표현식 (예: "() => document.title")
+            timeout: 타임아웃 (초)
+
+        Returns:
+            조건 함수의 반환값 (타임아웃 시 None)
+        """
+        return self._await(_CONDITION_TEMPLATE % {
+            'predicate': predicate,
+            'poll_ms': self.poll_ms,
+            'timeout_ms': self._timeout_ms(timeout),
+        })
+
+    def page_load(self, timeout: Optional[float] = None) -> bool:
+        """페이지 load 이벤트(readyState === 'complete')까지 대기"""
+        return bool(self._await(_PAGE_LOAD_TEMPLATE % {
+            'timeout_ms': self._timeout_ms(timeout),
+        }))
+
+    def selector(self, selector: str, visible: bool = False,
+                 timeout: Optional[float] = None) -> bool:
+        """선택자에 해당하는 요소가 존재(또는 화면에 표시)될 때까지 대기"""
+        predicate = _SELECTOR_PREDICATE % {
+            'selector': json.dumps(selector),
+            'visible': 'true' if visible else 'false',
+        }
+        return bool(self.condition(predicate, timeout))
+
+    def network_idle(self, idle_ms: int = 500, timeout: Optional[float] = None) -> bool:
+        """idle_ms 동안 새 네트워크 요청이 없을 때까지 대기"""
+        return bool(self._await(_NETWORK_IDLE_TEMPLATE % {
+            'idle_ms': idle_ms,
+            'timeout_ms': self._timeout_ms(timeout),
+        }))
+
+    def dom_settled(self, quiet_ms: int = 300, timeout: Optional[float] = None) -> bool:
+        """quiet_ms 동안 DOM 변경이 없을 때까지 대기"""
+        return bool(self._await(_DOM_SETTLED_TEMPLATE % {
+            'quiet_ms': quiet_ms,
+            'timeout_ms': self._timeout_ms(timeout),
+        }))
@@ -9,17 +9,17 @@ import time
 from typing import Optional
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
+from adapters.browser.driver_resolver import create_chrome_driver, get_default_resolver
 from src.config import Config
+from src.cdp_network import PERFORMANCE_LOGGING_PREFS, PERF_LOGGING_OPTIONS
 
 
 def is_wsl() -> bool:
@@ -57,10 +57,9 @@ def get_windows_chrome_path() -> Optional[str]:
 
 
 def get_windows_chromedriver_path() -> Optional[str]:
-    """Windows용 ChromeDriver 다운로드 및 경로 반환"""
+    """Windows용 ChromeDriver 경로 반환 (캐시된 경로, 없을 때만 다운로드)"""
     try:
-        # webdriver-manager로 Windows용 드라이버 다운로드
-        driver_path = ChromeDriverManager().install()
+        driver_path = get_default_resolver().resolve().chromedriver_path
         
         # WSL에서 Windows 드라이버를 사용하려면 .exe 버전 필요
         # Windows 경로로 변환 시도
@@ -139,6 +138,10 @@ class WebDriverManager:
         options.add_argument('--lang=ko-KR')
         options.add_argument('--font-render-hinting=none')  # 한글 폰트 렌더링
         
+        # 발행 응답 캡처용 네트워크 이벤트 기록 (performance 로그)
+        options.set_capability('goog:loggingPrefs', PERFORMANCE_LOGGING_PREFS)
+        options.add_experimental_option('perfLoggingPrefs', PERF_LOGGING_OPTIONS)
+        
         # Wayland/X11 환경 감지 및 설정
         session_type = os.environ.get('XDG_SESSION_TYPE', '')
         if session_type == 'wayland':
@@ -166,8 +169,8 @@ class WebDriverManager:
             options.add_argument('--disable-software-rasterizer')
             options.add_argument('--remote-debugging-port=9222')
         
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        # 캐시된 chromedriver/Chrome 경로 사용 (매번 버전 조회/다운로드하지 않음)
+        driver = create_chrome_driver(options)
         
         # webdriver 속성 제거
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
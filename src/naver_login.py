@@ -16,6 +16,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from core.models import FAILURE_AUTH, FAILURE_CAPTCHA
 from src.config import Config
 
 # 플랫폼에 따른 모듈 임포트 (지연 로딩)
@@ -89,11 +90,16 @@ class NaverLogin:
     
     NAVER_LOGIN_URL = "https://nid.naver.com/nidlogin.login"
     NAVER_MAIN_URL = "https://www.naver.com"
+    # 로그인 상태면 본인 블로그로, 아니면 로그인 페이지로 리다이렉트되는 URL
+    SESSION_PROBE_URL = "https://blog.naver.com/MyBlog.naver"
     
     def __init__(self, driver, config: Config):
         self.driver = driver
         self.config = config
         self.wait = WebDriverWait(driver, 20)
+        # 마지막 로그인 실패 원인 (FAILURE_CAPTCHA, FAILURE_AUTH 또는 None)
+        self.last_failure: Optional[str] = None
+        self.last_error_text: Optional[str] = None
         
         # 로그인 페이지 요소 선택자 (여러 버전 지원)
         self.selectors = {
@@ -123,6 +129,8 @@ class NaverLogin:
             bool: 로그인 성공 여부
         """
         print("[INFO] 네이버 로그인을 시작합니다...")
+        self.last_failure = None
+        self.last_error_text = None
         
         try:
             # 로그인 페이지로 이동
@@ -282,6 +290,7 @@ class NaverLogin:
             # 캡차나 추가 인증이 필요한 경우
             if "captcha" in current_url.lower() or "protect" in current_url.lower():
                 print("[WARNING] 캡차 또는 추가 인증이 필요합니다.")
+                self.last_failure = FAILURE_CAPTCHA
                 return False
             
             # 로그인 성공 시 리다이렉트되는 페이지 확인
@@ -293,6 +302,8 @@ class NaverLogin:
                 error_msg = self.driver.find_element(By.CLASS_NAME, "error_message")
                 if error_msg.is_displayed():
                     print(f"[ERROR] 로그인 실패: {error_msg.text}")
+                    self.last_failure = FAILURE_AUTH
+                    self.last_error_text = error_msg.text
                     return False
             except NoSuchElementException:
                 pass
@@ -322,6 +333,26 @@ class NaverLogin:
         print("[ERROR] 로그인 시간 초과")
         return False
     
+    def is_session_valid(self) -> bool:
+        """
+        복원된 세션(쿠키)이 유효한지 가볍게 확인
+        
+        로그인이 필요한 URL 한 번만 요청하고 로그인 페이지로
+        리다이렉트되는지 여부로 판단합니다 (추가 대기 없음).
+        
+        Returns:
+            bool: 세션이 유효하면 True
+        """
+        try:
+            self.driver.get(self.SESSION_PROBE_URL)
+            current_url = self.driver.current_url.lower()
+            if "nidlogin" in current_url or "captcha" in current_url or "protect" in current_url:
+                return False
+            return True
+        except Exception as e:
+            print(f"[WARNING] 세션 확인 중 오류: {e}")
+            return False
+    
     def is_logged_in(self) -> bool:
         """현재 로그인 상태 확인"""
         try:
@@ -0,0 +1,352 @@
+"""Unit tests for verifying posts over HTTP."""
+import gzip
+import json
+import threading
+import pytest
+import sys
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote_plus, urlsplit
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import POST_UNVERIFIED, BatchPostingOrchestrator, PostingConfig
+from adapters.http import (
+    BlogHttpClient,
+    BlogPostSummary,
+    PostListSnapshot,
+    PostVerifier,
+    cookie_header,
+    cookies_from_driver,
+)
+from adapters.http.blog_client import _parse_post_list
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult
+
+
+def _post_list(*posts):
+    return json.dumps({'postList': [
+        {'logNo': log_no, 'title': quote_plus(title)} for log_no, title in posts
+    ]})
+
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<item><title>Public post</title><link>https://blog.naver.com/user/223000000001</link></item>
+</channel></rss>"""
+
+
+class BlogStub(BaseHTTPRequestHandler):
+    """Post list and RSS endpoints over keep-alive HTTP/1.1."""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get('Cookie'), self.client_address[1]))
+        if self.path.startswith('/PostTitleListAsync.naver'):
+            page = int(parse_qs(urlsplit(self.path).query)['currentPage'][0])
+            pages = server.post_list if isinstance(server.post_list, list) else [server.post_list]
+            status, body = server.list_status, (pages[page - 1] if page <= len(pages) else _post_list()).encode()
+        elif self.path == '/user.xml':
+            status, body = 200, RSS.encode()
+        else:
+            status, body = 404, b''
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Stub blog server on a free local port."""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), BlogStub)
+    httpd.requests = []
+    httpd.list_status = 200
+    httpd.post_list = _post_list(('223000000002', "Today's post"))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    client = BlogHttpClient(blog_url=url, rss_url=url)
+    yield client
+    client.close()
+
+
+class TestBlogHttpClient:
+    """Tests for BlogHttpClient."""
+
+    def test_list_posts(self, client, server):
+        posts = client.list_posts('user', cookies=[{'name': 'NID_AUT', 'value': 'a'}])
+
+        assert [(p.log_no, p.title) for p in posts] == [('223000000002', "Today's post")]
+        path, cookie, _ = server.requests[0]
+        assert 'blogId=user' in path
+        assert cookie == 'NID_AUT=a'
+
+    def test_connections_are_kept_alive(self, client, server):
+        for _ in range(3):
+            client.list_posts('user')
+
+        assert len({port for _, _, port in server.requests}) == 1
+        assert client._pools[('http', f"127.0.0.1:{server.server_address[1]}")].created == 1
+        assert client.bytes_received > 0
+
+    def test_find_post(self, client):
+        assert client.find_post('user', log_no='223000000002') is True
+        assert client.find_post('user', title=" Today's  post") is True
+        # Only public posts are in the RSS feed
+        assert client.find_post('user', log_no='223000000001') is True
+        assert client.find_post('user', log_no='1') is False
+
+    def test_snapshot_reads_only_as_far_back_as_needed(self, client, server):
+        server.post_list = [
+            _post_list(('3', 'Third'), ('2', 'Second')),
+            _post_list(('1', 'First'), ('0', 'Old')),
+            _post_list(('-1', 'Older')),
+        ]
+
+        snapshot = client.snapshot('user', log_nos=['3', '1'], page_size=2)
+
+        assert snapshot.pages == 2
+        assert snapshot.contains('1') and not snapshot.contains('-1')
+        assert snapshot.contains(title=' Second')
+        # Stops at the last (short) page when a post is not listed
+        assert client.snapshot('user', log_nos=['9'], page_size=2).pages == 3
+
+    def test_unreadable_blog(self, client, server):
+        server.list_status = 500
+
+        assert client.find_post('nobody', log_no='1') is None
+        assert client.snapshot('nobody', log_nos=['1']) is None
+
+    def test_malformed_post_list_falls_back_to_regex(self):
+        text = '{"postList":[{"logNo":"5","title":"A%20b","extra":bad}]}'
+
+        assert [(p.log_no, p.title) for p in _parse_post_list(text)] == [('5', 'A b')]
+        assert _parse_post_list('<html>login</html>') is None
+
+
+def test_cookies_from_driver():
+    class FakeDriver:
+        def execute_cdp_cmd(self, cmd, params):
+            assert cmd == 'Network.getCookies'
+            return {'cookies': [{'name': 'NID_SES', 'value': 'x'}, {'name': 'NID_AUT', 'value': 'y'}]}
+
+    assert cookie_header(cookies_from_driver(FakeDriver())) == 'NID_SES=x; NID_AUT=y'
+    assert cookies_from_driver(object()) == []
+
+
+class TestPostVerifier:
+    """Tests for PostVerifier."""
+
+    def test_polls_until_the_post_is_listed(self, client, server, monkeypatch):
+        verifier = PostVerifier(client, attempts=3, interval=0)
+        polls = []
+        find_post = client.find_post
+
+        def listed_on_second_poll(*args, **kwargs):
+            polls.append(1)
+            if len(polls) == 2:
+                server.post_list = _post_list(('223000000009', 'New'))
+            return find_post(*args, **kwargs)
+        monkeypatch.setattr(client, 'find_post', listed_on_second_poll)
+
+        try:
+            assert verifier.submit('user', '223000000009', 'New').result() is True
+            assert len(polls) == 2
+            assert verifier.check('user', '1', 'Missing') is False
+        finally:
+            verifier.close()
+
+
+def _entry(index):
+    return BlogPostEntry(
+        sns_id="user@naver.com",
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}", blog_basic="Body"),
+        index=index
+    )
+
+
+class TestOrchestratorHttpVerify:
+    """Tests for http_verify inside BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def make_orchestrator(self, monkeypatch):
+        def make(found):
+            config = PostingConfig(delay_between_accounts=0, delay_between_posts=0,
+                                   reuse_sessions=False, pipeline=False, http_verify=True)
+            orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+            orchestrator.calls = []
+
+            class FakeAdapter:
+                def __init__(self, config):
+                    pass
+
+                def create_driver(self):
+                    return object()
+
+                def close(self):
+                    pass
+
+            class FakeWriter:
+                blog_id = 'user'
+                last_log_no = '223000000002'
+
+                def verify_post(self, title):
+                    orchestrator.calls.append(('browser verify', title))
+                    return True
+
+            class FakeVerifier:
+                closed = False
+
+                def submit(self, blog_id, log_no, title, cookies):
+                    orchestrator.calls.append(('http verify', log_no, cookies))
+                    future = Future()
+                    future.set_result(found)
+                    return future
+
+                def close(self):
+                    FakeVerifier.closed = True
+
+            def fake_post_single(driver, entry, creds, prepared=None, verify=True):
+                orchestrator.calls.append(('post', entry.index, verify))
+                if not verify:
+                    orchestrator._pending_verifications[entry.index] = (FakeWriter(), f"Post {entry.index}")
+                return PostResult(entry=entry, success=True)
+
+            monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+            monkeypatch.setattr(orchestrator_module, 'cookies_from_driver', lambda driver: ['cookie'])
+            monkeypatch.setattr(orchestrator, '_login', lambda driver, creds: True)
+            monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+            orchestrator.http_verifier = FakeVerifier()
+            orchestrator.verifier_class = FakeVerifier
+            return orchestrator
+        return make
+
+    def test_found_over_http_skips_the_browser(self, make_orchestrator):
+        orchestrator = make_orchestrator(found=True)
+
+        result = orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert result.successful == 2
+        assert orchestrator.calls == [
+            ('post', 0, False), ('http verify', '223000000002', ['cookie']),
+            ('post', 1, False), ('http verify', '223000000002', ['cookie']),
+        ]
+        assert orchestrator._pending_verifications == {}
+        assert orchestrator.verifier_class.closed
+        assert orchestrator.http_verifier is None
+
+    @pytest.mark.parametrize('found', [False, None])
+    def test_browser_checks_what_http_did_not_find(self, make_orchestrator, found):
+        orchestrator = make_orchestrator(found=found)
+
+        result = orchestrator.post_all([_entry(0)])
+
+        assert result.successful == 1
+        assert orchestrator.calls[-1] == ('browser verify', 'Post 0')
+
+
+class TestOrchestratorBatchVerify:
+    """Tests for verify_batch inside BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def make_orchestrator(self, monkeypatch):
+        def make(listed, browser_finds=()):
+            config = PostingConfig(delay_between_accounts=0, delay_between_posts=0,
+                                   reuse_sessions=False, pipeline=False, verify_batch=True)
+            orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+            orchestrator.calls = []
+
+            class FakeAdapter:
+                def __init__(self, config):
+                    pass
+
+                def create_driver(self):
+                    return object()
+
+                def close(self):
+                    pass
+
+            class FakeWriter:
+                def __init__(self, index):
+                    self.last_log_no = f"22300000000{index}"
+
+                def verify_post(self, title):
+                    orchestrator.calls.append(('browser verify', title))
+                    return title in browser_finds
+
+            class FakeClient:
+                def snapshot(self, blog_id, log_nos=(), titles=(), cookies=None):
+                    orchestrator.calls.append(('snapshot', blog_id, sorted(log_nos)))
+                    snapshot = PostListSnapshot()
+                    snapshot.add([BlogPostSummary(log_no=n, title='') for n in listed])
+                    snapshot.pages = 1
+                    return snapshot
+
+                def close(self):
+                    pass
+
+            def fake_post_single(driver, entry, creds, prepared=None, verify=True):
+                orchestrator.calls.append(('post', entry.index))
+                assert not verify
+                orchestrator._pending_verifications[entry.index] = (FakeWriter(entry.index), f"Post {entry.index}")
+                return PostResult(entry=entry, success=True)
+
+            monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+            monkeypatch.setattr(orchestrator_module, 'cookies_from_driver', lambda driver: [])
+            monkeypatch.setattr(orchestrator, '_login', lambda driver, creds: True)
+            monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+            orchestrator.http_verifier = PostVerifier(FakeClient(), workers=1)
+            return orchestrator
+        return make
+
+    def test_one_snapshot_verifies_the_whole_account(self, make_orchestrator):
+        orchestrator = make_orchestrator(listed=['223000000000', '223000000001', '223000000002'])
+
+        result = orchestrator.post_all([_entry(i) for i in range(3)])
+
+        assert result.successful == 3
+        assert orchestrator.calls == [
+            ('post', 0), ('post', 1), ('post', 2),
+            ('snapshot', 'user', ['223000000000', '223000000001', '223000000002']),
+        ]
+        assert orchestrator._pending_verifications == {}
+
+    def test_missing_posts_are_published_again_once(self, make_orchestrator):
+        orchestrator = make_orchestrator(listed=['223000000000'], browser_finds=['Post 1'])
+
+        result = orchestrator.post_all([_entry(i) for i in range(3)])
+
+        assert orchestrator.calls[3:] == [
+            ('snapshot', 'user', ['223000000000', '223000000001', '223000000002']),
+            ('browser verify', 'Post 1'), ('browser verify', 'Post 2'),
+            ('post', 2),
+            ('snapshot', 'user', ['223000000002']),
+            ('browser verify', 'Post 2'),
+        ]
+        assert result.successful == 2
+        assert result.failed == 1
+        assert result.results[-1].entry.index == 2
+        assert result.results[-1].error_message == POST_UNVERIFIED
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
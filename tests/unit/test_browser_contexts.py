@@ -0,0 +1,196 @@
+"""Unit tests for isolated browser contexts in one shared browser."""
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from adapters.browser import BrowserConfig, BrowserContextHost
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        assert handle in self.driver.window_handles
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Driver implementing the Target domain on top of window handles."""
+
+    def __init__(self):
+        self.window_handles = ['HOME']
+        self.current_window_handle = 'HOME'
+        self.switch_to = FakeSwitchTo(self)
+        self.contexts = {}
+        self.scripts = []
+        self.alive = True
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise Exception("browser gone")
+        return 'about:blank'
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == 'Target.createBrowserContext':
+            context_id = f"ctx{len(self.contexts)}"
+            self.contexts[context_id] = []
+            return {'browserContextId': context_id}
+        if cmd == 'Target.createTarget':
+            target_id = f"t{len(self.window_handles)}"
+            self.contexts[params['browserContextId']].append(target_id.upper())
+            self.window_handles.append(target_id.upper())
+            return {'targetId': target_id}
+        if cmd == 'Target.disposeBrowserContext':
+            for handle in self.contexts.pop(params['browserContextId']):
+                self.window_handles.remove(handle)
+            return {}
+        if cmd == 'Page.addScriptToEvaluateOnNewDocument':
+            self.scripts.append(self.current_window_handle)
+        return {}
+
+
+class FakeAdapter:
+    """BrowserAdapter stand-in that counts launches."""
+
+    launched = []
+
+    def __init__(self, config):
+        self.driver = None
+
+    def create_driver(self):
+        self.driver = FakeDriver()
+        FakeAdapter.launched.append(self)
+        return self.driver
+
+    def close(self):
+        self.driver = None
+
+    def is_healthy(self):
+        return self.driver is not None and self.driver.alive
+
+
+@pytest.fixture(autouse=True)
+def reset_launches():
+    FakeAdapter.launched = []
+
+
+def _host():
+    return BrowserContextHost(BrowserConfig(), adapter_factory=FakeAdapter)
+
+
+def _entry(index, sns_id):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+class TestBrowserContextHost:
+    """Tests for BrowserContextHost."""
+
+    def test_contexts_share_one_browser(self):
+        host = _host()
+        first, second = host.open(), host.open()
+
+        assert len(FakeAdapter.launched) == 1
+        assert first.context_id != second.context_id
+        assert first.window != second.window
+        assert first.driver is second.driver
+        assert host.open_contexts == 2
+        # The webdriver flag is hidden in every new tab
+        assert first.driver.scripts == [first.window, second.window]
+
+    def test_using_switches_to_the_context_tab(self):
+        host = _host()
+        first, second = host.open(), host.open()
+
+        with host.using(first) as driver:
+            assert driver.current_window_handle == first.window
+        with host.using(second) as driver:
+            assert driver.current_window_handle == second.window
+
+    def test_close_context_disposes_it(self):
+        host = _host()
+        context = host.open()
+        driver = context.driver
+
+        host.close_context(context)
+
+        assert driver.window_handles == ['HOME']
+        assert driver.current_window_handle == 'HOME'
+        assert host.open_contexts == 0
+        host.close_context(context)  # already gone: no-op
+
+    def test_dead_browser_is_relaunched(self):
+        host = _host()
+        host.open().driver.alive = False
+
+        context = host.open()
+
+        assert len(FakeAdapter.launched) == 2
+        assert host.open_contexts == 1
+        assert context.driver.alive
+
+    def test_close(self):
+        host = _host()
+        host.open()
+        host.close()
+
+        assert host.driver is None
+        assert not host.is_healthy()
+
+
+class TestOrchestratorBrowserContexts:
+    """Tests for posting with browser_contexts in BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, monkeypatch):
+        config = PostingConfig(delay_between_posts=0, delay_between_accounts=0, reuse_sessions=False,
+                               browser_contexts=True, sessions=2)
+        orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+        orchestrator.posted = []
+
+        def fake_login(driver, creds):
+            return True
+
+        def fake_post_single(driver, entry, creds, **kwargs):
+            orchestrator.posted.append((creds.sns_id, driver.current_window_handle))
+            return PostResult(entry=entry, success=True)
+
+        monkeypatch.setattr(
+            orchestrator_module, 'BrowserContextHost',
+            lambda config: BrowserContextHost(config, adapter_factory=FakeAdapter)
+        )
+        monkeypatch.setattr(orchestrator, '_login', fake_login)
+        monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+        return orchestrator
+
+    def test_accounts_post_from_their_own_context(self, orchestrator):
+        entries = [_entry(0, "a@naver.com"), _entry(1, "b@naver.com"),
+                   _entry(2, "a@naver.com"), _entry(3, "b@naver.com")]
+
+        result = orchestrator.post_all(entries)
+
+        assert result.successful == 4
+        assert len(FakeAdapter.launched) == 1
+        windows = {}
+        for sns_id, window in orchestrator.posted:
+            assert windows.setdefault(sns_id, window) == window
+        assert len(set(windows.values())) == 2
+        assert orchestrator._context_host is None
+        assert FakeAdapter.launched[0].driver is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
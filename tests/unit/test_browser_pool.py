@@ -0,0 +1,177 @@
+"""Unit tests for the warm browser pool."""
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapters.browser import BrowserConfig, BrowserPool, reset_browser_state
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_handle = handle
+
+
+class FakeDriver:
+    """Driver recording cleanup calls."""
+
+    def __init__(self):
+        self.window_handles = ['main']
+        self.current_handle = 'main'
+        self.switch_to = FakeSwitchTo(self)
+        self.visited = []
+        self.cdp_calls = []
+        self.alive = True
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise Exception("browser gone")
+        return self.visited[-1] if self.visited else 'data:,'
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def close(self):
+        self.window_handles.remove(self.current_handle)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append(cmd)
+        return {}
+
+
+class FakeAdapter:
+    """BrowserAdapter stand-in that counts launches."""
+
+    launched = []
+
+    def __init__(self, config):
+        self.config = config
+        self.driver = None
+        self.closed = False
+
+    def create_driver(self):
+        self.driver = FakeDriver()
+        FakeAdapter.launched.append(self)
+        return self.driver
+
+    def close(self):
+        self.closed = True
+        self.driver = None
+
+    def is_healthy(self):
+        return self.driver is not None and self.driver.alive
+
+
+@pytest.fixture(autouse=True)
+def reset_launches():
+    FakeAdapter.launched = []
+
+
+def _pool(**kwargs):
+    return BrowserPool(BrowserConfig(), adapter_factory=FakeAdapter, **kwargs)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestResetBrowserState:
+    """Tests for reset_browser_state."""
+
+    def test_closes_extra_tabs_and_clears_state(self):
+        driver = FakeDriver()
+        driver.window_handles = ['main', 'tab2', 'tab3']
+
+        reset_browser_state(driver)
+
+        assert driver.window_handles == ['main']
+        assert driver.visited[-1] == 'about:blank'
+        assert 'Network.clearBrowserCookies' in driver.cdp_calls
+        assert 'Storage.clearDataForOrigin' in driver.cdp_calls
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    def test_start_warms_instances(self):
+        pool = _pool(size=2)
+        pool.start()
+        assert _wait_for(lambda: len(FakeAdapter.launched) == 2)
+        pool.close()
+
+    def test_reuses_released_browser(self):
+        """A released browser is cleaned and handed out again."""
+        with _pool(size=1) as pool:
+            first = pool.acquire(timeout=2)
+            pool.release(first)
+            second = pool.acquire(timeout=2)
+
+            assert second is first
+            assert second.uses == 2
+            assert 'Network.clearBrowserCookies' in first.driver.cdp_calls
+            assert len(FakeAdapter.launched) == 1
+
+    def test_retires_after_max_uses(self):
+        """A browser is replaced once it reaches max_uses."""
+        with _pool(size=1, max_uses=2) as pool:
+            first = pool.acquire(timeout=2)
+            pool.release(first)
+            again = pool.acquire(timeout=2)  # last use -> replacement launches
+            assert again is first
+            pool.release(again)
+
+            assert first.adapter.closed
+            replacement = pool.acquire(timeout=2)
+            assert replacement is not first
+            assert replacement.uses == 1
+
+    def test_unhealthy_browser_is_replaced(self):
+        """A browser released as unhealthy is closed and replaced."""
+        with _pool(size=1) as pool:
+            first = pool.acquire(timeout=2)
+            pool.release(first, healthy=False)
+
+            assert first.adapter.closed
+            second = pool.acquire(timeout=2)
+            assert second is not first
+
+    def test_dead_idle_browser_is_skipped(self):
+        """A browser that died while idle is not handed out."""
+        with _pool(size=1) as pool:
+            first = pool.acquire(timeout=2)
+            pool.release(first)
+            first.driver.alive = False
+
+            second = pool.acquire(timeout=2)
+            assert second is not first
+            assert first.adapter.closed
+
+    def test_context_manager_releases(self):
+        """browser() releases the instance back to the pool."""
+        with _pool(size=1) as pool:
+            with pool.browser(timeout=2) as pooled:
+                driver = pooled.driver
+            with pool.browser(timeout=2) as pooled:
+                assert pooled.driver is driver
+
+    def test_close_shuts_down_idle_browsers(self):
+        pool = _pool(size=2)
+        pool.start()
+        assert _wait_for(lambda: len(FakeAdapter.launched) == 2)
+        pool.close()
+
+        assert all(adapter.closed for adapter in FakeAdapter.launched)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
@@ -0,0 +1,161 @@
+"""Unit tests for publish response capture and the traffic meter."""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.cdp_network import PublishResponseCapture, TrafficMeter, extract_log_no, build_post_url
+
+
+def _event(method, webview=None, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}, 'webview': webview})}
+
+
+def _loaded(webview, size):
+    return _event('Network.loadingFinished', webview=webview, requestId='r', encodedDataLength=size)
+
+
+class FakeDriver:
+    """Driver returning queued performance log batches."""
+
+    def __init__(self, batches=None, bodies=None, logging_enabled=True, targets=None):
+        self.batches = list(batches or [])
+        self.bodies = bodies or {}
+        self.logging_enabled = logging_enabled
+        self.targets = targets or {}  # target id -> browser context id
+        self.target_lookups = 0
+
+    def get_log(self, log_type):
+        if not self.logging_enabled:
+            raise Exception("log type 'performance' not found")
+        return self.batches.pop(0) if self.batches else []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Target.getTargets":
+            self.target_lookups += 1
+            return {'targetInfos': [
+                {'targetId': target, 'browserContextId': context} for target, context in self.targets.items()
+            ]}
+        assert cmd == "Network.getResponseBody"
+        return {'body': self.bodies[params['requestId']], 'base64Encoded': False}
+
+
+class TestExtractLogNo:
+    """Tests for extract_log_no."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ('{"isSuccess":true,"result":{"logNo":"223456789012"}}', '223456789012'),
+        ('{"result":{"logNo":223456789012}}', '223456789012'),
+        ('https://blog.naver.com/PostView.naver?blogId=test&logNo=223456789012', '223456789012'),
+        ('https://blog.naver.com/test_blog/223456789012', '223456789012'),
+        ('{"redirectUrl":"https://blog.naver.com/test/223456789012?x=1"}', '223456789012'),
+        ('https://blog.naver.com/test/postwrite', None),
+        ('', None),
+    ])
+    def test_extract(self, text, expected):
+        """logNo is found in JSON bodies and post URLs."""
+        assert extract_log_no(text) == expected
+
+    def test_build_post_url(self):
+        """Post URL uses the short blog form."""
+        assert build_post_url('test', '123456') == 'https://blog.naver.com/test/123456'
+
+
+class TestPublishResponseCapture:
+    """Tests for PublishResponseCapture."""
+
+    def test_reads_log_no_from_publish_response(self):
+        """The publish API response body is parsed once loading finishes."""
+        driver = FakeDriver(
+            batches=[
+                [_event('Network.responseReceived', requestId='old',
+                        response={'url': 'https://blog.naver.com/RabbitWrite.naver'})],  # drained by start()
+                [_event('Network.responseReceived', requestId='1',
+                        response={'url': 'https://blog.naver.com/static/app.js'}),
+                 _event('Network.responseReceived', requestId='2',
+                        response={'url': 'https://blog.naver.com/RabbitWrite.naver'})],
+                [_event('Network.loadingFinished', requestId='2')],
+            ],
+            bodies={'2': '{"isSuccess":true,"result":{"logNo":"223000000001"}}'},
+        )
+        capture = PublishResponseCapture(driver, poll_interval=0)
+
+        assert capture.start()
+        assert capture.wait_for_log_no(timeout=1) == '223000000001'
+
+    def test_reads_log_no_from_document_navigation(self):
+        """Navigation to the new post URL also yields the logNo."""
+        driver = FakeDriver(batches=[[], [
+            _event('Network.requestWillBeSent', type='Document',
+                   request={'url': 'https://blog.naver.com/test/223000000002'}),
+        ]])
+        capture = PublishResponseCapture(driver, poll_interval=0)
+        capture.start()
+
+        assert capture.wait_for_log_no(timeout=1) == '223000000002'
+
+    def test_disabled_performance_log(self):
+        """Without performance logging the capture reports nothing."""
+        capture = PublishResponseCapture(FakeDriver(logging_enabled=False), poll_interval=0)
+
+        assert capture.start() is False
+        assert capture.wait_for_log_no(timeout=1) is None
+
+    def test_timeout(self):
+        """No matching events returns None after the timeout."""
+        capture = PublishResponseCapture(FakeDriver(), poll_interval=0.01)
+        capture.start()
+
+        assert capture.wait_for_log_no(timeout=0.05) is None
+
+
+class TestTrafficMeter:
+    """Tests for TrafficMeter."""
+
+    def test_take_returns_bytes_since_last_take(self):
+        driver = FakeDriver(batches=[[_loaded('T1', 100), _loaded('T1', 50)], [_loaded('T1', 25)]])
+        meter = TrafficMeter(driver)
+
+        assert meter.take() == 150
+        assert meter.take() == 25
+        assert meter.take() == 0
+
+    def test_bytes_are_counted_per_browser_context(self):
+        """Accounts sharing one browser as contexts only get their own tabs' bytes."""
+        driver = FakeDriver(
+            batches=[[_loaded('A1', 100), _loaded('B1', 40), _loaded('A2', 10)], [_loaded('B1', 5)]],
+            targets={'A1': 'ctx-a', 'A2': 'ctx-a', 'B1': 'ctx-b'},
+        )
+        meter = TrafficMeter(driver)
+
+        assert meter.take('ctx-a') == 110
+        assert meter.take('ctx-b') == 45
+        assert meter.take('ctx-a') == 0
+        # The whole browser keeps its own running count
+        assert meter.take() == 155
+        assert driver.target_lookups == 1
+
+    def test_events_from_unknown_tabs_count_for_the_browser_only(self):
+        driver = FakeDriver(batches=[[_loaded('gone', 70), _loaded(None, 30)]], targets={'A1': 'ctx-a'})
+        meter = TrafficMeter(driver)
+
+        assert meter.take('ctx-a') == 0
+        assert meter.take() == 100
+
+    def test_capture_events_are_counted(self):
+        """Events read by the publish response capture reach the meter too."""
+        driver = FakeDriver(batches=[[_loaded('A1', 300)]], targets={'A1': 'ctx-a'})
+        meter = TrafficMeter(driver)
+
+        PublishResponseCapture(driver, poll_interval=0, meter=meter).start()
+
+        assert meter.take('ctx-a') == 300
+
+    def test_disabled_performance_log(self):
+        meter = TrafficMeter(FakeDriver(logging_enabled=False))
+
+        assert meter.take() == 0
+        assert meter.enabled is False
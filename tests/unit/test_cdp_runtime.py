@@ -0,0 +1,152 @@
+"""Unit tests for the injected JS helper runtime."""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.cdp_runtime import CDPHelperRuntime
+
+
+class FakeDriver:
+    """Driver that simulates one document with (or without) helpers installed."""
+
+    def __init__(self, installed=True):
+        self.installed = installed
+        self.calls = []
+        self.stale_window = False
+        self.window_count = 0
+        self.current_window_handle = 'TAB-1'
+        self.registered = []  # tabs with the new-document script
+        self.released = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append(cmd)
+        if cmd == "Page.addScriptToEvaluateOnNewDocument":
+            self.registered.append(self.current_window_handle)
+            return {'identifier': str(len(self.registered))}
+        if cmd == "Runtime.releaseObjectGroup":
+            self.released.append(params['objectGroup'])
+            return {}
+        if cmd == "Runtime.evaluate":
+            if params['expression'] == 'window':
+                self.window_count += 1
+                self.stale_window = False
+                return {'result': {'type': 'object', 'objectId': f'window-{self.window_count}'}}
+            self.installed = True
+            return {'result': {'type': 'undefined'}}
+        if cmd == "Runtime.callFunctionOn":
+            if self.stale_window:
+                raise Exception("Cannot find context with specified id")
+            if not self.installed:
+                return {'result': {'type': 'object', 'value': {'__nblogMissing': True}}}
+            name, args = (arg['value'] for arg in params['arguments'])
+            return {'result': {'type': 'object', 'value': {'name': name, 'args': args}}}
+        raise AssertionError(f"unexpected command {cmd}")
+
+
+class TestCDPHelperRuntime:
+    """Tests for CDPHelperRuntime."""
+
+    def test_call_passes_json_arguments(self):
+        """Arguments are sent as values, not spliced into the script."""
+        driver = FakeDriver()
+        runtime = CDPHelperRuntime(driver)
+        title = "It's a \"quoted\" title"
+
+        assert runtime.call('searchPostList', title) == {'name': 'searchPostList', 'args': [title]}
+
+    def test_registers_script_once(self):
+        """The new-document script is registered only on first use."""
+        driver = FakeDriver()
+        runtime = CDPHelperRuntime(driver)
+
+        runtime.call('findTitleArea')
+        runtime.call('findBodyParagraph')
+
+        assert driver.calls.count("Page.addScriptToEvaluateOnNewDocument") == 1
+        # window handle is reused within one document
+        assert driver.window_count == 1
+
+    def test_registration_shared_per_driver(self):
+        """A second runtime on the same driver does not register again."""
+        driver = FakeDriver()
+        CDPHelperRuntime(driver).call('findTitleArea')
+        CDPHelperRuntime(driver).call('findTitleArea')
+
+        assert driver.calls.count("Page.addScriptToEvaluateOnNewDocument") == 1
+
+    def test_registration_per_tab(self):
+        """Each tab gets the new-document script once, on first use there."""
+        driver = FakeDriver()
+        runtime = CDPHelperRuntime(driver)
+        runtime.call('findTitleArea')
+
+        # A tab opened later has no helpers until they are registered there
+        driver.current_window_handle = 'TAB-2'
+        driver.installed = False
+        driver.stale_window = True
+        assert runtime.call('findTitleArea') is not None
+        CDPHelperRuntime(driver).call('findTitleArea')
+
+        driver.current_window_handle = 'TAB-1'
+        CDPHelperRuntime(driver).call('findTitleArea')
+
+        assert driver.registered == ['TAB-1', 'TAB-2']
+
+    def test_reinstalls_when_helpers_missing(self):
+        """A document without helpers gets them injected and the call retried."""
+        driver = FakeDriver()
+        runtime = CDPHelperRuntime(driver)
+        runtime.install()
+        driver.installed = False
+
+        assert runtime.call('findTagInput') == {'name': 'findTagInput', 'args': []}
+        assert driver.installed
+
+    def test_reacquires_window_after_navigation(self):
+        """A stale window handle is dropped and the call retried."""
+        driver = FakeDriver()
+        runtime = CDPHelperRuntime(driver)
+        runtime.call('findTitleArea')
+        driver.stale_window = True
+
+        assert runtime.call('findTitleArea') is not None
+        assert driver.window_count == 2
+
+    def test_releases_previous_window_handle(self):
+        """The old document's handle is released before a new one is taken."""
+        driver = FakeDriver()
+        runtime = CDPHelperRuntime(driver)
+        runtime.call('findTitleArea')
+        driver.stale_window = True
+        runtime.call('findTitleArea')
+
+        assert driver.window_count == 2
+        assert len(driver.released) == 1
+
+        # Another runtime's handles live in their own group
+        other = CDPHelperRuntime(driver)
+        other.call('findTitleArea')
+        driver.stale_window = True
+        other.call('findTitleArea')
+        assert len(driver.released) == 2
+        assert driver.released[1] != driver.released[0]
+
+    def test_wait_for_forwards_timeout(self):
+        """wait_for calls the in-page waitFor helper with ms timeouts."""
+        runtime = CDPHelperRuntime(FakeDriver())
+
+        result = runtime.wait_for('searchBlogMain', 'title', timeout=2.5, poll_ms=50)
+
+        assert result == {'name': 'waitFor', 'args': ['searchBlogMain', ['title'], 2500, 50]}
+
+    def test_gives_up_after_retries(self):
+        """Persistent failures return None instead of raising."""
+        driver = FakeDriver()
+        runtime = CDPHelperRuntime(driver)
+        runtime.install()
+        driver.stale_window = True
+        driver.execute_cdp_cmd = lambda cmd, params: (_ for _ in ()).throw(Exception("gone"))
+
+        assert runtime.call('findTitleArea') is None
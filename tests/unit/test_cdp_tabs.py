@@ -0,0 +1,185 @@
+"""Unit tests for drafting posts ahead in extra editor tabs."""
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult
+from src.cdp_tabs import EditorTabs
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        assert handle in self.driver.window_handles
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Driver implementing the Target commands used for tabs."""
+
+    def __init__(self):
+        self.window_handles = ['HOME']
+        self.current_window_handle = 'HOME'
+        self.switch_to = FakeSwitchTo(self)
+        self.created = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == 'Target.getTargetInfo':
+            return {'targetInfo': {'targetId': 'home', 'browserContextId': 'CTX'}}
+        if cmd == 'Target.createTarget':
+            target_id = f"tab{len(self.created) + 1}"
+            self.created.append(params)
+            self.window_handles.append(target_id.upper())
+            return {'targetId': target_id}
+        if cmd == 'Target.closeTarget':
+            self.window_handles.remove(params['targetId'].upper())
+        return {}
+
+
+def _entry(index, sns_id="user@naver.com"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}", blog_basic="Body"),
+        index=index
+    )
+
+
+class TestEditorTabs:
+    """Tests for EditorTabs."""
+
+    def test_open_in_same_context_without_switching(self):
+        driver = FakeDriver()
+        tabs = EditorTabs(driver)
+
+        handle = tabs.open('https://blog.naver.com/user/postwrite')
+
+        assert handle == 'TAB1'
+        assert driver.created == [{
+            'url': 'https://blog.naver.com/user/postwrite',
+            'background': True,
+            'browserContextId': 'CTX',
+        }]
+        assert driver.current_window_handle == 'HOME'
+        assert len(tabs) == 1
+
+    def test_close_returns_home(self):
+        driver = FakeDriver()
+        tabs = EditorTabs(driver)
+        first, second = tabs.open('a'), tabs.open('b')
+        tabs.switch(first)
+
+        tabs.close(first)
+        tabs.close(first)  # already closed: no-op
+
+        assert driver.window_handles == ['HOME', second]
+        assert driver.current_window_handle == 'HOME'
+        tabs.close_all()
+        assert driver.window_handles == ['HOME']
+
+
+class TestOrchestratorDraftTabs:
+    """Tests for draft_tabs inside BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, monkeypatch):
+        config = PostingConfig(delay_between_posts=0, delay_between_accounts=0,
+                               reuse_sessions=False, draft_tabs=3)
+        orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+        orchestrator.posted = []
+        orchestrator.drafted = []
+        driver = FakeDriver()
+        orchestrator.driver = driver
+
+        class FakeAdapter:
+            def __init__(self, config):
+                pass
+
+            def create_driver(self):
+                return driver
+
+            def close(self):
+                pass
+
+        class FakeWriter:
+            def __init__(self, entry):
+                self.entry = entry
+                self.window = None
+                self.editor_preloaded = False
+                self.editor_url = None
+                self.drafted = False
+
+            def editor_entry_url(self):
+                return 'https://blog.naver.com/user/postwrite'
+
+            def draft_post(self, title, content, tags=None, image_files=None):
+                orchestrator.drafted.append((self.entry.index, self.window, self.editor_preloaded))
+                self.drafted = True
+                return True
+
+        def fake_post_single(driver, entry, creds, prepared=None, verify=True, writer=None):
+            if writer is not None:
+                orchestrator.posted.append((entry.index, writer.window, writer.drafted))
+            return PostResult(entry=entry, success=True)
+
+        monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+        monkeypatch.setattr(orchestrator, '_login', lambda driver, creds: True)
+        monkeypatch.setattr(orchestrator, '_create_writer', lambda driver, entry, creds: FakeWriter(entry))
+        monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+        return orchestrator
+
+    def test_next_entries_are_drafted_in_background_tabs(self, orchestrator):
+        result = orchestrator.post_all([_entry(i) for i in range(4)])
+
+        assert result.successful == 4
+        assert orchestrator.posted == [
+            (0, 'HOME', False), (1, 'TAB1', True), (2, 'TAB2', True), (3, 'TAB3', True)
+        ]
+        assert orchestrator.drafted == [(1, 'TAB1', True), (2, 'TAB2', True), (3, 'TAB3', True)]
+        # At most draft_tabs - 1 extra tabs at a time, all closed at the end
+        assert [params['url'] for params in orchestrator.driver.created] == [
+            'https://blog.naver.com/user/postwrite'
+        ] * 3
+        assert orchestrator.driver.window_handles == ['HOME']
+
+    def test_next_editor_loads_while_posting(self, orchestrator):
+        orchestrator.config.draft_tabs = 1
+        orchestrator.config.preload_editor = True
+        opened_before_post = []
+        post_single = orchestrator._post_single
+
+        def post_and_count(driver, entry, creds, **kwargs):
+            opened_before_post.append(len(driver.created))
+            return post_single(driver, entry, creds, **kwargs)
+        orchestrator._post_single = post_and_count
+
+        result = orchestrator.post_all([_entry(i) for i in range(3)])
+
+        assert result.successful == 3
+        assert orchestrator.posted == [(0, 'HOME', False), (1, 'TAB1', False), (2, 'TAB2', False)]
+        assert orchestrator.drafted == []
+        # The next entry's tab is already loading when the current one publishes
+        assert opened_before_post == [1, 2, 2]
+        assert orchestrator.driver.window_handles == ['HOME']
+
+    def test_single_tab_posts_in_place(self, orchestrator):
+        orchestrator.config.draft_tabs = 1
+
+        result = orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert result.successful == 2
+        assert orchestrator.posted == []
+        assert orchestrator.drafted == []
+        assert orchestrator.driver.created == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,146 @@
+"""Unit tests for the CDP promise-based waits."""
+import ast
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.cdp_wait import CDPWaiter
+
+
+class FakeDriver:
+    """Driver whose Runtime.evaluate resolves to a fixed value (or raises)."""
+
+    def __init__(self, value=True, error=None):
+        self.value = value
+        self.error = error
+        self.calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append((cmd, params))
+        if self.error:
+            raise self.error
+        return {'result': {'type': 'object', 'value': self.value}}
+
+    @property
+    def expression(self):
+        return self.calls[-1][1]['expression']
+
+
+# Every wait, called with a 2.5s timeout
+WAITS = {
+    'condition': lambda waiter: waiter.condition("() => document.title", timeout=2.5),
+    'page_load': lambda waiter: waiter.page_load(timeout=2.5),
+    'selector': lambda waiter: waiter.selector('.se-title', timeout=2.5),
+    'network_idle': lambda waiter: waiter.network_idle(timeout=2.5),
+    'dom_settled': lambda waiter: waiter.dom_settled(timeout=2.5),
+}
+
+
+class TestCDPWaiter:
+    """Tests for CDPWaiter."""
+
+    def test_request_awaits_the_promise(self):
+        """Waits are one Runtime.evaluate that resolves in the page."""
+        driver = FakeDriver()
+
+        CDPWaiter(driver).page_load()
+
+        assert len(driver.calls) == 1
+        cmd, params = driver.calls[0]
+        assert cmd == "Runtime.evaluate"
+        assert params['awaitPromise'] is True
+        assert params['returnByValue'] is True
+        assert params['expression'].strip().startswith('new Promise')
+
+    @pytest.mark.parametrize('timeout, expected', [(None, 10000), (2.5, 2500), (0.1, 100), (0, 0)])
+    def test_timeout_ms(self, timeout, expected):
+        """None uses the default timeout; 0 is kept, not replaced by the default."""
+        assert CDPWaiter(FakeDriver())._timeout_ms(timeout) == expected
+
+    @pytest.mark.parametrize('name', WAITS)
+    def test_timeout_is_enforced_in_the_page(self, name):
+        driver = FakeDriver()
+
+        WAITS[name](CDPWaiter(driver))
+
+        assert ', 2500)' in driver.expression
+
+    def test_default_timeout_and_poll_interval(self):
+        driver = FakeDriver()
+
+        CDPWaiter(driver, default_timeout=3, poll_ms=50).condition("() => true")
+
+        assert 'setTimeout(() => finish(null), 3000)' in driver.expression
+        assert '}, 50);' in driver.expression
+
+    def test_condition_returns_the_predicate_value(self):
+        driver = FakeDriver(value={'nodeId': 7})
+
+        assert CDPWaiter(driver).condition("() => ({nodeId: 7})") == {'nodeId': 7}
+        assert 'const predicate = () => ({nodeId: 7});' in driver.expression
+
+    @pytest.mark.parametrize('name', ['page_load', 'selector', 'network_idle', 'dom_settled'])
+    def test_boolean_waits(self, name):
+        assert WAITS[name](CDPWaiter(FakeDriver(value=True))) is True
+        # The promise resolves to false (or null for a selector) when the time is up
+        assert WAITS[name](CDPWaiter(FakeDriver(value=False))) is False
+        assert WAITS[name](CDPWaiter(FakeDriver(value=None))) is False
+
+    def test_condition_timeout_returns_none(self):
+        assert CDPWaiter(FakeDriver(value=None)).condition("() => null") is None
+
+    @pytest.mark.parametrize('name', WAITS)
+    def test_evaluation_failure_is_not_raised(self, name):
+        """A navigation during the wait destroys the context: the wait just fails."""
+        driver = FakeDriver(error=Exception("Execution context was destroyed"))
+
+        result = WAITS[name](CDPWaiter(driver))
+
+        assert result is None if name == 'condition' else result is False
+
+    def test_exception_in_page_counts_as_failure(self):
+        driver = FakeDriver()
+        driver.execute_cdp_cmd = lambda cmd, params: {
+            'result': {'type': 'object', 'subtype': 'error'},
+            'exceptionDetails': {'text': 'Uncaught'},
+        }
+
+        assert CDPWaiter(driver).condition("() => boom()") is None
+        assert CDPWaiter(driver).page_load() is False
+
+    def test_selector_is_passed_as_json(self):
+        driver = FakeDriver()
+        selector = 'button[data-name="publish"]'
+
+        CDPWaiter(driver).selector(selector, visible=True)
+
+        assert f'document.querySelector({json.dumps(selector)})' in driver.expression
+        assert 'if (!true) return true;' in driver.expression
+
+    def test_quiet_and_idle_windows(self):
+        driver = FakeDriver()
+        waiter = CDPWaiter(driver)
+
+        waiter.dom_settled(quiet_ms=250)
+        assert 'finish(true), 250)' in driver.expression
+
+        waiter.network_idle(idle_ms=750)
+        assert 'finish(true), 750)' in driver.expression
+
+
+def test_cdp_writer_does_not_sleep():
+    """The CDP writer waits on page conditions only, never for a fixed time."""
+    source = Path(__file__).parent.parent.parent / 'src' / 'blog_writer_cdp.py'
+    calls = [
+        node.func for node in ast.walk(ast.parse(source.read_text(encoding='utf-8')))
+        if isinstance(node, ast.Call)
+    ]
+    assert not [f for f in calls if getattr(f, 'attr', getattr(f, 'id', None)) == 'sleep']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
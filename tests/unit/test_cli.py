@@ -67,6 +67,149 @@ class TestCLIParser:
         args = parser.parse_args(['post', 'input.json', '--all', '--retries', '5'])
         assert args.retries == 5
 
+    def test_post_command_jobs_default(self, parser):
+        """Test that jobs defaults to sequential posting."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.jobs == 1
+
+    def test_post_command_jobs(self, parser):
+        """Test post command with --jobs."""
+        args = parser.parse_args(['post', 'input.json', '--all', '--jobs', '4'])
+        assert args.jobs == 4
+
+    def test_post_command_sessions(self, parser):
+        """Test post command with --sessions."""
+        assert parser.parse_args(['post', 'input.json', '--all']).sessions == 1
+        assert parser.parse_args(['post', 'input.json', '--all', '--sessions', '3']).sessions == 3
+
+    def test_post_command_browser_pool_default(self, parser):
+        """Test that the browser pool is off by default."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.browser_pool == 0
+        assert args.browser_max_uses == 20
+
+    def test_post_command_browser_pool(self, parser):
+        """Test post command with --browser-pool."""
+        args = parser.parse_args(['post', 'input.json', '--all', '--browser-pool', '2',
+                                  '--browser-max-uses', '5'])
+        assert args.browser_pool == 2
+        assert args.browser_max_uses == 5
+
+    def test_post_command_browser_contexts(self, parser):
+        """Test post command with --browser-contexts."""
+        assert parser.parse_args(['post', 'input.json', '--all']).browser_contexts is False
+        assert parser.parse_args(['post', 'input.json', '--all', '--browser-contexts']).browser_contexts is True
+
+    def test_post_command_draft_tabs(self, parser):
+        """Test post command with --draft-tabs."""
+        assert parser.parse_args(['post', 'input.json', '--all']).draft_tabs == 1
+        assert parser.parse_args(['post', 'input.json', '--all', '--draft-tabs', '3']).draft_tabs == 3
+
+    def test_post_command_preload(self, parser):
+        """Test that editor preloading is opt-in."""
+        assert parser.parse_args(['post', 'input.json', '--all']).preload is False
+        assert parser.parse_args(['post', 'input.json', '--all', '--preload']).preload is True
+
+    def test_post_command_events(self, parser):
+        """Test post command with --events."""
+        args = parser.parse_args(['post', 'input.json', '--all', '--events', 'events.jsonl'])
+        assert args.events == 'events.jsonl'
+        assert parser.parse_args(['post', 'input.json', '--all']).events is None
+
+    def test_post_command_report_jsonl(self, parser):
+        """Test post command with streaming report options."""
+        args = parser.parse_args(['post', 'input.json', '--all', '--report-jsonl', 'r.jsonl',
+                                  '--report-fsync', 'always', '--report-rotate-mb', '50'])
+        assert args.report_jsonl == 'r.jsonl'
+        assert args.report_fsync == 'always'
+        assert args.report_rotate_mb == 50
+
+    def test_post_command_pacing(self, parser):
+        """Test that fixed pacing is the default and adaptive pacing is opt-in."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.pacing == 'fixed'
+        assert args.max_rate == 30.0
+        args = parser.parse_args(['post', 'input.json', '--all', '--pacing', 'adaptive', '--max-rate', '6'])
+        assert args.pacing == 'adaptive'
+        assert args.max_rate == 6.0
+
+    def test_post_command_pipeline(self, parser):
+        """Test that the posting pipeline is on by default."""
+        assert parser.parse_args(['post', 'input.json', '--all']).pipeline is True
+        assert parser.parse_args(['post', 'input.json', '--all', '--no-pipeline']).pipeline is False
+
+    def test_post_command_session_cache_default(self, parser):
+        """Test that cached login sessions are reused by default."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.reuse_sessions is True
+
+    def test_post_command_no_session_cache(self, parser):
+        """Test post command with --no-session-cache."""
+        args = parser.parse_args(['post', 'input.json', '--all', '--no-session-cache'])
+        assert args.reuse_sessions is False
+
+    def test_post_command_editor_cache(self, parser):
+        """Test that cached editor URLs are used by default."""
+        assert parser.parse_args(['post', 'input.json', '--all']).reuse_editor_urls is True
+        args = parser.parse_args(['post', 'input.json', '--all', '--no-editor-cache'])
+        assert args.reuse_editor_urls is False
+
+    def test_post_command_http_verify(self, parser):
+        """Test that HTTP verification is opt-in."""
+        assert parser.parse_args(['post', 'input.json', '--all']).http_verify is False
+        args = parser.parse_args(['post', 'input.json', '--all', '--http-verify'])
+        assert args.http_verify is True
+
+    def test_post_command_batch_verify(self, parser):
+        """Test post command with --batch-verify."""
+        assert parser.parse_args(['post', 'input.json', '--all']).verify_batch is False
+        args = parser.parse_args(['post', 'input.json', '--all', '--batch-verify'])
+        assert args.verify_batch is True
+
+    def test_post_command_block_resources(self, parser):
+        """Test post command with --block-resources and --block-url."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.block_resources is None
+        assert args.block_urls == []
+
+        args = parser.parse_args(['post', 'input.json', '--all', '--block-resources'])
+        assert args.block_resources == 'images,media,fonts,trackers'
+
+        args = parser.parse_args([
+            'post', 'input.json', '--all', '--block-resources', 'fonts',
+            '--block-url', '*ads*', '--block-url', '*.svg'
+        ])
+        assert args.block_resources == 'fonts'
+        assert args.block_urls == ['*ads*', '*.svg']
+
+    def test_post_command_upload_images(self, parser):
+        """Test post command with --upload-images."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.upload_images is False
+        assert args.image_cache_mb == 512
+
+        args = parser.parse_args(['post', 'input.json', '--all', '--upload-images', '--image-cache-mb', '64'])
+        assert args.upload_images is True
+        assert args.image_cache_mb == 64
+
+    def test_post_command_normalize_images(self, parser):
+        """Test post command with --normalize-images."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.normalize_images is False
+        assert (args.image_max_width, args.image_quality) == (966, 85)
+
+        args = parser.parse_args(['post', 'input.json', '--all', '--upload-images', '--normalize-images',
+                                  '--image-max-width', '693', '--image-quality', '75'])
+        assert args.normalize_images is True
+        assert (args.image_max_width, args.image_quality) == (693, 75)
+
+    def test_post_command_resume(self, parser):
+        """Test post command with --resume."""
+        args = parser.parse_args(['post', 'input.json', '--all'])
+        assert args.resume is False
+        args = parser.parse_args(['post', 'input.json', '--all', '--resume'])
+        assert args.resume is True
+
     def test_post_command_headless_default(self, parser):
         """Test that headless defaults to True."""
         args = parser.parse_args(['post', 'input.json', '--all'])
@@ -0,0 +1,179 @@
+"""Unit tests for the offline chromedriver resolver."""
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapters.browser import driver_resolver
+from adapters.browser.driver_resolver import (
+    DriverResolver,
+    DriverResolutionError,
+    ResolvedDriver,
+    get_shared_service,
+    parse_version,
+)
+
+
+def _binary(path: Path) -> str:
+    path.write_text('#!/bin/sh\n')
+    path.chmod(0o755)
+    return str(path)
+
+
+class VersionReader:
+    """Fake --version reader with a call counter."""
+
+    def __init__(self, versions):
+        self.versions = versions
+        self.calls = []
+
+    def __call__(self, path):
+        self.calls.append(path)
+        return self.versions.get(path)
+
+
+@pytest.fixture
+def binaries(tmp_path, monkeypatch):
+    """Fake chrome and chromedriver binaries found locally."""
+    chrome = _binary(tmp_path / 'chrome')
+    chromedriver = _binary(tmp_path / 'chromedriver')
+    monkeypatch.setattr(driver_resolver, 'find_chrome_binary', lambda: chrome)
+    monkeypatch.setattr(driver_resolver, 'find_local_chromedrivers', lambda: [chromedriver])
+    return chrome, chromedriver
+
+
+class TestParseVersion:
+    """Tests for version parsing."""
+
+    def test_chrome_output(self):
+        assert parse_version('Google Chrome 131.0.6778.85 ') == '131.0.6778.85'
+
+    def test_chromedriver_output(self):
+        assert parse_version('ChromeDriver 131.0.6778.85 (abc-refs/branch-heads/6778@{#1})') == '131.0.6778.85'
+
+    def test_no_version(self):
+        assert parse_version('command not found') is None
+
+
+class TestResolvedDriver:
+    """Tests for ResolvedDriver."""
+
+    def test_compatible_majors(self):
+        assert ResolvedDriver('d', '131.0.1.2', 'c', '131.0.3.4').is_compatible()
+
+    def test_incompatible_majors(self):
+        assert not ResolvedDriver('d', '130.0.1.2', 'c', '131.0.3.4').is_compatible()
+
+    def test_unknown_version_is_compatible(self):
+        assert ResolvedDriver('d', '131.0.1.2', 'c', None).is_compatible()
+
+
+class TestDriverResolver:
+    """Tests for DriverResolver."""
+
+    def test_local_resolution_is_cached(self, tmp_path, binaries):
+        """First run finds local binaries and writes the cache."""
+        chrome, chromedriver = binaries
+        reader = VersionReader({chrome: '131.0.1.1', chromedriver: '131.0.2.2'})
+        cache_file = tmp_path / 'drivers.json'
+
+        resolved = DriverResolver(str(cache_file), version_reader=reader).resolve()
+
+        assert resolved.chromedriver_path == chromedriver
+        assert resolved.chrome_path == chrome
+        assert json.loads(cache_file.read_text())['chromedriver_version'] == '131.0.2.2'
+
+    def test_cache_hit_spawns_nothing(self, tmp_path, binaries, monkeypatch):
+        """An unchanged cache is used without reading versions or downloading."""
+        chrome, chromedriver = binaries
+        cache_file = tmp_path / 'drivers.json'
+        DriverResolver(str(cache_file), version_reader=VersionReader({
+            chrome: '131.0.1.1', chromedriver: '131.0.2.2'
+        })).resolve()
+
+        monkeypatch.setattr(driver_resolver, 'find_local_chromedrivers', lambda: pytest.fail("rescanned"))
+        reader = VersionReader({})
+        resolved = DriverResolver(
+            str(cache_file), version_reader=reader,
+            downloader=lambda: pytest.fail("downloaded")
+        ).resolve()
+
+        assert resolved.chromedriver_path == chromedriver
+        assert reader.calls == []
+
+    def test_changed_binary_rechecks_versions(self, tmp_path, binaries):
+        """A Chrome update within the same major keeps the cached driver."""
+        chrome, chromedriver = binaries
+        cache_file = tmp_path / 'drivers.json'
+        DriverResolver(str(cache_file), version_reader=VersionReader({
+            chrome: '131.0.1.1', chromedriver: '131.0.2.2'
+        })).resolve()
+
+        os.utime(chrome, (1, 1))
+        reader = VersionReader({chrome: '131.0.9.9', chromedriver: '131.0.2.2'})
+        resolved = DriverResolver(str(cache_file), version_reader=reader).resolve()
+
+        assert resolved.chrome_version == '131.0.9.9'
+        assert chrome in reader.calls
+
+    def test_major_mismatch_downloads(self, tmp_path, binaries):
+        """An incompatible local driver falls back to the downloader."""
+        chrome, chromedriver = binaries
+        downloaded = _binary(tmp_path / 'downloaded-chromedriver')
+        reader = VersionReader({chrome: '132.0.1.1', chromedriver: '131.0.2.2', downloaded: '132.0.3.3'})
+
+        resolved = DriverResolver(
+            str(tmp_path / 'drivers.json'), version_reader=reader, downloader=lambda: downloaded
+        ).resolve()
+
+        assert resolved.chromedriver_path == downloaded
+
+    def test_offline_without_match_raises(self, tmp_path, binaries):
+        """With downloads disabled and nothing compatible, resolution fails."""
+        chrome, chromedriver = binaries
+        reader = VersionReader({chrome: '132.0.1.1', chromedriver: '131.0.2.2'})
+
+        with pytest.raises(DriverResolutionError):
+            DriverResolver(str(tmp_path / 'drivers.json'), allow_download=False,
+                           version_reader=reader).resolve()
+
+    def test_invalidate_removes_cache(self, tmp_path, binaries):
+        chrome, chromedriver = binaries
+        cache_file = tmp_path / 'drivers.json'
+        resolver = DriverResolver(str(cache_file), version_reader=VersionReader({
+            chrome: '131.0.1.1', chromedriver: '131.0.2.2'
+        }))
+        resolver.resolve()
+
+        resolver.invalidate()
+
+        assert not cache_file.exists()
+
+
+class TestSharedService:
+    """Tests for the shared chromedriver service."""
+
+    def test_one_service_per_driver_path(self, tmp_path):
+        path = _binary(tmp_path / 'chromedriver')
+        assert get_shared_service(path) is get_shared_service(path)
+
+    def test_stop_keeps_service_running(self, tmp_path):
+        """Driver quit() calls stop(), which must not end the shared process."""
+        service = get_shared_service(_binary(tmp_path / 'chromedriver'))
+
+        class Process:
+            terminated = False
+
+            def poll(self):
+                return None
+
+            def terminate(self):
+                self.terminated = True
+
+        service.process = Process()
+        service.stop()
+        assert not service.process.terminated
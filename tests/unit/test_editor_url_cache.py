@@ -0,0 +1,134 @@
+"""Unit tests for the per-blog editor URL cache."""
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapters.browser.editor_url_cache import EditorUrlCache, is_editor_url
+from src.blog_writer_cdp import NaverBlogWriterCDP
+
+WRITE_URL = 'https://blog.naver.com/user?Redirect=Write&categoryNo=1'
+
+
+class TestIsEditorUrl:
+    """Tests for is_editor_url."""
+
+    @pytest.mark.parametrize('url, valid', [
+        (WRITE_URL, True),
+        ('https://blog.naver.com/PostWriteForm.naver?blogId=user', True),
+        ('http://blog.naver.com/user/postwrite', False),
+        ('https://evil.example.com/user/postwrite', False),
+        ('https://blog.naver.com/other/postwrite', False),
+        ('', False),
+    ])
+    def test_validation(self, url, valid):
+        assert is_editor_url(url, 'user') is valid
+
+
+class TestEditorUrlCache:
+    """Tests for EditorUrlCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache in a temp directory."""
+        return EditorUrlCache(path=str(tmp_path / "nblog" / "editor_urls.json"))
+
+    def test_put_and_get(self, cache):
+        assert cache.put('user', WRITE_URL)
+        assert cache.get('user') == WRITE_URL
+        assert cache.get('other') is None
+        assert oct(os.stat(cache.path).st_mode & 0o777) == '0o600'
+
+    def test_invalid_url_is_not_cached(self, cache):
+        assert not cache.put('user', 'https://blog.naver.com/other/postwrite')
+        assert not cache.path.exists()
+
+    def test_stale_entry_is_ignored(self, cache):
+        cache.put('user', WRITE_URL)
+        data = json.loads(cache.path.read_text())
+        data['user']['saved_at'] -= cache.max_age + 1
+        cache.path.write_text(json.dumps(data))
+
+        assert cache.get('user') is None
+
+    def test_invalidate(self, cache):
+        cache.put('user', WRITE_URL)
+        cache.put('other', 'https://blog.naver.com/other/postwrite')
+        cache.invalidate('user')
+
+        assert cache.get('user') is None
+        assert cache.get('other') is not None
+
+    def test_corrupt_file(self, cache):
+        cache.path.parent.mkdir(parents=True)
+        cache.path.write_text('{not json')
+
+        assert cache.get('user') is None
+        assert cache.put('user', WRITE_URL)
+
+
+class FakeDriver:
+    """Driver recording visited URLs."""
+
+    def __init__(self):
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+
+class TestWriterEditorNavigation:
+    """Tests for the cached editor URL in NaverBlogWriterCDP._navigate_to_editor."""
+
+    @pytest.fixture
+    def make_writer(self, tmp_path):
+        def make(editor_opens=True):
+            writer = NaverBlogWriterCDP(FakeDriver(), SimpleNamespace(blog_id='user'))
+            writer.editor_url_cache = EditorUrlCache(path=str(tmp_path / "editor_urls.json"))
+            writer._handle_alert = lambda: None
+            writer._wait_for_editor = lambda timeout=15: editor_opens or 'Redirect' not in writer.driver.visited[-1]
+            writer.waiter = SimpleNamespace(condition=lambda script, timeout=10: WRITE_URL)
+            return writer
+        return make
+
+    def test_discovered_url_is_cached(self, make_writer):
+        writer = make_writer()
+
+        assert writer._navigate_to_editor()
+        assert writer.driver.visited == ['https://blog.naver.com/user', WRITE_URL]
+        assert writer.editor_url_cache.get('user') == WRITE_URL
+
+    def test_cached_url_skips_the_blog_main_page(self, make_writer):
+        writer = make_writer()
+        writer.editor_url_cache.put('user', WRITE_URL)
+
+        assert writer._navigate_to_editor()
+        assert writer.driver.visited == [WRITE_URL]
+        assert writer.editor_url == WRITE_URL
+
+    def test_broken_cached_url_falls_back_to_discovery(self, make_writer):
+        writer = make_writer(editor_opens=False)
+        writer.waiter = SimpleNamespace(condition=lambda script, timeout=10: None)
+        writer.editor_url_cache.put('user', WRITE_URL)
+
+        assert writer._navigate_to_editor()
+        assert writer.driver.visited == [
+            WRITE_URL, 'https://blog.naver.com/user', 'https://blog.naver.com/user/postwrite'
+        ]
+        assert writer.editor_url_cache.get('user') is None
+
+    def test_entry_url_for_new_tabs(self, make_writer):
+        writer = make_writer()
+        assert writer.editor_entry_url() == 'https://blog.naver.com/user/postwrite'
+
+        writer.editor_url_cache.put('user', WRITE_URL)
+        assert writer.editor_entry_url() == WRITE_URL
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
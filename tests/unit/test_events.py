@@ -0,0 +1,191 @@
+"""Unit tests for structured progress events."""
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.events import EventBus, JsonlEventSink, create_event_bus
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult
+
+
+def _entry(index, sns_id="user@naver.com"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+class TestEventBus:
+    """Tests for EventBus."""
+
+    def test_emit_reaches_subscribers(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append)
+
+        bus.emit('post_succeeded', index=3)
+
+        assert received[0]['event'] == 'post_succeeded'
+        assert received[0]['index'] == 3
+        assert 'ts' in received[0] and 'pid' in received[0]
+
+    def test_unsubscribe(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append)
+        bus.unsubscribe(received.append)
+
+        bus.emit('batch_started')
+
+        assert received == []
+
+    def test_failing_subscriber_is_isolated(self):
+        """One broken subscriber does not stop the others."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(lambda record: 1 / 0)
+        bus.subscribe(received.append)
+
+        bus.emit('batch_started')
+
+        assert len(received) == 1
+
+    def test_span_emits_started_and_finished(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append)
+
+        with bus.span('account_login', sns_id='a@naver.com') as outcome:
+            outcome['success'] = True
+
+        assert [r['event'] for r in received] == ['account_login_started', 'account_login_finished']
+        assert received[1]['sns_id'] == 'a@naver.com'
+        assert received[1]['success'] is True
+        assert received[1]['duration_ms'] >= 0
+
+    def test_span_records_exception(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append)
+
+        with pytest.raises(RuntimeError):
+            with bus.span('account_login'):
+                raise RuntimeError("browser gone")
+
+        assert received[1]['success'] is False
+        assert received[1]['error'] == "browser gone"
+
+
+class TestJsonlEventSink:
+    """Tests for JsonlEventSink."""
+
+    def test_writes_one_line_per_event(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        bus = create_event_bus(str(path))
+
+        bus.emit('batch_started', total=2)
+        # Visible before close: lines are flushed as they are written
+        assert json.loads(path.read_text())['total'] == 2
+
+        bus.emit('batch_finished', blog_title="제목")
+        bus.close()
+
+        records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        assert [r['event'] for r in records] == ['batch_started', 'batch_finished']
+        assert records[1]['blog_title'] == "제목"
+
+    def test_file_descriptor_target(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        try:
+            sink = JsonlEventSink(f'fd:{fd}')
+            sink({'event': 'batch_started'})
+            sink.close()
+            # The descriptor belongs to the caller and stays open
+            os.fstat(fd)
+        finally:
+            os.close(fd)
+
+        assert json.loads(path.read_text())['event'] == 'batch_started'
+
+
+class TestOrchestratorEvents:
+    """Tests for events emitted by BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, monkeypatch):
+        """Orchestrator with the browser, login and writer stubbed out."""
+        received = []
+        events = EventBus()
+        events.subscribe(received.append)
+        config = PostingConfig(delay_between_accounts=0, delay_between_posts=0, reuse_sessions=False)
+        orchestrator = BatchPostingOrchestrator(CredentialManager(), config, events=events)
+
+        class FakeAdapter:
+            def __init__(self, config):
+                pass
+
+            def create_driver(self):
+                return object()
+
+            def close(self):
+                pass
+
+        def fake_post_single(driver, entry, creds, **kwargs):
+            listener = orchestrator._step_listener(entry)
+            listener('started', 'title', attempt=0)
+            listener('finished', 'title', attempt=0, ok=True, duration_ms=1.0)
+            if entry.index == 1:
+                return PostResult(entry=entry, success=False, error_message="Post failed")
+            return PostResult(entry=entry, success=True, post_url="https://blog.naver.com/user/1")
+
+        monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+        monkeypatch.setattr(orchestrator, '_login', lambda driver, creds: True)
+        monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+        orchestrator.received = received
+        return orchestrator
+
+    def test_event_sequence(self, orchestrator):
+        orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert [r['event'] for r in orchestrator.received] == [
+            'batch_started',
+            'account_login_started',
+            'account_login_finished',
+            'post_step_started',
+            'post_step_finished',
+            'post_succeeded',
+            'post_step_started',
+            'post_step_finished',
+            'post_failed',
+            'batch_finished',
+        ]
+
+    def test_event_payloads(self, orchestrator):
+        orchestrator.post_all([_entry(0), _entry(1)])
+        by_event = {r['event']: r for r in orchestrator.received}
+
+        assert by_event['batch_started']['total'] == 2
+        assert by_event['account_login_finished']['success'] is True
+        assert by_event['post_step_finished']['step'] == 'title'
+        assert by_event['post_succeeded']['post_url'] == "https://blog.naver.com/user/1"
+        assert by_event['post_succeeded']['duration_ms'] >= 0
+        assert by_event['post_failed']['error_message'] == "Post failed"
+        assert by_event['batch_finished']['failed'] == 1
+
+    def test_no_password_in_events(self, orchestrator):
+        orchestrator.post_all([_entry(0)])
+        assert 'password' not in json.dumps(orchestrator.received)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,198 @@
+"""Unit tests for failure classification and the per-account circuit breaker."""
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.circuit import AccountCircuitBreaker
+from automation.naver_blog.orchestrator import (
+    BatchPostingOrchestrator,
+    PostingConfig,
+    _classify_writer_failure,
+)
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult, classify_error, is_transient
+
+
+def _entry(index, sns_id="user@naver.com"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+def _failed(kind, index=0):
+    return PostResult(entry=_entry(index), success=False, error_message="Post failed", failure_kind=kind)
+
+
+class TestClassifyError:
+    """Tests for classify_error."""
+
+    @pytest.mark.parametrize('message, kind', [
+        ("https://nid.naver.com/login/ext/captcha", 'captcha'),
+        ("아이디 또는 비밀번호를 잘못 입력했습니다.", 'auth'),
+        ("No credentials available", 'auth'),
+        ("짧은 시간에 너무 많은 글을 작성하셨습니다. 잠시 후 다시 시도해주세요.", 'rate_limit'),
+        ("unknown error: net::ERR_CONNECTION_RESET", 'network'),
+        ("Timed out receiving message from renderer", 'network'),
+        ("invalid session id", 'browser_crash'),
+        ("Message: no such element: Unable to locate element", 'selector_drift'),
+        ("something odd", 'unknown'),
+        ("", 'unknown'),
+    ])
+    def test_classify(self, message, kind):
+        assert classify_error(message) == kind
+
+    def test_transient_kinds(self):
+        assert is_transient('rate_limit')
+        assert is_transient('network')
+        assert not is_transient('auth')
+        assert not is_transient('selector_drift')
+
+
+class TestAccountCircuitBreaker:
+    """Tests for AccountCircuitBreaker."""
+
+    def test_fatal_failure_opens_immediately(self):
+        breaker = AccountCircuitBreaker()
+
+        assert breaker.record(_failed('captcha')) == 0
+        assert breaker.is_open
+        assert breaker.open_reason == 'captcha'
+
+    def test_backoff_only_for_transient_failures(self):
+        breaker = AccountCircuitBreaker(failure_threshold=0, rng=lambda: 1.0)
+
+        assert breaker.record(_failed('selector_drift')) == 0
+        assert breaker.record(_failed('network')) == 5.0
+        assert breaker.record(_failed('network')) == 10.0
+        assert breaker.record(_failed('rate_limit')) == 20.0
+        assert not breaker.is_open
+
+    def test_backoff_is_jittered_and_capped(self):
+        breaker = AccountCircuitBreaker(backoff_base=10.0, backoff_max=30.0, rng=lambda: 0.0)
+
+        assert breaker.backoff_delay(1) == 5.0
+        assert breaker.backoff_delay(10) == 15.0
+
+    def test_success_resets(self):
+        breaker = AccountCircuitBreaker(failure_threshold=2, rng=lambda: 1.0)
+        breaker.record(_failed('network'))
+        breaker.record(PostResult(entry=_entry(1), success=True))
+
+        assert breaker.record(_failed('network')) == 5.0
+        assert not breaker.is_open
+
+    def test_consecutive_failures_open(self):
+        breaker = AccountCircuitBreaker(failure_threshold=2)
+        breaker.record(_failed('selector_drift'))
+        breaker.record(_failed('network'))
+
+        assert breaker.open_reason == 'network'
+
+
+class TestWriterFailureKind:
+    """Tests for classifying a write_post() that returned False."""
+
+    def test_alert_text_wins(self):
+        writer = SimpleNamespace(last_alert_text="잠시 후 다시 시도해주세요", last_error=None,
+                                 last_failed_step='publish')
+        assert _classify_writer_failure(writer) == 'rate_limit'
+
+    def test_failed_step(self):
+        writer = SimpleNamespace(last_alert_text=None, last_error=None, last_failed_step='title')
+        assert _classify_writer_failure(writer) == 'selector_drift'
+
+    def test_writer_without_failure_info(self):
+        assert _classify_writer_failure(object()) == 'unknown'
+
+
+class TestOrchestratorCircuitBreaker:
+    """Tests for the circuit breaker inside BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def make_orchestrator(self, monkeypatch):
+        """Orchestrator whose posts fail with the given kinds in order."""
+        def make(kinds, login_failure=None):
+            config = PostingConfig(delay_between_accounts=0, delay_between_posts=0, reuse_sessions=False)
+            orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+            kinds = iter(kinds)
+            orchestrator.posted = []
+            orchestrator.sleeps = []
+
+            class FakeAdapter:
+                def __init__(self, config):
+                    pass
+
+                def create_driver(self):
+                    return object()
+
+                def close(self):
+                    pass
+
+            def fake_login(driver, creds):
+                if login_failure:
+                    orchestrator._login_failure = login_failure
+                    return False
+                return True
+
+            def fake_post_single(driver, entry, creds, **kwargs):
+                orchestrator.posted.append(entry.index)
+                kind = next(kinds)
+                if not kind:
+                    return PostResult(entry=entry, success=True)
+                return PostResult(entry=entry, success=False, error_message="Post failed", failure_kind=kind)
+
+            monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+            monkeypatch.setattr(orchestrator_module.time, 'sleep', orchestrator.sleeps.append)
+            monkeypatch.setattr(orchestrator, '_login', fake_login)
+            monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+            return orchestrator
+        return make
+
+    def test_rate_limit_backs_off_before_next_entry(self, make_orchestrator):
+        orchestrator = make_orchestrator(['rate_limit', ''])
+
+        result = orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert result.successful == 1
+        assert len(orchestrator.sleeps) == 1
+        assert 2.5 <= orchestrator.sleeps[0] <= 5.0
+
+    def test_repeated_failures_fail_fast(self, make_orchestrator):
+        orchestrator = make_orchestrator(['selector_drift'] * 3)
+
+        result = orchestrator.post_all([_entry(i) for i in range(5)])
+
+        assert orchestrator.posted == [0, 1, 2]
+        assert result.failed == 5
+        skipped = result.results[-1]
+        assert skipped.failure_kind == 'selector_drift'
+        assert skipped.error_message.startswith("Skipped")
+
+    def test_login_failure_kind(self, make_orchestrator):
+        orchestrator = make_orchestrator([], login_failure='captcha')
+
+        result = orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert orchestrator.posted == []
+        assert [r.failure_kind for r in result.results] == ['captcha', 'captcha']
+
+    def test_breaker_is_per_account(self, make_orchestrator):
+        orchestrator = make_orchestrator(['selector_drift'] * 3 + ['', ''])
+        entries = [_entry(i) for i in range(4)] + [_entry(4, "other@naver.com"), _entry(5, "other@naver.com")]
+
+        result = orchestrator.post_all(entries)
+
+        assert orchestrator.posted == [0, 1, 2, 4, 5]
+        assert result.successful == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
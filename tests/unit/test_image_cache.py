@@ -0,0 +1,361 @@
+"""Unit tests for the image cache and parallel image downloads."""
+import os
+import threading
+import pytest
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapters.images import ImageCache, ImageFetcher, ImageNormalizer, image_extension
+from adapters.images import normalize
+from automation.naver_blog.pipeline import prepare_post
+from core.models import BlogContent, BlogPostEntry
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100
+JPEG = b'\xff\xd8\xff\xe0' + b'\x01' * 200
+
+
+class ImageStub(BaseHTTPRequestHandler):
+    """Serves images, a redirect and an HTML error page."""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path == '/moved.png':
+            self.send_response(302)
+            self.send_header('Location', '/a.png')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = {'/a.png': PNG, '/b.jpg': JPEG, '/page.html': b'<html></html>'}.get(self.path)
+        self.send_response(200 if body else 404)
+        body = body or b''
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Stub image server on a free local port."""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ImageStub)
+    httpd.requests = []
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ImageCache(str(tmp_path / "images"))
+
+
+class TestImageCache:
+    """Tests for ImageCache."""
+
+    @pytest.mark.parametrize('data, extension', [
+        (PNG, 'png'), (JPEG, 'jpg'), (b'GIF89a...', 'gif'),
+        (b'RIFF\x00\x00\x00\x00WEBPVP8 ', 'webp'), (b'<html>', None),
+    ])
+    def test_image_extension(self, data, extension):
+        assert image_extension(data) == extension
+
+    def test_identical_images_are_stored_once(self, cache):
+        first = cache.put('https://a.example/1.png', PNG)
+        second = cache.put('https://b.example/header.png', PNG)
+
+        assert first == second
+        assert first.read_bytes() == PNG
+        assert cache.size == len(PNG)
+        assert cache.get('https://b.example/header.png') == first
+        assert cache.get('https://c.example/other.png') is None
+
+    def test_index_survives_a_new_instance(self, cache):
+        path = cache.put('https://a.example/1.png', PNG)
+
+        assert ImageCache(str(cache.root)).get('https://a.example/1.png') == path
+
+    def test_not_an_image(self, cache):
+        with pytest.raises(ValueError):
+            cache.put('https://a.example/error', b'<html>Not found</html>')
+
+    def test_least_recently_used_images_are_evicted(self, tmp_path):
+        cache = ImageCache(str(tmp_path / "images"), max_bytes=len(PNG) + len(JPEG))
+        old = cache.put('https://a.example/old.png', PNG)
+        used = cache.put('https://a.example/used.jpg', JPEG)
+        os.utime(old, (1, 1))
+        os.utime(used, (2, 2))
+        cache.get('https://a.example/used.jpg')  # refreshes its use time
+
+        cache.put('https://a.example/new.gif', b'GIF89a' + b'\x02' * 50)
+
+        assert cache.get('https://a.example/old.png') is None
+        assert cache.get('https://a.example/used.jpg') == used
+        assert cache.size <= cache.max_bytes
+
+    def test_pinned_images_are_not_evicted(self, tmp_path):
+        cache = ImageCache(str(tmp_path / "images"), max_bytes=100)
+        first = cache.put('https://a.example/u1.png', PNG, pin=True)
+        cache.put('https://a.example/u2.jpg', JPEG)
+
+        assert first.exists()
+        assert cache.get('https://a.example/u1.png') == first
+
+        cache.unpin(first)
+        cache.put('https://a.example/u3.gif', b'GIF89a' + b'\x02' * 50)
+        assert not first.exists()
+
+
+class TestSharedImageCache:
+    """Tests for one cache directory shared by several processes (--jobs)."""
+
+    def test_index_keeps_every_process_entries(self, tmp_path):
+        root = str(tmp_path / "images")
+        first, second = ImageCache(root), ImageCache(root)
+        first.get('https://a.example/none.png')  # both have read the (empty) index
+        second.get('https://a.example/none.png')
+
+        first.put('https://a.example/1.png', PNG)
+        second.put('https://a.example/2.jpg', JPEG)
+
+        fresh = ImageCache(root)
+        assert fresh.get('https://a.example/1.png') is not None
+        assert fresh.get('https://a.example/2.jpg') is not None
+        # Entries added by another process are found without a restart
+        assert first.get('https://a.example/2.jpg') is not None
+
+    def test_file_deleted_by_another_process_while_scanning(self, tmp_path, monkeypatch):
+        root = str(tmp_path / "images")
+        other = ImageCache(root)
+        gone = other.put('https://a.example/1.png', PNG)
+        real_stat = Path.stat
+
+        def stat(path, *args, **kwargs):
+            if path == gone:
+                raise FileNotFoundError(str(path))
+            return real_stat(path, *args, **kwargs)
+        monkeypatch.setattr(Path, 'stat', stat)
+
+        cache = ImageCache(root, max_bytes=10)
+        path = cache.put('https://a.example/2.jpg', JPEG)
+        assert path.read_bytes() == JPEG
+
+    def test_eviction_rescans_what_other_processes_added(self, tmp_path):
+        root = str(tmp_path / "images")
+        cache = ImageCache(root, max_bytes=300)
+        os.utime(cache.put('https://a.example/1.jpg', JPEG), (1, 1))
+        os.utime(ImageCache(root).put('https://a.example/2.png', PNG + b'\x00' * 300), (2, 2))
+
+        cache.put('https://a.example/3.gif', b'GIF89a' + b'\x02' * 114)
+        on_disk = sum(p.stat().st_size for p in (Path(root) / 'objects').glob('*/*'))
+        assert on_disk <= cache.max_bytes
+        assert cache.size == on_disk
+
+
+class TestImageFetcher:
+    """Tests for ImageFetcher."""
+
+    def test_duplicate_urls_are_downloaded_once(self, cache, server):
+        fetcher = ImageFetcher(cache, workers=2)
+        try:
+            urls = [f"{server.url}/a.png", f"{server.url}/b.jpg", f"{server.url}/a.png"]
+
+            assert fetcher.prefetch(urls) == 2
+            files = fetcher.local_files(urls)
+
+            assert [Path(f).read_bytes() for f in files] == [PNG, JPEG, PNG]
+            assert sorted(server.requests) == ['/a.png', '/b.jpg']
+            assert fetcher.downloaded == 2
+        finally:
+            fetcher.close()
+
+    def test_cached_images_are_not_downloaded_again(self, cache, server):
+        url = f"{server.url}/a.png"
+        first = ImageFetcher(cache)
+        try:
+            first.local_files([url])
+        finally:
+            first.close()
+
+        second = ImageFetcher(ImageCache(str(cache.root)))
+        try:
+            assert second.local_files([url]) == [str(cache.get(url))]
+            assert server.requests == ['/a.png']
+            assert second.cache_hits == 1
+        finally:
+            second.close()
+
+    def test_redirects_and_failures(self, cache, server):
+        fetcher = ImageFetcher(cache)
+        try:
+            assert Path(fetcher.local_file(f"{server.url}/moved.png")).read_bytes() == PNG
+            assert fetcher.local_file(f"{server.url}/missing.png") is None
+            assert fetcher.local_file(f"{server.url}/page.html") is None
+            assert fetcher.local_files([f"{server.url}/missing.png", f"{server.url}/b.jpg"]) == [
+                str(cache.get(f"{server.url}/b.jpg"))
+            ]
+        finally:
+            fetcher.close()
+
+    def test_prefetched_images_stay_until_released(self, tmp_path, server):
+        cache = ImageCache(str(tmp_path / "images"), max_bytes=100)
+        fetcher = ImageFetcher(cache, workers=2)
+        try:
+            urls = [f"{server.url}/a.png", f"{server.url}/b.jpg"]
+            fetcher.prefetch(urls)
+            files = fetcher.local_files(urls)
+            assert all(Path(f).exists() for f in files)
+
+            fetcher.release(urls[:1])
+            cache.put('https://a.example/new.gif', b'GIF89a' + b'\x02' * 50)
+            assert not Path(files[0]).exists()
+            assert Path(files[1]).exists()
+
+            # Needed again after its release: fetched again
+            assert Path(fetcher.local_file(urls[0])).read_bytes() == PNG
+            assert server.requests.count('/a.png') == 2
+        finally:
+            fetcher.close()
+
+    def test_shared_image_is_pinned_until_its_last_use(self, tmp_path, server):
+        cache = ImageCache(str(tmp_path / "images"), max_bytes=100)
+        fetcher = ImageFetcher(cache)
+        try:
+            url = f"{server.url}/a.png"
+            fetcher.prefetch([url, url])  # two entries use it
+            path = fetcher.local_file(url)
+
+            fetcher.release([url])
+            cache.put('https://a.example/new.jpg', JPEG)
+            assert Path(path).exists()
+            assert fetcher.local_file(url) == path
+        finally:
+            fetcher.close()
+
+    def test_prepare_post_downloads_the_entry_images(self, cache, server):
+        entry = BlogPostEntry(
+            sns_id="user@naver.com",
+            sns_pw="password",
+            sns_upload_cont=BlogContent(
+                blog_title="Post",
+                blog_basic="Body",
+                blog_title_img=f"{server.url}/a.png",
+                site_img1=f"{server.url}/b.jpg",
+            ),
+            index=0
+        )
+        fetcher = ImageFetcher(cache)
+        try:
+            prepared = prepare_post(entry, fetcher)
+        finally:
+            fetcher.close()
+
+        assert [Path(f).read_bytes() for f in prepared.image_files] == [PNG, JPEG]
+        assert prepare_post(entry).image_files == []
+
+
+@pytest.fixture
+def reencoded(monkeypatch):
+    """Stand-in for Pillow: re-encoding returns a small JPEG and records its calls."""
+    calls = []
+
+    def fake_reencode(path, max_width, quality):
+        calls.append((path, max_width, quality))
+        return JPEG[:4] + bytes([quality])
+
+    monkeypatch.setattr(normalize, 'PIL_AVAILABLE', True)
+    monkeypatch.setattr(normalize, 'reencode_image', fake_reencode)
+    return calls
+
+
+class TestImageNormalizer:
+    """Tests for ImageNormalizer."""
+
+    def test_results_are_cached_by_source_and_parameters(self, cache, tmp_path, reencoded):
+        source = cache.put('https://a.example/photo.png', PNG)
+        normalized = ImageCache(str(tmp_path / "normalized"))
+
+        first = ImageNormalizer(normalized, max_width=500, quality=70, workers=0)
+        path = first.normalize(str(source))
+        assert Path(path).read_bytes() == JPEG[:4] + bytes([70])
+        assert (first.normalized, first.bytes_in, first.bytes_out) == (1, len(PNG), 5)
+
+        again = ImageNormalizer(ImageCache(str(normalized.root)), max_width=500, quality=70, workers=0)
+        assert again.normalize(str(source)) == path
+        assert again.cache_hits == 1
+
+        other = ImageNormalizer(normalized, max_width=500, quality=60, workers=0)
+        assert other.normalize(str(source)) != path
+        assert len(reencoded) == 2
+
+    def test_source_is_kept_when_not_smaller(self, cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(normalize, 'PIL_AVAILABLE', True)
+        monkeypatch.setattr(normalize, 'reencode_image', lambda path, max_width, quality: None)
+        source = cache.put('https://a.example/anim.gif', b'GIF89a' + b'\x03' * 20)
+        normalizer = ImageNormalizer(ImageCache(str(tmp_path / "normalized")), workers=0)
+
+        assert Path(normalizer.normalize(str(source))).read_bytes() == source.read_bytes()
+
+    def test_failures_and_missing_pillow_keep_the_source(self, cache, tmp_path, monkeypatch):
+        source = str(cache.put('https://a.example/photo.png', PNG))
+        normalized = ImageCache(str(tmp_path / "normalized"))
+
+        monkeypatch.setattr(normalize, 'PIL_AVAILABLE', False)
+        assert ImageNormalizer(normalized, workers=0).normalize(source) == source
+
+        def broken(path, max_width, quality):
+            raise OSError("cannot identify image file")
+        monkeypatch.setattr(normalize, 'PIL_AVAILABLE', True)
+        monkeypatch.setattr(normalize, 'reencode_image', broken)
+        assert ImageNormalizer(normalized, workers=0).normalize(source) == source
+
+    @pytest.mark.parametrize('max_width, quality', [(0, 85), (966, 0), (966, 100)])
+    def test_invalid_parameters(self, cache, max_width, quality):
+        with pytest.raises(ValueError):
+            ImageNormalizer(cache, max_width=max_width, quality=quality)
+
+    def test_fetcher_returns_normalized_files(self, cache, tmp_path, server, reencoded):
+        normalizer = ImageNormalizer(ImageCache(str(tmp_path / "normalized")), quality=50, workers=0)
+        fetcher = ImageFetcher(cache, normalizer=normalizer)
+        try:
+            files = fetcher.local_files([f"{server.url}/a.png", f"{server.url}/b.jpg"])
+        finally:
+            fetcher.close()
+
+        assert [Path(f).read_bytes() for f in files] == [JPEG[:4] + bytes([50])] * 2
+        assert normalizer.normalized == 2
+
+    def test_reencode_photo(self, cache, tmp_path):
+        """Real re-encoding in a worker process."""
+        Image = pytest.importorskip('PIL.Image')
+        photo = Image.new('RGB', (2000, 1000), (200, 120, 40))
+        exif = Image.Exif()
+        exif[0x010F] = 'Camera'  # Make
+        buffer = tmp_path / "photo.jpg"
+        photo.save(buffer, 'JPEG', quality=100, exif=exif)
+        source = cache.put('https://a.example/photo.jpg', buffer.read_bytes())
+
+        normalizer = ImageNormalizer(ImageCache(str(tmp_path / "normalized")), max_width=966, workers=1)
+        try:
+            path = normalizer.normalize(str(source))
+        finally:
+            normalizer.close()
+
+        with Image.open(path) as result:
+            assert result.format == 'JPEG'
+            assert result.size == (966, 483)
+            assert not result.getexif()
+        assert normalizer.bytes_out < normalizer.bytes_in
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
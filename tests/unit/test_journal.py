@@ -0,0 +1,212 @@
+"""Unit tests for the posting journal and resume handling."""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.journal import PostingJournal, hash_input_file
+from automation.naver_blog.orchestrator import POST_UNVERIFIED, BatchPostingOrchestrator, PostingConfig
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult
+
+
+def _entry(index, sns_id="user@naver.com"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+class TestPostingJournal:
+    """Tests for PostingJournal."""
+
+    @pytest.fixture
+    def journal(self, tmp_path):
+        """Create a journal in a temp directory."""
+        return PostingJournal(str(tmp_path / "journal.jsonl"), input_hash="abc")
+
+    def test_for_input_file_uses_hash(self, tmp_path):
+        """Test that journals are keyed by input file content."""
+        input_file = tmp_path / "input.json"
+        input_file.write_text('[]', encoding='utf-8')
+        journal = PostingJournal.for_input_file(str(input_file), journal_dir=str(tmp_path))
+        assert journal.input_hash == hash_input_file(str(input_file))
+        assert journal.path.name == f"{journal.input_hash}.jsonl"
+
+    def test_empty_state(self, journal):
+        """Test loading a missing journal."""
+        assert journal.load().is_empty
+
+    def test_completed_and_failed(self, journal):
+        """Test that outcomes are replayed."""
+        journal.start()
+        journal.record_publishing(_entry(0))
+        journal.record_result(PostResult(entry=_entry(0), success=True))
+        journal.record_publishing(_entry(1))
+        journal.record_result(PostResult(entry=_entry(1), success=False, error_message="x"))
+
+        state = journal.load()
+        assert state.completed == {0}
+        assert state.failed == {1}
+        assert state.in_flight == set()
+
+    def test_in_flight(self, journal):
+        """Test that a publish without an outcome is reported as in flight."""
+        journal.start()
+        journal.record_publishing(_entry(3))
+        assert journal.load().in_flight == {3}
+
+    def test_unverified_stays_in_flight(self, journal):
+        """Test that a published but unverified entry is re-checked, not retried blindly."""
+        journal.record_publishing(_entry(2))
+        journal.record_result(PostResult(entry=_entry(2), success=False), published=True)
+
+        state = journal.load()
+        assert state.in_flight == {2}
+        assert state.failed == set()
+        assert json.loads(journal.path.read_text().splitlines()[-1])['event'] == 'unverified'
+
+    def test_retry_after_failure_completes(self, journal):
+        """Test that a later success overrides an earlier failure."""
+        journal.record_result(PostResult(entry=_entry(0), success=False))
+        journal.record_result(PostResult(entry=_entry(0), success=True))
+        state = journal.load()
+        assert state.completed == {0}
+        assert state.failed == set()
+
+    def test_truncated_line_ignored(self, journal):
+        """Test that a partially written last record is skipped."""
+        journal.record_result(PostResult(entry=_entry(0), success=True))
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"event": "completed", "ind')
+        assert journal.load().completed == {0}
+
+    def test_fresh_start_discards_previous(self, journal):
+        """Test that a non-resume start begins a new journal."""
+        journal.record_result(PostResult(entry=_entry(0), success=True))
+        state = journal.start(resume=False)
+        assert state.is_empty
+        assert journal.load().is_empty
+
+    def test_resume_start_keeps_previous(self, journal):
+        """Test that a resume start returns the previous state."""
+        journal.record_result(PostResult(entry=_entry(0), success=True))
+        state = journal.start(resume=True)
+        assert state.completed == {0}
+
+    def test_records_are_json_lines(self, journal):
+        """Test the on-disk format."""
+        journal.start()
+        journal.record_publishing(_entry(0))
+        lines = journal.path.read_text(encoding='utf-8').splitlines()
+        records = [json.loads(line) for line in lines]
+        assert records[0]['event'] == 'batch_started'
+        assert records[0]['input_hash'] == 'abc'
+        assert records[1]['event'] == 'publishing'
+        assert records[1]['index'] == 0
+        assert 'sns_pw' not in lines[1]
+
+
+class TestOrchestratorResume:
+    """Tests for resume handling in BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path, monkeypatch):
+        """Create an orchestrator whose account posting is stubbed out."""
+        journal = PostingJournal(str(tmp_path / "journal.jsonl"))
+        config = PostingConfig(delay_between_accounts=0, reuse_sessions=False)
+        orchestrator = BatchPostingOrchestrator(CredentialManager(), config, journal=journal)
+
+        posted = []
+
+        def fake_post_account_entries(entries, creds, session=None):
+            results = []
+            for entry in entries:
+                posted.append(entry.index)
+                results.append(orchestrator._journal_result(PostResult(entry=entry, success=True)))
+            return results
+
+        monkeypatch.setattr(orchestrator, '_post_account_entries', fake_post_account_entries)
+        orchestrator.posted = posted
+        return orchestrator
+
+    def test_resume_skips_completed(self, orchestrator):
+        """Test that completed entries are not posted again."""
+        orchestrator.journal.record_result(PostResult(entry=_entry(0), success=True))
+        orchestrator.journal.record_publishing(_entry(1))
+
+        result = orchestrator.post_all([_entry(0), _entry(1), _entry(2)], resume=True)
+
+        assert orchestrator.posted == [1, 2]
+        assert result.skipped == 1
+        assert result.successful == 2
+        assert orchestrator._recheck_indexes == {1}
+
+    def test_resume_rechecks_unverified_posts(self, orchestrator):
+        """Test that a post published but not verified is checked on the blog before retrying."""
+        orchestrator.journal.record_publishing(_entry(0))
+        orchestrator._journal_result(PostResult(entry=_entry(0), success=False, error_message=POST_UNVERIFIED))
+        orchestrator.journal.record_publishing(_entry(1))
+        orchestrator._journal_result(PostResult(entry=_entry(1), success=False, error_message="Post failed"))
+
+        orchestrator.post_all([_entry(0), _entry(1)], resume=True)
+
+        assert orchestrator._recheck_indexes == {0}
+
+    def test_resumed_unverified_post_is_not_published_again(self, tmp_path, monkeypatch):
+        """Test that the blog check runs for an unverified post and prevents a duplicate."""
+        journal = PostingJournal(str(tmp_path / "journal.jsonl"))
+        journal.record_publishing(_entry(0))
+        journal.record_result(PostResult(entry=_entry(0), success=False, error_message=POST_UNVERIFIED),
+                              published=True)
+        config = PostingConfig(delay_between_posts=0, reuse_sessions=False, pipeline=False)
+        orchestrator = BatchPostingOrchestrator(CredentialManager(), config, journal=journal)
+
+        class FakeAdapter:
+            def __init__(self, config):
+                pass
+
+            def create_driver(self):
+                return object()
+
+            def close(self):
+                pass
+
+        posted, checked = [], []
+        monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+        monkeypatch.setattr(orchestrator, '_login', lambda driver, creds: True)
+        monkeypatch.setattr(orchestrator, '_is_already_published',
+                            lambda driver, entry, creds: checked.append(entry.index) or True)
+        monkeypatch.setattr(orchestrator, '_post_single', lambda driver, entry, creds, **kwargs: (
+            posted.append(entry.index) or PostResult(entry=entry, success=True)))
+
+        result = orchestrator.post_all([_entry(0), _entry(1)], resume=True)
+
+        assert checked == [0]
+        assert posted == [1]
+        assert result.successful == 2
+        assert journal.load().completed == {0, 1}
+
+    def test_without_resume_posts_everything(self, orchestrator):
+        """Test that a fresh run ignores the old journal."""
+        orchestrator.journal.record_result(PostResult(entry=_entry(0), success=True))
+
+        result = orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert orchestrator.posted == [0, 1]
+        assert result.skipped == 0
+
+    def test_results_are_journaled(self, orchestrator):
+        """Test that a run leaves every outcome in the journal."""
+        orchestrator.post_all([_entry(0), _entry(1)])
+        assert orchestrator.journal.load().completed == {0, 1}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,223 @@
+"""Unit tests for adaptive pacing."""
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from automation.naver_blog.pacing import PacingController, PacingManager, TokenBucket, create_pacer
+from adapters.report.stream import JsonlReportWriter, read_report
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult, BatchPostResult
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _entry(index, sns_id="user@naver.com"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+def _ok():
+    return PostResult(entry=_entry(0), success=True)
+
+
+def _failed(kind):
+    return PostResult(entry=_entry(0), success=False, error_message="Post failed", failure_kind=kind)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_back_to_back_reservations_are_spaced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(1, clock)
+
+        assert bucket.reserve(0.5) == 0
+        assert bucket.reserve(0.5) == 2.0
+        assert bucket.reserve(0.5) == 4.0
+
+    def test_refills_while_idle(self):
+        clock = FakeClock()
+        bucket = TokenBucket(1, clock)
+        bucket.reserve(0.5)
+
+        clock.now = 10.0
+
+        assert bucket.reserve(0.5) == 0
+
+
+class TestPacingController:
+    """Tests for PacingController."""
+
+    def test_additive_increase_on_success(self):
+        pacer = PacingController(initial_rate=10, max_rate=12, clock=FakeClock())
+
+        assert pacer.record('a', _ok(), 30) == 11
+        assert pacer.record('a', _ok(), 30) == 12
+        assert pacer.record('a', _ok(), 30) == 12
+
+    def test_multiplicative_decrease_on_rate_limit(self):
+        clock = FakeClock()
+        pacer = PacingController(initial_rate=10, clock=clock)
+
+        assert pacer.record('a', _failed('rate_limit'), 30) == 5
+        assert pacer.snapshot()['last_signal'] == 'rate_limit'
+
+    def test_one_decrease_per_interval(self):
+        """Simultaneous signals from several workers cut the rate once."""
+        clock = FakeClock()
+        pacer = PacingController(initial_rate=10, clock=clock)
+
+        pacer.record('a', _failed('captcha'), 30)
+        pacer.record('b', _failed('rate_limit'), 30)
+        assert pacer.rate == 5
+
+        clock.now = 60 / 5
+        pacer.record('b', _failed('rate_limit'), 30)
+        assert pacer.rate == 2.5
+
+    def test_unverified_publish_decreases(self):
+        pacer = PacingController(initial_rate=10, clock=FakeClock())
+
+        pacer.record('a', _failed('network'), 30, verified=False)
+
+        assert pacer.rate == 5
+
+    def test_other_failures_are_neutral(self):
+        pacer = PacingController(initial_rate=10, clock=FakeClock())
+
+        pacer.record('a', _failed('selector_drift'), 30)
+
+        assert pacer.rate == 10
+
+    def test_slow_publish_decreases(self):
+        pacer = PacingController(initial_rate=10, max_rate=10, clock=FakeClock())
+        for _ in range(3):
+            pacer.record('a', _ok(), 30)
+
+        pacer.record('a', _ok(), 90)
+
+        assert pacer.rate == 5
+        assert pacer.last_signal == 'slow_publish'
+
+    def test_global_bucket_spans_accounts(self):
+        """A new account does not get a free post while the shared budget is spent."""
+        pacer = PacingController(initial_rate=6, clock=FakeClock())
+
+        assert pacer.reserve('a') == 0
+        assert pacer.reserve('b') == 10.0
+
+    def test_concurrency_scales_global_bucket(self):
+        pacer = PacingController(initial_rate=6, concurrency=2, clock=FakeClock())
+
+        assert pacer.reserve('a') == 0
+        assert pacer.reserve('b') == 0
+        assert pacer.reserve('a') == 10.0
+
+    def test_snapshot(self):
+        pacer = PacingController(initial_rate=6, clock=FakeClock())
+        pacer.reserve('a')
+        pacer.reserve('a')
+        pacer.record('a', _ok(), 20)
+
+        snapshot = pacer.snapshot()
+
+        assert snapshot['rate_per_minute'] == 7
+        assert snapshot['increases'] == 1
+        assert snapshot['accounts']['a'] == {'posts': 1, 'waited_seconds': 10.0}
+
+
+class TestCreatePacer:
+    """Tests for create_pacer."""
+
+    def test_fixed_pacing_has_no_controller(self):
+        assert create_pacer(PostingConfig()) is None
+
+    def test_initial_rate_from_delay(self):
+        pacer = create_pacer(PostingConfig(pacing='adaptive', delay_between_posts=10))
+        assert pacer.rate == 6
+
+    def test_shared_controller_through_manager(self):
+        manager = PacingManager()
+        manager.start()
+        try:
+            pacer = create_pacer(PostingConfig(pacing='adaptive'), concurrency=2, manager=manager)
+            pacer.record('a', _failed('rate_limit'), 10)
+            assert pacer.snapshot()['decreases'] == 1
+        finally:
+            manager.shutdown()
+
+
+class TestOrchestratorPacing:
+    """Tests for adaptive pacing inside BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, monkeypatch):
+        """Adaptive-paced orchestrator with the browser, login and writer stubbed out."""
+        config = PostingConfig(pacing='adaptive', reuse_sessions=False)
+        orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+        orchestrator.sleeps = []
+        orchestrator.pacer = PacingController(initial_rate=1, clock=FakeClock())
+
+        class FakeAdapter:
+            def __init__(self, config):
+                pass
+
+            def create_driver(self):
+                return object()
+
+            def close(self):
+                pass
+
+        def fake_post_single(driver, entry, creds, **kwargs):
+            if entry.index == 1:
+                return PostResult(entry=entry, success=False, error_message="Post failed",
+                                  failure_kind='rate_limit')
+            return PostResult(entry=entry, success=True)
+
+        monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+        monkeypatch.setattr(orchestrator_module.time, 'sleep', orchestrator.sleeps.append)
+        monkeypatch.setattr(orchestrator, '_login', lambda driver, creds: True)
+        monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+        return orchestrator
+
+    def test_waits_come_from_pacer(self, orchestrator):
+        result = orchestrator.post_all([_entry(0), _entry(1), _entry(2, "other@naver.com")])
+
+        # No fixed delays: the second post waits for the account bucket (rate 2/min
+        # after a success), the other account for the shared bucket (rate cut to 1/min)
+        assert orchestrator.sleeps == [30.0, 120.0]
+        assert result.pacing['decreases'] == 1
+        assert result.pacing['increases'] == 2
+        assert result.pacing['accounts']['user@naver.com']['posts'] == 2
+
+    def test_pacing_in_reports(self, orchestrator, tmp_path):
+        result = orchestrator.post_all([_entry(0)])
+
+        assert result.to_dict()['pacing']['mode'] == 'adaptive'
+        writer = JsonlReportWriter(str(tmp_path / "report.jsonl"))
+        writer.finish({'pacing': result.pacing})
+        assert list(read_report(str(tmp_path / "report.jsonl")))[-1]['pacing']['rate_per_minute'] == 2
+
+    def test_fixed_pacing_report_unchanged(self):
+        assert 'pacing' not in BatchPostResult().to_dict()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,176 @@
+"""Unit tests for posting account groups in parallel worker processes."""
+import pytest
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.events import EventBus
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from adapters.secrets import CredentialManager
+from core.models import FAILURE_AUTH, FAILURE_BROWSER_CRASH, BlogContent, BlogPostEntry, PostResult
+
+
+def _entry(index, sns_id, sns_pw="password"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw=sns_pw,
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+class InlineExecutor:
+    """Process pool stand-in that runs each submitted worker right away."""
+
+    instances = []
+
+    def __init__(self, max_workers, mp_context=None):
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        InlineExecutor.instances.append(self)
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeReportWriter:
+    def __init__(self):
+        self.written = []
+
+    def write_result(self, post_result):
+        self.written.append(post_result.entry.index)
+
+
+class TestParallelPosting:
+    """Tests for BatchPostingOrchestrator with jobs > 1."""
+
+    @pytest.fixture
+    def make_orchestrator(self, monkeypatch):
+        """Orchestrator whose worker processes are stubbed, recording their calls."""
+        def make(jobs=2, crashing=(), events=None):
+            config = PostingConfig(jobs=jobs, reuse_sessions=False, pipeline=False)
+            orchestrator = BatchPostingOrchestrator(
+                CredentialManager(), config, events=events, report_writer=FakeReportWriter()
+            )
+            orchestrator.worker_calls = []
+
+            def fake_worker(config, entries, creds, journal, recheck_indexes, events_queue, pacer):
+                orchestrator.worker_calls.append((creds.sns_id, creds.sns_pw, [e.index for e in entries]))
+                if creds.sns_id in crashing:
+                    raise RuntimeError("browser crashed")
+                if events_queue is not None:
+                    events_queue.put({'event': 'post_succeeded', 'index': entries[0].index})
+                return [PostResult(entry=entry, success=entry.index % 2 == 0) for entry in entries]
+
+            InlineExecutor.instances = []
+            monkeypatch.setattr(orchestrator_module, 'ProcessPoolExecutor', InlineExecutor)
+            monkeypatch.setattr(orchestrator_module, '_post_account_worker', fake_worker)
+            monkeypatch.setattr(orchestrator, '_post_accounts_sequential',
+                                lambda *args: pytest.fail("posted sequentially"))
+            return orchestrator
+        return make
+
+    def _entries(self):
+        return [_entry(0, "a@naver.com"), _entry(1, "b@naver.com"), _entry(2, "a@naver.com"),
+                _entry(3, "c@naver.com"), _entry(4, "b@naver.com")]
+
+    def test_each_account_goes_to_its_own_worker(self, make_orchestrator):
+        orchestrator = make_orchestrator(jobs=2)
+
+        orchestrator.post_all(self._entries())
+
+        # One worker call per account, with its entries in input order and resolved credentials
+        assert orchestrator.worker_calls == [
+            ("a@naver.com", "password", [0, 2]),
+            ("b@naver.com", "password", [1, 4]),
+            ("c@naver.com", "password", [3]),
+        ]
+        assert InlineExecutor.instances[0].max_workers == 2
+        assert InlineExecutor.instances[0].mp_context.get_start_method() == 'spawn'
+
+    def test_workers_are_capped_at_the_account_count(self, make_orchestrator):
+        orchestrator = make_orchestrator(jobs=8)
+
+        orchestrator.post_all(self._entries())
+
+        assert InlineExecutor.instances[0].max_workers == 3
+
+    def test_worker_results_are_merged(self, make_orchestrator):
+        orchestrator = make_orchestrator()
+
+        result = orchestrator.post_all(self._entries())
+
+        assert (result.total, result.successful, result.failed) == (5, 3, 2)
+        indexes = [r.entry.index for r in result.results]
+        assert sorted(indexes) == [0, 1, 2, 3, 4]
+        # Each account's results keep the order its worker posted them in
+        for account in ([0, 2], [1, 4]):
+            positions = [indexes.index(i) for i in account]
+            assert positions == sorted(positions)
+        assert orchestrator.report_writer.written == indexes
+
+    def test_crashed_worker_fails_only_its_account(self, make_orchestrator):
+        orchestrator = make_orchestrator(crashing=("b@naver.com",))
+
+        result = orchestrator.post_all(self._entries())
+
+        failed = {r.entry.index: r for r in result.results if r.entry.sns_id == "b@naver.com"}
+        assert sorted(failed) == [1, 4]
+        assert all(not r.success for r in failed.values())
+        assert all(r.failure_kind == FAILURE_BROWSER_CRASH for r in failed.values())
+        assert all("browser crashed" in r.error_message for r in failed.values())
+        assert result.total == 5
+        assert result.successful == 2  # entries 0 and 2 of account a
+
+    def test_account_without_password_is_not_sent_to_a_worker(self, make_orchestrator):
+        orchestrator = make_orchestrator()
+        entries = self._entries() + [_entry(5, "d@naver.com", sns_pw="")]
+
+        result = orchestrator.post_all(entries)
+
+        assert "d@naver.com" not in [call[0] for call in orchestrator.worker_calls]
+        missing = [r for r in result.results if r.entry.index == 5]
+        assert missing[0].failure_kind == FAILURE_AUTH
+        assert missing[0].error_message == "No credentials available"
+        assert result.total == 6
+
+    def test_single_account_is_posted_in_process(self, make_orchestrator, monkeypatch):
+        orchestrator = make_orchestrator(jobs=4)
+        posted = []
+        monkeypatch.setattr(orchestrator, '_post_accounts_sequential',
+                            lambda by_account, total, result: posted.extend(by_account))
+
+        orchestrator.post_all([_entry(0, "a@naver.com"), _entry(1, "a@naver.com")])
+
+        assert posted == ["a@naver.com"]
+        assert orchestrator.worker_calls == []
+
+    def test_worker_events_are_forwarded(self, make_orchestrator):
+        events = EventBus()
+        received = []
+        events.subscribe(received.append)
+        orchestrator = make_orchestrator(events=events)
+
+        orchestrator.post_all(self._entries())
+
+        forwarded = sorted(e['index'] for e in received if e['event'] == 'post_succeeded')
+        assert forwarded == [0, 1, 3]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,195 @@
+"""Unit tests for the pipelined posting stages."""
+import threading
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import POST_UNVERIFIED, BatchPostingOrchestrator, PostingConfig
+from automation.naver_blog.pipeline import EntryPreparer, IdleWindowRunner, prepare_post
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult
+
+
+class FakeClock:
+    """Clock advanced by the tasks under test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _entry(index, sns_id="user@naver.com"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(
+            blog_title=f"Post {index}",
+            blog_basic="Body",
+            site_tag="tag",
+            blog_title_img="https://example.com/a.jpg"
+        ),
+        index=index
+    )
+
+
+class TestEntryPreparer:
+    """Tests for EntryPreparer."""
+
+    def test_prepare_post(self):
+        prepared = prepare_post(_entry(0))
+
+        assert "Body" in prepared.content_text
+        assert prepared.tags == ["tag"]
+        assert prepared.image_urls == ["https://example.com/a.jpg"]
+
+    def test_prepares_ahead_with_bounded_lookahead(self):
+        entries = [_entry(i) for i in range(5)]
+        preparer = EntryPreparer(entries, lookahead=2)
+        try:
+            assert len(preparer._futures) == 2
+            assert preparer.get(entries[0]).entry is entries[0]
+            assert set(preparer._futures) == {1, 2}
+        finally:
+            preparer.close()
+
+    def test_unqueued_entry_is_prepared_on_the_spot(self):
+        preparer = EntryPreparer([])
+        try:
+            assert preparer.get(_entry(7)).entry.index == 7
+        finally:
+            preparer.close()
+
+
+class TestIdleWindowRunner:
+    """Tests for IdleWindowRunner."""
+
+    def test_tasks_run_inside_the_delay(self):
+        clock = FakeClock()
+        sleeps = []
+        runner = IdleWindowRunner(clock=clock, sleep=sleeps.append)
+
+        def verify():
+            clock.now += 3
+
+        runner.defer(verify)
+        runner.idle(5)
+
+        assert sleeps == [2]
+        assert runner.overlapped == 3
+        assert runner.pending == 0
+
+    def test_slow_tasks_extend_the_window(self):
+        """Deferred work always finishes; the delay is not added on top."""
+        clock = FakeClock()
+        sleeps = []
+        runner = IdleWindowRunner(clock=clock, sleep=sleeps.append)
+        runner.defer(lambda: setattr(clock, 'now', 8))
+
+        runner.idle(5)
+
+        assert sleeps == []
+
+    def test_window_length_decided_after_tasks(self):
+        clock = FakeClock()
+        sleeps = []
+        runner = IdleWindowRunner(clock=clock, sleep=sleeps.append)
+        length = {'seconds': 1}
+        runner.defer(lambda: length.update(seconds=4))
+
+        runner.idle(lambda: length['seconds'])
+
+        assert sleeps == [4]
+
+
+class TestOrchestratorPipeline:
+    """Tests for the pipeline inside BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def make_orchestrator(self, monkeypatch):
+        """Orchestrator whose posts defer verification to a fake writer."""
+        def make(verified=True):
+            config = PostingConfig(delay_between_accounts=0, delay_between_posts=0, reuse_sessions=False)
+            orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+            calls = []
+            logins = []
+
+            class FakeAdapter:
+                def __init__(self, config):
+                    pass
+
+                def create_driver(self):
+                    return object()
+
+                def close(self):
+                    pass
+
+            class FakeWriter:
+                def verify_post(self, title):
+                    calls.append(('verify', title))
+                    return verified
+
+            def fake_login(driver, creds):
+                logins.append((creds.sns_id, threading.current_thread().name))
+                return True
+
+            def fake_post_single(driver, entry, creds, prepared=None, verify=True):
+                calls.append(('post', entry.index, bool(prepared)))
+                if not verify:
+                    orchestrator._pending_verifications[entry.index] = (FakeWriter(), f"Post {entry.index}")
+                return PostResult(entry=entry, success=True)
+
+            monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+            monkeypatch.setattr(orchestrator, '_login', fake_login)
+            monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+            orchestrator.calls = calls
+            orchestrator.logins = logins
+            return orchestrator
+        return make
+
+    def test_verification_runs_before_the_next_post(self, make_orchestrator):
+        orchestrator = make_orchestrator()
+
+        result = orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert orchestrator.calls == [
+            ('post', 0, True), ('verify', 'Post 0'), ('post', 1, True), ('verify', 'Post 1')
+        ]
+        assert result.successful == 2
+
+    def test_failed_deferred_verification_fails_the_post(self, make_orchestrator):
+        orchestrator = make_orchestrator(verified=False)
+
+        result = orchestrator.post_all([_entry(0)])
+
+        assert result.failed == 1
+        assert result.results[0].error_message == POST_UNVERIFIED
+        assert result.results[0].failure_kind == 'network'
+
+    def test_next_account_logs_in_in_background(self, make_orchestrator):
+        orchestrator = make_orchestrator()
+
+        result = orchestrator.post_all([_entry(0), _entry(1, "other@naver.com")])
+
+        assert result.successful == 2
+        assert orchestrator.logins[0] == ("user@naver.com", threading.current_thread().name)
+        assert orchestrator.logins[1][0] == "other@naver.com"
+        assert orchestrator.logins[1][1].startswith('login')
+
+    def test_pipeline_off_verifies_inline(self, make_orchestrator):
+        orchestrator = make_orchestrator()
+        orchestrator.config.pipeline = False
+
+        orchestrator.post_all([_entry(0), _entry(1, "other@naver.com")])
+
+        assert orchestrator.calls == [('post', 0, False), ('post', 1, False)]
+        assert all(name == threading.current_thread().name for _, name in orchestrator.logins)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
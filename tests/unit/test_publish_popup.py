@@ -0,0 +1,90 @@
+"""Unit tests for the publish popup change planner."""
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.blog_writer_cdp import NaverBlogWriterCDP
+
+
+def _box(checked, x=10, y=20):
+    return {'checked': checked, 'x': x, 'y': y}
+
+
+class TestPlanPublishPopupChanges:
+    """Tests for NaverBlogWriterCDP._plan_publish_popup_changes."""
+
+    plan = staticmethod(NaverBlogWriterCDP._plan_publish_popup_changes)
+
+    @pytest.fixture
+    def default_state(self):
+        """Popup state as Naver opens it: everything allowed, public, link share."""
+        return {
+            'checkboxes': {
+                'allow_comment': _box(True),
+                'allow_sympathy': _box(True),
+                'allow_search': _box(True),
+                'allow_external_share': _box(True),
+                'blog_cafe_share': _box(True),
+                'is_notice': _box(False),
+            },
+            'visibility': {
+                'public': _box(True, 1, 1),
+                'neighbor': _box(False, 2, 2),
+                'mutual': _box(False, 3, 3),
+                'private': _box(False, 4, 4),
+            },
+            'share': {'current': 'link', 'x': 5, 'y': 5},
+        }
+
+    def test_default_settings_need_no_changes(self, default_state):
+        """Default settings match the default popup."""
+        plan = self.plan(default_state, {})
+        assert plan == {'clicks': [], 'share': None}
+
+    def test_only_changed_controls_are_clicked(self, default_state):
+        """Only controls that differ are planned."""
+        plan = self.plan(default_state, {
+            'allow_comment': False,
+            'allow_search': True,
+            'is_notice': True,
+            'visibility': 'private',
+        })
+        names = [name for name, _, _ in plan['clicks']]
+        assert names == ['allow_comment', 'is_notice', 'visibility:private']
+        assert plan['clicks'][-1] == ('visibility:private', 4, 4)
+
+    def test_checkbox_is_checked_when_unchecked(self, default_state):
+        """An unchecked box is checked when the setting is True."""
+        default_state['checkboxes']['allow_search'] = _box(False)
+        plan = self.plan(default_state, {'allow_search': True})
+        assert [name for name, _, _ in plan['clicks']] == ['allow_search']
+
+    def test_share_dropdown_change(self, default_state):
+        """Switching link -> content is planned as a dropdown change."""
+        plan = self.plan(default_state, {'blog_cafe_share': 'content'})
+        assert plan['clicks'] == []
+        assert plan['share'] == 'content'
+
+    def test_share_none_unchecks_checkbox(self, default_state):
+        """blog_cafe_share='none' unchecks the share checkbox."""
+        plan = self.plan(default_state, {'blog_cafe_share': 'none'})
+        assert [name for name, _, _ in plan['clicks']] == ['blog_cafe_share']
+        assert plan['share'] is None
+
+    def test_missing_controls_are_skipped(self):
+        """Controls that were not found are not planned."""
+        plan = self.plan({'checkboxes': {}, 'visibility': {}}, {
+            'allow_comment': False,
+            'visibility': 'private',
+            'blog_cafe_share': 'content',
+        })
+        assert plan == {'clicks': [], 'share': None}
+
+    def test_unknown_visibility_falls_back_to_public(self, default_state):
+        """Unknown visibility values behave like 'public'."""
+        default_state['visibility']['public'] = _box(False, 1, 1)
+        plan = self.plan(default_state, {'visibility': 'everyone'})
+        assert plan['clicks'] == [('visibility:public', 1, 1)]
@@ -0,0 +1,207 @@
+"""Unit tests for the streaming JSONL report writer."""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from adapters.report import create_reporter
+from adapters.secrets import CredentialManager
+from adapters.report.stream import JsonlReportWriter, read_report, summarize_report
+from core.models import BlogContent, BlogPostEntry, PostResult, BatchPostResult
+
+
+def _entry(index, sns_id="user@naver.com"):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="secret_password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+def _result(index, success=True):
+    entry = _entry(index)
+    return PostResult(entry=entry, success=success,
+                      error_message="" if success else "Post failed")
+
+
+class TestJsonlReportWriter:
+    """Tests for JsonlReportWriter."""
+
+    def test_records_written_as_they_arrive(self, tmp_path):
+        """Results are on disk before finish() (crash-safe)."""
+        path = tmp_path / "report.jsonl"
+        writer = JsonlReportWriter(str(path))
+
+        writer.write_result(_result(0))
+        writer.write_result(_result(1, success=False))
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r['record'] for r in records] == ['started', 'result', 'result']
+        assert records[2]['index'] == 1
+        assert records[2]['success'] is False
+        assert 'secret_password' not in path.read_text()
+
+    def test_summary_from_counters(self, tmp_path):
+        path = tmp_path / "report.jsonl"
+        with JsonlReportWriter(str(path)) as writer:
+            writer.write_result(_result(0))
+            writer.write_result(_result(1, success=False))
+            writer.add_skipped(3)
+
+        summary = list(read_report(str(path)))[-1]
+        assert summary['record'] == 'summary'
+        assert (summary['total'], summary['successful'], summary['failed'], summary['skipped']) == (2, 1, 1, 3)
+
+    def test_invalid_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            JsonlReportWriter(str(tmp_path / "report.jsonl"), fsync='sometimes')
+
+    def test_fsync_always(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr('adapters.report.stream.os.fsync', synced.append)
+        writer = JsonlReportWriter(str(tmp_path / "report.jsonl"), fsync='always')
+
+        writer.write_result(_result(0))
+        writer.write_result(_result(1))
+
+        assert len(synced) == 3  # started + 2 results
+
+    def test_fsync_never_still_syncs_summary(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr('adapters.report.stream.os.fsync', synced.append)
+        writer = JsonlReportWriter(str(tmp_path / "report.jsonl"), fsync='never')
+
+        writer.write_result(_result(0))
+        assert synced == []
+        writer.finish()
+        assert len(synced) == 1
+
+    def test_rotation_gzips_and_reads_back_in_order(self, tmp_path):
+        path = tmp_path / "report.jsonl"
+        with JsonlReportWriter(str(path), rotate_bytes=400) as writer:
+            for index in range(20):
+                writer.write_result(_result(index))
+
+        assert list(tmp_path.glob("report.jsonl.*.gz"))
+        indexes = [r['index'] for r in read_report(str(path)) if r['record'] == 'result']
+        assert indexes == list(range(20))
+
+    def test_open_discards_previous_parts(self, tmp_path):
+        path = tmp_path / "report.jsonl"
+        with JsonlReportWriter(str(path), rotate_bytes=200) as writer:
+            for index in range(10):
+                writer.write_result(_result(index))
+
+        with JsonlReportWriter(str(path)) as writer:
+            writer.write_result(_result(99))
+
+        assert not list(tmp_path.glob("report.jsonl.*.gz"))
+        assert summarize_report(str(path))['total'] == 1
+
+
+class TestSummarizeReport:
+    """Tests for reading partial reports."""
+
+    def test_partial_report_after_crash(self, tmp_path):
+        """An unfinished report with a torn last line is still readable."""
+        path = tmp_path / "report.jsonl"
+        writer = JsonlReportWriter(str(path))
+        writer.write_result(_result(0))
+        writer.write_result(_result(1, success=False))
+        with open(path, 'a') as f:
+            f.write('{"record": "result", "ind')
+
+        summary = summarize_report(str(path))
+
+        assert summary == {'total': 2, 'successful': 1, 'failed': 1, 'skipped': 0, 'complete': False}
+
+
+class TestReporterStreaming:
+    """Tests for Reporter with a streaming report."""
+
+    def test_batch_report_finishes_stream(self, tmp_path, capsys):
+        path = tmp_path / "report.jsonl"
+        reporter = create_reporter(jsonl_file=str(path))
+        reporter.start()
+
+        batch = BatchPostResult(keep_results=False)
+        for post_result in (_result(0), _result(1, success=False)):
+            batch.add_result(post_result)
+            reporter.stream.write_result(post_result)
+        batch.add_skipped()
+
+        reporter.report_batch_result(batch)
+
+        assert batch.results == []
+        assert str(path) in capsys.readouterr().out
+        assert summarize_report(str(path)) == {
+            'total': 2, 'successful': 1, 'failed': 1, 'skipped': 1, 'complete': True
+        }
+
+
+class TestOrchestratorStreaming:
+    """Tests for results reaching the streaming report while an account is posting."""
+
+    @pytest.fixture
+    def make_orchestrator(self, tmp_path, monkeypatch):
+        """Orchestrator with the browser, login and writer stubbed out, reading back its report."""
+        def make(**config):
+            path = tmp_path / "report.jsonl"
+            writer = JsonlReportWriter(str(path))
+            config = PostingConfig(delay_between_accounts=0, delay_between_posts=0,
+                                   reuse_sessions=False, pipeline=False, **config)
+            orchestrator = BatchPostingOrchestrator(CredentialManager(), config, report_writer=writer)
+            # Indexes already in the report when each entry started posting
+            orchestrator.reported = {}
+
+            class FakeAdapter:
+                def __init__(self, config):
+                    pass
+
+                def create_driver(self):
+                    return object()
+
+                def close(self):
+                    pass
+
+            def fake_post_single(driver, entry, creds, **kwargs):
+                orchestrator.reported[entry.index] = [
+                    r['index'] for r in read_report(str(path)) if r['record'] == 'result'
+                ]
+                return PostResult(entry=entry, success=True)
+
+            monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+            monkeypatch.setattr(orchestrator, '_login', lambda driver, creds: True)
+            monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+            return orchestrator
+        return make
+
+    def test_sequential_results_are_written_as_posted(self, make_orchestrator):
+        orchestrator = make_orchestrator()
+
+        orchestrator.post_all([_entry(0), _entry(1), _entry(2)])
+
+        assert orchestrator.reported == {0: [], 1: [0], 2: [0, 1]}
+        assert orchestrator.report_writer.total == 3
+
+    def test_interleaved_results_are_written_as_posted(self, make_orchestrator):
+        orchestrator = make_orchestrator(sessions=2)
+
+        orchestrator.post_all([_entry(0, "a@naver.com"), _entry(1, "b@naver.com"),
+                               _entry(2, "a@naver.com"), _entry(3, "b@naver.com")])
+
+        # Each result is in the report before the next post starts, not after its account finishes
+        order = sorted(orchestrator.reported, key=lambda i: len(orchestrator.reported[i]))
+        for position, index in enumerate(order):
+            assert orchestrator.reported[index] == order[:position]
+        assert orchestrator.report_writer.total == 4
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,213 @@
+"""Unit tests for resource blocking and per-post traffic measurement."""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from adapters.browser import (
+    BrowserConfig,
+    BrowserContextHost,
+    RESOURCE_GROUPS,
+    apply_resource_blocking,
+    blocked_url_patterns,
+)
+from adapters.secrets import CredentialManager
+from core.models import BatchPostResult, BlogContent, BlogPostEntry, PostResult
+from src.cdp_network import PublishResponseCapture, TrafficMeter
+from src.cdp_tabs import EditorTabs
+
+
+def _log_entry(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Driver recording CDP commands with the tab they were sent to."""
+
+    def __init__(self):
+        self.window_handles = ['HOME']
+        self.current_window_handle = 'HOME'
+        self.switch_to = FakeSwitchTo(self)
+        self.commands = []
+        self.log = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((self.current_window_handle, cmd, params))
+        if cmd == 'Target.createBrowserContext':
+            return {'browserContextId': 'CTX'}
+        if cmd == 'Target.getTargetInfo':
+            return {'targetInfo': {'browserContextId': 'CTX'}}
+        if cmd == 'Target.createTarget':
+            target_id = f"tab{len(self.window_handles)}"
+            self.window_handles.append(target_id.upper())
+            return {'targetId': target_id}
+        return {}
+
+    def get_log(self, kind):
+        assert kind == 'performance'
+        entries, self.log = self.log, []
+        return entries
+
+
+class TestBlockedUrlPatterns:
+    """Tests for blocked_url_patterns and apply_resource_blocking."""
+
+    def test_groups_and_extra_patterns(self):
+        patterns = blocked_url_patterns(['fonts', 'trackers'], extra=['*.svg', '*.woff'])
+
+        assert patterns == RESOURCE_GROUPS['fonts'] + RESOURCE_GROUPS['trackers'] + ['*.svg']
+        assert '*.png' in blocked_url_patterns()
+
+    def test_unknown_group(self):
+        with pytest.raises(ValueError, match='scripts'):
+            blocked_url_patterns(['scripts'])
+
+    def test_apply(self):
+        driver = FakeDriver()
+
+        assert apply_resource_blocking(driver, ['*.png'])
+        assert not apply_resource_blocking(driver, [])
+        assert [cmd for _, cmd, _ in driver.commands] == ['Network.enable', 'Network.setBlockedURLs']
+        assert driver.commands[-1][2] == {'urls': ['*.png']}
+        assert not apply_resource_blocking(object(), ['*.png'])
+
+    def test_context_tab_is_blocked(self):
+        driver = FakeDriver()
+
+        class FakeAdapter:
+            def __init__(self, config):
+                self.driver = None
+
+            def create_driver(self):
+                self.driver = driver
+                return driver
+
+            def is_healthy(self):
+                return True
+
+        host = BrowserContextHost(BrowserConfig(blocked_urls=('*.png',)), adapter_factory=FakeAdapter)
+        context = host.open()
+
+        assert (context.window, 'Network.setBlockedURLs', {'urls': ['*.png']}) in driver.commands
+
+
+class TestEditorTabsBlocking:
+    """Tests for blocked URLs in background editor tabs."""
+
+    def test_block_list_is_set_before_loading(self):
+        driver = FakeDriver()
+        tabs = EditorTabs(driver, blocked_urls=['*.png'])
+
+        handle = tabs.open('https://blog.naver.com/user/postwrite')
+
+        assert driver.commands[1:] == [
+            ('HOME', 'Target.createTarget', {'url': 'about:blank', 'background': True, 'browserContextId': 'CTX'}),
+            (handle, 'Network.enable', {}),
+            (handle, 'Network.setBlockedURLs', {'urls': ['*.png']}),
+            (handle, 'Page.navigate', {'url': 'https://blog.naver.com/user/postwrite'}),
+        ]
+        assert driver.current_window_handle == 'HOME'
+
+
+class TestTrafficMeter:
+    """Tests for TrafficMeter."""
+
+    def test_counts_finished_loads(self):
+        driver = FakeDriver()
+        meter = TrafficMeter(driver)
+        driver.log = [
+            _log_entry('Network.loadingFinished', requestId='1', encodedDataLength=1500),
+            _log_entry('Network.responseReceived', requestId='2'),
+            _log_entry('Network.loadingFinished', requestId='2', encodedDataLength=500),
+        ]
+
+        assert meter.take() == 2000
+        assert meter.take() == 0
+
+    def test_events_read_by_the_publish_capture_are_counted(self):
+        driver = FakeDriver()
+        meter = TrafficMeter(driver)
+        capture = PublishResponseCapture(driver, meter=meter)
+        driver.log = [_log_entry('Network.loadingFinished', requestId='1', encodedDataLength=700)]
+
+        assert capture.start()
+        assert meter.take() == 700
+
+    def test_driver_without_performance_log(self):
+        meter = TrafficMeter(object())
+
+        assert meter.take() == 0
+        assert not meter.enabled
+
+
+def _entry(index):
+    return BlogPostEntry(
+        sns_id="user@naver.com",
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}", blog_basic="Body"),
+        index=index
+    )
+
+
+class TestOrchestratorTraffic:
+    """Tests for per-post received bytes in BatchPostingOrchestrator."""
+
+    def test_each_post_records_its_bytes(self, monkeypatch):
+        config = PostingConfig(delay_between_posts=0, delay_between_accounts=0,
+                               reuse_sessions=False, blocked_urls=('*.png',))
+        orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+        driver = FakeDriver()
+        browser_configs = []
+
+        class FakeAdapter:
+            def __init__(self, config):
+                browser_configs.append(config)
+
+            def create_driver(self):
+                return driver
+
+            def close(self):
+                pass
+
+        def fake_login(driver, creds):
+            driver.log.append(_log_entry('Network.loadingFinished', encodedDataLength=9999))
+            return True
+
+        def fake_post_single(driver, entry, creds, prepared=None, verify=True):
+            driver.log.append(_log_entry('Network.loadingFinished', encodedDataLength=1000 * (entry.index + 1)))
+            return PostResult(entry=entry, success=True)
+
+        monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+        monkeypatch.setattr(orchestrator, '_login', fake_login)
+        monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+
+        result = orchestrator.post_all([_entry(0), _entry(1)])
+
+        assert [r.bytes_received for r in result.results] == [1000, 2000]
+        assert result.bytes_received == 3000
+        assert result.to_dict()['summary']['bytes_received'] == 3000
+        assert browser_configs[0].blocked_urls == ('*.png',)
+
+    def test_batch_result_sums_without_keeping_results(self):
+        batch = BatchPostResult(keep_results=False)
+        batch.add_result(PostResult(entry=_entry(0), success=True, bytes_received=10))
+        batch.add_result(PostResult(entry=_entry(1), success=False, bytes_received=5))
+
+        assert batch.bytes_received == 15
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,138 @@
+"""Unit tests for interleaved scheduling of several account sessions."""
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from automation.naver_blog import orchestrator as orchestrator_module
+from automation.naver_blog.orchestrator import BatchPostingOrchestrator, PostingConfig
+from automation.naver_blog.scheduler import InterleavedScheduler
+from adapters.secrets import CredentialManager
+from core.models import BlogContent, BlogPostEntry, PostResult
+
+
+class FakeRun:
+    """Run that becomes ready at a fixed time."""
+
+    def __init__(self, name, ready):
+        self.name = name
+        self.ready = ready
+
+    def ready_at(self):
+        return self.ready
+
+
+def _entry(index, sns_id):
+    return BlogPostEntry(
+        sns_id=sns_id,
+        sns_pw="password",
+        sns_upload_cont=BlogContent(blog_title=f"Post {index}"),
+        index=index
+    )
+
+
+class TestInterleavedScheduler:
+    """Tests for InterleavedScheduler."""
+
+    def test_soonest_ready_goes_first(self):
+        scheduler = InterleavedScheduler(clock=lambda: 100.0)
+        a, b = FakeRun('a', 130.0), FakeRun('b', 110.0)
+
+        assert scheduler.pick([a, b]) is b
+
+    def test_ready_runs_take_turns(self):
+        scheduler = InterleavedScheduler(clock=lambda: 100.0)
+        runs = [FakeRun('a', 0.0), FakeRun('b', 50.0), FakeRun('c', 90.0)]
+
+        picked = [scheduler.pick(runs).name for _ in range(6)]
+
+        assert picked == ['a', 'b', 'c', 'a', 'b', 'c']
+
+    def test_forget(self):
+        scheduler = InterleavedScheduler(clock=lambda: 0.0)
+        a, b = FakeRun('a', 0.0), FakeRun('b', 0.0)
+        scheduler.pick([a, b])
+        scheduler.forget(a)
+
+        assert scheduler.pick([a, b]) is a
+
+
+class TestOrchestratorInterleaving:
+    """Tests for interleaved posting inside BatchPostingOrchestrator."""
+
+    @pytest.fixture
+    def make_orchestrator(self, monkeypatch):
+        """Orchestrator posting through fakes, recording posts and sleeps."""
+        def make(sessions=2, failed_logins=()):
+            config = PostingConfig(delay_between_posts=10, delay_between_accounts=30,
+                                   reuse_sessions=False, pipeline=False, sessions=sessions)
+            orchestrator = BatchPostingOrchestrator(CredentialManager(), config)
+            orchestrator.posted = []
+            orchestrator.sleeps = []
+
+            class FakeAdapter:
+                def __init__(self, config):
+                    pass
+
+                def create_driver(self):
+                    return object()
+
+                def close(self):
+                    pass
+
+            def fake_login(driver, creds):
+                return creds.sns_id not in failed_logins
+
+            def fake_post_single(driver, entry, creds, **kwargs):
+                orchestrator.posted.append((creds.sns_id, entry.index))
+                return PostResult(entry=entry, success=True)
+
+            monkeypatch.setattr(orchestrator_module, 'BrowserAdapter', FakeAdapter)
+            monkeypatch.setattr(orchestrator_module.time, 'sleep', orchestrator.sleeps.append)
+            monkeypatch.setattr(orchestrator, '_login', fake_login)
+            monkeypatch.setattr(orchestrator, '_post_single', fake_post_single)
+            return orchestrator
+        return make
+
+    def _entries(self):
+        return [_entry(0, "a@naver.com"), _entry(1, "a@naver.com"),
+                _entry(2, "b@naver.com"), _entry(3, "b@naver.com")]
+
+    def test_cooldown_is_filled_by_another_account(self, make_orchestrator):
+        orchestrator = make_orchestrator()
+
+        result = orchestrator.post_all(self._entries())
+
+        assert orchestrator.posted == [
+            ("a@naver.com", 0), ("b@naver.com", 2), ("a@naver.com", 1), ("b@naver.com", 3)
+        ]
+        assert result.successful == 4
+        # Only A's and B's own spacing is waited (partly), never the account delay
+        assert len(orchestrator.sleeps) == 2
+        assert all(0 < seconds <= 10 for seconds in orchestrator.sleeps)
+
+    def test_single_session_posts_accounts_one_after_another(self, make_orchestrator):
+        orchestrator = make_orchestrator(sessions=1)
+
+        orchestrator.post_all(self._entries())
+
+        assert [index for _, index in orchestrator.posted] == [0, 1, 2, 3]
+        assert [round(seconds) for seconds in orchestrator.sleeps] == [10, 30, 10]
+
+    def test_failed_login_frees_the_session(self, make_orchestrator):
+        orchestrator = make_orchestrator(failed_logins=("a@naver.com",))
+        entries = self._entries() + [_entry(4, "c@naver.com")]
+
+        result = orchestrator.post_all(entries)
+
+        assert result.failed == 2
+        assert result.successful == 3
+        assert orchestrator.posted == [
+            ("b@naver.com", 2), ("c@naver.com", 4), ("b@naver.com", 3)
+        ]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
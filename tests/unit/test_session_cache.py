@@ -0,0 +1,138 @@
+"""Unit tests for the login session cache."""
+import json
+import os
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapters.browser.session_cache import SessionCache, CachedSession
+
+
+class FakeDriver:
+    """Minimal driver recording CDP calls."""
+
+    def __init__(self, cookies=None):
+        self.cookies = cookies or []
+        self.calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append((cmd, params))
+        if cmd == "Network.getAllCookies":
+            return {'cookies': self.cookies}
+        return {}
+
+
+def _cookie(name, domain='.naver.com', expires=-1):
+    return {'name': name, 'value': f'{name}-value', 'domain': domain,
+            'path': '/', 'expires': expires, 'size': 10, 'session': expires < 0}
+
+
+class TestSessionCache:
+    """Tests for SessionCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache in a temp directory."""
+        return SessionCache(cache_dir=str(tmp_path / "sessions"))
+
+    def test_save_and_load(self, cache):
+        """Test round-tripping a session."""
+        cache.save('user@naver.com', [_cookie('NID_AUT'), _cookie('NID_SES')])
+        session = cache.load('user@naver.com')
+        assert session is not None
+        assert {c['name'] for c in session.cookies} == {'NID_AUT', 'NID_SES'}
+
+    def test_save_requires_auth_cookies(self, cache):
+        """Test that a jar without login cookies is not cached."""
+        assert cache.save('user@naver.com', [_cookie('NNB')]) is None
+        assert cache.load('user@naver.com') is None
+
+    def test_save_filters_foreign_domains(self, cache):
+        """Test that only Naver cookies are stored."""
+        cache.save('user@naver.com', [
+            _cookie('NID_AUT'), _cookie('NID_SES'), _cookie('other', domain='.example.com')
+        ])
+        session = cache.load('user@naver.com')
+        assert all('naver.com' in c['domain'] for c in session.cookies)
+
+    def test_file_permissions(self, cache):
+        """Test that cache files are only readable by the owner."""
+        cache.save('user@naver.com', [_cookie('NID_AUT'), _cookie('NID_SES')])
+        path = cache._path_for('user@naver.com')
+        assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+
+    def test_expiry_from_auth_cookie(self, cache):
+        """Test that the earliest auth cookie expiry wins."""
+        soon = time.time() + 60
+        session = cache.save('user@naver.com', [_cookie('NID_AUT', expires=soon), _cookie('NID_SES')])
+        assert session.expires_at == soon
+
+    def test_expired_session_not_loaded(self, cache):
+        """Test that stale sessions are ignored."""
+        cache.save('user@naver.com', [_cookie('NID_AUT', expires=time.time() - 1), _cookie('NID_SES')])
+        assert cache.load('user@naver.com') is None
+
+    def test_max_age(self, tmp_path):
+        """Test that session cookies expire after max_age."""
+        cache = SessionCache(cache_dir=str(tmp_path), max_age=0)
+        cache.save('user@naver.com', [_cookie('NID_AUT'), _cookie('NID_SES')])
+        assert cache.load('user@naver.com') is None
+
+    def test_invalidate(self, cache):
+        """Test removing a cached session."""
+        cache.save('user@naver.com', [_cookie('NID_AUT'), _cookie('NID_SES')])
+        cache.invalidate('user@naver.com')
+        assert cache.load('user@naver.com') is None
+        cache.invalidate('user@naver.com')  # missing file is fine
+
+    def test_corrupt_file(self, cache):
+        """Test that an unreadable cache file is treated as missing."""
+        path = cache._path_for('user@naver.com')
+        path.parent.mkdir(parents=True)
+        path.write_text('not json', encoding='utf-8')
+        assert cache.load('user@naver.com') is None
+
+    def test_export_and_restore(self, cache):
+        """Test exporting from one driver and restoring into another."""
+        source = FakeDriver([_cookie('NID_AUT'), _cookie('NID_SES')])
+        assert cache.export_from_driver(source, 'user@naver.com') is True
+
+        target = FakeDriver()
+        assert cache.restore_to_driver(target, 'user@naver.com') is True
+        cmd, params = target.calls[0]
+        assert cmd == "Network.setCookies"
+        restored = params['cookies']
+        assert len(restored) == 2
+        # CDP-only fields are stripped and session expiry is omitted
+        assert all('size' not in c and 'session' not in c for c in restored)
+        assert all('expires' not in c for c in restored)
+
+    def test_restore_without_cache(self, cache):
+        """Test that restore reports a miss without touching the driver."""
+        driver = FakeDriver()
+        assert cache.restore_to_driver(driver, 'nobody@naver.com') is False
+        assert driver.calls == []
+
+
+class TestCachedSession:
+    """Tests for CachedSession model."""
+
+    def test_round_trip(self):
+        """Test dict conversion."""
+        session = CachedSession(sns_id='a@naver.com', cookies=[{'name': 'x'}],
+                                saved_at=1.0, expires_at=2.0)
+        assert CachedSession.from_dict(json.loads(json.dumps(session.to_dict()))) == session
+
+    def test_is_expired(self):
+        """Test expiry check."""
+        session = CachedSession(sns_id='a', expires_at=100.0)
+        assert session.is_expired(now=100.0)
+        assert not session.is_expired(now=99.0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
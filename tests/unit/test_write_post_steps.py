@@ -0,0 +1,367 @@
+"""Unit tests for step-level retry in NaverBlogWriterCDP.write_post."""
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.blog_writer_cdp import IMAGE_FILE_INPUT_SELECTOR, NaverBlogWriterCDP
+
+
+class FakeDriver:
+    """Driver whose URL follows the fake editor."""
+
+    def __init__(self):
+        self.editor = None
+
+    @property
+    def current_url(self):
+        return self.editor.url
+
+
+class FakeEditor:
+    """
+    Simulated editor behind the writer's step methods.
+
+    ``failures`` maps a step method name to how many times it fails before
+    succeeding.
+    """
+
+    def __init__(self, writer, failures=None):
+        self.writer = writer
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.title = ''
+        self.body = ''
+        self.popup_open = False
+        self.images = 0
+        self.uploads = []
+        self.landed_on_failure = 0  # images that reach the editor when an upload reports failure
+        self.url = 'https://blog.naver.com/user'
+
+    def _fails(self, name):
+        self.calls.append(name)
+        if self.failures.get(name, 0) > 0:
+            self.failures[name] -= 1
+            return True
+        return False
+
+    def open_editor(self):
+        self.calls.append('open_editor')
+        self.title = self.body = ''
+        self.url = 'https://blog.naver.com/user/postwrite'
+        return True
+
+    def input_title(self, title):
+        if self._fails('input_title'):
+            return False
+        self.title = title
+        return True
+
+    def input_content(self, content):
+        if self._fails('input_content'):
+            return False
+        self.body = content
+        return True
+
+    def insert_images(self, files, expected=None):
+        self.uploads.append(list(files))
+        if self._fails('insert_images'):
+            self.images += min(self.landed_on_failure, len(files))
+            return False
+        self.images += len(files)
+        return True
+
+    def open_publish_popup(self):
+        self.popup_open = not self._fails('open_publish_popup')
+        return self.popup_open
+
+    def configure(self, category, tags, settings):
+        self.calls.append(('configure', tuple(tags or ())))
+        return True
+
+    def click_final_publish(self):
+        if self._fails('click_final_publish'):
+            return False
+        self.writer._published = True
+        self.writer.last_log_no = '223'
+        self.url = 'https://blog.naver.com/user/223'
+        return True
+
+    def verify(self, log_no):
+        return not self._fails('verify')
+
+    def state(self):
+        return {'inEditor': 'postwrite' in self.url, 'title': self.title, 'body': self.body}
+
+
+@pytest.fixture
+def make_writer():
+    """Create a writer whose page interactions go to a FakeEditor."""
+    def make(failures=None):
+        driver = FakeDriver()
+        writer = NaverBlogWriterCDP(driver, SimpleNamespace(blog_id='user'))
+        editor = FakeEditor(writer, failures)
+        driver.editor = editor
+        writer._open_editor = editor.open_editor
+        writer._reload_editor = editor.open_editor
+        writer._input_title = editor.input_title
+        writer._input_content = editor.input_content
+        writer._insert_images = editor.insert_images
+        writer._count_editor_images = lambda: editor.images
+        writer._open_publish_popup = editor.open_publish_popup
+        writer._is_publish_popup_open = lambda: editor.popup_open
+        writer._clear_editor_overlays = lambda: True
+        writer._configure_publish_popup = editor.configure
+        writer._click_final_publish = editor.click_final_publish
+        writer._verify_post_by_log_no = editor.verify
+        writer._verify_post_published = lambda title: False
+        writer._read_editor_state = editor.state
+        return writer, editor
+    return make
+
+
+def _write(writer, tags=None):
+    return writer.write_post("Title", "Body text", tags=tags, max_retries=2)
+
+
+class TestWritePostSteps:
+    """Tests for write_post step recovery."""
+
+    def test_happy_path_runs_each_step_once(self, make_writer):
+        writer, editor = make_writer()
+
+        assert _write(writer)
+        assert editor.calls.count('open_editor') == 1
+        assert editor.calls.count('click_final_publish') == 1
+
+    def test_title_retry_does_not_reload_editor(self, make_writer):
+        """A missed title click is retried in place."""
+        writer, editor = make_writer({'input_title': 1})
+
+        assert _write(writer)
+        assert editor.calls.count('input_title') == 2
+        assert editor.calls.count('open_editor') == 1
+
+    def test_popup_retry_only_reclicks_publish(self, make_writer):
+        writer, editor = make_writer({'open_publish_popup': 2})
+
+        assert _write(writer)
+        assert editor.calls.count('open_publish_popup') == 3
+        assert editor.calls.count('input_content') == 1
+
+    def test_body_typed_into_title_restarts(self, make_writer):
+        """A polluted title cannot be fixed in place, so the attempt restarts."""
+        writer, editor = make_writer()
+
+        def input_content(content):
+            editor.calls.append('input_content')
+            if editor.calls.count('input_content') == 1:
+                editor.title += content
+                return True
+            editor.body = content
+            return True
+
+        writer._input_content = input_content
+
+        assert _write(writer)
+        assert editor.calls.count('open_editor') == 2
+
+    def test_publish_that_went_through_is_not_repeated(self, make_writer):
+        """If the editor was left, a failed publish step is not clicked again."""
+        writer, editor = make_writer()
+
+        def click_final_publish():
+            editor.calls.append('click_final_publish')
+            editor.url = 'https://blog.naver.com/user'
+            return False
+
+        writer._click_final_publish = click_final_publish
+        writer._verify_post_published = lambda title: True
+
+        assert _write(writer)
+        assert editor.calls.count('click_final_publish') == 1
+
+    def test_unverified_publish_is_not_republished(self, make_writer):
+        writer, editor = make_writer({'verify': 10})
+
+        assert not _write(writer)
+        assert editor.calls.count('click_final_publish') == 1
+        assert editor.calls.count('open_editor') == 1
+
+    def test_tags_entered_once_across_configure_retries(self, make_writer):
+        writer, editor = make_writer()
+        results = iter([False, True])
+        configure = editor.configure
+
+        def flaky_configure(category, tags, settings):
+            configure(category, tags, settings)
+            return next(results)
+
+        writer._configure_publish_popup = flaky_configure
+
+        assert _write(writer, tags=['a', 'b'])
+        assert [c for c in editor.calls if isinstance(c, tuple)] == [('configure', ('a', 'b')), ('configure', ())]
+
+    def test_exhausted_step_retries_fall_back_to_full_restart(self, make_writer):
+        writer, editor = make_writer({'input_title': 3})
+
+        assert _write(writer)
+        assert editor.calls.count('open_editor') == 2
+
+    def test_deferred_verification(self, make_writer):
+        """verify=False publishes without verifying; verify_post() checks later."""
+        writer, editor = make_writer({'verify': 1})
+
+        assert writer.write_post("Title", "Body text", verify=False)
+        assert 'verify' not in editor.calls
+
+        assert not writer.verify_post("Title")
+        assert writer.last_failed_step == 'verify'
+        assert writer.verify_post("Title")
+
+    def test_drafted_post_publishes_without_retyping(self, make_writer):
+        writer, editor = make_writer()
+
+        assert writer.draft_post("Title", "Body text", tags=['a'])
+        assert writer.drafted
+        assert not writer.published
+        assert editor.calls == ['open_editor', 'input_title', 'input_content', 'open_publish_popup',
+                                ('configure', ('a',))]
+
+        assert writer.write_post("Title", "Body text", tags=['a'])
+        assert editor.calls.count('open_editor') == 1
+        assert editor.calls.count('input_title') == 1
+        assert editor.calls.count(('configure', ('a',))) == 1
+        assert not writer.drafted
+
+    def test_failed_draft_is_written_from_scratch(self, make_writer):
+        writer, editor = make_writer({'input_title': 3})
+
+        assert not writer.draft_post("Title", "Body text")
+        assert _write(writer)
+        assert editor.calls.count('open_editor') == 2
+
+    def test_images_are_uploaded_after_the_body(self, make_writer):
+        writer, editor = make_writer()
+
+        assert writer.write_post("Title", "Body text", image_files=['/tmp/a.jpg'])
+        assert editor.calls[:4] == ['open_editor', 'input_title', 'input_content', 'insert_images']
+
+        writer, editor = make_writer()
+        assert _write(writer)
+        assert 'insert_images' not in editor.calls
+
+    def test_failed_image_upload_does_not_block_publishing(self, make_writer):
+        writer, editor = make_writer({'insert_images': 10})
+
+        assert writer.write_post("Title", "Body text", image_files=['/tmp/a.jpg'])
+        assert editor.calls.count('open_editor') == 1
+        assert editor.calls.count('click_final_publish') == 1
+
+    def test_images_that_landed_are_not_uploaded_again(self, make_writer):
+        writer, editor = make_writer({'insert_images': 1})
+        editor.landed_on_failure = 2  # upload timed out, but the images did arrive
+
+        assert writer.write_post("Title", "Body text", image_files=['/tmp/a.jpg', '/tmp/b.jpg'])
+        assert editor.uploads == [['/tmp/a.jpg', '/tmp/b.jpg']]
+        assert editor.images == 2
+
+    def test_retry_uploads_only_the_missing_images(self, make_writer):
+        writer, editor = make_writer({'insert_images': 1})
+        editor.images = 3  # images already in the body before the step
+        editor.landed_on_failure = 1
+
+        assert writer.write_post("Title", "Body text", image_files=['/tmp/a.jpg', '/tmp/b.jpg'])
+        assert editor.uploads == [['/tmp/a.jpg', '/tmp/b.jpg'], ['/tmp/b.jpg']]
+        assert editor.images == 5
+
+    def test_drafted_images_are_not_uploaded_again(self, make_writer):
+        writer, editor = make_writer()
+
+        assert writer.draft_post("Title", "Body text", image_files=['/tmp/a.jpg'])
+        assert writer.write_post("Title", "Body text", image_files=['/tmp/a.jpg'])
+        assert editor.calls.count('insert_images') == 1
+
+    def test_insert_images_fills_the_file_input(self):
+        commands = []
+
+        class CdpDriver:
+            def execute_cdp_cmd(self, cmd, params):
+                commands.append((cmd, params))
+                if cmd == 'DOM.getDocument':
+                    return {'root': {'nodeId': 1}}
+                if cmd == 'DOM.querySelector':
+                    return {'nodeId': 42}
+                return {}
+
+        writer = NaverBlogWriterCDP(CdpDriver(), SimpleNamespace(blog_id='user'))
+        writer._click_element_by_selector = lambda selector: True
+        writer._evaluate_js = lambda expression: 1
+        writer.waiter = SimpleNamespace(condition=lambda predicate, timeout=None: True)
+
+        assert writer._insert_images(['/tmp/a.jpg', '/tmp/b.png'])
+        assert [cmd for cmd, _ in commands] == [
+            'Page.setInterceptFileChooserDialog', 'DOM.getDocument', 'DOM.querySelector',
+            'DOM.setFileInputFiles', 'Page.setInterceptFileChooserDialog',
+        ]
+        assert commands[2][1]['selector'] == IMAGE_FILE_INPUT_SELECTOR
+        assert commands[3][1] == {'files': ['/tmp/a.jpg', '/tmp/b.png'], 'nodeId': 42}
+        assert commands[-1][1] == {'enabled': False}
+
+    @pytest.mark.parametrize('inputs, expected', [
+        ({IMAGE_FILE_INPUT_SELECTOR: 7, 'input[type="file"]': 3}, 7),
+        ({IMAGE_FILE_INPUT_SELECTOR: 0, 'input[type="file"]': 3}, 3),  # no image input: first file input
+        ({IMAGE_FILE_INPUT_SELECTOR: 0, 'input[type="file"]': 0}, None),
+    ])
+    def test_find_file_input_prefers_the_image_input(self, inputs, expected):
+        class CdpDriver:
+            def execute_cdp_cmd(self, cmd, params):
+                if cmd == 'DOM.getDocument':
+                    return {'root': {'nodeId': 1}}
+                return {'nodeId': inputs[params['selector']]}
+
+        writer = NaverBlogWriterCDP(CdpDriver(), SimpleNamespace(blog_id='user'))
+
+        assert writer._find_file_input() == expected
+
+    def test_writer_switches_to_its_tab(self, make_writer):
+        writer, editor = make_writer()
+        switched = []
+        writer.driver.switch_to = SimpleNamespace(window=switched.append)
+        writer.window = 'TAB'
+
+        assert _write(writer)
+        assert writer.verify_post("Title")
+        assert switched == ['TAB', 'TAB']
+
+    def test_preloaded_editor_is_not_navigated_again(self):
+        writer = NaverBlogWriterCDP(FakeDriver(), SimpleNamespace(blog_id='user'))
+        navigations = []
+        writer._navigate_to_editor = lambda: navigations.append('navigate') or True
+        writer._wait_for_editor = lambda timeout=15: True
+        writer._handle_draft_popup = lambda: False
+        writer._close_help_popup = lambda: False
+        writer.editor_preloaded = True
+
+        assert writer._open_editor()
+        assert navigations == []
+        # Only the first open uses the preloaded page (a reload navigates)
+        assert writer._open_editor()
+        assert navigations == ['navigate']
+
+    def test_step_listener_reports_retries(self, make_writer):
+        writer, editor = make_writer({'input_title': 1})
+        events = []
+        writer.step_listener = lambda phase, step, **info: events.append((phase, step, info.get('retry')))
+
+        assert _write(writer)
+        assert ('finished', 'title', 0) in events
+        assert ('finished', 'title', 1) in events
+        assert ('finished', 'verify', 0) in events
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])